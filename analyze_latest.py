@@ -5,23 +5,21 @@
 
 import json
 import asyncio
-from pathlib import Path
 from datetime import datetime
+from artifact_index import get_artifact_index
 from macho_gpt.core.logi_ai_summarizer_241219 import LogiAISummarizer
 
 def main():
     print("🤖 MACHO-GPT v3.4-mini AI 분석 시작")
     print("=" * 50)
     
-    # 최신 파일 찾기
-    data_dir = Path('data')
-    data_files = list(data_dir.glob('hvdc_whatsapp_extraction_*.json'))
+    # 최신 파일 찾기 (artifact 인덱스 조회)
+    latest_file = get_artifact_index().latest('hvdc_extraction')
     
-    if not data_files:
+    if latest_file is None:
         print("❌ 추출 데이터 파일을 찾을 수 없습니다.")
         return
     
-    latest_file = max(data_files, key=lambda x: x.stat().st_mtime)
     print(f"📁 최신 파일: {latest_file}")
     
     # AI 분석 실행
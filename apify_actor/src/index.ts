@@ -1,11 +1,12 @@
 import { Actor } from "apify";
 import { PocInput } from "./types.js";
-import { postJSON } from "./util.js";
+import { openNdjsonSink, postJSON } from "./util.js";
 import { startWhatsapp } from "./whatsapp.js";
 
 const WEBHOOK_URL = process.env.WEBHOOK_URL!;
 const SESSION_KV_KEY = process.env.SESSION_KV_KEY || "baileys_session";
 const PAIR_MODE = (process.env.PAIR_MODE || "qr") as "qr" | "code";
+const NDJSON_SOCKET = process.env.NDJSON_SOCKET;
 
 await Actor.init();
 
@@ -15,6 +16,7 @@ const keyword = input.keywordFilter ? new RegExp(input.keywordFilter, "i") : nul
 const forward = input.forwardToWebhook !== false;
 
 const store = await Actor.openKeyValueStore();
+const emit = NDJSON_SOCKET ? openNdjsonSink(NDJSON_SOCKET) : null;
 const sessionDir = `/tmp/${SESSION_KV_KEY}`;
 
 // (옵션) KV에서 세션 파일 복구/백업 로직 추가 가능
@@ -44,6 +46,7 @@ await startWhatsapp({
             hasMedia: Boolean(msg?.imageMessage || msg?.documentMessage || msg?.videoMessage)
         };
 
+        emit?.("wa.message", payload);
         await Actor.pushData(payload);
         if (forward && WEBHOOK_URL) {
             await postJSON(WEBHOOK_URL, { event: "wa.message", data: payload });
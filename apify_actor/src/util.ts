@@ -1,3 +1,4 @@
+import { createConnection, Socket } from "node:net";
 import { request } from "undici";
 
 export const postJSON = async (url: string, body: unknown) => {
@@ -9,3 +10,17 @@ export const postJSON = async (url: string, body: unknown) => {
   if (res.statusCode >= 400) throw new Error(`Webhook ${res.statusCode}`);
 };
 
+// Python 소비자(BaileysEventConsumer)로 NDJSON 이벤트 전송 (유닉스 소켓 경로 또는 host:port)
+export const openNdjsonSink = (target: string) => {
+  const [host, port] = target.split(":");
+  let socket: Socket | null = null;
+  const connect = () => {
+    socket = port ? createConnection(Number(port), host) : createConnection(target);
+    socket.on("error", () => { socket?.destroy(); socket = null; });
+  };
+  connect();
+  return (event: string, data: unknown) => {
+    if (!socket || socket.destroyed) connect();
+    socket!.write(JSON.stringify({ event, data }) + "\n");
+  };
+};
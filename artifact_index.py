@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+MACHO-GPT v3.4-mini 결과물(artifact) 인덱스
+-----------------------------------------
+Samsung C&T Logistics · HVDC Project
+
+타임스탬프 파일이 계속 쌓이는 data/, reports/ 디렉토리를 매번 glob + stat
+하지 않도록, writer가 저장할 때마다 종류별 최신/이력 항목을 manifest
+(data/artifact_index.json)에 기록합니다. manifest는 파일 잠금 하에 임시
+파일 + os.replace로 원자적으로 교체되며, 읽기는 mtime 기준으로 캐시됩니다.
+
+종류(kind):
+    hvdc_extraction    - HVDCWhatsAppExtractor.save_results
+    media_ocr          - WhatsAppMediaOCRExtractor.save_results
+    ai_analysis        - LogiAISummarizer.save_analysis
+    morning_report     - MorningReportSystem.save_report
+    performance_report - PerformanceMonitor.save_report
+
+사용법:
+    record_artifact("ai_analysis", "reports/ai_analysis_20250724.json")
+    latest = get_artifact_index().latest("ai_analysis")
+    get_artifact_index().compact(keep_last=50, delete_files=True)
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from atomic_io import atomic_write_json, file_key
+
+try:  # POSIX
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_PATH = "data/artifact_index.json"
+
+# 인덱스가 없을 때 1회 부트스트랩용 기존 파일 위치
+ARTIFACT_PATTERNS: Dict[str, Tuple[str, str]] = {
+    "hvdc_extraction": ("data", "hvdc_whatsapp_extraction_*.json"),
+    "media_ocr": ("data", "whatsapp_media_ocr_*.json"),
+    "ai_analysis": ("reports", "ai_analysis_*.json"),
+    "morning_report": ("reports/morning_reports", "morning_report_*.json"),
+    "performance_report": (".", "performance_report_*.json"),
+}
+
+
+class ArtifactIndex:
+    """
+    종류별 최신/이력 manifest/Manifest of latest and historical artifacts by kind.
+
+    형식: {"version": 1, "kinds": {kind: [entry, ...]}} — 각 kind의 목록은
+    created_ts 오름차순이며 마지막 항목이 최신입니다.
+    """
+
+    def __init__(self, path: str | Path = DEFAULT_INDEX_PATH) -> None:
+        self.path = Path(path)
+        self.lock_path = self.path.with_name(self.path.name + ".lock")
+        self._mutex = threading.RLock()
+        self._cache_key: Optional[Tuple[int, int]] = None
+        self._data: Dict[str, Any] = {"version": 1, "kinds": {}}
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """프로세스 간 쓰기 잠금/Exclusive cross-process write lock."""
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._mutex, open(self.lock_path, "a+b") as handle:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+    def _load(self) -> Dict[str, Any]:
+        """manifest 읽기 (변경 시에만 파싱)/Read the manifest, cached by file version."""
+        key = file_key(self.path)
+        with self._mutex:
+            if key == self._cache_key:
+                return self._data
+            data: Dict[str, Any] = {"version": 1, "kinds": {}}
+            if key is not None:
+                try:
+                    data = json.loads(self.path.read_text(encoding="utf-8"))
+                except (OSError, json.JSONDecodeError) as exc:
+                    logger.error("Invalid artifact index %s: %s", self.path, exc)
+            self._data, self._cache_key = data, key
+            return data
+
+    def _write(self, data: Dict[str, Any]) -> None:
+        """원자적 교체 (호출자가 잠금 보유)/Atomic replace; caller holds the lock."""
+        atomic_write_json(self.path, data)
+        self._data, self._cache_key = data, file_key(self.path)
+
+    def record(
+        self,
+        kind: str,
+        path: str | Path,
+        created_at: Optional[datetime] = None,
+        meta: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        결과물 등록/Register a newly written artifact.
+
+        Args:
+            kind: 결과물 종류
+            path: 저장된 파일 경로
+            created_at: 생성 시각 (기본: 현재)
+            meta: 부가 정보 (건수 등)
+        """
+        created_at = created_at or datetime.now()
+        file_path = Path(path)
+        entry = {
+            "path": file_path.as_posix(),
+            "created_at": created_at.isoformat(),
+            "created_ts": created_at.timestamp(),
+            "size": file_path.stat().st_size if file_path.exists() else None,
+            "meta": meta or {},
+        }
+
+        with self._locked():
+            self._cache_key = None  # 잠금 하에서 최신 내용으로 다시 읽기
+            data = self._load()
+            entries = [e for e in data["kinds"].get(kind, []) if e["path"] != entry["path"]]
+            timestamps = [e["created_ts"] for e in entries]
+            entries.insert(bisect.bisect_right(timestamps, entry["created_ts"]), entry)
+            data = {**data, "kinds": {**data["kinds"], kind: entries}}
+            self._write(data)
+        return entry
+
+    def latest(self, kind: str, bootstrap: bool = True) -> Optional[Path]:
+        """
+        최신 결과물 경로/Path of the newest existing artifact of a kind.
+
+        인덱스에 해당 종류가 없고 bootstrap=True이면 기존 파일을 한 번
+        스캔하여 인덱스를 채웁니다. 외부에서 삭제된 파일은 건너뜁니다.
+        """
+        entries = self._load()["kinds"].get(kind)
+        if entries is None and bootstrap and kind in ARTIFACT_PATTERNS:
+            self.rebuild(kind)
+            entries = self._load()["kinds"].get(kind)
+        for entry in reversed(entries or []):
+            path = Path(entry["path"])
+            if path.exists():
+                return path
+        return None
+
+    def history(
+        self,
+        kind: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """기간별 이력 (오래된 순)/Entries of a kind within [since, until]."""
+        entries = self._load()["kinds"].get(kind, [])
+        timestamps = [e["created_ts"] for e in entries]
+        start = bisect.bisect_left(timestamps, since.timestamp()) if since else 0
+        end = bisect.bisect_right(timestamps, until.timestamp()) if until else len(entries)
+        return entries[start:end]
+
+    def rebuild(self, kind: str, directory: Optional[str] = None, pattern: Optional[str] = None) -> int:
+        """
+        디렉토리 스캔으로 인덱스 재구성 (마이그레이션용 1회)/Seed a kind from disk.
+
+        Returns:
+            int: 등록된 항목 수
+        """
+        default_dir, default_pattern = ARTIFACT_PATTERNS.get(kind, (".", "*"))
+        directory = Path(directory or default_dir)
+        files = sorted(
+            directory.glob(pattern or default_pattern), key=lambda p: p.stat().st_mtime
+        ) if directory.exists() else []
+        entries = [
+            {
+                "path": file_path.as_posix(),
+                "created_at": datetime.fromtimestamp(file_path.stat().st_mtime).isoformat(),
+                "created_ts": file_path.stat().st_mtime,
+                "size": file_path.stat().st_size,
+                "meta": {},
+            }
+            for file_path in files
+        ]
+        with self._locked():
+            self._cache_key = None
+            data = self._load()
+            self._write({**data, "kinds": {**data["kinds"], kind: entries}})
+        return len(entries)
+
+    def compact(
+        self,
+        kind: Optional[str] = None,
+        keep_last: Optional[int] = None,
+        max_age_days: Optional[float] = None,
+        delete_files: bool = False,
+    ) -> List[str]:
+        """
+        보존 정책 적용/Apply retention to one or all kinds.
+
+        최신 keep_last개와 max_age_days 이내 항목만 남기며, 최신 항목은 항상
+        유지합니다. 사라진 파일의 항목도 제거합니다.
+
+        Returns:
+            List[str]: 인덱스에서 제거된 경로
+        """
+        cutoff = time.time() - max_age_days * 86400 if max_age_days is not None else None
+        removed: List[str] = []
+
+        with self._locked():
+            self._cache_key = None
+            data = self._load()
+            kinds = dict(data["kinds"])
+            for name in [kind] if kind else list(kinds):
+                entries = kinds.get(name, [])
+                kept = []
+                for index, entry in enumerate(entries):
+                    newest = index == len(entries) - 1
+                    too_many = keep_last is not None and index < len(entries) - keep_last
+                    too_old = cutoff is not None and entry["created_ts"] < cutoff
+                    missing = not Path(entry["path"]).exists()
+                    if missing or (not newest and (too_many or too_old)):
+                        removed.append(entry["path"])
+                        if delete_files and not missing:
+                            Path(entry["path"]).unlink(missing_ok=True)
+                    else:
+                        kept.append(entry)
+                kinds[name] = kept
+            self._write({**data, "kinds": kinds})
+        return removed
+
+
+_INDEXES: Dict[Path, ArtifactIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_artifact_index(path: str | Path = DEFAULT_INDEX_PATH) -> ArtifactIndex:
+    """경로별 공유 인덱스/Return the process-wide index for a manifest path."""
+    resolved = Path(path).resolve()
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(resolved)
+        if index is None:
+            index = _INDEXES[resolved] = ArtifactIndex(resolved)
+        return index
+
+
+def record_artifact(kind: str, path: str | Path, **meta: Any) -> None:
+    """writer용 등록 헬퍼 (실패해도 저장을 막지 않음)/Best-effort registration."""
+    try:
+        get_artifact_index().record(kind, path, meta=meta)
+    except Exception as exc:
+        logger.warning("Failed to index artifact %s (%s): %s", path, kind, exc)
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+MACHO-GPT v3.4-mini 원자적 파일 기록·버전 키
+-------------------------------------------
+Samsung C&T Logistics · HVDC Project
+
+상태·캐시 파일(artifact 인덱스, 인증 상태, 대시보드 저장소, 메트릭 스냅샷,
+아침 보고서 상태 등)이 공유하는 두 가지 도우미입니다.
+
+- file_key: (st_mtime_ns, st_size) 버전 키 — 같으면 파일을 다시 파싱하지 않음
+- atomic_path / atomic_write_text / atomic_write_json: 같은 디렉토리의 고유
+  임시 파일에 기록한 뒤 os.replace로 교체. 임시 파일 이름이 호출마다 달라
+  같은 프로세스의 여러 스레드(Streamlit 세션, OCR 작업 스레드)가 동시에
+  같은 경로를 써도 서로의 임시 파일을 덮어쓰지 않으며, 읽는 쪽은 항상
+  완성된 파일만 봅니다. 기록 중 실패하면 원래 파일은 그대로 남습니다.
+
+사용법:
+    key = file_key(path)
+    atomic_write_json(path, data)
+    with atomic_path("cache/out.png", suffix=".png.tmp") as tmp_path:
+        image.save(tmp_path, format="PNG")
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, Optional, Tuple
+
+FileKey = Optional[Tuple[int, int]]
+DEFAULT_MODE = 0o644
+
+
+def file_key(path: str | Path) -> FileKey:
+    """파일 버전 키/(mtime_ns, size), or None when the file cannot be stat'ed."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+@contextmanager
+def atomic_path(path: str | Path, suffix: str = ".tmp") -> Iterator[Path]:
+    """
+    고유 임시 경로 제공 후 성공 시 path로 교체/Yield a unique temp path, then replace.
+
+    블록에서 예외가 나면 임시 파일만 지우고 path는 건드리지 않습니다.
+    mkstemp의 0600 권한 대신 기존 파일 권한(새 파일은 0644)을 유지합니다.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, name = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=suffix)
+    os.close(fd)
+    tmp_path = Path(name)
+    try:
+        yield tmp_path
+        try:
+            mode = path.stat().st_mode & 0o777
+        except OSError:
+            mode = DEFAULT_MODE
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def atomic_write_text(path: str | Path, text: str, encoding: str = "utf-8") -> None:
+    """텍스트 원자적 기록/Write text via a unique temp file + os.replace."""
+    with atomic_path(path) as tmp_path:
+        tmp_path.write_text(text, encoding=encoding)
+
+
+def atomic_write_json(path: str | Path, data: Any, indent: Optional[int] = 2) -> None:
+    """JSON 원자적 기록/Write JSON (UTF-8, ensure_ascii=False) atomically."""
+    atomic_write_text(path, json.dumps(data, ensure_ascii=False, indent=indent))
@@ -16,12 +16,15 @@ from pathlib import Path
 from datetime import datetime
 from playwright.async_api import async_playwright
 
+from auth_state import get_auth_store
+
 
 class WhatsAppAuthSetup:
     """WhatsApp Web 인증 설정 클래스"""
 
     def __init__(self):
         self.auth_file = Path("auth.json")
+        self.auth_store = get_auth_store(self.auth_file)
         self.backup_dir = Path("auth_backups")
         self.backup_dir.mkdir(exist_ok=True)
 
@@ -87,7 +90,7 @@ class WhatsAppAuthSetup:
 
                 # 인증 정보 저장
                 print("[INFO] 인증 정보 저장 중...")
-                await context.storage_state(path=str(self.auth_file))
+                self.auth_store.save(await context.storage_state())
 
                 # 저장된 정보 확인
                 if self.auth_file.exists():
@@ -128,27 +131,49 @@ class WhatsAppAuthSetup:
     async def _preview_auth_info(self):
         """저장된 인증 정보 미리보기"""
         try:
-            with open(self.auth_file, "r", encoding="utf-8") as f:
-                auth_data = json.load(f)
+            status = self.auth_store.inspect()
 
             print("\n[INFO] 저장된 인증 정보:")
-            print(f"   - 쿠키: {len(auth_data.get('cookies', []))}개")
-            print(f"   - 로컬스토리지: {len(auth_data.get('origins', []))}개 도메인")
+            print(f"   - 쿠키: {status.cookie_count}개")
+            print(f"   - 로컬스토리지: {status.origin_count}개 도메인")
             print(f"   - 저장 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
         except Exception as e:
             print(f"[WARNING] 인증 정보 미리보기 실패: {e}")
 
+    def check_authentication(self, max_age_days=None):
+        """브라우저 없이 인증 파일 점검"""
+        status = self.auth_store.inspect(max_age_days=max_age_days)
+        if not status.exists:
+            print("[ERROR] 인증 파일이 없습니다. 인증 설정을 먼저 실행하세요.")
+            return False
+
+        print(f"[INFO] 인증 파일: {status.path}")
+        print(f"   - 쿠키: {status.cookie_count}개 (만료 {status.expired_cookies}개)")
+        print(f"   - WhatsApp 로컬스토리지: {'있음' if status.has_whatsapp_storage else '없음'}")
+        if status.expires_in_seconds is not None:
+            print(f"   - 가장 이른 쿠키 만료: {status.expires_in_seconds / 86400:.1f}일 후")
+        if status.age_seconds is not None:
+            print(f"   - 파일 경과 시간: {status.age_seconds / 86400:.1f}일")
+
+        if status.valid:
+            print("[SUCCESS] 인증 파일 유효 (오프라인 점검)")
+        else:
+            print(f"[ERROR] 인증 파일 무효: {status.reason}")
+        return status.valid
+
     async def verify_authentication(self):
         """인증 상태 검증"""
-        if not self.auth_file.exists():
-            print("[ERROR] 인증 파일이 없습니다. 인증 설정을 먼저 실행하세요.")
+        # 오프라인 점검에서 무효면 브라우저 실행 생략
+        if not self.check_authentication():
             return False
 
         try:
             async with async_playwright() as p:
                 browser = await p.chromium.launch(headless=True)
-                context = await browser.new_context(storage_state=str(self.auth_file))
+                context = await browser.new_context(
+                    storage_state=self.auth_store.load()
+                )
                 page = await context.new_page()
 
                 await page.goto("https://web.whatsapp.com/")
@@ -197,9 +222,8 @@ class WhatsAppAuthSetup:
             return False
 
         try:
-            import shutil
-
-            shutil.copy2(backup_file, self.auth_file)
+            # 잠금 + 원자적 교체로 복원 (실행 중인 스크래퍼와 경합 방지)
+            self.auth_store.save(json.loads(backup_file.read_text(encoding="utf-8")))
             print(f"[SUCCESS] 백업 복원 완료: {backup_name}")
             return True
         except Exception as e:
@@ -216,6 +240,12 @@ async def main():
     )
     parser.add_argument("--setup", action="store_true", help="새로운 인증 설정")
     parser.add_argument("--verify", action="store_true", help="인증 상태 검증")
+    parser.add_argument(
+        "--check", action="store_true", help="브라우저 없이 인증 파일 점검"
+    )
+    parser.add_argument(
+        "--max-age-days", type=float, default=None, help="--check 시 최대 허용 경과일"
+    )
     parser.add_argument("--backups", action="store_true", help="백업 파일 목록")
     parser.add_argument("--restore", type=str, help="백업 파일 복원")
 
@@ -236,6 +266,10 @@ async def main():
         # 인증 상태 검증
         await auth_setup.verify_authentication()
 
+    elif args.check:
+        # 오프라인 점검
+        auth_setup.check_authentication(max_age_days=args.max_age_days)
+
     elif args.backups:
         # 백업 파일 목록
         auth_setup.list_backups()
@@ -250,6 +284,7 @@ async def main():
         print("사용법:")
         print("  python auth_setup.py --setup     # 새로운 인증 설정")
         print("  python auth_setup.py --verify    # 인증 상태 검증")
+        print("  python auth_setup.py --check     # 브라우저 없이 인증 파일 점검")
         print("  python auth_setup.py --backups   # 백업 파일 목록")
         print("  python auth_setup.py --restore <파일명>  # 백업 복원")
 
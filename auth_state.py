@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+MACHO-GPT v3.4-mini 인증 상태(auth.json) 공유 서비스
+---------------------------------------------------
+Samsung C&T Logistics · HVDC Project
+
+Playwright storage_state 파일을 한 번만 읽고 정규화하여 파일 mtime 기준으로
+캐시합니다. 여러 그룹 스크래퍼가 동시에 시작해도 파싱은 1회만 수행되며,
+쓰기는 파일 잠금 + 원자적 교체로 직렬화됩니다. 브라우저 없이 만료/유효성을
+점검하는 inspect()를 제공합니다.
+
+사용법:
+    store = get_auth_store("auth.json")
+    state = store.load()          # 캐시된 storage_state dict 또는 None
+    status = store.inspect()      # AuthStatus (exists/valid/expiry)
+    store.save(await context.storage_state())
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from atomic_io import atomic_write_json, file_key
+
+try:  # POSIX
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+try:  # Windows
+    import msvcrt
+except ImportError:  # pragma: no cover - POSIX
+    msvcrt = None
+
+logger = logging.getLogger(__name__)
+
+WHATSAPP_ORIGIN = "https://web.whatsapp.com"
+
+
+def normalize_storage_state(raw_data: Any) -> Tuple[Optional[Dict[str, Any]], bool]:
+    """스토리지 상태 포맷 정규화/Normalize storage_state payload.
+
+    Returns:
+        (normalized, needs_update): 지원하지 않는 형식이면 (None, False)
+    """
+    needs_update = False
+
+    if isinstance(raw_data, dict):
+        cookies = raw_data.get("cookies", [])
+        origins = raw_data.get("origins", [])
+
+        if isinstance(cookies, dict):
+            cookies = [cookies]
+            needs_update = True
+
+        if cookies is None:
+            cookies = []
+        elif not isinstance(cookies, list):
+            return None, False
+
+        if origins is None:
+            origins = []
+            needs_update = True
+        elif not isinstance(origins, list):
+            origins = []
+            needs_update = True
+
+        return {"cookies": cookies, "origins": origins}, needs_update
+
+    if isinstance(raw_data, list):
+        return {"cookies": raw_data, "origins": []}, True
+
+    return None, False
+
+
+@dataclass(frozen=True)
+class AuthStatus:
+    """인증 상태 점검 결과/Offline auth state check result."""
+
+    path: str
+    exists: bool
+    valid: bool
+    reason: str = ""
+    cookie_count: int = 0
+    origin_count: int = 0
+    has_whatsapp_storage: bool = False
+    expired_cookies: int = 0
+    earliest_expiry: Optional[float] = None
+    age_seconds: Optional[float] = None
+
+    @property
+    def expires_in_seconds(self) -> Optional[float]:
+        """가장 이른 쿠키 만료까지 남은 시간/Seconds until the earliest cookie expiry."""
+        if self.earliest_expiry is None:
+            return None
+        return self.earliest_expiry - time.time()
+
+
+class AuthStateStore:
+    """
+    auth.json 캐시/잠금 저장소/Cached, lock-protected storage_state file.
+
+    읽기는 (mtime_ns, size)가 바뀐 경우에만 파일을 다시 파싱합니다. 쓰기는
+    임시 파일 기록 후 os.replace로 교체하므로 읽는 쪽은 잠금이 필요 없습니다.
+    """
+
+    def __init__(self, path: str | Path = "auth.json") -> None:
+        self.path = Path(path)
+        self.lock_path = self.path.with_name(self.path.name + ".lock")
+        self._mutex = threading.Lock()
+        self._cache_key: Optional[Tuple[int, int]] = None
+        self._cached: Optional[Dict[str, Any]] = None
+        self.stats = {"parses": 0, "cache_hits": 0, "writes": 0}
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """프로세스 간 쓰기 잠금/Exclusive cross-process write lock."""
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._mutex, open(self.lock_path, "a+b") as handle:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            elif msvcrt is not None:  # pragma: no cover - Windows
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+                elif msvcrt is not None:  # pragma: no cover - Windows
+                    handle.seek(0)
+                    msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def _write_atomic(self, state: Dict[str, Any]) -> None:
+        """원자적 파일 교체/Write via temp file + os.replace (caller holds lock)."""
+        atomic_write_json(self.path, state)
+        self.stats["writes"] += 1
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """
+        정규화된 storage_state 반환/Return normalized storage_state.
+
+        파일이 없거나 형식이 잘못된 경우 None을 반환합니다. 레거시 형식은
+        잠금 하에 한 번만 정규화하여 다시 기록합니다.
+        """
+        key = file_key(self.path)
+        if key is None:
+            return None
+
+        with self._mutex:
+            if key == self._cache_key:
+                self.stats["cache_hits"] += 1
+                return self._cached
+
+        try:
+            raw_data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.error("Invalid JSON in storage state file %s: %s", self.path, exc)
+            return None
+
+        normalized, needs_update = normalize_storage_state(raw_data)
+        self.stats["parses"] += 1
+        if normalized is None:
+            logger.error("Unsupported storage state format for %s", self.path)
+            return None
+
+        if needs_update:
+            try:
+                with self.lock():
+                    # 잠금 대기 중 다른 프로세스가 이미 갱신했으면 덮어쓰지 않음
+                    if file_key(self.path) == key:
+                        self._write_atomic(normalized)
+                        logger.info(
+                            "Normalized storage state file for Playwright compatibility: %s",
+                            self.path,
+                        )
+                key = file_key(self.path)
+            except OSError as exc:
+                logger.warning("Failed to update storage state file %s: %s", self.path, exc)
+
+        with self._mutex:
+            self._cache_key = key
+            self._cached = normalized
+        return normalized
+
+    def save(self, state: Dict[str, Any]) -> None:
+        """storage_state 저장 (잠금 + 원자적 교체)/Persist state under the lock."""
+        normalized, _ = normalize_storage_state(state)
+        if normalized is None:
+            raise ValueError("Unsupported storage state format")
+
+        with self.lock():
+            self._write_atomic(normalized)
+            key = file_key(self.path)
+        with self._mutex:
+            self._cache_key = key
+            self._cached = normalized
+
+    def inspect(self, max_age_days: Optional[float] = None) -> AuthStatus:
+        """
+        브라우저 없이 인증 상태 점검/Check validity and expiry without a browser.
+
+        유효 조건: WhatsApp 로컬스토리지 또는 만료되지 않은 WhatsApp 쿠키가 있고,
+        max_age_days가 주어진 경우 파일이 그보다 오래되지 않아야 합니다.
+        """
+        path = str(self.path)
+        key = file_key(self.path)
+        if key is None:
+            return AuthStatus(path=path, exists=False, valid=False, reason="missing")
+
+        state = self.load()
+        if state is None:
+            return AuthStatus(path=path, exists=True, valid=False, reason="unreadable")
+
+        now = time.time()
+        cookies = [c for c in state["cookies"] if isinstance(c, dict)]
+        wa_cookies = [c for c in cookies if "whatsapp" in str(c.get("domain", ""))]
+        expiries = [
+            float(c["expires"])
+            for c in wa_cookies
+            if isinstance(c.get("expires"), (int, float)) and c["expires"] > 0
+        ]
+        expired = sum(1 for expiry in expiries if expiry <= now)
+        live_cookies = len(wa_cookies) - expired
+        future = [expiry for expiry in expiries if expiry > now]
+        has_storage = any(
+            isinstance(origin, dict)
+            and origin.get("origin") == WHATSAPP_ORIGIN
+            and origin.get("localStorage")
+            for origin in state["origins"]
+        )
+        age_seconds = now - key[0] / 1e9
+
+        reason = ""
+        if not has_storage and live_cookies <= 0:
+            reason = "expired" if expired else "no_whatsapp_session"
+        elif max_age_days is not None and age_seconds > max_age_days * 86400:
+            reason = "stale"
+
+        return AuthStatus(
+            path=path,
+            exists=True,
+            valid=not reason,
+            reason=reason,
+            cookie_count=len(cookies),
+            origin_count=len(state["origins"]),
+            has_whatsapp_storage=has_storage,
+            expired_cookies=expired,
+            earliest_expiry=min(future) if future else None,
+            age_seconds=age_seconds,
+        )
+
+
+_STORES: Dict[Path, AuthStateStore] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def get_auth_store(path: str | Path = "auth.json") -> AuthStateStore:
+    """경로별 공유 저장소 반환/Return the process-wide store for a path."""
+    resolved = Path(path).resolve()
+    with _STORES_LOCK:
+        store = _STORES.get(resolved)
+        if store is None:
+            store = _STORES[resolved] = AuthStateStore(resolved)
+        return store
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+MACHO-GPT v3.4-mini 대시보드 데이터 서비스
+-----------------------------------------
+Samsung C&T Logistics · HVDC Project
+
+Streamlit은 위젯 클릭마다 스크립트 전체를 다시 실행하지만 import된 모듈은
+유지됩니다. 이 모듈의 서비스 인스턴스는 JSON 파일을 (mtime_ns, size) 버전
+기준으로 캐시하고, 파일 종류별 집계(건수·키워드 빈도·신뢰도 히스토그램)를
+버전당 한 번만 계산합니다. 같은 프로세스의 writer가 commit()으로 저장하면
+디스크를 다시 읽지 않고 캐시와 집계가 즉시 갱신됩니다.
+
+사용법:
+    service = get_dashboard_service()
+    snapshot = service.get("reports/ai_analysis_x.json", kind="ai_analysis")
+    snapshot.data, snapshot.aggregates
+    service.commit("summaries.json", db, kind="summaries")
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from atomic_io import FileKey, atomic_write_json, file_key
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """캐시된 파일 버전/Cached file version with precomputed aggregates."""
+
+    path: str
+    data: Any
+    aggregates: Dict[str, Any] = field(default_factory=dict)
+    version: Tuple[FileKey, ...] = ()
+
+
+def histogram(values: List[float], bins: int = 10) -> Dict[str, int]:
+    """신뢰도 히스토그램 (0~1 또는 0~100 자동 판별)/Fixed-width confidence histogram."""
+    values = [float(v) for v in values if isinstance(v, (int, float)) and v > 0]
+    if not values:
+        return {}
+    upper = 100.0 if max(values) > 1.0 else 1.0
+    width = upper / bins
+    counts = Counter(min(int(v / width), bins - 1) for v in values)
+    return {
+        f"{index * width:g}-{(index + 1) * width:g}": counts.get(index, 0)
+        for index in range(bins)
+    }
+
+
+# ---------------------------------------------------------------------------
+# 종류별 로더/집계
+# ---------------------------------------------------------------------------
+
+
+def _load_json(path: Path) -> Any:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def workflow_change_log(path: Path) -> Path:
+    """WorkflowManager 변경 로그 경로/Change log next to the workflow snapshot."""
+    return path.with_suffix(".changes.jsonl")
+
+
+def _load_workflow(path: Path) -> Dict[str, Any]:
+    """스냅샷 + 변경 로그 병합 (WorkflowManager는 변경을 로그에 추가)"""
+    data = _load_json(path) if path.exists() else {"chat_rooms": [], "tasks": [], "metadata": {}}
+    rooms = {room["id"]: room for room in data.get("chat_rooms", [])}
+    tasks = {task["id"]: task for task in data.get("tasks", [])}
+
+    log_path = workflow_change_log(path)
+    if log_path.exists():
+        with open(log_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if record.get("op") == "room":
+                    rooms[record["room"]["id"]] = record["room"]
+                elif record.get("op") == "task":
+                    tasks[record["task"]["id"]] = record["task"]
+                elif record.get("op") == "link" and record.get("child") in rooms:
+                    rooms[record["child"]]["parent_room_id"] = record.get("parent")
+
+    data["chat_rooms"] = list(rooms.values())
+    data["tasks"] = list(tasks.values())
+    return data
+
+
+def _aggregate_workflow(data: Dict[str, Any]) -> Dict[str, Any]:
+    tasks = data.get("tasks", [])
+    rooms = data.get("chat_rooms", [])
+    by_status = Counter(task.get("status") for task in tasks)
+    return {
+        "total_rooms": len(rooms),
+        "total_tasks": len(tasks),
+        "rooms_by_type": dict(Counter(room.get("type") for room in rooms)),
+        "tasks_by_status": dict(by_status),
+        "tasks_by_priority": dict(Counter(task.get("priority") for task in tasks)),
+        "completion_rate": by_status.get("completed", 0) / len(tasks) if tasks else 0.0,
+    }
+
+
+def _aggregate_summaries(data: Dict[str, Any]) -> Dict[str, Any]:
+    entries = [entry for entry in data.values() if isinstance(entry, dict)]
+    confidences = [entry.get("confidence", 0) for entry in entries]
+    return {
+        "count": len(entries),
+        "task_count": sum(len(entry.get("tasks", [])) for entry in entries),
+        "avg_confidence": sum(confidences) / len(confidences) if confidences else 0.0,
+        "confidence_histogram": histogram(confidences),
+        "latest_key": max(data) if data else None,
+    }
+
+
+def _aggregate_ai_analysis(data: Dict[str, Any]) -> Dict[str, Any]:
+    analyses = data.get("chat_analyses", [])
+    details = [a["analysis"] for a in analyses if isinstance(a.get("analysis"), dict)]
+    return {
+        "chat_count": len(analyses),
+        "total_messages": data.get("total_messages", 0),
+        "message_counts": {
+            a.get("chat_title", "Unknown"): a.get("message_count", 0) for a in analyses
+        },
+        "keyword_counts": dict(
+            Counter(data.get("overall_summary", {}).get("common_keywords", []))
+        ),
+        "sentiment_counts": dict(Counter(d.get("sentiment", "중립") for d in details)),
+        "confidence_histogram": histogram([a.get("confidence", 0) for a in analyses]),
+    }
+
+
+def _aggregate_ocr(data: Dict[str, Any]) -> Dict[str, Any]:
+    results = data.get("media_results", [])
+    ocr = [r.get("ocr_result", {}) for r in results]
+    confidences = [o.get("confidence", 0) for o in ocr]
+    positive = [c for c in confidences if isinstance(c, (int, float)) and c > 0]
+    engines = Counter(o.get("engine", "unknown") for o in ocr)
+    total = data.get("media_count", 0)
+    processed = data.get("processed_count", 0)
+    return {
+        "total_media": total,
+        "processed_media": processed,
+        "success_rate": processed / total * 100 if total > 0 else 0,
+        "engine_counts": dict(engines),
+        "engines_used": len(engines),
+        "most_used_engine": engines.most_common(1)[0][0] if engines else "N/A",
+        "avg_confidence": sum(positive) / len(positive) if positive else 0,
+        "confidence_histogram": histogram(confidences, bins=20),
+    }
+
+
+LOADERS: Dict[str, Callable[[Path], Any]] = {"workflow": _load_workflow}
+AGGREGATORS: Dict[str, Callable[[Any], Dict[str, Any]]] = {
+    "workflow": _aggregate_workflow,
+    "summaries": _aggregate_summaries,
+    "ai_analysis": _aggregate_ai_analysis,
+    "ocr": _aggregate_ocr,
+}
+
+
+class DashboardDataService:
+    """버전 키 캐시 + 사전 집계/Version-keyed JSON cache with precomputed aggregates."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._snapshots: Dict[Tuple[str, str], Snapshot] = {}
+        self._write_locks: Dict[str, threading.Lock] = {}
+        self.stats = {"hits": 0, "loads": 0, "commits": 0}
+
+    @staticmethod
+    def _version(path: Path, kind: str) -> Tuple[FileKey, ...]:
+        if kind == "workflow":
+            return file_key(path), file_key(workflow_change_log(path))
+        return (file_key(path),)
+
+    def get(self, path: str | Path, kind: str = "raw", default: Any = None) -> Snapshot:
+        """
+        파일 스냅샷 반환/Return the cached snapshot, reloading only on change.
+
+        파일이 없거나 읽을 수 없으면 default 데이터로 스냅샷을 만듭니다.
+        """
+        path = Path(path)
+        cache_key = (str(path), kind)
+        version = self._version(path, kind)
+
+        with self._lock:
+            cached = self._snapshots.get(cache_key)
+            if cached is not None and cached.version == version:
+                self.stats["hits"] += 1
+                return cached
+
+        if all(key is None for key in version):
+            data = default
+        else:
+            try:
+                data = LOADERS.get(kind, _load_json)(path)
+            except (OSError, ValueError) as exc:
+                logger.error("Failed to load dashboard data %s: %s", path, exc)
+                data = default
+
+        snapshot = self._snapshot(path, kind, data, version)
+        with self._lock:
+            self._snapshots[cache_key] = snapshot
+            self.stats["loads"] += 1
+        return snapshot
+
+    def load(self, path: str | Path, kind: str = "raw", default: Any = None) -> Any:
+        """데이터만 반환 (읽기 전용으로 취급)/Return cached data (treat as read-only)."""
+        return self.get(path, kind, default).data
+
+    def aggregates(self, path: str | Path, kind: str) -> Dict[str, Any]:
+        """사전 집계 반환/Return precomputed aggregates for a file."""
+        return self.get(path, kind).aggregates
+
+    @staticmethod
+    def _snapshot(path: Path, kind: str, data: Any, version: Tuple[FileKey, ...]) -> Snapshot:
+        aggregator = AGGREGATORS.get(kind)
+        aggregates: Dict[str, Any] = {}
+        if aggregator is not None and isinstance(data, dict):
+            try:
+                aggregates = aggregator(data)
+            except Exception as exc:  # 집계 실패가 화면 렌더링을 막지 않도록
+                logger.warning("Aggregation failed for %s (%s): %s", path, kind, exc)
+        return Snapshot(path=str(path), data=data, aggregates=aggregates, version=version)
+
+    def commit(self, path: str | Path, data: Any, kind: str = "raw") -> Snapshot:
+        """
+        writer 저장 + 캐시 갱신/Write atomically and refresh the cache in place.
+
+        다음 rerun은 파일을 다시 파싱하지 않고 갱신된 스냅샷을 사용합니다.
+        Streamlit 세션은 같은 프로세스의 스레드이므로 경로별 잠금으로 쓰기와
+        스냅샷 갱신을 직렬화합니다.
+        """
+        path = Path(path)
+        with self._lock:
+            write_lock = self._write_locks.setdefault(str(path), threading.Lock())
+
+        with write_lock:
+            atomic_write_json(path, data)
+
+            snapshot = self._snapshot(path, kind, data, self._version(path, kind))
+            with self._lock:
+                self._snapshots[(str(path), kind)] = snapshot
+                self.stats["commits"] += 1
+        return snapshot
+
+    def invalidate(self, path: Optional[str | Path] = None) -> None:
+        """캐시 비우기/Drop cached snapshots (all or for one path)."""
+        with self._lock:
+            if path is None:
+                self._snapshots.clear()
+                return
+            for key in [k for k in self._snapshots if k[0] == str(Path(path))]:
+                del self._snapshots[key]
+
+
+_SERVICE: Optional[DashboardDataService] = None
+_SERVICE_LOCK = threading.Lock()
+
+
+def get_dashboard_service() -> DashboardDataService:
+    """프로세스 공유 서비스 (Streamlit rerun 간 유지)/Process-wide service."""
+    global _SERVICE
+    with _SERVICE_LOCK:
+        if _SERVICE is None:
+            _SERVICE = DashboardDataService()
+        return _SERVICE
@@ -2,21 +2,49 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
-from typing import Any, Dict, Optional
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from dotenv import load_dotenv
 
 try:  # pragma: no cover - optional dependency import
     from apify_client import ApifyClient as LoadedApifyClient
+    from apify_client import ApifyClientAsync as LoadedApifyClientAsync
 except ImportError:  # pragma: no cover - optional dependency import
     LoadedApifyClient = None
+    LoadedApifyClientAsync = None
+
+TERMINAL_RUN_STATUSES = frozenset({"SUCCEEDED", "FAILED", "ABORTED", "TIMED-OUT"})
 
 
 logger = logging.getLogger(__name__)
 
 
+def _load_token(token_env: str) -> str:
+    """환경변수에서 토큰 로드 / Load Apify token from environment."""
+
+    load_dotenv()
+    token = os.getenv(token_env)
+    if not token:
+        raise ValueError(f"환경변수 {token_env}에 Apify 토큰이 설정되지 않았습니다")
+    return token
+
+
+def _as_dict(value: Any) -> Dict[str, Any]:
+    """클라이언트 응답 정규화 / Normalize client responses (dict or model)."""
+
+    if value is None:
+        return {}
+    if isinstance(value, dict):
+        return value
+    if hasattr(value, "model_dump"):
+        return value.model_dump(by_alias=True, mode="json")
+    return dict(value)
+
+
 def actor_call(
     actor_id: str,
     input_payload: Dict[str, Any],
@@ -26,10 +54,7 @@ def actor_call(
 ) -> Dict[str, Any]:
     """Apify 액터 호출 / Invoke Apify actor and return run metadata with dataset."""
 
-    load_dotenv()
-    token = os.getenv(token_env)
-    if not token:
-        raise ValueError(f"환경변수 {token_env}에 Apify 토큰이 설정되지 않았습니다")
+    token = _load_token(token_env)
 
     if LoadedApifyClient is None:
         raise ImportError(
@@ -54,3 +79,115 @@ def actor_call(
     logger.info("Apify actor %s completed with status %s", actor_id, run.get("status"))
 
     return {"run": run, "items": dataset_items}
+
+
+class ActorItemStream:
+    """
+    Apify 액터 결과 스트리밍 / Stream actor dataset items while the run progresses.
+
+    액터 실행을 시작만 하고(대기 없음) 상태를 비동기로 폴링하면서 기본
+    데이터셋을 offset/limit 페이지 단위로 읽습니다. 메모리에는 한 페이지만
+    유지되며, 액터가 끝나기 전부터 아이템을 반환합니다.
+
+    Example:
+        stream = ActorItemStream("user/actor", {"group_name": "HVDC"})
+        async for page in stream.pages():
+            store(page)
+        print(stream.run["status"], stream.items_read)
+    """
+
+    def __init__(
+        self,
+        actor_id: str,
+        input_payload: Dict[str, Any],
+        *,
+        token_env: str = "APIFY_TOKEN",
+        timeout_seconds: Optional[int] = None,
+        page_size: int = 1000,
+        poll_interval: float = 5.0,
+        client: Any = None,
+    ) -> None:
+        self.actor_id = actor_id
+        self.input_payload = input_payload
+        self.timeout_seconds = timeout_seconds
+        self.page_size = page_size
+        self.poll_interval = poll_interval
+        self.run: Dict[str, Any] = {}
+        self.items_read = 0
+
+        if client is None:
+            token = _load_token(token_env)
+            if LoadedApifyClientAsync is None:
+                raise ImportError(
+                    "apify-client 패키지가 필요합니다. 'pip install apify-client'로 설치하세요."
+                )
+            client = LoadedApifyClientAsync(token)
+        self._client = client
+
+    async def _start(self) -> None:
+        """액터 실행 시작 (완료 대기 없음) / Start the run without waiting."""
+
+        logger.info("Starting Apify actor %s", self.actor_id)
+        kwargs: Dict[str, Any] = {"run_input": self.input_payload}
+        if self.timeout_seconds:
+            kwargs["timeout_secs"] = self.timeout_seconds
+        self.run = _as_dict(await self._client.actor(self.actor_id).start(**kwargs))
+
+    async def _refresh_run(self) -> str:
+        """실행 상태 갱신 / Refresh run status."""
+
+        run = _as_dict(await self._client.run(self.run["id"]).get())
+        if run:
+            self.run = run
+        return str(self.run.get("status", ""))
+
+    async def _read_page(self, dataset_id: str) -> List[Dict[str, Any]]:
+        """데이터셋 한 페이지 조회 / Fetch one dataset page at the current offset."""
+
+        page = await self._client.dataset(dataset_id).list_items(
+            offset=self.items_read, limit=self.page_size
+        )
+        items = page.get("items", []) if isinstance(page, dict) else page.items
+        self.items_read += len(items)
+        return list(items)
+
+    async def pages(self) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        아이템 페이지 순회 / Iterate dataset pages until the run has finished.
+
+        Raises:
+            TimeoutError: timeout_seconds 내에 실행이 끝나지 않은 경우
+        """
+
+        await self._start()
+        dataset_id = self.run.get("defaultDatasetId")
+        deadline = (
+            time.monotonic() + self.timeout_seconds if self.timeout_seconds else None
+        )
+        finished = str(self.run.get("status", "")) in TERMINAL_RUN_STATUSES
+
+        while True:
+            page = await self._read_page(dataset_id) if dataset_id else []
+            if page:
+                yield page
+                if len(page) == self.page_size:
+                    continue  # 다음 페이지가 이미 준비되어 있을 수 있음
+
+            if finished:
+                break
+
+            if deadline is not None and time.monotonic() > deadline:
+                raise TimeoutError(
+                    f"Apify actor {self.actor_id} run {self.run.get('id')} timed out"
+                )
+
+            await asyncio.sleep(self.poll_interval)
+            # 종료 확인 후 한 번 더 읽어 마지막 페이지까지 수집
+            finished = await self._refresh_run() in TERMINAL_RUN_STATUSES
+
+        logger.info(
+            "Apify actor %s finished with status %s (%d items)",
+            self.actor_id,
+            self.run.get("status"),
+            self.items_read,
+        )
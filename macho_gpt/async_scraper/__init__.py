@@ -6,12 +6,14 @@ Samsung C&T Logistics · HVDC Project
 """
 
 from .async_scraper import AsyncGroupScraper
+from .baileys_consumer import BaileysEventConsumer, BaileysEventReplayer
 from .group_config import (
     AIIntegrationSettings,
     ApifyFallbackSettings,
     GroupConfig,
     ScraperSettings,
 )
+from .metrics import MetricsServer, ScraperMetrics
 from .multi_group_manager import MultiGroupManager
 
 __all__ = [
@@ -21,6 +23,10 @@ __all__ = [
     "AsyncGroupScraper",
     "MultiGroupManager",
     "ApifyFallbackSettings",
+    "BaileysEventConsumer",
+    "BaileysEventReplayer",
+    "ScraperMetrics",
+    "MetricsServer",
 ]
 
 __version__ = "1.0.0"
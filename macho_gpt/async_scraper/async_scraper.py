@@ -6,21 +6,94 @@ Playwright 기반 비동기 스크래핑 및 MACHO-GPT AI 통합
 import asyncio
 import json
 import logging
+import re
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from playwright.async_api import Browser, BrowserContext, Page, async_playwright
 
+from auth_state import get_auth_store, normalize_storage_state
+from resource_policy import ResourcePolicy
 from macho_gpt.integrations.apify_client import (
     ApifyDatasetClient,
     ApifyDatasetClientError,
+    ApifyDatasetWriter,
 )
+from macho_gpt.integrations.dataset_outbox import DatasetOutbox
 
 from .group_config import GroupConfig
+from .metrics import ScraperMetrics
 
 logger = logging.getLogger(__name__)
 
+WHATSAPP_URL = "https://web.whatsapp.com"
+CHAT_LIST_SELECTOR = '[data-testid="chat-list"]'
+BROWSER_ARGS = [
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-blink-features=AutomationControlled",
+    "--disable-web-security",
+    "--disable-features=VizDisplayCompositor",
+]
+MESSAGE_PANEL_SELECTOR = '[data-testid="conversation-panel-messages"]'
+PUSH_BINDING_NAME = "__machoOnMessages"
+CAPTURE_MODES = ("poll", "push")
+PUSH_RETRY_MAX_DELAY = 60.0  # observer 점검 실패 시 최대 대기 (초)
+
+# 대화 패널에 MutationObserver 설치: 추가된 메시지 노드만 추출하여 binding으로 전달
+MESSAGE_OBSERVER_JS = """
+(flushMs) => {
+  const PANEL = '[data-testid="conversation-panel-messages"]';
+  const ITEM = '[data-testid="msg-container"]';
+  const read = (root, sel) => {
+    const el = root.querySelector(sel);
+    return el && el.textContent ? el.textContent.trim() : null;
+  };
+  if (window.__machoObserver) window.__machoObserver.disconnect();
+  const panel = document.querySelector(PANEL);
+  if (!panel) return false;
+
+  let pending = [];
+  let timer = null;
+  const flush = () => {
+    timer = null;
+    const batch = pending;
+    pending = [];
+    if (batch.length) window.__machoOnMessages({observed_at: Date.now(), messages: batch});
+  };
+  const collect = (node) => {
+    if (node.nodeType !== 1) return;
+    const items = node.matches(ITEM) ? [node] : node.querySelectorAll(ITEM);
+    for (const item of items) {
+      const text = read(item, '[data-testid="msg-text"]');
+      if (!text) continue;
+      pending.push({
+        text,
+        sender: read(item, '[data-testid="msg-sender"]'),
+        timestamp: read(item, '[data-testid="msg-meta"]'),
+      });
+    }
+  };
+  const observer = new MutationObserver((mutations) => {
+    for (const mutation of mutations) mutation.addedNodes.forEach(collect);
+    if (pending.length && !timer) timer = setTimeout(flush, flushMs);
+  });
+  observer.observe(panel, {childList: true, subtree: true});
+  window.__machoObserver = observer;
+  window.__machoPanel = panel;
+  return true;
+}
+"""
+OBSERVER_ALIVE_JS = "() => !!(window.__machoPanel && window.__machoPanel.isConnected)"
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/120.0.0.0 Safari/537.36"
+)
+
 
 class AsyncGroupScraper:
     """
@@ -41,6 +114,15 @@ class AsyncGroupScraper:
         timeout: int = 30000,
         ai_integration: Optional[Dict[str, Any]] = None,
         storage_state_path: Optional[str] = "auth.json",
+        dataset_writer: Optional[ApifyDatasetWriter] = None,
+        dataset_outbox: Optional[DatasetOutbox] = None,
+        warm_start: bool = False,
+        resource_mode: str = "text",
+        capture_mode: str = "poll",
+        push_flush_ms: int = 50,
+        push_health_interval: float = 30.0,
+        metrics: Optional[ScraperMetrics] = None,
+        whatsapp_url: str = WHATSAPP_URL,
     ):
         """
         Args:
@@ -50,6 +132,15 @@ class AsyncGroupScraper:
             timeout: 타임아웃 (ms)
             ai_integration: AI 통합 설정
             storage_state_path: Playwright storage_state 파일 경로
+            dataset_writer: 공유 Apify Dataset writer (배치 전송)
+            dataset_outbox: 공유 디스크 outbox (지정 시 writer보다 우선)
+            warm_start: 그룹별 영구 프로필(HTTP 캐시·IndexedDB) 재사용 + 대기 페이지 유지
+            resource_mode: 리소스 차단 모드 ("text" | "media" | "full")
+            capture_mode: 메시지 수집 방식 ("poll": 주기적 전체 조회, "push": MutationObserver)
+            push_flush_ms: push 모드 페이지 내 배치 지연 (ms)
+            push_health_interval: push 모드 유휴 시 observer 점검 주기 (초)
+            metrics: 공유 지표 레지스트리 (MultiGroupManager가 그룹 간 공유)
+            whatsapp_url: 접속 URL (오프라인 벤치마크 fixture 서버 지정용)
         """
         self.group_config = group_config
         self.chrome_data_dir = chrome_data_dir
@@ -59,6 +150,19 @@ class AsyncGroupScraper:
         self.storage_state_path = (
             Path(storage_state_path) if storage_state_path else None
         )
+        self.dataset_writer = dataset_writer
+        self.dataset_outbox = dataset_outbox
+        if capture_mode not in CAPTURE_MODES:
+            raise ValueError(f"capture_mode must be one of {CAPTURE_MODES}: {capture_mode}")
+        self.warm_start = warm_start
+        self.capture_mode = capture_mode
+        self.push_flush_ms = push_flush_ms
+        self.push_health_interval = push_health_interval
+        self.whatsapp_url = whatsapp_url
+        # 웜 스타트는 HTTP 캐시 유지를 위해 CDP 차단, 그 외는 context.route
+        self.resource_policy = ResourcePolicy(
+            resource_mode, strategy="cdp" if warm_start else "route"
+        )
 
         # Playwright 객체들
         self.playwright = None
@@ -69,11 +173,24 @@ class AsyncGroupScraper:
         # 상태 관리
         self.is_running = False
         self.scraped_messages = set()  # 중복 방지용
+        self._standby_task: Optional[asyncio.Task[Page]] = None
+        self._push_queue: asyncio.Queue[Dict[str, Any]] = asyncio.Queue()
+        self._binding_exposed = False
+        self.push_stats = {"batches": 0, "messages": 0, "reinstalls": 0, "max_latency_ms": 0}
+        self.metrics = metrics if metrics is not None else ScraperMetrics()
+
+        # 웜 스타트 측정 (initialize 시작 기준, 초)
+        self._started_at: Optional[float] = None
+        self.timings: Dict[str, float] = {}
 
         logger.info(f"AsyncGroupScraper initialized for group: {group_config.name}")
 
     def _load_storage_state(self) -> Optional[Dict[str, Any]]:
-        """저장된 인증 상태 로드/Load persisted authentication state."""
+        """저장된 인증 상태 로드/Load persisted authentication state.
+
+        경로별 공유 AuthStateStore를 사용하므로 그룹이 여러 개여도 파일은
+        mtime이 바뀔 때만 다시 파싱됩니다.
+        """
         if not self.storage_state_path:
             return None
 
@@ -85,120 +202,150 @@ class AsyncGroupScraper:
             )
             return None
 
-        try:
-            raw_data = json.loads(self.storage_state_path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError as exc:
-            logger.error(
-                "Invalid JSON in storage state file %s: %s",
-                self.storage_state_path,
-                exc,
-            )
-            return None
+        return get_auth_store(self.storage_state_path).load()
 
-        normalized, needs_update = self._normalize_storage_state(raw_data)
-        if normalized is None:
-            logger.error(
-                "Unsupported storage state format for %s",
-                self.storage_state_path,
-            )
-            return None
+    @staticmethod
+    def _normalize_storage_state(
+        raw_data: Any,
+    ) -> tuple[Optional[Dict[str, Any]], bool]:
+        """스토리지 상태 포맷 정규화/Normalize storage_state payload."""
+        return normalize_storage_state(raw_data)
 
-        if needs_update:
-            try:
-                self.storage_state_path.write_text(
-                    json.dumps(normalized, ensure_ascii=False, indent=2),
-                    encoding="utf-8",
-                )
+    def _mark(self, name: str) -> None:
+        """단계별 경과 시간 기록/Record elapsed time for a startup stage."""
+        if self._started_at is not None and name not in self.timings:
+            self.timings[name] = round(time.perf_counter() - self._started_at, 3)
+            if name == "first_scrape":
                 logger.info(
-                    "Normalized storage state file for Playwright compatibility: %s",
-                    self.storage_state_path,
-                )
-            except OSError as exc:
-                logger.warning(
-                    "Failed to update storage state file %s: %s",
-                    self.storage_state_path,
-                    exc,
+                    "Time to first scrape for %s: %.2fs (%s)",
+                    self.group_config.name,
+                    self.timings[name],
+                    "warm" if self.warm_start else "cold",
                 )
 
-        return normalized
+    def _time(self, stage: str):
+        """그룹 단계 소요 시간 측정/Time a pipeline stage for this group."""
+        return self.metrics.time(self.group_config.name, stage)
 
     @staticmethod
-    def _normalize_storage_state(
-        raw_data: Any,
-    ) -> tuple[Optional[Dict[str, Any]], bool]:
-        """스토리지 상태 포맷 정규화/Normalize storage_state payload."""
-        needs_update = False
+    def _message_key(sender: Optional[str], text: str, timestamp: Optional[str]) -> str:
+        """poll/push 공통 중복 키 (공백 제거 값 기준)/Dedup key shared by both capture paths."""
+        sender = (sender or "").strip() or "Unknown"
+        timestamp = (timestamp or "").strip() or None
+        return f"{sender}_{text.strip()}_{timestamp}"
+
+    def _is_new_message(self, message_id: str) -> bool:
+        """중복 확인 + 적중률 집계/Dedup check that feeds the hit-rate counters."""
+        group = self.group_config.name
+        self.metrics.inc(group, "dedup_checks")
+        if message_id in self.scraped_messages:
+            self.metrics.inc(group, "dedup_hits")
+            return False
+        self.scraped_messages.add(message_id)
+        return True
 
-        if isinstance(raw_data, dict):
-            cookies = raw_data.get("cookies", [])
-            origins = raw_data.get("origins", [])
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        그룹 계측 요약/Per-stage timings, counters and dedup hit rate.
 
-            if isinstance(cookies, dict):
-                cookies = [cookies]
-                needs_update = True
+        Returns:
+            Dict: stages(단계별 count/avg/p95), messages_per_cycle, counters 등
+        """
+        return {
+            "group_name": self.group_config.name,
+            "capture_mode": self.capture_mode,
+            "timings": dict(self.timings),
+            "push_stats": dict(self.push_stats),
+            **self.metrics.group_stats(self.group_config.name),
+        }
 
-            if cookies is None:
-                cookies = []
-            elif not isinstance(cookies, list):
-                return None, False
+    def _profile_dir(self) -> Path:
+        """그룹별 영구 프로필 경로/Per-group persistent profile directory."""
+        slug = re.sub(r"[^0-9A-Za-z가-힣_-]+", "_", self.group_config.name).strip("_")
+        return Path(self.chrome_data_dir) / (slug or "default")
 
-            if origins is None:
-                origins = []
-                needs_update = True
-            elif not isinstance(origins, list):
-                origins = []
-                needs_update = True
+    async def _launch_persistent_context(
+        self, storage_state: Optional[Dict[str, Any]]
+    ) -> BrowserContext:
+        """영구 프로필 컨텍스트 실행/Launch a persistent-profile context.
 
-            return {"cookies": cookies, "origins": origins}, needs_update
+        HTTP 캐시와 IndexedDB가 프로필에 남으므로 두 번째 실행부터 앱 번들을
+        다시 받지 않습니다. 새 프로필이면 storage_state 쿠키로 시드합니다.
+        """
+        profile_dir = self._profile_dir()
+        is_new_profile = not profile_dir.exists()
+        profile_dir.mkdir(parents=True, exist_ok=True)
+
+        context = await self.playwright.chromium.launch_persistent_context(
+            user_data_dir=str(profile_dir),
+            headless=self.headless,
+            args=BROWSER_ARGS,
+            user_agent=USER_AGENT,
+            viewport={"width": 1920, "height": 1080},
+        )
+        if is_new_profile and storage_state and storage_state.get("cookies"):
+            await context.add_cookies(storage_state["cookies"])
+        return context
 
-        if isinstance(raw_data, list):
-            return {"cookies": raw_data, "origins": []}, True
+    async def _open_whatsapp_page(self) -> Page:
+        """WhatsApp 페이지 생성 및 이동/Open a page on WhatsApp Web.
 
-        return None, False
+        networkidle은 WhatsApp의 상시 연결 때문에 늦게 오거나 오지 않으므로
+        DOM 로드까지만 기다리고, 준비 여부는 채팅 목록 셀렉터로 판단합니다.
+        """
+        page = None
+        if self.warm_start:
+            # 영구 프로필은 기본 탭을 포함하므로 재사용
+            page = next((p for p in self.context.pages if not p.is_closed()), None)
+        if page is None:
+            page = await self.context.new_page()
+        await page.goto(self.whatsapp_url, wait_until="domcontentloaded")
+        return page
 
     async def initialize(self) -> None:
         """브라우저 및 컨텍스트 초기화"""
+        with self._time("init"):
+            await self._initialize()
+
+    async def _initialize(self) -> None:
+        self._started_at = time.perf_counter()
+        self.timings = {}
         try:
             self.playwright = await async_playwright().start()
 
-            # Chrome 브라우저 시작
-            self.browser = await self.playwright.chromium.launch(
-                headless=self.headless,
-                args=[
-                    "--no-sandbox",
-                    "--disable-dev-shm-usage",
-                    "--disable-blink-features=AutomationControlled",
-                    "--disable-web-security",
-                    "--disable-features=VizDisplayCompositor",
-                ],
-            )
-
-            # 브라우저 컨텍스트 생성 (storage_state 로딩)
+            # storage_state 로딩 (경로별 캐시)
             storage_state = self._load_storage_state()
-            context_kwargs: Dict[str, Any] = {
-                "user_agent": (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/120.0.0.0 Safari/537.36"
-                ),
-                "viewport": {"width": 1920, "height": 1080},
-            }
-
-            if storage_state is not None:
-                context_kwargs["storage_state"] = storage_state
-                logger.info(
-                    "Loaded storage state for group %s from %s",
-                    self.group_config.name,
-                    self.storage_state_path,
+
+            if self.warm_start:
+                self.context = await self._launch_persistent_context(storage_state)
+            else:
+                # Chrome 브라우저 시작
+                self.browser = await self.playwright.chromium.launch(
+                    headless=self.headless,
+                    args=BROWSER_ARGS,
                 )
 
-            self.context = await self.browser.new_context(**context_kwargs)
+                # 브라우저 컨텍스트 생성 (storage_state 로딩)
+                context_kwargs: Dict[str, Any] = {
+                    "user_agent": USER_AGENT,
+                    "viewport": {"width": 1920, "height": 1080},
+                }
+
+                if storage_state is not None:
+                    context_kwargs["storage_state"] = storage_state
+                    logger.info(
+                        "Loaded storage state for group %s from %s",
+                        self.group_config.name,
+                        self.storage_state_path,
+                    )
 
-            # 새 페이지 생성
-            self.page = await self.context.new_page()
+                self.context = await self.browser.new_context(**context_kwargs)
+            await self.resource_policy.apply(self.context)
+            self._mark("context_ready")
 
             # WhatsApp Web으로 이동
-            await self.page.goto("https://web.whatsapp.com", wait_until="networkidle")
+            self.page = await self._open_whatsapp_page()
+            self._mark("page_loaded")
 
             logger.info(f"Browser initialized for group: {self.group_config.name}")
 
@@ -208,6 +355,34 @@ class AsyncGroupScraper:
             )
             raise
 
+    async def _prepare_standby_page(self) -> Page:
+        """대기 페이지 준비/Prepare a standby page in the same context.
+
+        같은 프로필에서 WhatsApp 탭이 두 개 열리면 나중 탭이 세션을 가져가므로
+        대기 페이지는 렌더러만 띄워 두고, 교체 시점에 이동합니다.
+        """
+        return await self.context.new_page()
+
+    async def _swap_to_standby(self) -> bool:
+        """죽은 활성 페이지를 대기 페이지로 교체/Swap in the standby page."""
+        if self._standby_task is None:
+            return False
+
+        task, self._standby_task = self._standby_task, None
+        try:
+            page = await task
+        except Exception as exc:
+            logger.warning(f"Standby page unavailable for {self.group_config.name}: {exc}")
+            return False
+
+        self.metrics.inc(self.group_config.name, "browser_restarts")
+        await page.goto(self.whatsapp_url, wait_until="domcontentloaded")
+        await page.wait_for_selector(CHAT_LIST_SELECTOR, timeout=self.timeout)
+        self.page = page
+        logger.info(f"Swapped to standby page for group: {self.group_config.name}")
+        self._standby_task = asyncio.create_task(self._prepare_standby_page())
+        return await self.find_and_click_group()
+
     async def wait_for_whatsapp_login(self, timeout: int = 120) -> bool:
         """
         WhatsApp 로그인 대기
@@ -220,9 +395,11 @@ class AsyncGroupScraper:
         """
         try:
             # QR 코드 또는 채팅 목록이 나타날 때까지 대기
-            await self.page.wait_for_selector(
-                '[data-testid="chat-list"]', timeout=timeout * 1000
-            )
+            with self._time("login"):
+                await self.page.wait_for_selector(
+                    CHAT_LIST_SELECTOR, timeout=timeout * 1000
+                )
+            self._mark("chat_list_ready")
 
             logger.info(
                 f"WhatsApp login successful for group: {self.group_config.name}"
@@ -240,6 +417,10 @@ class AsyncGroupScraper:
         Returns:
             bool: 그룹 찾기 성공 여부
         """
+        with self._time("find_group"):
+            return await self._find_and_click_group()
+
+    async def _find_and_click_group(self) -> bool:
         try:
             # 그룹 검색
             search_box = await self.page.wait_for_selector(
@@ -272,6 +453,10 @@ class AsyncGroupScraper:
         Returns:
             List[Dict]: 스크래핑된 메시지 리스트
         """
+        with self._time("extract"):
+            return await self._scrape_messages()
+
+    async def _scrape_messages(self) -> List[Dict[str, Any]]:
         try:
             # 메시지 컨테이너 대기
             await self.page.wait_for_selector(
@@ -322,10 +507,9 @@ class AsyncGroupScraper:
                             }
 
                             # 중복 체크
-                            message_id = f"{sender}_{text}_{timestamp}"
-                            if message_id not in self.scraped_messages:
+                            message_id = self._message_key(sender, text, timestamp)
+                            if self._is_new_message(message_id):
                                 messages.append(message_data)
-                                self.scraped_messages.add(message_id)
 
                 except Exception as e:
                     logger.warning(f"Failed to extract message: {e}")
@@ -348,6 +532,16 @@ class AsyncGroupScraper:
         if not dataset_id:
             return
 
+        if self.dataset_outbox is not None:
+            # 디스크 outbox에 기록만 → OutboxDrainer가 별도 전송
+            self.dataset_outbox.append(dataset_id, messages)
+            return
+
+        if self.dataset_writer is not None:
+            # 공유 writer 버퍼에 추가 → 백그라운드 배치 전송
+            self.dataset_writer.enqueue(dataset_id, messages)
+            return
+
         try:
             client = ApifyDatasetClient()
         except ValueError as exc:
@@ -394,28 +588,30 @@ class AsyncGroupScraper:
             return
 
         try:
-            # 기존 메시지 로드
-            save_path = Path(self.group_config.save_file)
-            existing_messages = []
+            with self._time("save"):
+                # 기존 메시지 로드
+                save_path = Path(self.group_config.save_file)
+                existing_messages = []
 
-            if save_path.exists():
-                with open(save_path, "r", encoding="utf-8") as f:
-                    existing_messages = json.load(f)
+                if save_path.exists():
+                    with open(save_path, "r", encoding="utf-8") as f:
+                        existing_messages = json.load(f)
 
-            # 새 메시지 추가
-            existing_messages.extend(messages)
+                # 새 메시지 추가
+                existing_messages.extend(messages)
 
-            # 파일 저장
-            save_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(save_path, "w", encoding="utf-8") as f:
-                json.dump(existing_messages, f, ensure_ascii=False, indent=2)
+                # 파일 저장
+                save_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(save_path, "w", encoding="utf-8") as f:
+                    json.dump(existing_messages, f, ensure_ascii=False, indent=2)
 
             logger.info(
                 f"Saved {len(messages)} messages to {self.group_config.save_file}"
             )
 
             # Apify Dataset에 푸시 추가
-            await self._push_messages_to_dataset(messages)
+            with self._time("push"):
+                await self._push_messages_to_dataset(messages)
 
         except Exception as e:
             logger.error(f"Failed to save messages: {e}")
@@ -462,14 +658,34 @@ class AsyncGroupScraper:
 
         return None
 
-    async def run_scraping_cycle(self) -> Dict[str, Any]:
-        """
-        단일 스크래핑 사이클 실행
+    async def _process_messages(
+        self, messages: List[Dict[str, Any]], result: Dict[str, Any]
+    ) -> None:
+        """저장 + AI 요약 파이프라인/Save and summarize captured messages."""
+        self.metrics.observe_messages(self.group_config.name, len(messages))
+        if messages:
+            # 메시지 저장
+            await self.save_messages(messages)
+
+            # AI 요약 (설정된 경우)
+            if self.ai_integration.get("summarize_on_extraction", False):
+                with self._time("ai"):
+                    ai_summary = await self.integrate_with_ai_summarizer(messages)
+                result["ai_summary"] = ai_summary
 
-        Returns:
-            Dict: 실행 결과
-        """
-        result = {
+            result["messages_scraped"] = len(messages)
+            result["success"] = True
+
+            logger.info(
+                f"Scraping cycle completed for {self.group_config.name}: {len(messages)} messages"
+            )
+        else:
+            logger.info(f"No new messages found for {self.group_config.name}")
+            result["success"] = True  # 새 메시지가 없는 것도 성공
+        self._mark("first_scrape")
+
+    def _new_cycle_result(self) -> Dict[str, Any]:
+        return {
             "group_name": self.group_config.name,
             "success": False,
             "messages_scraped": 0,
@@ -477,34 +693,116 @@ class AsyncGroupScraper:
             "error": None,
         }
 
+    async def run_scraping_cycle(self) -> Dict[str, Any]:
+        """
+        단일 스크래핑 사이클 실행
+
+        Returns:
+            Dict: 실행 결과
+        """
+        result = self._new_cycle_result()
+
         try:
             # 메시지 스크래핑
             messages = await self.scrape_messages()
+            await self._process_messages(messages, result)
+
+        except Exception as e:
+            logger.error(f"Scraping cycle failed for {self.group_config.name}: {e}")
+            result["error"] = str(e)
 
-            if messages:
-                # 메시지 저장
-                await self.save_messages(messages)
+        return result
 
-                # AI 요약 (설정된 경우)
-                if self.ai_integration.get("summarize_on_extraction", False):
-                    ai_summary = await self.integrate_with_ai_summarizer(messages)
-                    result["ai_summary"] = ai_summary
+    def _on_pushed_messages(self, source: Any, payload: Dict[str, Any]) -> None:
+        """페이지 binding 콜백 → 큐 적재/Binding callback feeding the asyncio queue."""
+        self._push_queue.put_nowait(payload)
+
+    async def _install_observer(self) -> bool:
+        """MutationObserver 설치 (binding은 컨텍스트당 1회)/Install the panel observer."""
+        if not self._binding_exposed:
+            await self.context.expose_binding(PUSH_BINDING_NAME, self._on_pushed_messages)
+            self._binding_exposed = True
+        installed = bool(await self.page.evaluate(MESSAGE_OBSERVER_JS, self.push_flush_ms))
+        if not installed:
+            logger.warning(f"Message panel not found for observer: {self.group_config.name}")
+        return installed
+
+    async def _ensure_observer(self) -> None:
+        """유휴 시 observer 상태 점검 및 재설치/Reinstall the observer if detached."""
+        if self.page.is_closed() and not await self._swap_to_standby():
+            raise RuntimeError("Active page closed and no standby available")
+        if not await self.page.evaluate(OBSERVER_ALIVE_JS):
+            self.push_stats["reinstalls"] += 1
+            await self._install_observer()
+
+    def _collect_pushed(self, payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """push 배치 정규화 + 중복 제거/Normalize and dedupe a pushed batch."""
+        latency_ms = max(0, int(time.time() * 1000) - int(payload.get("observed_at", 0)))
+        self.push_stats["batches"] += 1
+        self.push_stats["max_latency_ms"] = max(self.push_stats["max_latency_ms"], latency_ms)
+
+        messages = []
+        for raw in payload.get("messages", []):
+            text = (raw.get("text") or "").strip()
+            if not text:
+                continue
+            sender = (raw.get("sender") or "Unknown").strip()
+            timestamp = (raw.get("timestamp") or "").strip() or None
+
+            message_id = self._message_key(sender, text, timestamp)
+            if not self._is_new_message(message_id):
+                continue
+            messages.append(
+                {
+                    "text": text,
+                    "sender": sender,
+                    "timestamp": timestamp,
+                    "scraped_at": datetime.now().isoformat(),
+                    "group_name": self.group_config.name,
+                }
+            )
+        self.push_stats["messages"] += len(messages)
+        return messages
 
-                result["messages_scraped"] = len(messages)
-                result["success"] = True
+    async def run_push_loop(self) -> None:
+        """
+        push 모드 수집 루프/Event-driven capture loop.
 
-                logger.info(
-                    f"Scraping cycle completed for {self.group_config.name}: {len(messages)} messages"
+        기존 메시지를 한 번 읽은 뒤에는 observer가 보낸 배치만 처리하므로 유휴
+        그룹은 push_health_interval마다 observer 점검 외에 비용이 없습니다.
+        """
+        await self.run_scraping_cycle()
+        await self._install_observer()
+
+        failures = 0
+        while self.is_running:
+            try:
+                payload = await asyncio.wait_for(
+                    self._push_queue.get(), timeout=self.push_health_interval
                 )
-            else:
-                logger.info(f"No new messages found for {self.group_config.name}")
-                result["success"] = True  # 새 메시지가 없는 것도 성공
+            except asyncio.TimeoutError:
+                try:
+                    await self._ensure_observer()
+                    failures = 0
+                except Exception as e:
+                    failures += 1
+                    delay = min(self.push_health_interval * 2**failures, PUSH_RETRY_MAX_DELAY)
+                    logger.error(
+                        f"Observer check failed for {self.group_config.name} "
+                        f"(attempt {failures}, retry in {delay:.1f}s): {e}"
+                    )
+                    await asyncio.sleep(delay)
+                continue
 
-        except Exception as e:
-            logger.error(f"Scraping cycle failed for {self.group_config.name}: {e}")
-            result["error"] = str(e)
+            messages = self._collect_pushed(payload)
+            while not self._push_queue.empty():
+                messages.extend(self._collect_pushed(self._push_queue.get_nowait()))
 
-        return result
+            result = self._new_cycle_result()
+            try:
+                await self._process_messages(messages, result)
+            except Exception as e:
+                logger.error(f"Push processing failed for {self.group_config.name}: {e}")
 
     async def run(self) -> None:
         """
@@ -532,7 +830,8 @@ class AsyncGroupScraper:
                     )
                     await asyncio.sleep(5)
                     if self.page:
-                        await self.page.reload(wait_until="networkidle")
+                        self.metrics.inc(self.group_config.name, "browser_restarts")
+                        await self.page.reload(wait_until="domcontentloaded")
 
             if not login_success:
                 logger.error(
@@ -545,9 +844,24 @@ class AsyncGroupScraper:
                 logger.error(f"Failed to find group {self.group_config.name}")
                 return
 
+            if self.warm_start:
+                # 활성 페이지 장애 시 즉시 교체할 대기 페이지
+                self._standby_task = asyncio.create_task(self._prepare_standby_page())
+
+            if self.capture_mode == "push":
+                # 이벤트 기반 수집 (폴링 없음)
+                await self.run_push_loop()
+                return
+
             # 스크래핑 루프
             while self.is_running:
                 try:
+                    if self.page.is_closed() and not await self._swap_to_standby():
+                        logger.error(
+                            f"Active page closed and no standby for {self.group_config.name}"
+                        )
+                        break
+
                     result = await self.run_scraping_cycle()
 
                     if result["error"]:
@@ -576,6 +890,9 @@ class AsyncGroupScraper:
     async def close(self) -> None:
         """리소스 정리"""
         try:
+            if self._standby_task:
+                self._standby_task.cancel()
+                self._standby_task = None
             if self.page:
                 await self.page.close()
             if self.context:
@@ -586,6 +903,12 @@ class AsyncGroupScraper:
                 await self.playwright.stop()
 
             self.is_running = False
+            if self.resource_policy.enabled:
+                logger.info(
+                    "Resource policy for %s: %s",
+                    self.group_config.name,
+                    self.resource_policy.report(),
+                )
             logger.info(f"Scraper closed for group: {self.group_config.name}")
 
         except Exception as e:
@@ -0,0 +1,278 @@
+"""
+Baileys 이벤트 스트림 소비자
+Node Baileys 프로세스(apify_actor)가 내보내는 NDJSON 이벤트를 브라우저 없이 수집
+
+각 줄은 {"event": "wa.message", "data": {groupId, messageId, from, ts, text, hasMedia}}
+형식이며, AsyncGroupScraper와 동일한 메시지 스키마로 변환되어 같은 저장소
+(save_file JSON + Dataset outbox + AI 요약)에 기록됩니다.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from .async_scraper import AsyncGroupScraper
+from .group_config import GroupConfig
+from .metrics import ScraperMetrics
+
+logger = logging.getLogger(__name__)
+
+MESSAGE_EVENT = "wa.message"
+
+
+def map_baileys_message(data: Dict[str, Any], group_name: str) -> Optional[Dict[str, Any]]:
+    """
+    Baileys 페이로드 → 스크래퍼 메시지 스키마 변환
+
+    Args:
+        data: Node 측 onMessage 페이로드
+        group_name: 대상 그룹 이름
+
+    Returns:
+        Optional[Dict]: 변환된 메시지 (본문이 없으면 None)
+    """
+    text = (data.get("text") or "").strip()
+    if not text:
+        return None
+
+    timestamp = None
+    ts = data.get("ts")
+    if isinstance(ts, (int, float)):
+        timestamp = datetime.fromtimestamp(ts).isoformat()
+
+    return {
+        "text": text,
+        "sender": data.get("from") or "Unknown",
+        "timestamp": timestamp,
+        "scraped_at": datetime.now().isoformat(),
+        "group_name": group_name,
+        "message_id": data.get("messageId"),
+        "has_media": bool(data.get("hasMedia", False)),
+        "source": "baileys",
+    }
+
+
+class BaileysEventConsumer:
+    """
+    NDJSON 이벤트 소비자/Ingest Baileys message events into group stores.
+
+    그룹별 AsyncGroupScraper를 브라우저 없이 저장 파이프라인으로만 사용합니다.
+    save_file은 호출마다 다시 기록되므로 메시지를 flush_interval 동안 모아
+    그룹당 한 번에 저장합니다.
+    """
+
+    def __init__(
+        self,
+        groups: Iterable[GroupConfig],
+        ai_integration: Optional[Dict[str, Any]] = None,
+        dataset_writer: Any = None,
+        dataset_outbox: Any = None,
+        flush_interval: float = 1.0,
+        max_batch: int = 200,
+        dedup_size: int = 10_000,
+        metrics: Optional[ScraperMetrics] = None,
+    ):
+        self.metrics = metrics if metrics is not None else ScraperMetrics()
+        self.sinks: Dict[str, AsyncGroupScraper] = {}
+        for group in groups:
+            if not group.group_jid:
+                logger.warning(f"Group {group.name} has no group_jid; Baileys events skipped")
+                continue
+            self.sinks[group.group_jid] = AsyncGroupScraper(
+                group_config=group,
+                ai_integration=ai_integration,
+                dataset_writer=dataset_writer,
+                dataset_outbox=dataset_outbox,
+                metrics=self.metrics,
+            )
+
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self.dedup_size = dedup_size
+        self._pending: Dict[str, List[Dict[str, Any]]] = {}
+        self._seen: "OrderedDict[str, None]" = OrderedDict()
+        self._last_flush = time.monotonic()
+        self.stats = {
+            "lines": 0,
+            "messages": 0,
+            "saved": 0,
+            "invalid": 0,
+            "duplicates": 0,
+            "unknown_group": 0,
+            "ignored_events": 0,
+        }
+
+    def _is_duplicate(self, message_id: Optional[str]) -> bool:
+        """재연결 시 재전송된 메시지 제거 (LRU)/Drop redelivered message ids."""
+        if not message_id:
+            return False
+        if message_id in self._seen:
+            return True
+        self._seen[message_id] = None
+        if len(self._seen) > self.dedup_size:
+            self._seen.popitem(last=False)
+        return False
+
+    def handle_line(self, line: str) -> bool:
+        """
+        NDJSON 한 줄 처리 (메모리 적재만)
+
+        Returns:
+            bool: 메시지가 대기열에 추가되었는지 여부
+        """
+        line = line.strip()
+        if not line:
+            return False
+        self.stats["lines"] += 1
+
+        try:
+            event = json.loads(line)
+        except json.JSONDecodeError:
+            self.stats["invalid"] += 1
+            return False
+
+        if not isinstance(event, dict) or event.get("event") != MESSAGE_EVENT:
+            self.stats["ignored_events"] += 1
+            return False
+
+        data = event.get("data") or {}
+        sink = self.sinks.get(data.get("groupId"))
+        if sink is None:
+            self.stats["unknown_group"] += 1
+            return False
+
+        group_name = sink.group_config.name
+        self.metrics.inc(group_name, "dedup_checks")
+        if self._is_duplicate(data.get("messageId")):
+            self.stats["duplicates"] += 1
+            self.metrics.inc(group_name, "dedup_hits")
+            return False
+
+        message = map_baileys_message(data, group_name)
+        if message is None:
+            return False
+
+        self.stats["messages"] += 1
+        self._pending.setdefault(data["groupId"], []).append(message)
+        return True
+
+    def _flush_due(self) -> bool:
+        if any(len(batch) >= self.max_batch for batch in self._pending.values()):
+            return True
+        return bool(self._pending) and (
+            time.monotonic() - self._last_flush >= self.flush_interval
+        )
+
+    async def flush(self) -> int:
+        """대기 메시지를 그룹별로 저장/Persist pending messages per group."""
+        pending, self._pending = self._pending, {}
+        self._last_flush = time.monotonic()
+
+        saved = 0
+        for group_jid, messages in pending.items():
+            sink = self.sinks[group_jid]
+            result = sink._new_cycle_result()
+            try:
+                await sink._process_messages(messages, result)
+                saved += len(messages)
+            except Exception as e:
+                logger.error(f"Failed to store Baileys messages for {sink.group_config.name}: {e}")
+        self.stats["saved"] += saved
+        return saved
+
+    async def consume(self, reader: asyncio.StreamReader) -> None:
+        """
+        스트림 EOF까지 소비/Consume an NDJSON stream until EOF.
+
+        Args:
+            reader: 소켓·파이프·서브프로세스 stdout의 StreamReader
+        """
+        try:
+            while True:
+                try:
+                    line = await asyncio.wait_for(reader.readline(), timeout=self.flush_interval)
+                except asyncio.TimeoutError:
+                    if self._pending:
+                        await self.flush()
+                    continue
+
+                if not line:
+                    break
+                self.handle_line(line.decode("utf-8", errors="replace"))
+                if self._flush_due():
+                    await self.flush()
+        finally:
+            if self._pending:
+                await self.flush()
+
+    async def serve_unix(self, path: str) -> asyncio.AbstractServer:
+        """유닉스 소켓 서버 (Node NDJSON_SOCKET 대상)/Listen on a unix socket."""
+        Path(path).unlink(missing_ok=True)
+        return await asyncio.start_unix_server(
+            lambda reader, writer: self._serve_connection(reader, writer), path=path
+        )
+
+    async def serve_tcp(self, host: str = "127.0.0.1", port: int = 8765) -> asyncio.AbstractServer:
+        """로컬 TCP 서버/Listen on a local TCP port."""
+        return await asyncio.start_server(
+            lambda reader, writer: self._serve_connection(reader, writer), host, port
+        )
+
+    async def _serve_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        logger.info("Baileys event stream connected")
+        try:
+            await self.consume(reader)
+        finally:
+            writer.close()
+            logger.info(f"Baileys event stream closed: {self.stats}")
+
+
+class BaileysEventReplayer:
+    """
+    녹화된 NDJSON 이벤트 재생기/Replay a recorded event file into a StreamReader.
+
+    speed=0이면 지연 없이 재생하고, 그 외에는 이벤트 ts 간격을 speed배로
+    압축하여 실제 도착 간격을 재현합니다.
+    """
+
+    def __init__(self, path: str, speed: float = 0.0):
+        self.path = Path(path)
+        self.speed = speed
+
+    async def feed(self, reader: asyncio.StreamReader) -> int:
+        """파일 내용을 reader에 공급 후 EOF 전달/Feed lines, then EOF."""
+        count = 0
+        previous_ts = None
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                if self.speed > 0:
+                    ts = self._event_ts(line)
+                    if ts is not None and previous_ts is not None and ts > previous_ts:
+                        await asyncio.sleep((ts - previous_ts) / self.speed)
+                    previous_ts = ts if ts is not None else previous_ts
+                reader.feed_data(line.encode("utf-8"))
+                count += 1
+                await asyncio.sleep(0)
+        reader.feed_eof()
+        return count
+
+    @staticmethod
+    def _event_ts(line: str) -> Optional[float]:
+        try:
+            ts = json.loads(line).get("data", {}).get("ts")
+        except (json.JSONDecodeError, AttributeError):
+            return None
+        return float(ts) if isinstance(ts, (int, float)) else None
+
+    async def replay(self, consumer: BaileysEventConsumer) -> Dict[str, int]:
+        """소비자에 재생 후 통계 반환/Replay into a consumer and return its stats."""
+        reader = asyncio.StreamReader()
+        await asyncio.gather(self.feed(reader), consumer.consume(reader))
+        return dict(consumer.stats)
@@ -19,6 +19,7 @@ class GroupConfig:
     scrape_interval: int = 60
     priority: str = "MEDIUM"
     apify_dataset_id: Optional[str] = None
+    group_jid: Optional[str] = None  # Baileys 이벤트 매핑용 그룹 JID (예: 1203...@g.us)
 
     def __post_init__(self) -> None:
         """설정 유효성 검증 / Validate core group configuration."""
@@ -43,6 +44,11 @@ class ScraperSettings:
     timeout: int = 30000
     max_parallel_groups: int = 5
     auth_state_path: Optional[str] = "auth.json"
+    dataset_outbox_dir: Optional[str] = "data/dataset_outbox"
+    warm_start: bool = False
+    resource_mode: str = "text"
+    capture_mode: str = "poll"
+    metrics_port: Optional[int] = None
 
     def __post_init__(self) -> None:
         """설정 유효성 검증 / Validate scraper settings."""
@@ -57,6 +63,22 @@ class ScraperSettings:
         if self.auth_state_path is not None and not str(self.auth_state_path).strip():
             raise ValueError("auth_state_path는 비워둘 수 없습니다")
 
+        if self.dataset_outbox_dir is not None and not str(self.dataset_outbox_dir).strip():
+            raise ValueError("dataset_outbox_dir는 비워둘 수 없습니다")
+
+        if self.resource_mode not in ("text", "media", "full"):
+            raise ValueError(
+                f"resource_mode는 text/media/full 중 하나여야 합니다: {self.resource_mode}"
+            )
+
+        if self.capture_mode not in ("poll", "push"):
+            raise ValueError(
+                f"capture_mode는 poll/push 중 하나여야 합니다: {self.capture_mode}"
+            )
+
+        if self.metrics_port is not None and not 0 <= self.metrics_port <= 65535:
+            raise ValueError(f"metrics_port는 0~65535 사이여야 합니다: {self.metrics_port}")
+
     def dict(self) -> Dict[str, Any]:
         """dataclass 딕셔너리 변환 / Return settings as dictionary."""
 
@@ -154,6 +176,7 @@ class MultiGroupConfig:
                 scrape_interval=group_data.get("scrape_interval", 60),
                 priority=group_data.get("priority", "MEDIUM"),
                 apify_dataset_id=group_data.get("apify_dataset_id"),
+                group_jid=group_data.get("group_jid"),
             )
             groups.append(group)
 
@@ -168,6 +191,13 @@ class MultiGroupConfig:
             timeout=scraper_data.get("timeout", 30000),
             max_parallel_groups=scraper_data.get("max_parallel_groups", 5),
             auth_state_path=scraper_data.get("auth_state_path", "auth.json"),
+            dataset_outbox_dir=scraper_data.get(
+                "dataset_outbox_dir", "data/dataset_outbox"
+            ),
+            warm_start=scraper_data.get("warm_start", False),
+            resource_mode=scraper_data.get("resource_mode", "text"),
+            capture_mode=scraper_data.get("capture_mode", "poll"),
+            metrics_port=scraper_data.get("metrics_port"),
         )
 
         # AI 통합 설정 파싱
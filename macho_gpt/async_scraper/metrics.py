@@ -0,0 +1,257 @@
+"""
+스크래퍼 계측 (단계별 소요 시간 히스토그램 + OpenMetrics 노출)
+AsyncGroupScraper/MultiGroupManager가 공유하는 그룹·단계별 지표 레지스트리
+
+단계(stage): init, login, find_group, extract, save, push, ai
+카운터: dedup_checks, dedup_hits, browser_restarts, fallback_attempts, fallback_used
+
+외부 의존성 없이 OpenMetrics 텍스트 형식을 직접 생성하며, MetricsServer가
+로컬 HTTP 엔드포인트(GET /metrics)로 노출합니다.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+METRIC_PREFIX = "macho_scraper"
+STAGES = ("init", "login", "find_group", "extract", "save", "push", "ai")
+COUNTERS = (
+    "dedup_checks",
+    "dedup_hits",
+    "browser_restarts",
+    "fallback_attempts",
+    "fallback_used",
+)
+# 초 단위 - 브라우저 기동(수십 초)부터 파일 저장(ms)까지
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+MESSAGE_BUCKETS = (0, 1, 5, 10, 25, 50, 100, 250, 500, 1000)
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+
+class Histogram:
+    """고정 버킷 히스토그램/Fixed-bucket histogram (cumulative on export)."""
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # 마지막은 +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+        self.counts[index] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """(le, 누적 건수) 목록/Cumulative bucket counts including +Inf."""
+        total = 0
+        result = []
+        for bound, count in zip(self.buckets + (math.inf,), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def quantile(self, q: float) -> Optional[float]:
+        """버킷 상한 기준 분위수 추정/Upper-bound quantile estimate."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        for bound, total in self.cumulative():
+            if total >= rank:
+                return self.max if math.isinf(bound) else min(bound, self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "avg": round(self.sum / self.count, 6) if self.count else 0.0,
+            "max": round(self.max, 6),
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+        }
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: Any) -> str:
+    inner = ",".join(f'{key}="{_escape(str(value))}"' for key, value in labels.items())
+    return "{" + inner + "}"
+
+
+def _number(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class ScraperMetrics:
+    """
+    그룹·단계별 지표 레지스트리/Per-group, per-stage scraper metrics.
+
+    한 이벤트 루프에서만 갱신된다고 가정합니다 (스크래퍼·매니저 공통).
+    """
+
+    def __init__(self) -> None:
+        self.stage_durations: Dict[Tuple[str, str], Histogram] = {}
+        self.messages_per_cycle: Dict[str, Histogram] = {}
+        self.counters: Dict[Tuple[str, str], int] = {}
+
+    def observe_stage(self, group: str, stage: str, seconds: float) -> None:
+        histogram = self.stage_durations.get((group, stage))
+        if histogram is None:
+            histogram = self.stage_durations[(group, stage)] = Histogram(DURATION_BUCKETS)
+        histogram.observe(seconds)
+
+    @contextmanager
+    def time(self, group: str, stage: str) -> Iterator[None]:
+        """단계 소요 시간 측정 (예외 시에도 기록)/Time a stage, including failures."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe_stage(group, stage, time.perf_counter() - started)
+
+    def observe_messages(self, group: str, count: int) -> None:
+        histogram = self.messages_per_cycle.get(group)
+        if histogram is None:
+            histogram = self.messages_per_cycle[group] = Histogram(MESSAGE_BUCKETS)
+        histogram.observe(count)
+
+    def inc(self, group: str, name: str, amount: int = 1) -> None:
+        self.counters[(group, name)] = self.counters.get((group, name), 0) + amount
+
+    def groups(self) -> List[str]:
+        names = {group for group, _ in self.stage_durations}
+        names.update(self.messages_per_cycle)
+        names.update(group for group, _ in self.counters)
+        return sorted(names)
+
+    def group_stats(self, group: str) -> Dict[str, Any]:
+        """그룹 요약/Summary for one group (used by get_stats)."""
+        counters = {name: self.counters.get((group, name), 0) for name in COUNTERS}
+        checks = counters["dedup_checks"]
+        messages = self.messages_per_cycle.get(group)
+        return {
+            "stages": {
+                stage: histogram.summary()
+                for (name, stage), histogram in sorted(self.stage_durations.items())
+                if name == group
+            },
+            "messages_per_cycle": messages.summary() if messages else Histogram(MESSAGE_BUCKETS).summary(),
+            "counters": counters,
+            "dedup_hit_rate": round(counters["dedup_hits"] / checks, 4) if checks else 0.0,
+        }
+
+    def slowest_stages(self, limit: int = 5) -> List[Dict[str, Any]]:
+        """평균 소요 시간 상위 (그룹, 단계)/Slowest group stages by average."""
+        ranked = sorted(
+            (
+                {"group": group, "stage": stage, **histogram.summary()}
+                for (group, stage), histogram in self.stage_durations.items()
+            ),
+            key=lambda item: item["avg"],
+            reverse=True,
+        )
+        return ranked[:limit]
+
+    def render_openmetrics(self) -> str:
+        """OpenMetrics 텍스트 노출 형식/Render the OpenMetrics text exposition."""
+        lines: List[str] = []
+
+        def histogram_family(name: str, unit: Optional[str], help_text: str, items) -> None:
+            lines.append(f"# TYPE {name} histogram")
+            if unit:
+                lines.append(f"# UNIT {name} {unit}")
+            lines.append(f"# HELP {name} {help_text}")
+            for labels, histogram in items:
+                for bound, total in histogram.cumulative():
+                    lines.append(f"{name}_bucket{_labels(**labels, le=_number(float(bound)))} {total}")
+                lines.append(f"{name}_count{_labels(**labels)} {histogram.count}")
+                lines.append(f"{name}_sum{_labels(**labels)} {_number(histogram.sum)}")
+
+        histogram_family(
+            f"{METRIC_PREFIX}_stage_duration_seconds",
+            "seconds",
+            "Scraper stage duration by group.",
+            (
+                ({"group": group, "stage": stage}, histogram)
+                for (group, stage), histogram in sorted(self.stage_durations.items())
+            ),
+        )
+        histogram_family(
+            f"{METRIC_PREFIX}_messages_per_cycle",
+            None,
+            "New messages per scraping cycle.",
+            (({"group": group}, h) for group, h in sorted(self.messages_per_cycle.items())),
+        )
+        for counter in COUNTERS:
+            name = f"{METRIC_PREFIX}_{counter}"
+            lines.append(f"# TYPE {name} counter")
+            for (group, counter_name), value in sorted(self.counters.items()):
+                if counter_name == counter:
+                    lines.append(f"{name}_total{_labels(group=group)} {value}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+class MetricsServer:
+    """
+    로컬 OpenMetrics 엔드포인트/Minimal asyncio HTTP server for GET /metrics.
+
+    Prometheus 스크레이프 전용이므로 keep-alive 없이 요청마다 응답 후 닫습니다.
+    """
+
+    def __init__(self, metrics: ScraperMetrics, host: str = "127.0.0.1", port: int = 9464):
+        self.metrics = metrics
+        self.host = host
+        self.port = port
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> int:
+        """서버 시작 후 실제 포트 반환 (port=0이면 임의 포트)"""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info(f"Scraper metrics endpoint: http://{self.host}:{self.port}/metrics")
+        return self.port
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), timeout=5)
+            parts = request.split(b" ", 2)
+            path = parts[1].decode("latin-1") if len(parts) > 1 else ""
+            if parts[0] == b"GET" and path.split("?")[0] == "/metrics":
+                status, content_type = "200 OK", OPENMETRICS_CONTENT_TYPE
+                body = self.metrics.render_openmetrics().encode("utf-8")
+            else:
+                status, content_type, body = "404 Not Found", "text/plain", b"not found\n"
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode("latin-1")
+                + body
+            )
+            await writer.drain()
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
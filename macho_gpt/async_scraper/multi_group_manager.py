@@ -4,16 +4,23 @@
 """
 
 import asyncio
+import json
 import logging
 import signal
 import sys
+import tempfile
 from dataclasses import asdict, is_dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from integrations.apify_client import actor_call
+from atomic_io import atomic_write_json
+from integrations.apify_client import ActorItemStream
+from macho_gpt.integrations.apify_client import ApifyDatasetWriter
+from macho_gpt.integrations.dataset_outbox import DatasetOutbox, OutboxDrainer
 
 from .async_scraper import AsyncGroupScraper
+from .metrics import MetricsServer, ScraperMetrics
 from .group_config import (
     ApifyFallbackSettings,
     GroupConfig,
@@ -72,6 +79,18 @@ class MultiGroupManager:
         # 스크래퍼 인스턴스들
         self.scrapers: Dict[str, AsyncGroupScraper] = {}
 
+        # 그룹 공용 Apify Dataset writer (dataset 설정 그룹이 있을 때만)
+        self.dataset_writer = self._create_dataset_writer()
+        # 디스크 outbox: 스크래핑은 기록만, 전송은 drainer가 담당
+        self.dataset_outbox: Optional[DatasetOutbox] = None
+        self.outbox_drainer: Optional[OutboxDrainer] = None
+        if self.dataset_writer and self.scraper_settings.dataset_outbox_dir:
+            self.dataset_outbox = DatasetOutbox(self.scraper_settings.dataset_outbox_dir)
+
+        # 그룹·단계별 계측 (모든 스크래퍼 공유) + 선택적 OpenMetrics 엔드포인트
+        self.metrics = ScraperMetrics()
+        self.metrics_server: Optional[MetricsServer] = None
+
         # 상태 관리
         self.is_running = False
         self.tasks: List[asyncio.Task[Any]] = []
@@ -88,6 +107,39 @@ class MultiGroupManager:
 
         logger.info(f"MultiGroupManager initialized with {len(group_configs)} groups")
 
+    def _create_dataset_writer(self) -> Optional[ApifyDatasetWriter]:
+        """공용 Dataset writer 생성 / Create shared dataset writer."""
+        if not any(g.apify_dataset_id for g in self.group_configs):
+            return None
+
+        try:
+            return ApifyDatasetWriter()
+        except ValueError as exc:
+            logger.error(f"Apify dataset writer 초기화 실패: {exc}")
+            return None
+
+    async def _start_dataset_delivery(self) -> None:
+        """Dataset 전송 시작 / Start writer and outbox drainer."""
+        if not self.dataset_writer:
+            return
+        await self.dataset_writer.start()
+        if self.dataset_outbox and self.outbox_drainer is None:
+            self.outbox_drainer = OutboxDrainer(self.dataset_outbox, self.dataset_writer)
+            self.outbox_drainer.start()
+
+    async def _start_metrics_server(self) -> None:
+        """OpenMetrics 엔드포인트 시작 (metrics_port 설정 시)"""
+        port = self.scraper_settings.metrics_port
+        if port is None or self.metrics_server is not None:
+            return
+        server = MetricsServer(self.metrics, port=port)
+        try:
+            await server.start()
+        except OSError as exc:
+            logger.error(f"Metrics endpoint 시작 실패 (port {port}): {exc}")
+            return
+        self.metrics_server = server
+
     def _create_scraper(self, group_config: GroupConfig) -> AsyncGroupScraper:
         """
         개별 그룹용 스크래퍼 생성
@@ -105,6 +157,12 @@ class MultiGroupManager:
             timeout=self.scraper_settings.timeout,
             ai_integration=self.ai_integration,
             storage_state_path=self.scraper_settings.auth_state_path,
+            dataset_writer=self.dataset_writer,
+            dataset_outbox=self.dataset_outbox,
+            warm_start=self.scraper_settings.warm_start,
+            resource_mode=self.scraper_settings.resource_mode,
+            capture_mode=self.scraper_settings.capture_mode,
+            metrics=self.metrics,
         )
 
         return scraper
@@ -196,16 +254,36 @@ class MultiGroupManager:
             self.apify_fallback.actor_id,
         )
 
+        self.metrics.inc(group_config.name, "fallback_attempts")
         payload = self._build_apify_payload(group_config, original_error)
+        store_path = Path(group_config.save_file)
+        message_count = 0
+        spool_path: Optional[Path] = None
 
         try:
-            fallback_output = await asyncio.to_thread(
-                actor_call,
+            stream = ActorItemStream(
                 self.apify_fallback.actor_id,
                 payload,
                 token_env=self.apify_fallback.token_env,
                 timeout_seconds=self.apify_fallback.timeout_seconds,
             )
+            store_path.parent.mkdir(parents=True, exist_ok=True)
+            # 페이지 단위로 임시 JSONL에 기록 → 그룹 크기와 무관하게 메모리 일정,
+            # 스트림이 중간에 실패해도 메시지 저장소는 그대로 유지
+            with tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                dir=store_path.parent,
+                prefix=f"{store_path.name}.",
+                suffix=".apify.tmp",
+                delete=False,
+            ) as spool:
+                spool_path = Path(spool.name)
+                async for page in stream.pages():
+                    for message in self._iter_remote_messages(page):
+                        spool.write(json.dumps(message, ensure_ascii=False) + "\n")
+                        message_count += 1
+            added, duplicates = self._merge_remote_messages(group_config, spool_path)
         except Exception as fallback_error:  # pragma: no cover - network interaction
             logger.error(
                 "Apify fallback failed for group %s: %s",
@@ -214,31 +292,89 @@ class MultiGroupManager:
                 exc_info=True,
             )
             return {}
+        finally:
+            if spool_path is not None and spool_path.exists():
+                spool_path.unlink()
 
-        remote_messages = self._extract_remote_messages(
-            fallback_output.get("items", [])
-        )
-
+        self.metrics.inc(group_config.name, "fallback_used")
         logger.info(
-            "Apify fallback succeeded for group %s with %d messages",
+            "Apify fallback succeeded for group %s: %d new messages (%d duplicates)",
             group_config.name,
-            len(remote_messages),
+            added,
+            duplicates,
         )
 
         return {
             "success": True,
             "fallback_used": "apify",
-            "remote_messages": remote_messages,
-            "messages_scraped": len(remote_messages),
+            "messages_file": str(store_path),
+            "messages_scraped": added,
+            "duplicates_skipped": duplicates,
             "apify_run": {
                 "actor_id": self.apify_fallback.actor_id,
-                "run_id": fallback_output.get("run", {}).get("id"),
-                "status": fallback_output.get("run", {}).get("status"),
-                "dataset_items": len(fallback_output.get("items", [])),
+                "run_id": stream.run.get("id"),
+                "status": stream.run.get("status"),
+                "dataset_items": stream.items_read,
+                "messages_received": message_count,
             },
             "original_error": str(original_error),
         }
 
+    @staticmethod
+    def _merge_remote_messages(group_config: GroupConfig, spool_path: Path) -> Tuple[int, int]:
+        """
+        폴백 메시지를 그룹 메시지 저장소에 병합 / Merge spooled messages into save_file.
+
+        스크래퍼와 같은 중복 키(AsyncGroupScraper._message_key)로 이미 저장된
+        메시지는 건너뛰고, 저장소는 atomic_write_json으로 교체합니다.
+
+        Returns:
+            (추가된 메시지 수, 중복으로 건너뛴 수)
+        """
+
+        store_path = Path(group_config.save_file)
+        existing: List[Dict[str, Any]] = []
+        if store_path.exists():
+            with open(store_path, "r", encoding="utf-8") as f:
+                existing = json.load(f)
+
+        seen = {
+            AsyncGroupScraper._message_key(m.get("sender"), m.get("text") or "", m.get("timestamp"))
+            for m in existing
+            if isinstance(m, dict)
+        }
+        added = duplicates = 0
+        scraped_at = datetime.now().isoformat()
+        with open(spool_path, "r", encoding="utf-8") as spool:
+            for line in spool:
+                message = json.loads(line)
+                text = str(message.get("text") or "").strip()
+                if not text:
+                    continue
+                sender = str(message.get("sender") or "").strip() or "Unknown"
+                timestamp = str(message.get("timestamp") or "").strip() or None
+                key = AsyncGroupScraper._message_key(sender, text, timestamp)
+                if key in seen:
+                    duplicates += 1
+                    continue
+                seen.add(key)
+                existing.append(
+                    {
+                        **message,
+                        "text": text,
+                        "sender": sender,
+                        "timestamp": timestamp,
+                        "scraped_at": message.get("scraped_at") or scraped_at,
+                        "group_name": group_config.name,
+                        "source": "apify",
+                    }
+                )
+                added += 1
+
+        if added:
+            atomic_write_json(store_path, existing)
+        return added, duplicates
+
     def _build_apify_payload(
         self, group_config: GroupConfig, original_error: Exception
     ) -> Dict[str, Any]:
@@ -254,20 +390,18 @@ class MultiGroupManager:
         return payload
 
     @staticmethod
-    def _extract_remote_messages(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Apify 데이터셋 메시지 추출 / Normalize remote dataset messages."""
+    def _iter_remote_messages(
+        items: Iterable[Dict[str, Any]],
+    ) -> Iterator[Dict[str, Any]]:
+        """Apify 데이터셋 메시지 순회 / Lazily normalize remote dataset messages."""
 
-        messages: List[Dict[str, Any]] = []
         for item in items:
             if not isinstance(item, dict):
                 continue
             if "messages" in item and isinstance(item["messages"], list):
-                messages.extend(
-                    msg for msg in item["messages"] if isinstance(msg, dict)
-                )
+                yield from (msg for msg in item["messages"] if isinstance(msg, dict))
             else:
-                messages.append(item)
-        return messages
+                yield item
 
     async def start_all_scrapers(self) -> None:
         """모든 스크래퍼 시작"""
@@ -292,6 +426,8 @@ class MultiGroupManager:
         logger.info(f"Starting parallel scraping for {len(self.group_configs)} groups")
         self.is_running = True
         self.stats["start_time"] = datetime.now().isoformat()
+        await self._start_dataset_delivery()
+        await self._start_metrics_server()
 
         try:
             # 모든 그룹에 대한 태스크 생성
@@ -352,6 +488,8 @@ class MultiGroupManager:
         )
         self.is_running = True
         self.stats["start_time"] = datetime.now().isoformat()
+        await self._start_dataset_delivery()
+        await self._start_metrics_server()
 
         results = []
 
@@ -443,12 +581,24 @@ class MultiGroupManager:
         """리소스 정리"""
         try:
             await self.stop_all()
+            if self.outbox_drainer:
+                # 미전송 outbox 레코드 최종 전송 (실패분은 다음 실행 시 재전송)
+                await self.outbox_drainer.stop()
+                self.outbox_drainer = None
+            if self.dataset_outbox:
+                self.dataset_outbox.close()
+            if self.dataset_writer:
+                # 잔여 버퍼 flush 및 연결 정리
+                await self.dataset_writer.close()
+            if self.metrics_server:
+                await self.metrics_server.stop()
+                self.metrics_server = None
             logger.info("MultiGroupManager cleanup completed")
         except Exception as e:
             logger.error(f"Error during cleanup: {e}")
 
     def get_stats(self) -> Dict[str, Any]:
-        """현재 통계 반환"""
+        """현재 통계 반환 (그룹·단계별 계측 포함)"""
         current_time = datetime.now()
         if self.stats["start_time"]:
             start_time = datetime.fromisoformat(self.stats["start_time"])
@@ -456,7 +606,12 @@ class MultiGroupManager:
         else:
             self.stats["runtime_seconds"] = 0
 
-        return self.stats.copy()
+        stats = self.stats.copy()
+        stats["groups"] = {
+            group: self.metrics.group_stats(group) for group in self.metrics.groups()
+        }
+        stats["slowest_stages"] = self.metrics.slowest_stages()
+        return stats
 
     def get_status(self) -> Dict[str, Any]:
         """현재 상태 반환"""
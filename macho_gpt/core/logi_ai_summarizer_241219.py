@@ -11,6 +11,8 @@ from typing import Dict, List, Optional
 import openai
 from pathlib import Path
 
+from artifact_index import record_artifact
+
 class LogiAISummarizer:
     """AI-powered WhatsApp message summarizer for HVDC project"""
     
@@ -222,7 +224,9 @@ class LogiAISummarizer:
             
             with open(output_path, 'w', encoding='utf-8') as f:
                 json.dump(analysis, f, ensure_ascii=False, indent=2)
-                
+            
+            record_artifact("ai_analysis", output_path,
+                            total_messages=analysis.get("total_messages", 0))
             self.logger.info(f"Analysis saved to: {output_path}")
             
         except Exception as e:
@@ -4,10 +4,14 @@ HVDC Project - Samsung C&T Logistics Integration
 대화방 간 업무 연결 및 워크플로우 관리
 """
 
+import heapq
 import json
 import logging
+import os
+from collections import defaultdict
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Set, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 import uuid
@@ -95,19 +99,147 @@ class ChatRoom:
         if self.last_activity is None:
             self.last_activity = datetime.now().isoformat()
 
+# 태스크 상태별 신뢰도 가중치
+STATUS_WEIGHTS = {
+    TaskStatus.COMPLETED: 1.0,
+    TaskStatus.IN_PROGRESS: 0.8,
+    TaskStatus.PENDING: 0.6,
+    TaskStatus.BLOCKED: 0.3,
+    TaskStatus.CANCELLED: 0.1
+}
+
+
+def parse_due_date(value: Optional[str]) -> Optional[datetime]:
+    """due_date ISO 문자열 → 로컬 naive datetime (파싱 불가 시 None)"""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (TypeError, ValueError):
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed
+
+
 class WorkflowManager:
-    """MACHO-GPT 워크플로우 관리자"""
+    """MACHO-GPT 워크플로우 관리자
+
+    변경 사항은 스냅샷(data_file)을 매번 다시 쓰지 않고 변경 로그
+    (<data_file>.changes.jsonl)에 한 줄씩 추가합니다. 로그가
+    compact_threshold 줄을 넘으면 스냅샷으로 압축합니다. batch() 안의
+    변경은 객체별로 병합되어 블록 종료 시 한 번에 기록됩니다.
+
+    조회용 보조 인덱스(대화방·담당자·상태·우선순위별 태스크 ID 집합)와
+    미완료 태스크의 마감일 힙을 변경 시점에 함께 갱신하므로, 대시보드와
+    트리거 생성은 전체 태스크가 아닌 결과 크기에 비례하여 동작합니다.
+    """
     
-    def __init__(self, data_file: str = "data/workflow_data.json"):
+    def __init__(self, data_file: str = "data/workflow_data.json",
+                 compact_threshold: int = 1000):
         self.data_file = data_file
+        self.change_log_file = str(Path(data_file).with_suffix('.changes.jsonl'))
+        self.compact_threshold = compact_threshold
         self.chat_rooms: Dict[str, ChatRoom] = {}
         self.tasks: Dict[str, BusinessTask] = {}
+        self._batch_depth = 0
+        self._pending: Dict[Tuple[str, ...], Any] = {}
+        self._log_entries = 0
+        self._reset_indexes()
         
         # 데이터 폴더가 없으면 생성
         data_dir = Path(data_file).parent
         data_dir.mkdir(parents=True, exist_ok=True)
         
         self.load_data()
+        self._rebuild_indexes()
+    
+    def _reset_indexes(self):
+        self._tasks_by_room: Dict[str, Set[str]] = defaultdict(set)
+        self._tasks_by_assignee: Dict[str, Set[str]] = defaultdict(set)
+        self._tasks_by_status: Dict[TaskStatus, Set[str]] = defaultdict(set)
+        self._tasks_by_priority: Dict[TaskPriority, Set[str]] = defaultdict(set)
+        self._confidence_by_status: Dict[TaskStatus, float] = defaultdict(float)
+        # 마감일 힙: (due, token, task_id), token이 최신이 아니면 무효 항목
+        self._due_heap: List[Tuple[datetime, int, str]] = []
+        self._due_tokens: Dict[str, int] = {}
+        self._next_token = 0
+    
+    def _rebuild_indexes(self):
+        """전체 태스크로 인덱스 재구성 (로드 직후 1회)"""
+        self._reset_indexes()
+        for task in self.tasks.values():
+            self._index_task(task)
+        heapq.heapify(self._due_heap)
+    
+    def _index_task(self, task: BusinessTask):
+        self._tasks_by_room[task.chat_room_id].add(task.id)
+        self._tasks_by_assignee[task.assignee].add(task.id)
+        self._tasks_by_status[task.status].add(task.id)
+        self._tasks_by_priority[task.priority].add(task.id)
+        self._confidence_by_status[task.status] += task.confidence
+        
+        due = parse_due_date(task.due_date)
+        if due is not None and task.status != TaskStatus.COMPLETED:
+            self._next_token += 1
+            self._due_tokens[task.id] = self._next_token
+            heapq.heappush(self._due_heap, (due, self._next_token, task.id))
+    
+    def _unindex_task(self, task: BusinessTask):
+        self._tasks_by_room[task.chat_room_id].discard(task.id)
+        self._tasks_by_assignee[task.assignee].discard(task.id)
+        self._tasks_by_status[task.status].discard(task.id)
+        self._tasks_by_priority[task.priority].discard(task.id)
+        self._confidence_by_status[task.status] -= task.confidence
+        
+        # 힙 항목은 지연 삭제, 무효 항목이 과반이면 재구성
+        if self._due_tokens.pop(task.id, None) is not None and \
+                len(self._due_heap) > 2 * len(self._due_tokens) + 64:
+            self._due_heap = [entry for entry in self._due_heap
+                              if self._due_tokens.get(entry[2]) == entry[1]]
+            heapq.heapify(self._due_heap)
+    
+    @staticmethod
+    def _intersection(a: Set[str], b: Set[str]) -> Set[str]:
+        """작은 집합 기준 교집합"""
+        return a & b if len(a) <= len(b) else b & a
+    
+    def get_tasks_by_room(self, room_id: str) -> List[BusinessTask]:
+        """대화방별 태스크"""
+        return [self.tasks[task_id] for task_id in self._tasks_by_room.get(room_id, ())]
+    
+    def get_tasks_by_assignee(self, assignee: str) -> List[BusinessTask]:
+        """담당자별 태스크"""
+        return [self.tasks[task_id] for task_id in self._tasks_by_assignee.get(assignee, ())]
+    
+    def get_tasks_by_status(self, status: TaskStatus) -> List[BusinessTask]:
+        """상태별 태스크"""
+        return [self.tasks[task_id] for task_id in self._tasks_by_status.get(status, ())]
+    
+    def get_tasks_by_priority(self, priority: TaskPriority) -> List[BusinessTask]:
+        """우선순위별 태스크"""
+        return [self.tasks[task_id] for task_id in self._tasks_by_priority.get(priority, ())]
+    
+    def _iter_overdue_ids(self, now: Optional[datetime] = None) -> Iterable[str]:
+        """마감일이 now 이전인 미완료 태스크 ID (힙 상위 구간만 탐색)"""
+        now = now or datetime.now()
+        heap = self._due_heap
+        stack = [0] if heap else []
+        while stack:
+            index = stack.pop()
+            due, token, task_id = heap[index]
+            if due >= now:
+                continue  # 힙 특성상 하위 항목도 모두 now 이후
+            if self._due_tokens.get(task_id) == token:
+                yield task_id
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < len(heap):
+                    stack.append(child)
+    
+    def get_overdue_tasks(self, now: Optional[datetime] = None) -> List[BusinessTask]:
+        """지연된(마감 경과 + 미완료) 태스크, 마감일 순"""
+        overdue = [self.tasks[task_id] for task_id in self._iter_overdue_ids(now)]
+        return sorted(overdue, key=lambda task: parse_due_date(task.due_date))
     
     def get_enum_value(self, enum_obj):
         """Safely get enum value whether it's a string or enum object"""
@@ -136,18 +268,146 @@ class WorkflowManager:
                     self.tasks[task.id] = task
                     
         except FileNotFoundError:
-            logger.info("워크플로우 데이터 파일이 없습니다. 기본 데이터를 생성합니다.")
-            self._create_default_data()
+            if not Path(self.change_log_file).exists():
+                logger.info("워크플로우 데이터 파일이 없습니다. 기본 데이터를 생성합니다.")
+                self._create_default_data()
+                return
         except Exception as e:
             logger.error(f"데이터 로드 오류: {str(e)}")
             self._create_default_data()
+            return
+        
+        self._replay_change_log()
+    
+    def _replay_change_log(self):
+        """스냅샷 이후 변경 로그 재적용 (멱등)"""
+        linked: Dict[str, set] = {}
+        try:
+            with open(self.change_log_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        self._apply_change(json.loads(line), linked)
+                    except (ValueError, KeyError, TypeError) as e:
+                        # 기록 중 중단된 마지막 줄 등은 건너뜀
+                        logger.warning(f"변경 로그 항목 무시: {str(e)}")
+                        continue
+                    self._log_entries += 1
+        except FileNotFoundError:
+            return
+    
+    def _apply_change(self, record: Dict[str, Any], linked: Dict[str, set]):
+        """변경 로그 한 항목 적용
+        
+        linked: 대화방별 connected_tasks 집합 캐시 (재생 중 중복 연결 방지)
+        """
+        op = record['op']
+        if op == 'room':
+            room_data = dict(record['room'])
+            room_data['type'] = ChatRoomType(room_data['type'])
+            room_data['priority'] = TaskPriority(room_data['priority'])
+            room = ChatRoom(**room_data)
+            parent = self.chat_rooms.get(room.parent_room_id) if room.parent_room_id else None
+            if parent and room.id not in parent.child_room_ids:
+                parent.child_room_ids.append(room.id)
+            self.chat_rooms[room.id] = room
+            linked[room.id] = set(room.connected_tasks)
+        elif op == 'task':
+            task_data = dict(record['task'])
+            task_data['status'] = TaskStatus(task_data['status'])
+            task_data['priority'] = TaskPriority(task_data['priority'])
+            task = BusinessTask(**task_data)
+            room = self.chat_rooms.get(task.chat_room_id)
+            if room is not None:
+                room_tasks = linked.setdefault(room.id, set(room.connected_tasks))
+                if task.id not in room_tasks:
+                    room.connected_tasks.append(task.id)
+                    room_tasks.add(task.id)
+            self.tasks[task.id] = task
+        elif op == 'link':
+            parent = self.chat_rooms.get(record['parent'])
+            child = self.chat_rooms.get(record['child'])
+            if parent and child:
+                if child.id not in parent.child_room_ids:
+                    parent.child_room_ids.append(child.id)
+                child.parent_room_id = parent.id
+        else:
+            raise ValueError(f"unknown op: {op}")
+    
+    def _room_to_dict(self, room: ChatRoom) -> Dict[str, Any]:
+        room_data = asdict(room)
+        room_data['type'] = self.get_enum_value(room_data['type'])
+        room_data['priority'] = self.get_enum_value(room_data['priority'])
+        return room_data
+    
+    def _task_to_dict(self, task: BusinessTask) -> Dict[str, Any]:
+        task_data = asdict(task)
+        task_data['status'] = self.get_enum_value(task_data['status'])
+        task_data['priority'] = self.get_enum_value(task_data['priority'])
+        return task_data
+    
+    def _serialize_change(self, key: Tuple[str, ...], obj: Any) -> Dict[str, Any]:
+        if key[0] == 'room':
+            return {'op': 'room', 'room': self._room_to_dict(obj)}
+        if key[0] == 'task':
+            return {'op': 'task', 'task': self._task_to_dict(obj)}
+        return {'op': 'link', 'parent': key[1], 'child': key[2]}
+    
+    def _record_change(self, key: Tuple[str, ...], obj: Any = None):
+        """변경 기록 (batch 중이면 병합 후 지연)"""
+        self._pending[key] = obj
+        if self._batch_depth == 0:
+            self._flush_changes()
+    
+    def _flush_changes(self):
+        """대기 중인 변경을 로그에 추가하고 필요 시 압축"""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        try:
+            lines = [
+                json.dumps(self._serialize_change(key, obj), ensure_ascii=False)
+                for key, obj in pending.items()
+            ]
+            with open(self.change_log_file, 'a', encoding='utf-8') as f:
+                f.write('\n'.join(lines) + '\n')
+            self._log_entries += len(lines)
+        except Exception as e:
+            logger.error(f"변경 로그 기록 오류: {str(e)}")
+            self.save_data()
+            return
+        
+        if self._log_entries >= self.compact_threshold:
+            self.compact()
+    
+    @contextmanager
+    def batch(self) -> Iterator["WorkflowManager"]:
+        """변경을 모아 블록 종료 시 한 번에 기록하는 트랜잭션 블록
+        
+        예:
+            with manager.batch():
+                for item in ai_tasks:
+                    manager.create_task(**item)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._flush_changes()
+    
+    def compact(self):
+        """스냅샷 재작성 후 변경 로그 비우기"""
+        self.save_data()
     
     def save_data(self):
-        """워크플로우 데이터를 파일에 저장"""
+        """워크플로우 데이터를 파일에 저장 (전체 스냅샷, 변경 로그 초기화)"""
         try:
             data = {
-                'chat_rooms': [asdict(room) for room in self.chat_rooms.values()],
-                'tasks': [asdict(task) for task in self.tasks.values()],
+                'chat_rooms': [self._room_to_dict(room) for room in self.chat_rooms.values()],
+                'tasks': [self._task_to_dict(task) for task in self.tasks.values()],
                 'metadata': {
                     'version': '3.4-mini',
                     'last_updated': datetime.now().isoformat(),
@@ -156,17 +416,16 @@ class WorkflowManager:
                 }
             }
             
-            # Enum을 문자열로 변환
-            for room_data in data['chat_rooms']:
-                room_data['type'] = self.get_enum_value(room_data['type'])
-                room_data['priority'] = self.get_enum_value(room_data['priority'])
-            
-            for task_data in data['tasks']:
-                task_data['status'] = self.get_enum_value(task_data['status'])
-                task_data['priority'] = self.get_enum_value(task_data['priority'])
-            
-            with open(self.data_file, 'w', encoding='utf-8') as f:
+            # 임시 파일 기록 후 교체 (중단 시에도 기존 스냅샷 + 로그로 복구 가능)
+            tmp_file = f"{self.data_file}.tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
                 json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_file, self.data_file)
+            
+            # 스냅샷에 반영된 변경 로그 제거
+            Path(self.change_log_file).unlink(missing_ok=True)
+            self._pending.clear()
+            self._log_entries = 0
                 
         except Exception as e:
             logger.error(f"데이터 저장 오류: {str(e)}")
@@ -222,13 +481,14 @@ class WorkflowManager:
             }
         ]
         
-        for room_config in default_rooms:
-            self.create_chat_room(**room_config)
-        
-        # 기본 태스크 생성
-        self._create_sample_tasks()
-        
-        self.save_data()
+        with self.batch():
+            for room_config in default_rooms:
+                self.create_chat_room(**room_config)
+            
+            # 기본 태스크 생성
+            self._create_sample_tasks()
+            
+            self.save_data()
     
     def _create_sample_tasks(self):
         """샘플 태스크 생성"""
@@ -286,7 +546,7 @@ class WorkflowManager:
             self.chat_rooms[parent_room_id].child_room_ids.append(room_id)
         
         self.chat_rooms[room_id] = room
-        self.save_data()
+        self._record_change(('room', room_id), room)
         
         logger.info(f"새 대화방 생성: {name} (ID: {room_id})")
         return room_id
@@ -313,12 +573,13 @@ class WorkflowManager:
         )
         
         self.tasks[task_id] = task
+        self._index_task(task)
         
         # 대화방에 태스크 연결
         if chat_room_id in self.chat_rooms:
             self.chat_rooms[chat_room_id].connected_tasks.append(task_id)
         
-        self.save_data()
+        self._record_change(('task', task_id), task)
         
         logger.info(f"새 태스크 생성: {title} (ID: {task_id})")
         return task_id
@@ -337,15 +598,16 @@ class WorkflowManager:
         
         child_room.parent_room_id = parent_room_id
         
-        self.save_data()
+        self._record_change(('link', parent_room_id, child_room_id))
         logger.info(f"대화방 연결: {parent_room.name} -> {child_room.name}")
         return True
     
     def get_workflow_summary(self) -> Dict[str, Any]:
         """워크플로우 전체 요약 정보"""
         total_tasks = len(self.tasks)
-        completed_tasks = len([t for t in self.tasks.values() if t.status == TaskStatus.COMPLETED])
-        urgent_tasks = len([t for t in self.tasks.values() if t.priority in [TaskPriority.URGENT, TaskPriority.CRITICAL]])
+        completed_tasks = len(self._tasks_by_status[TaskStatus.COMPLETED])
+        urgent_tasks = len(self._tasks_by_priority[TaskPriority.URGENT]) + \
+            len(self._tasks_by_priority[TaskPriority.CRITICAL])
         
         # 대화방 타입별 통계
         room_stats = {}
@@ -368,19 +630,11 @@ class WorkflowManager:
         if not self.tasks:
             return 0.85  # 기본 신뢰도
         
-        total_confidence = 0
-        for task in self.tasks.values():
-            # 태스크 상태에 따른 가중치
-            status_weight = {
-                TaskStatus.COMPLETED: 1.0,
-                TaskStatus.IN_PROGRESS: 0.8,
-                TaskStatus.PENDING: 0.6,
-                TaskStatus.BLOCKED: 0.3,
-                TaskStatus.CANCELLED: 0.1
-            }
-            
-            task_confidence = task.confidence * status_weight.get(task.status, 0.5)
-            total_confidence += task_confidence
+        # 태스크 상태에 따른 가중치 (상태별 신뢰도 합계 인덱스 사용)
+        total_confidence = sum(
+            confidence_sum * STATUS_WEIGHTS.get(status, 0.5)
+            for status, confidence_sum in self._confidence_by_status.items()
+        )
         
         avg_confidence = total_confidence / len(self.tasks)
         return min(avg_confidence, 1.0)
@@ -414,10 +668,9 @@ class WorkflowManager:
         if room_id not in self.chat_rooms:
             return {}
         
-        room = self.chat_rooms[room_id]
-        tasks = [self.tasks[task_id] for task_id in room.connected_tasks if task_id in self.tasks]
+        room_task_ids = self._tasks_by_room.get(room_id, set())
         
-        if not tasks:
+        if not room_task_ids:
             return {
                 "status": "healthy",
                 "confidence": 0.85,
@@ -429,26 +682,24 @@ class WorkflowManager:
         recommendations = []
         
         # 지연된 태스크 확인
-        overdue_tasks = []
-        for task in tasks:
-            if task.due_date and task.status != TaskStatus.COMPLETED:
-                due_date = datetime.fromisoformat(task.due_date.replace('Z', '+00:00'))
-                if due_date < datetime.now():
-                    overdue_tasks.append(task.title)
+        overdue_tasks = [task_id for task_id in self._iter_overdue_ids()
+                         if task_id in room_task_ids]
         
         if overdue_tasks:
             issues.append(f"지연된 태스크: {len(overdue_tasks)}개")
             recommendations.append("지연된 태스크의 우선순위를 재검토하세요.")
         
         # 블록된 태스크 확인
-        blocked_tasks = [t for t in tasks if t.status == TaskStatus.BLOCKED]
+        blocked_tasks = self._intersection(room_task_ids, self._tasks_by_status[TaskStatus.BLOCKED])
         if blocked_tasks:
             issues.append(f"블록된 태스크: {len(blocked_tasks)}개")
             recommendations.append("블록된 태스크의 장애물을 해결하세요.")
         
         # 건강도 계산
-        total_tasks = len(tasks)
-        completed_tasks = len([t for t in tasks if t.status == TaskStatus.COMPLETED])
+        total_tasks = len(room_task_ids)
+        completed_tasks = len(
+            self._intersection(room_task_ids, self._tasks_by_status[TaskStatus.COMPLETED])
+        )
         health_score = completed_tasks / total_tasks if total_tasks > 0 else 0.85
         
         status = "healthy"
@@ -475,6 +726,7 @@ class WorkflowManager:
             return False
         
         task = self.tasks[task_id]
+        self._unindex_task(task)
         task.status = status
         task.updated_at = datetime.now().isoformat()
         
@@ -484,8 +736,9 @@ class WorkflowManager:
         # 완료된 태스크의 경우 진행률을 100%로 설정
         if status == TaskStatus.COMPLETED:
             task.progress = 100.0
+        self._index_task(task)
         
-        self.save_data()
+        self._record_change(('task', task_id), task)
         logger.info(f"태스크 상태 업데이트: {task.title} -> {status.value}")
         return True
     
@@ -495,30 +748,28 @@ class WorkflowManager:
         
         for room in self.chat_rooms.values():
             if room.type == ChatRoomType.TEAM:
-                tasks = [self.tasks[task_id] for task_id in room.connected_tasks if task_id in self.tasks]
+                room_task_ids = self._tasks_by_room.get(room.id, set())
                 
                 member_tasks = {}
                 for member in room.members:
-                    member_tasks[member] = len([t for t in tasks if t.assignee == member])
+                    member_tasks[member] = len(self._intersection(
+                        room_task_ids, self._tasks_by_assignee.get(member, set())
+                    ))
                 
                 team_workload[room.name] = {
-                    "total_tasks": len(tasks),
+                    "total_tasks": len(room_task_ids),
                     "member_tasks": member_tasks,
-                    "avg_tasks_per_member": len(tasks) / len(room.members) if room.members else 0,
-                    "priority_distribution": self._get_priority_distribution(tasks)
+                    "avg_tasks_per_member": len(room_task_ids) / len(room.members) if room.members else 0,
+                    "priority_distribution": {
+                        priority.value: len(self._intersection(
+                            room_task_ids, self._tasks_by_priority[priority]
+                        ))
+                        for priority in TaskPriority
+                    }
                 }
         
         return team_workload
     
-    def _get_priority_distribution(self, tasks: List[BusinessTask]) -> Dict[str, int]:
-        """태스크 우선순위 분포"""
-        distribution = {priority.value: 0 for priority in TaskPriority}
-        
-        for task in tasks:
-            distribution[task.priority.value] += 1
-        
-        return distribution
-    
     def generate_workflow_triggers(self) -> List[str]:
         """워크플로우 기반 자동 트리거 생성"""
         triggers = []
@@ -529,21 +780,19 @@ class WorkflowManager:
             triggers.append("/switch_mode ZERO")
             triggers.append("/workflow_optimization urgent")
         
-        # 지연된 태스크 확인
+        # 지연된 태스크 확인 (4건 확인 시 탐색 중단)
         overdue_count = 0
-        for task in self.tasks.values():
-            if task.due_date and task.status != TaskStatus.COMPLETED:
-                due_date = datetime.fromisoformat(task.due_date.replace('Z', '+00:00'))
-                if due_date < datetime.now():
-                    overdue_count += 1
+        for _ in self._iter_overdue_ids():
+            overdue_count += 1
+            if overdue_count > 3:
+                break
         
         if overdue_count > 3:
             triggers.append("/urgent_processor task_management")
             triggers.append("/alert_system overdue_tasks")
         
         # 크리티컬 태스크 확인
-        critical_tasks = [t for t in self.tasks.values() if t.priority == TaskPriority.CRITICAL]
-        if len(critical_tasks) > 2:
+        if len(self._tasks_by_priority[TaskPriority.CRITICAL]) > 2:
             triggers.append("/escalate_priority critical_review")
         
         # 팀 업무량 불균형 확인
@@ -3,11 +3,17 @@
 from __future__ import annotations
 
 import asyncio
+import gzip
+import http.client
 import json
+import logging
 import os
+import queue
 from dataclasses import dataclass
-from typing import Any, Iterable, Mapping, Sequence
-from urllib import error, request
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+from urllib import error, parse, request
+
+logger = logging.getLogger(__name__)
 
 
 class ApifyDatasetClientError(RuntimeError):
@@ -72,3 +78,286 @@ class ApifyDatasetClient:
             raise ApifyDatasetClientError(
                 f"Network error pushing items to Apify dataset: {exc.reason}"
             ) from exc
+
+
+class _ConnectionPool:
+    """HTTP keep-alive 연결 풀/Keep-alive HTTP connection pool."""
+
+    def __init__(self, base_url: str, size: int, timeout: float) -> None:
+        parsed = parse.urlsplit(base_url)
+        self.scheme = parsed.scheme
+        self.host = parsed.hostname
+        self.port = parsed.port
+        self.base_path = parsed.path.rstrip("/")
+        self.timeout = timeout
+        self.created = 0
+        self._idle: "queue.LifoQueue[http.client.HTTPConnection]" = queue.LifoQueue(
+            maxsize=size
+        )
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        """새 연결 생성/Open a new connection."""
+        self.created += 1
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(self.host, self.port, timeout=self.timeout)
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def request(
+        self, method: str, path: str, body: bytes, headers: Mapping[str, str]
+    ) -> Tuple[int, bytes]:
+        """풀 연결로 요청 전송/Send request over a pooled connection."""
+        for attempt in range(2):
+            try:
+                conn, reused = self._idle.get_nowait(), True
+            except queue.Empty:
+                conn, reused = self._new_connection(), False
+
+            try:
+                conn.request(method, self.base_path + path, body=body, headers=dict(headers))
+                response = conn.getresponse()
+                data = response.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if reused and attempt == 0:
+                    # 서버가 닫은 유휴 연결 → 새 연결로 1회 재시도
+                    continue
+                raise
+            except Exception:
+                conn.close()
+                raise
+
+            if response.will_close:
+                conn.close()
+            else:
+                try:
+                    self._idle.put_nowait(conn)
+                except queue.Full:
+                    conn.close()
+            return response.status, data
+
+        raise http.client.HTTPException("connection pool exhausted retries")
+
+    def close(self) -> None:
+        """유휴 연결 종료/Close idle connections."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+class ApifyDatasetWriter:
+    """
+    배치 Dataset writer/Pooled, batching Apify dataset writer.
+
+    enqueue()는 메모리 버퍼에 추가만 하고 즉시 반환하며, 백그라운드 flush 루프가
+    모든 그룹의 아이템을 크기·시간 기준 배치로 모아 gzip 압축 후 keep-alive 연결로
+    전송합니다. 재시도는 flush 루프에서 처리되어 스크래핑 경로를 막지 않습니다.
+    """
+
+    # Apify 요청당 페이로드 한도(9MB)보다 약간 작게 유지
+    MAX_REQUEST_BYTES = 9 * 1024 * 1024 - 64 * 1024
+    RETRYABLE_STATUS = {408, 429, 500, 502, 503, 504}
+
+    def __init__(
+        self,
+        token: str | None = None,
+        base_url: str = "https://api.apify.com/v2",
+        timeout: int = 30,
+        max_batch_items: int = 500,
+        flush_interval: float = 2.0,
+        max_request_bytes: int = MAX_REQUEST_BYTES,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        pool_size: int = 4,
+        compress: bool = True,
+    ) -> None:
+        self.token = token or os.getenv("APIFY_TOKEN")
+        if not self.token:
+            raise ValueError("Apify API token is required")
+        if max_batch_items < 1:
+            raise ValueError("max_batch_items must be positive")
+
+        self.max_batch_items = max_batch_items
+        self.flush_interval = flush_interval
+        self.max_request_bytes = max_request_bytes
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.compress = compress
+        self._pool = _ConnectionPool(base_url.rstrip("/"), pool_size, timeout)
+
+        self._buffers: Dict[str, List[Dict[str, Any]]] = {}
+        self._buffered = 0
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task[None]] = None
+        self._closing = False
+
+        self.stats: Dict[str, int] = {
+            "enqueued_items": 0,
+            "pushed_items": 0,
+            "failed_items": 0,
+            "requests": 0,
+            "retries": 0,
+            "bytes_sent": 0,
+            "bytes_uncompressed": 0,
+        }
+
+    async def __aenter__(self) -> "ApifyDatasetWriter":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    @property
+    def pending_items(self) -> int:
+        """버퍼 대기 아이템 수/Number of buffered items."""
+        return self._buffered
+
+    async def start(self) -> None:
+        """백그라운드 flush 루프 시작/Start background flush loop."""
+        if self._task is None or self._task.done():
+            self._closing = False
+            self._task = asyncio.create_task(self._run())
+
+    def enqueue(
+        self,
+        dataset_id: str,
+        items: Sequence[Mapping[str, Any]] | Iterable[Mapping[str, Any]],
+    ) -> int:
+        """버퍼에 아이템 추가 (비차단)/Buffer items without blocking."""
+        dataset = dataset_id.strip()
+        if not dataset:
+            raise ValueError("dataset_id must not be empty")
+
+        payload_items = [dict(item) for item in items]
+        if not payload_items:
+            return 0
+
+        self._buffers.setdefault(dataset, []).extend(payload_items)
+        self._buffered += len(payload_items)
+        self.stats["enqueued_items"] += len(payload_items)
+        if self._buffered >= self.max_batch_items:
+            self._wakeup.set()
+        return len(payload_items)
+
+    async def flush(self) -> None:
+        """버퍼 전체 전송/Flush all buffered items."""
+        async with self._flush_lock:
+            buffers, self._buffers, self._buffered = self._buffers, {}, 0
+            if buffers:
+                await asyncio.gather(
+                    *(self.push(dataset, items) for dataset, items in buffers.items())
+                )
+
+    async def push(self, dataset_id: str, items: Sequence[Mapping[str, Any]]) -> bool:
+        """아이템을 청크 단위로 즉시 전송/Send items now; True when all chunks succeed."""
+        ok = True
+        for count, payload in self._chunk_payloads(items):
+            ok = await self._send_chunk(dataset_id, count, payload) and ok
+        return ok
+
+    async def close(self) -> None:
+        """루프 종료 + 잔여 flush + 연결 정리/Stop loop, flush remainder, close pool."""
+        self._closing = True
+        self._wakeup.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+        await self.flush()
+        self._pool.close()
+
+    async def _run(self) -> None:
+        """크기·시간 기준 flush 루프/Size- and time-bounded flush loop."""
+        while not self._closing:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception as exc:  # pragma: no cover - defensive logging
+                logger.error("Apify dataset flush failed: %s", exc)
+
+    def _chunk_payloads(
+        self, items: Iterable[Mapping[str, Any]]
+    ) -> Iterator[Tuple[int, bytes]]:
+        """요청 한도 이하 JSON 배열 청크 생성/Yield JSON array chunks under the request limit."""
+        encoded: List[bytes] = []
+        size = 2  # "[" + "]"
+        for item in items:
+            raw = json.dumps(dict(item), ensure_ascii=False).encode("utf-8")
+            if len(raw) + 2 > self.max_request_bytes:
+                logger.error("Dropping oversized dataset item (%d bytes)", len(raw))
+                self.stats["failed_items"] += 1
+                continue
+            if encoded and (
+                size + len(raw) + 1 > self.max_request_bytes
+                or len(encoded) >= self.max_batch_items
+            ):
+                yield len(encoded), b"[" + b",".join(encoded) + b"]"
+                encoded, size = [], 2
+            encoded.append(raw)
+            size += len(raw) + 1
+        if encoded:
+            yield len(encoded), b"[" + b",".join(encoded) + b"]"
+
+    async def _send_chunk(self, dataset_id: str, count: int, payload: bytes) -> bool:
+        """청크 전송 + 재시도/Send one chunk with retries."""
+        headers = {"Content-Type": "application/json"}
+        body = payload
+        if self.compress:
+            body = gzip.compress(payload, compresslevel=5)
+            headers["Content-Encoding"] = "gzip"
+        path = (
+            f"/datasets/{parse.quote(dataset_id, safe='')}/items"
+            f"?token={parse.quote(self.token, safe='')}"
+        )
+
+        delay = self.retry_delay
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                status, data = await asyncio.to_thread(
+                    self._pool.request, "POST", path, body, headers
+                )
+                self.stats["requests"] += 1
+                if status < 400:
+                    self.stats["pushed_items"] += count
+                    self.stats["bytes_sent"] += len(body)
+                    self.stats["bytes_uncompressed"] += len(payload)
+                    return True
+                detail = data.decode("utf-8", errors="ignore")[:200]
+                exc: Exception = ApifyDatasetClientError(
+                    f"HTTP error pushing items to Apify dataset: {status} {detail}"
+                )
+                retryable = status in self.RETRYABLE_STATUS
+            except (OSError, http.client.HTTPException) as network_error:
+                exc = ApifyDatasetClientError(
+                    f"Network error pushing items to Apify dataset: {network_error}"
+                )
+                retryable = True
+
+            if not retryable or attempt == self.max_retries:
+                logger.error(
+                    "Apify dataset push of %d items to %s failed after %d attempts: %s",
+                    count,
+                    dataset_id,
+                    attempt,
+                    exc,
+                )
+                break
+
+            self.stats["retries"] += 1
+            logger.warning(
+                "Apify dataset push attempt %d failed: %s. Retrying in %.2f seconds",
+                attempt,
+                exc,
+                delay,
+            )
+            await asyncio.sleep(delay)
+            delay *= 2
+
+        self.stats["failed_items"] += count
+        return False
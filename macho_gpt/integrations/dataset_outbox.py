@@ -0,0 +1,243 @@
+"""디스크 기반 Dataset outbox/Durable disk-backed outbox for dataset pushes."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Protocol, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class _DatasetPusher(Protocol):
+    """Dataset 전송 인터페이스/Dataset push interface (ApifyDatasetWriter.push)."""
+
+    async def push(self, dataset_id: str, items: List[Mapping[str, Any]]) -> bool: ...
+
+
+def make_dedup_id(dataset_id: str, item: Mapping[str, Any]) -> str:
+    """아이템 고유 ID 생성/Stable dedup id from dataset and item content."""
+    canonical = json.dumps(item, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha1(f"{dataset_id}\n{canonical}".encode("utf-8")).hexdigest()
+
+
+class DatasetOutbox:
+    """
+    Append-only outbox 로그 + 확인(ack) 오프셋/Append-only log with acknowledged offset.
+
+    append()는 열린 파일 핸들에 JSON 한 줄씩 기록만 하므로 마이크로초 단위로
+    끝나며, 네트워크 전송은 OutboxDrainer가 별도로 수행합니다. 확인되지 않은
+    레코드는 재시작 후에도 다시 전송됩니다(at-least-once).
+    """
+
+    def __init__(
+        self,
+        directory: str | Path = "data/dataset_outbox",
+        compact_threshold_bytes: int = 1024 * 1024,
+        fsync: bool = False,
+    ) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.log_path = self.directory / "outbox.log"
+        self.offset_path = self.directory / "outbox.offset"
+        self.compact_threshold_bytes = compact_threshold_bytes
+        self.fsync = fsync
+
+        self._log = open(self.log_path, "ab")
+        self.acked_offset = self._read_offset()
+        self.stats = {"appended": 0, "acked": 0, "compactions": 0}
+
+    def _read_offset(self) -> int:
+        """확인 오프셋 로드/Load acknowledged offset."""
+        try:
+            offset = int(self.offset_path.read_text(encoding="utf-8").strip() or 0)
+        except (FileNotFoundError, ValueError):
+            return 0
+        return min(offset, self.log_path.stat().st_size)
+
+    def _write_offset(self, offset: int) -> None:
+        """오프셋 원자적 기록/Persist offset atomically."""
+        tmp_path = self.offset_path.with_name("outbox.offset.tmp")
+        tmp_path.write_text(str(offset), encoding="utf-8")
+        os.replace(tmp_path, self.offset_path)
+
+    @property
+    def pending_bytes(self) -> int:
+        """미확인 바이트 수/Unacknowledged bytes."""
+        return self.log_path.stat().st_size - self.acked_offset
+
+    def append(self, dataset_id: str, items: Iterable[Mapping[str, Any]]) -> int:
+        """아이템 기록 (네트워크 없음)/Record items without touching the network."""
+        lines = []
+        for item in items:
+            payload = dict(item)
+            payload.setdefault("dedup_id", make_dedup_id(dataset_id, payload))
+            lines.append(
+                json.dumps({"dataset_id": dataset_id, "item": payload}, ensure_ascii=False)
+            )
+        if not lines:
+            return 0
+
+        self._log.write(("\n".join(lines) + "\n").encode("utf-8"))
+        self._log.flush()
+        if self.fsync:
+            os.fsync(self._log.fileno())
+        self.stats["appended"] += len(lines)
+        return len(lines)
+
+    def read_pending(self, max_items: int = 500) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        미확인 레코드 읽기/Read unacknowledged records.
+
+        Returns:
+            (records, end_offset): 완전한 줄만 반환하며 end_offset을 ack()에 전달합니다.
+        """
+        records: List[Dict[str, Any]] = []
+        offset = self.acked_offset
+        with open(self.log_path, "rb") as reader:
+            reader.seek(offset)
+            while len(records) < max_items:
+                line = reader.readline()
+                if not line.endswith(b"\n"):
+                    break  # 기록 중인 마지막 줄은 다음 회차에 처리
+                offset += len(line)
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    logger.error("Skipping corrupt outbox record at offset %d", offset)
+        return records, offset
+
+    def ack(self, offset: int) -> None:
+        """오프셋까지 전송 확인/Acknowledge records up to offset."""
+        if offset <= self.acked_offset:
+            return
+        self._write_offset(offset)
+        self.acked_offset = offset
+        self.stats["acked"] += 1
+        self.maybe_compact()
+
+    def maybe_compact(self) -> bool:
+        """확인된 앞부분이 임계값을 넘으면 로그 압축/Drop acknowledged prefix."""
+        if self.acked_offset < self.compact_threshold_bytes:
+            return False
+
+        with open(self.log_path, "rb") as reader:
+            reader.seek(self.acked_offset)
+            tail = reader.read()
+
+        tmp_path = self.log_path.with_name("outbox.log.tmp")
+        tmp_path.write_bytes(tail)
+        # 오프셋을 먼저 0으로 기록: 교체 전 중단되면 재전송(중복)만 발생하고 유실은 없음
+        self._write_offset(0)
+        self._log.close()
+        os.replace(tmp_path, self.log_path)
+        self._log = open(self.log_path, "ab")
+        self.acked_offset = 0
+        self.stats["compactions"] += 1
+        return True
+
+    def close(self) -> None:
+        """파일 핸들 종료/Close the log handle."""
+        if not self._log.closed:
+            self._log.close()
+
+
+class OutboxDrainer:
+    """
+    Outbox 비동기 전송기/Async drainer shipping outbox records to datasets.
+
+    전송이 모두 성공한 배치만 ack하며, 실패 시 백오프 후 같은 레코드를
+    다시 전송합니다. 각 아이템의 dedup_id로 소비자 측 중복 제거가 가능합니다.
+    """
+
+    def __init__(
+        self,
+        outbox: DatasetOutbox,
+        pusher: _DatasetPusher,
+        batch_size: int = 500,
+        interval: float = 1.0,
+        max_backoff: float = 60.0,
+    ) -> None:
+        self.outbox = outbox
+        self.pusher = pusher
+        self.batch_size = batch_size
+        self.interval = interval
+        self.max_backoff = max_backoff
+        self._task: Optional[asyncio.Task[None]] = None
+        self._stopping = asyncio.Event()
+        # 부분 실패한 배치에서 이미 전송된 dataset (같은 구간 재시도 시 생략)
+        self._delivered: Tuple[int, int, set] = (-1, -1, set())
+        self.stats = {"shipped_items": 0, "failed_batches": 0}
+
+    def start(self) -> None:
+        """백그라운드 전송 시작/Start background draining."""
+        if self._task is None or self._task.done():
+            self._stopping.clear()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self, drain: bool = True) -> None:
+        """전송 중지 (기본: 잔여 1회 전송)/Stop draining, optionally one final pass."""
+        self._stopping.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+        if drain:
+            while await self.drain_once():
+                pass
+
+    async def drain_once(self) -> bool:
+        """배치 1회 전송/Ship one batch; True when a batch was acknowledged."""
+        records, end_offset = await asyncio.to_thread(
+            self.outbox.read_pending, self.batch_size
+        )
+        start_offset = self.outbox.acked_offset
+        if end_offset == start_offset:
+            return False
+
+        done_start, done_end, delivered = self._delivered
+        if (done_start, done_end) != (start_offset, end_offset):
+            delivered = set()
+
+        grouped: Dict[str, List[Mapping[str, Any]]] = {}
+        for record in records:
+            if record["dataset_id"] not in delivered:
+                grouped.setdefault(record["dataset_id"], []).append(record["item"])
+
+        results = await asyncio.gather(
+            *(self.pusher.push(dataset, items) for dataset, items in grouped.items())
+        )
+        delivered |= {dataset for dataset, ok in zip(grouped, results) if ok}
+        if not all(results):
+            self._delivered = (start_offset, end_offset, delivered)
+            self.stats["failed_batches"] += 1
+            return False
+
+        self.outbox.ack(end_offset)
+        self.stats["shipped_items"] += len(records)
+        return True
+
+    async def _run(self) -> None:
+        """전송 루프/Drain loop with exponential backoff on failure."""
+        backoff = self.interval
+        while not self._stopping.is_set():
+            try:
+                shipped = await self.drain_once()
+                failed = not shipped and self.outbox.pending_bytes > 0
+            except Exception as exc:
+                logger.error("Outbox drain failed: %s", exc)
+                shipped, failed = False, True
+
+            if shipped:
+                backoff = self.interval
+                continue
+            delay = backoff if failed else self.interval
+            if failed:
+                backoff = min(backoff * 2, self.max_backoff)
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
@@ -31,6 +31,7 @@ except ImportError:
     logging.warning("playwright_stealth not available, using basic mode")
 
 # MACHO-GPT 모듈 import
+from auth_state import get_auth_store
 from macho_gpt.core.logi_whatsapp_241219 import WhatsAppProcessor
 from macho_gpt.core.logi_ai_summarizer_241219 import LogiAISummarizer
 
@@ -60,6 +61,8 @@ class WhatsAppRPAExtractor:
         self.mode = mode
         self.confidence_threshold = 0.90
         self.auth_file = Path("auth.json")
+        self.auth_store = get_auth_store(self.auth_file)
+        self.whatsapp_url = "https://web.whatsapp.com/"
         self.data_dir = Path("data")
         self.logs_dir = Path("logs")
         
@@ -151,7 +154,7 @@ class WhatsAppRPAExtractor:
                 
                 # 브라우저 컨텍스트 설정
                 context = await browser.new_context(
-                    storage_state=str(self.auth_file) if self.auth_file.exists() else None,
+                    storage_state=self.auth_store.load(),
                     user_agent=random.choice(self.user_agents),
                     viewport={"width": 1280, "height": 720},
                     locale="en-US",
@@ -166,7 +169,7 @@ class WhatsAppRPAExtractor:
                     logger.info("스텔스 모드 비활성화 - 기본 모드로 실행")
                 
                 # WhatsApp Web 접속
-                await page.goto("https://web.whatsapp.com/", wait_until="networkidle")
+                await page.goto(self.whatsapp_url, wait_until="networkidle")
                 
                 # 로그인 확인 (QR 코드 스캔 필요시)
                 await self._handle_login(page)
@@ -263,7 +266,7 @@ class WhatsAppRPAExtractor:
     async def _save_auth_state(self, context) -> None:
         """인증 상태 저장"""
         try:
-            await context.storage_state(path=str(self.auth_file))
+            self.auth_store.save(await context.storage_state())
             logger.info("💾 인증 상태 저장 완료")
         except Exception as e:
             logger.warning(f"⚠️ 인증 상태 저장 실패: {str(e)}")
@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+MACHO-GPT v3.4-mini 시계열 지표 저장소
+-------------------------------------
+Samsung C&T Logistics · HVDC Project
+
+장시간 모니터링에서도 메모리가 일정하도록 지표를 고정 크기 링 버퍼에
+열(column)별 array('d')로 보관합니다. 원본(raw) 외에 1분/1시간 롤업
+(avg/min/max)을 함께 유지하고, 요약 통계는 누적 집계(count/sum/min/max)로
+O(1)에 계산합니다. path를 지정하면 스냅샷을 원자적으로 저장/복원합니다.
+
+해상도:
+    raw - 수집 주기 그대로 (기본 8,640개 ≈ 10초 간격 1일)
+    1m  - 1분 버킷 (기본 10,080개 = 7일)
+    1h  - 1시간 버킷 (기본 2,160개 = 90일)
+
+사용법:
+    store = MetricsTimeSeries(["cpu_percent", "memory_percent"], path="data/perf.json")
+    store.append(time.time(), {"cpu_percent": 12.5, "memory_percent": 40.1})
+    store.summary()["average"]["cpu_percent"]
+    store.series("1m", since=time.time() - 3600)
+    store.save()
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+
+from atomic_io import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+RESOLUTIONS: Dict[str, int] = {"1m": 60, "1h": 3600}
+ROLLUP_FIELDS = ("avg", "min", "max")
+SNAPSHOT_VERSION = 1
+
+
+class RingSeries:
+    """
+    고정 크기 열 기반 링 버퍼/Fixed-capacity ring buffer with array-backed columns.
+
+    타임스탬프(epoch 초)와 각 열을 array('d')로 미리 할당하므로 항목 수와
+    무관하게 메모리가 capacity * (열 수 + 1) * 8 bytes로 고정됩니다.
+    """
+
+    def __init__(self, columns: Sequence[str], capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive: {capacity}")
+        self.columns = tuple(columns)
+        self.capacity = capacity
+        self._timestamps = array("d", bytes(8 * capacity))
+        self._values = {name: array("d", bytes(8 * capacity)) for name in self.columns}
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, timestamp: float, values: Mapping[str, float]) -> None:
+        """항목 추가 (가득 차면 가장 오래된 항목 덮어쓰기)/Append, overwriting the oldest."""
+        index = self._next
+        self._timestamps[index] = timestamp
+        for name in self.columns:
+            self._values[name][index] = float(values.get(name, 0.0))
+        self._next = (index + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def _indexes(self) -> Iterable[int]:
+        start = (self._next - self._size) % self.capacity
+        return ((start + offset) % self.capacity for offset in range(self._size))
+
+    def rows(self, since: Optional[float] = None, limit: Optional[int] = None) -> List[Dict[str, float]]:
+        """
+        오래된 순 행 목록/Rows in chronological order.
+
+        Args:
+            since: 이 시각(epoch 초) 이후 항목만
+            limit: 최근 N개만
+        """
+        indexes = list(self._indexes())
+        if limit is not None:
+            indexes = indexes[-limit:] if limit > 0 else []
+        rows = []
+        for index in indexes:
+            timestamp = self._timestamps[index]
+            if since is not None and timestamp < since:
+                continue
+            row = {"timestamp": timestamp}
+            row.update((name, self._values[name][index]) for name in self.columns)
+            rows.append(row)
+        return rows
+
+    def latest(self) -> Optional[Dict[str, float]]:
+        """가장 최근 항목/Newest row, if any."""
+        rows = self.rows(limit=1)
+        return rows[0] if rows else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        indexes = list(self._indexes())
+        return {
+            "capacity": self.capacity,
+            "timestamps": [self._timestamps[i] for i in indexes],
+            "columns": {name: [self._values[name][i] for i in indexes] for name in self.columns},
+        }
+
+    def load_dict(self, data: Mapping[str, Any]) -> None:
+        """스냅샷 복원 (용량이 줄었으면 최근 항목만)/Restore rows from a snapshot."""
+        timestamps = data.get("timestamps", [])
+        columns = {name: data.get("columns", {}).get(name, []) for name in self.columns}
+        start = max(0, len(timestamps) - self.capacity)
+        for offset in range(start, len(timestamps)):
+            values = {name: col[offset] for name, col in columns.items() if offset < len(col)}
+            self.append(timestamps[offset], values)
+
+
+class RunningStats:
+    """누적 집계 (count/sum/min/max)/O(1) running aggregates per column."""
+
+    def __init__(self, columns: Sequence[str]) -> None:
+        self.columns = tuple(columns)
+        self.reset()
+
+    def reset(self) -> None:
+        self.count = 0
+        self.first_timestamp: Optional[float] = None
+        self.last_timestamp: Optional[float] = None
+        self.sum = {name: 0.0 for name in self.columns}
+        self.min = {name: float("inf") for name in self.columns}
+        self.max = {name: float("-inf") for name in self.columns}
+
+    def add(self, timestamp: float, values: Mapping[str, float]) -> None:
+        self.count += 1
+        if self.first_timestamp is None:
+            self.first_timestamp = timestamp
+        self.last_timestamp = timestamp
+        for name in self.columns:
+            value = float(values.get(name, 0.0))
+            self.sum[name] += value
+            if value < self.min[name]:
+                self.min[name] = value
+            if value > self.max[name]:
+                self.max[name] = value
+
+    def mean(self, name: str) -> float:
+        return self.sum[name] / self.count if self.count else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "first_timestamp": self.first_timestamp,
+            "last_timestamp": self.last_timestamp,
+            "sum": dict(self.sum),
+            "min": {k: v for k, v in self.min.items() if self.count},
+            "max": {k: v for k, v in self.max.items() if self.count},
+        }
+
+    def load_dict(self, data: Mapping[str, Any]) -> None:
+        self.reset()
+        self.count = int(data.get("count", 0))
+        self.first_timestamp = data.get("first_timestamp")
+        self.last_timestamp = data.get("last_timestamp")
+        for name in self.columns:
+            self.sum[name] = float(data.get("sum", {}).get(name, 0.0))
+            if name in data.get("min", {}):
+                self.min[name] = float(data["min"][name])
+            if name in data.get("max", {}):
+                self.max[name] = float(data["max"][name])
+
+
+class Rollup:
+    """
+    고정 간격 다운샘플링/Downsampling into fixed-width time buckets.
+
+    진행 중인 버킷은 RunningStats로 누적하고, 버킷 경계를 넘으면
+    avg/min/max 한 행으로 링 버퍼에 확정합니다.
+    """
+
+    def __init__(self, columns: Sequence[str], width: int, capacity: int) -> None:
+        self.columns = tuple(columns)
+        self.width = width
+        self.ring = RingSeries(
+            [f"{name}_{field}" for name in self.columns for field in ROLLUP_FIELDS], capacity
+        )
+        self._bucket_start: Optional[float] = None
+        self._bucket = RunningStats(self.columns)
+
+    def add(self, timestamp: float, values: Mapping[str, float]) -> None:
+        bucket_start = timestamp - timestamp % self.width
+        if self._bucket_start is not None and bucket_start != self._bucket_start:
+            self._close()
+        self._bucket_start = bucket_start
+        self._bucket.add(timestamp, values)
+
+    def _row(self) -> Dict[str, float]:
+        row: Dict[str, float] = {}
+        for name in self.columns:
+            row[f"{name}_avg"] = self._bucket.mean(name)
+            row[f"{name}_min"] = self._bucket.min[name]
+            row[f"{name}_max"] = self._bucket.max[name]
+        return row
+
+    def _close(self) -> None:
+        if self._bucket.count and self._bucket_start is not None:
+            self.ring.append(self._bucket_start, self._row())
+        self._bucket.reset()
+
+    def rows(self, since: Optional[float] = None, include_partial: bool = True) -> List[Dict[str, float]]:
+        """확정 버킷 (+ 진행 중 버킷)/Closed buckets plus the open one."""
+        rows = self.ring.rows(since=since)
+        if include_partial and self._bucket.count and self._bucket_start is not None:
+            if since is None or self._bucket_start >= since:
+                rows.append({"timestamp": self._bucket_start, **self._row()})
+        return rows
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "ring": self.ring.to_dict(),
+            "bucket_start": self._bucket_start,
+            "bucket": self._bucket.to_dict(),
+        }
+
+    def load_dict(self, data: Mapping[str, Any]) -> None:
+        self.ring.load_dict(data.get("ring", {}))
+        self._bucket_start = data.get("bucket_start")
+        self._bucket.load_dict(data.get("bucket", {}))
+
+
+class MetricsTimeSeries:
+    """
+    다중 해상도 시계열 저장소/Multi-resolution fixed-memory metrics store.
+    """
+
+    def __init__(
+        self,
+        columns: Sequence[str],
+        raw_capacity: int = 8_640,
+        minute_capacity: int = 10_080,
+        hour_capacity: int = 2_160,
+        path: Optional[str | Path] = None,
+    ) -> None:
+        self.columns = tuple(columns)
+        self.path = Path(path) if path else None
+        self._lock = threading.Lock()
+        self.raw = RingSeries(self.columns, raw_capacity)
+        self.rollups = {
+            "1m": Rollup(self.columns, RESOLUTIONS["1m"], minute_capacity),
+            "1h": Rollup(self.columns, RESOLUTIONS["1h"], hour_capacity),
+        }
+        self.totals = RunningStats(self.columns)
+        if self.path is not None and self.path.exists():
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    def append(self, timestamp: float, values: Mapping[str, float]) -> None:
+        """지표 1건 기록 (raw + 롤업 + 누적 집계)/Record one sample at every resolution."""
+        with self._lock:
+            self.raw.append(timestamp, values)
+            for rollup in self.rollups.values():
+                rollup.add(timestamp, values)
+            self.totals.add(timestamp, values)
+
+    def series(self, resolution: str = "raw", since: Optional[float] = None) -> List[Dict[str, float]]:
+        """
+        해상도별 시계열/Rows for a resolution ("raw", "1m", "1h").
+
+        롤업 행은 <column>_avg/_min/_max 열을 가집니다.
+        """
+        with self._lock:
+            if resolution == "raw":
+                return self.raw.rows(since=since)
+            if resolution not in self.rollups:
+                raise ValueError(f"resolution must be 'raw' or one of {tuple(RESOLUTIONS)}: {resolution}")
+            return self.rollups[resolution].rows(since=since)
+
+    def summary(self) -> Dict[str, Any]:
+        """누적 요약 통계 (O(1))/Running summary over every recorded sample."""
+        with self._lock:
+            totals = self.totals
+            if not totals.count:
+                return {"count": 0, "average": {}, "min": {}, "max": {}}
+            return {
+                "count": totals.count,
+                "first_timestamp": totals.first_timestamp,
+                "last_timestamp": totals.last_timestamp,
+                "average": {name: totals.mean(name) for name in self.columns},
+                "min": dict(totals.min),
+                "max": dict(totals.max),
+            }
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "version": SNAPSHOT_VERSION,
+                "columns": list(self.columns),
+                "raw": self.raw.to_dict(),
+                "rollups": {name: rollup.to_dict() for name, rollup in self.rollups.items()},
+                "totals": self.totals.to_dict(),
+            }
+
+    def save(self, path: Optional[str | Path] = None) -> Optional[Path]:
+        """스냅샷 원자적 저장/Write a snapshot atomically (no-op without a path)."""
+        target = Path(path) if path else self.path
+        if target is None:
+            return None
+        atomic_write_json(target, self.to_dict(), indent=None)
+        return target
+
+    def load(self, path: Optional[str | Path] = None) -> bool:
+        """
+        스냅샷 복원/Restore a snapshot written by save().
+
+        Returns:
+            bool: 복원 성공 여부
+        """
+        source = Path(path) if path else self.path
+        if source is None or not source.exists():
+            return False
+        try:
+            with open(source, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.error("Invalid metrics snapshot %s: %s", source, exc)
+            return False
+        if data.get("version") != SNAPSHOT_VERSION:
+            logger.warning("Unsupported metrics snapshot version in %s", source)
+            return False
+
+        with self._lock:
+            self.raw.load_dict(data.get("raw", {}))
+            for name, rollup in self.rollups.items():
+                rollup.load_dict(data.get("rollups", {}).get(name, {}))
+            self.totals.load_dict(data.get("totals", {}))
+        return True
+
+
+def memory_footprint(store: MetricsTimeSeries) -> int:
+    """열 배열의 고정 메모리 크기 (bytes)/Preallocated column bytes."""
+    rings = [store.raw] + [rollup.ring for rollup in store.rollups.values()]
+    return sum(ring.capacity * (len(ring.columns) + 1) * 8 for ring in rings)
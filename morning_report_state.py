@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+MACHO-GPT v3.4-mini 증분 아침 보고서 상태
+---------------------------------------
+Samsung C&T Logistics · HVDC Project
+
+아침 보고서가 매일 세 채팅방을 처음부터 다시 스크래핑·요약하지 않도록,
+스크래퍼가 이미 기록한 메시지 저장소(GroupConfig.save_file, JSON 배열)를
+시간 창(지난 보고서 시각, 현재] 단위로 읽고 채팅방별 상태를 보관합니다.
+
+채팅방별 상태:
+    offset      저장소에서 이미 소비한 항목 수 (파일 재작성 시 0으로 재설정)
+    file_key    마지막으로 읽은 파일의 (mtime_ns, size) — 같으면 파일을 열지 않음
+    kpi         누적 KPI (총계 + 일자별 건수, 최근 ACCUMULATOR_DAYS일)
+
+상태 파일은 임시 파일 + os.replace로 원자적으로 교체되며, 보고서 저장에
+성공한 뒤에만 갱신되므로 실패한 실행은 다음 실행에서 같은 창을 다시 처리합니다.
+요약 캐시(메시지 창 digest → 요약)는 별도 파일(SummaryCache)에 요약 직후
+기록되므로, 이렇게 다시 처리되는 창은 LLM을 재호출하지 않습니다.
+
+사용법:
+    state = MorningReportState("reports/morning_reports/report_state.json")
+    builder = IncrementalReportBuilder(state, processor, summarise=cli.generate)
+    result = builder.build({"물류팀": "data/messages_logistics.json"})
+    ...
+    state.save()
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from atomic_io import FileKey, atomic_write_json, file_key
+
+logger = logging.getLogger(__name__)
+
+STATE_VERSION = 1
+ACCUMULATOR_DAYS = 30
+SUMMARY_CACHE_SIZE = 14
+TOP_SENDERS = 50
+DEFAULT_WINDOW = timedelta(hours=24)
+
+
+def _parse_time(value: Any) -> Optional[datetime]:
+    if not isinstance(value, str):
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def format_messages(messages: List[Dict[str, Any]]) -> str:
+    """
+    저장소 메시지 → WhatsAppProcessor가 파싱하는 내보내기 형식 텍스트
+
+    msg-meta의 시각("10:01")은 날짜가 없으므로 수집 시각(scraped_at)을 사용합니다.
+    """
+    lines = []
+    for message in messages:
+        scraped_at = _parse_time(message.get("scraped_at")) or datetime.now()
+        text = " ".join(str(message.get("text", "")).split())
+        if not text:
+            continue
+        sender = " ".join(str(message.get("sender") or "").replace(":", " ").split()) or "Unknown"
+        lines.append(f"[{scraped_at:%Y-%m-%d %H:%M:%S}] {sender}: {text}")
+    return "\n".join(lines)
+
+
+def window_digest(messages: List[Dict[str, Any]]) -> str:
+    """메시지 창 식별자 (요약 캐시 키)"""
+    digest = hashlib.sha1()
+    for message in messages:
+        for key in ("sender", "text", "timestamp", "scraped_at"):
+            digest.update(str(message.get(key, "")).encode("utf-8"))
+            digest.update(b"\x1f")
+        digest.update(b"\x1e")
+    return digest.hexdigest()
+
+
+@dataclass
+class KpiAccumulator:
+    """채팅방 누적 KPI/Running per-chat KPI counters."""
+
+    total_messages: int = 0
+    urgent_count: int = 0
+    important_count: int = 0
+    senders: Dict[str, int] = field(default_factory=dict)
+    hour_distribution: Dict[str, int] = field(default_factory=dict)
+    daily: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+    def add(self, parsed: List[Any]) -> None:
+        """파싱된 WhatsAppMessage 목록 누적"""
+        senders = Counter(self.senders)
+        for message in parsed:
+            day = self.daily.setdefault(
+                message.timestamp.strftime("%Y-%m-%d"), {"messages": 0, "urgent": 0, "important": 0}
+            )
+            day["messages"] += 1
+            day["urgent"] += int(message.is_urgent)
+            day["important"] += int(message.is_important)
+            hour = str(message.timestamp.hour)
+            self.hour_distribution[hour] = self.hour_distribution.get(hour, 0) + 1
+            senders[message.sender] += 1
+        self.total_messages += len(parsed)
+        self.urgent_count += sum(1 for message in parsed if message.is_urgent)
+        self.important_count += sum(1 for message in parsed if message.is_important)
+        self.senders = dict(senders.most_common(TOP_SENDERS))
+        for stale in sorted(self.daily)[:-ACCUMULATOR_DAYS]:
+            del self.daily[stale]
+
+    def recent(self, days: int = 7) -> Dict[str, float]:
+        """최근 N일 합계/평균 (일자 버킷 기준)"""
+        buckets = [self.daily[key] for key in sorted(self.daily)[-days:]]
+        messages = sum(bucket["messages"] for bucket in buckets)
+        urgent = sum(bucket["urgent"] for bucket in buckets)
+        return {
+            "days": len(buckets),
+            "messages": messages,
+            "urgent": urgent,
+            "avg_messages_per_day": round(messages / len(buckets), 2) if buckets else 0.0,
+            "urgent_ratio": round(urgent / messages, 4) if messages else 0.0,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "KpiAccumulator":
+        return cls(**{key: data[key] for key in cls.__dataclass_fields__ if key in data})
+
+
+@dataclass
+class ChatState:
+    """채팅방별 증분 상태/Per-chat cursor and KPI accumulator."""
+
+    offset: int = 0
+    file_key: Optional[List[int]] = None
+    last_scraped_at: Optional[str] = None
+    kpi: KpiAccumulator = field(default_factory=KpiAccumulator)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "offset": self.offset,
+            "file_key": self.file_key,
+            "last_scraped_at": self.last_scraped_at,
+            "kpi": self.kpi.__dict__,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ChatState":
+        return cls(
+            offset=int(data.get("offset", 0)),
+            file_key=data.get("file_key"),
+            last_scraped_at=data.get("last_scraped_at"),
+            kpi=KpiAccumulator.from_dict(data.get("kpi", {})),
+        )
+
+
+class MorningReportState:
+    """
+    증분 보고서 상태 파일/Persistent state shared by consecutive morning reports.
+
+    형식: {"version": 1, "last_report_at": iso, "chats": {name: ChatState}}
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.last_report_at: Optional[datetime] = None
+        self.chats: Dict[str, ChatState] = {}
+        self.load()
+
+    def load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"보고서 상태 파일을 읽을 수 없어 새로 시작합니다: {e}")
+            return
+        if data.get("version") != STATE_VERSION:
+            return
+        self.last_report_at = _parse_time(data.get("last_report_at"))
+        self.chats = {name: ChatState.from_dict(chat) for name, chat in data.get("chats", {}).items()}
+
+    def chat(self, name: str) -> ChatState:
+        return self.chats.setdefault(name, ChatState())
+
+    def save(self) -> None:
+        """임시 파일 기록 후 교체"""
+        payload = {
+            "version": STATE_VERSION,
+            "last_report_at": self.last_report_at.isoformat() if self.last_report_at else None,
+            "chats": {name: chat.to_dict() for name, chat in self.chats.items()},
+        }
+        atomic_write_json(self.path, payload)
+
+
+class SummaryCache:
+    """
+    요약 캐시/Window digest → summary, persisted apart from the report cursor.
+
+    상태 파일과 달리 요약할 때마다 바로 기록되므로, 보고서 저장에 실패해
+    같은 창을 다시 처리하는 실행도 이전 요약을 재사용합니다.
+    형식: {"version": 1, "chats": {name: {digest: summary}}}
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.chats: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"요약 캐시 파일을 읽을 수 없어 새로 시작합니다: {e}")
+            return
+        if data.get("version") == STATE_VERSION:
+            self.chats = {name: dict(entries) for name, entries in data.get("chats", {}).items()}
+
+    @classmethod
+    def beside(cls, state: MorningReportState) -> "SummaryCache":
+        """상태 파일 옆의 기본 캐시 (report_state.json → report_state.summaries.json)"""
+        return cls(state.path.with_name(f"{state.path.stem}.summaries.json"))
+
+    def get(self, name: str, digest: str) -> Optional[Dict[str, Any]]:
+        return self.chats.get(name, {}).get(digest)
+
+    def put(self, name: str, digest: str, summary: Dict[str, Any]) -> None:
+        """요약 기록 후 즉시 저장 (채팅방별 최근 SUMMARY_CACHE_SIZE개 유지)"""
+        entries = self.chats.setdefault(name, {})
+        entries[digest] = summary
+        while len(entries) > SUMMARY_CACHE_SIZE:
+            del entries[next(iter(entries))]
+        try:
+            atomic_write_json(self.path, {"version": STATE_VERSION, "chats": self.chats})
+        except OSError as e:
+            logger.warning(f"요약 캐시를 저장할 수 없습니다: {e}")
+
+
+@dataclass
+class ChatWindow:
+    """한 채팅방의 이번 창 처리 결과"""
+
+    name: str
+    new_messages: int = 0
+    summary: Optional[Dict[str, Any]] = None
+    cached: bool = False
+    kpi_7d: Dict[str, float] = field(default_factory=dict)
+
+
+@dataclass
+class IncrementalResult:
+    """증분 보고서 입력/Per-window result consumed by MorningReportGenerator."""
+
+    since: datetime
+    until: datetime
+    chats: List[ChatWindow] = field(default_factory=list)
+
+    @property
+    def total_messages(self) -> int:
+        return sum(chat.new_messages for chat in self.chats)
+
+    @property
+    def active_chats(self) -> List[ChatWindow]:
+        return [chat for chat in self.chats if chat.new_messages]
+
+    @property
+    def idle_chats(self) -> List[str]:
+        return [chat.name for chat in self.chats if not chat.new_messages]
+
+
+class IncrementalReportBuilder:
+    """
+    저장소 → 증분 요약/Summarise only messages newer than the last report.
+
+    summarise는 CLI.generate처럼 내보내기 형식 텍스트를 받아 key_points,
+    urgent_items, total_messages, confidence_score, processing_mode 속성
+    (또는 model_dump())을 가진 결과를 반환해야 합니다.
+    """
+
+    def __init__(
+        self,
+        state: MorningReportState,
+        processor: Any,
+        summarise: Callable[[str], Any],
+        default_window: timedelta = DEFAULT_WINDOW,
+        summaries: Optional[SummaryCache] = None,
+    ) -> None:
+        self.state = state
+        self.processor = processor
+        self.summarise = summarise
+        self.default_window = default_window
+        self.summaries = summaries if summaries is not None else SummaryCache.beside(state)
+
+    def read_window(
+        self, name: str, path: Path, since: datetime, until: datetime
+    ) -> Tuple[List[Dict[str, Any]], int, FileKey]:
+        """
+        저장소에서 (since, until] 창의 새 메시지 읽기
+
+        Returns:
+            (메시지 목록, 새 offset, 파일 key) — 파일이 그대로면 빈 목록
+        """
+        chat = self.state.chat(name)
+        key = file_key(path)
+        if key is None or (chat.file_key is not None and tuple(chat.file_key) == key):
+            return [], chat.offset, key
+        try:
+            entries = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"메시지 저장소를 읽을 수 없습니다 ({path}): {e}")
+            return [], chat.offset, chat.file_key and tuple(chat.file_key)
+        if not isinstance(entries, list):
+            return [], chat.offset, key
+
+        offset = chat.offset if chat.offset <= len(entries) else 0  # 파일 재작성 감지
+        messages: List[Dict[str, Any]] = []
+        for index in range(offset, len(entries)):
+            entry = entries[index]
+            scraped_at = _parse_time(entry.get("scraped_at")) if isinstance(entry, dict) else None
+            if scraped_at is not None and scraped_at > until:
+                return messages, index, None  # 창 이후 항목은 다음 보고서에서 처리
+            if isinstance(entry, dict) and (scraped_at is None or scraped_at > since):
+                messages.append(entry)
+        return messages, len(entries), key
+
+    def _summary_for(self, name: str, messages: List[Dict[str, Any]], text: str) -> Tuple[Dict[str, Any], bool]:
+        digest = window_digest(messages)
+        cached = self.summaries.get(name, digest)
+        if cached is not None:
+            return cached, True
+        result = self.summarise(text)
+        summary = result.model_dump() if hasattr(result, "model_dump") else dict(result)
+        self.summaries.put(name, digest, summary)
+        return summary, False
+
+    def build(self, store_files: Dict[str, str | Path], now: Optional[datetime] = None) -> IncrementalResult:
+        """
+        채팅방별 새 메시지 요약 및 KPI 누적 (상태는 메모리에서만 갱신)
+
+        Args:
+            store_files: 채팅방 이름 → 메시지 저장소 경로
+            now: 창 끝 시각 (기본: 현재)
+        """
+        until = now or datetime.now()
+        since = self.state.last_report_at or (until - self.default_window)
+        result = IncrementalResult(since=since, until=until)
+
+        for name, path in store_files.items():
+            chat = self.state.chat(name)
+            messages, offset, key = self.read_window(name, Path(path), since, until)
+            window = ChatWindow(name=name)
+            if messages:
+                text = format_messages(messages)
+                chat.kpi.add(self.processor.parse_whatsapp_text(text))
+                window.summary, window.cached = self._summary_for(name, messages, text)
+                window.new_messages = len(messages)
+                chat.last_scraped_at = messages[-1].get("scraped_at")
+            chat.offset = offset
+            chat.file_key = list(key) if key else None
+            window.kpi_7d = chat.kpi.recent(7)
+            result.chats.append(window)
+            logger.info(
+                f"채팅방 '{name}': 새 메시지 {window.new_messages}개"
+                + (" (요약 캐시 사용)" if window.cached else "")
+            )
+
+        self.state.last_report_at = until
+        return result
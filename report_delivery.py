@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+MACHO-GPT v3.4-mini 보고서 렌더링·메일 전송
+-------------------------------------------
+Samsung C&T Logistics · HVDC Project
+
+아침 보고서 HTML을 호출마다 f-string으로 조립하지 않도록 Jinja2 템플릿
+(templates/morning_report.html.j2)을 프로세스당 한 번 컴파일해 재사용하고,
+cache_dir가 주어지면 컴파일 결과를 바이트코드 캐시로 남겨 다음 실행의
+콜드 스타트도 줄입니다. 값은 자동 이스케이프됩니다.
+
+메일은 AsyncMailSender가 SMTP 연결 하나를 유지하며 수신자를 batch_size
+단위로 나눠 보냅니다. smtplib 호출은 작업 스레드에서 실행되므로 수신자가
+많아도 이벤트 루프를 막지 않습니다.
+
+사용법:
+    html = get_report_renderer(cache_dir="reports/.template_cache").render(report)
+    async with AsyncMailSender.from_env() as sender:
+        result = await sender.send("아침 보고서", html, recipients)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import html as html_lib
+import logging
+import os
+import smtplib
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import jinja2
+
+    JINJA2_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    jinja2 = None
+    JINJA2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TEMPLATE_DIR = Path(__file__).parent / "templates"
+MORNING_REPORT_TEMPLATE = "morning_report.html.j2"
+
+
+def _as_dict(report: Any) -> Dict[str, Any]:
+    return report.model_dump() if hasattr(report, "model_dump") else dict(report)
+
+
+class ReportRenderer:
+    """
+    컴파일된 보고서 템플릿/Precompiled, autoescaped report template.
+
+    auto_reload를 끄므로 렌더링마다 템플릿 파일을 stat하지 않습니다.
+    Jinja2가 없으면 스타일 없는 최소 HTML로 대체합니다.
+    """
+
+    def __init__(
+        self,
+        template_dir: str | Path = DEFAULT_TEMPLATE_DIR,
+        cache_dir: Optional[str | Path] = None,
+        template_name: str = MORNING_REPORT_TEMPLATE,
+    ) -> None:
+        self.template_name = template_name
+        self._template = None
+        self._env = None
+        if JINJA2_AVAILABLE:
+            bytecode_cache = None
+            if cache_dir is not None:
+                Path(cache_dir).mkdir(parents=True, exist_ok=True)
+                bytecode_cache = jinja2.FileSystemBytecodeCache(str(cache_dir))
+            self._env = jinja2.Environment(
+                loader=jinja2.FileSystemLoader(str(template_dir)),
+                autoescape=True,
+                auto_reload=False,
+                bytecode_cache=bytecode_cache,
+            )
+
+    @property
+    def template(self):
+        if self._template is None:
+            self._template = self._env.get_template(self.template_name)
+        return self._template
+
+    def render(self, report: Any, generated_at: Optional[datetime] = None) -> str:
+        """보고서(모델 또는 dict) → HTML"""
+        data = _as_dict(report)
+        generated = (generated_at or datetime.now()).strftime("%Y-%m-%d %H:%M:%S")
+        if self._env is None:
+            return self._render_plain(data, generated)
+        return self.template.render(report=data, generated_at=generated)
+
+    @staticmethod
+    def _render_plain(data: Dict[str, Any], generated_at: str) -> str:
+        sections = []
+        for title, key in (("긴급 사항", "urgent_items"), ("주요 내용", "key_points"),
+                           ("추천사항", "recommendations"), ("다음 액션", "next_actions")):
+            items = "".join(f"<li>{html_lib.escape(str(item))}</li>" for item in data.get(key, []))
+            sections.append(f"<h2>{title}</h2><ul>{items}</ul>")
+        return (
+            f"<html><body><h1>아침 보고서 - {html_lib.escape(str(data.get('report_date', '')))}</h1>"
+            f"<p>총 메시지: {data.get('total_messages', 0)}</p>{''.join(sections)}"
+            f"<p>생성일시: {generated_at}</p></body></html>"
+        )
+
+
+_RENDERERS: Dict[Tuple[str, Optional[str], str], ReportRenderer] = {}
+_RENDERERS_LOCK = threading.Lock()
+
+
+def get_report_renderer(
+    template_dir: str | Path = DEFAULT_TEMPLATE_DIR,
+    cache_dir: Optional[str | Path] = None,
+    template_name: str = MORNING_REPORT_TEMPLATE,
+) -> ReportRenderer:
+    """템플릿 경로별 공유 렌더러 (프로세스당 1회 컴파일)"""
+    key = (str(Path(template_dir).resolve()), str(cache_dir) if cache_dir else None, template_name)
+    with _RENDERERS_LOCK:
+        renderer = _RENDERERS.get(key)
+        if renderer is None:
+            renderer = _RENDERERS[key] = ReportRenderer(template_dir, cache_dir, template_name)
+        return renderer
+
+
+def build_message(subject: str, html: str, sender: str, recipients: Sequence[str]) -> MIMEMultipart:
+    """HTML 메일 메시지 생성"""
+    msg = MIMEMultipart("alternative")
+    msg["Subject"] = subject
+    msg["From"] = sender
+    msg["To"] = ", ".join(recipients)
+    msg.attach(MIMEText(html, "html", "utf-8"))
+    return msg
+
+
+@dataclass
+class DeliveryResult:
+    """전송 결과/Per-recipient delivery outcome."""
+
+    sent: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+    batches: int = 0
+    connections: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return bool(self.sent) and not self.failed
+
+
+class AsyncMailSender:
+    """
+    재사용 SMTP 연결 + 수신자 배치 전송/Async facade over one reusable SMTP connection.
+
+    smtplib 연결은 스레드 안전하지 않으므로 배치는 내부 잠금으로 직렬화되고,
+    끊긴 연결은 배치마다 한 번 재연결합니다. 이벤트 루프와 무관한 잠금을
+    쓰므로 asyncio.run()을 반복 호출하는 스케줄러에서도 인스턴스를 재사용할 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int = 587,
+        username: str = "",
+        password: str = "",
+        sender: Optional[str] = None,
+        use_starttls: bool = True,
+        batch_size: int = 50,
+        timeout: float = 30.0,
+        smtp_factory: Callable[..., smtplib.SMTP] = smtplib.SMTP,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size는 1 이상이어야 합니다")
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.sender = sender or username
+        self.use_starttls = use_starttls
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.smtp_factory = smtp_factory
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._lock = threading.Lock()
+        self.connections = 0
+
+    @classmethod
+    def from_env(cls, **kwargs: Any) -> Optional["AsyncMailSender"]:
+        """SMTP_SERVER/SMTP_PORT/SENDER_EMAIL/SENDER_PASSWORD 환경변수로 생성 (미설정 시 None)"""
+        sender_email = os.getenv("SENDER_EMAIL", "")
+        sender_password = os.getenv("SENDER_PASSWORD", "")
+        if not all([sender_email, sender_password]):
+            return None
+        return cls(
+            host=os.getenv("SMTP_SERVER", "smtp.gmail.com"),
+            port=int(os.getenv("SMTP_PORT", "587")),
+            username=sender_email,
+            password=sender_password,
+            **kwargs,
+        )
+
+    def _connect(self) -> smtplib.SMTP:
+        smtp = self.smtp_factory(self.host, self.port, timeout=self.timeout)
+        try:
+            smtp.ehlo()
+            if self.use_starttls:
+                smtp.starttls()
+                smtp.ehlo()
+            if self.username:
+                smtp.login(self.username, self.password)
+        except BaseException:
+            smtp.close()
+            raise
+        self.connections += 1
+        return smtp
+
+    def _drop(self) -> None:
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                self._smtp.close()
+            self._smtp = None
+
+    def _send_batch(self, subject: str, html: str, batch: List[str]) -> Dict[str, str]:
+        """배치 1건 전송 (작업 스레드) → 거부된 수신자"""
+        msg = build_message(subject, html, self.sender, batch)
+        with self._lock:
+            for attempt in (1, 2):
+                try:
+                    if self._smtp is None:
+                        self._smtp = self._connect()
+                    refused = self._smtp.send_message(msg, self.sender, batch)
+                    return {rcpt: f"{code} {reply.decode(errors='replace')}" for rcpt, (code, reply) in refused.items()}
+                except smtplib.SMTPRecipientsRefused as e:
+                    return {rcpt: f"{code} {reply.decode(errors='replace')}" for rcpt, (code, reply) in e.recipients.items()}
+                except (smtplib.SMTPServerDisconnected, ConnectionError) as e:
+                    self._smtp = None
+                    if attempt == 2:
+                        return {rcpt: f"disconnected: {e}" for rcpt in batch}
+                except (smtplib.SMTPException, OSError) as e:
+                    self._drop()
+                    return {rcpt: str(e) for rcpt in batch}
+        return {}
+
+    async def send(self, subject: str, html: str, recipients: Sequence[str]) -> DeliveryResult:
+        """수신자를 batch_size 단위로 나눠 전송 (연결 재사용)"""
+        result = DeliveryResult()
+        recipients = list(dict.fromkeys(recipients))
+        connections_before = self.connections
+        for start in range(0, len(recipients), self.batch_size):
+            batch = recipients[start:start + self.batch_size]
+            refused = await asyncio.to_thread(self._send_batch, subject, html, batch)
+            result.batches += 1
+            result.failed.update(refused)
+            result.sent.extend(rcpt for rcpt in batch if rcpt not in refused)
+        result.connections = self.connections - connections_before
+        if result.failed:
+            logger.warning(f"메일 전송 실패 {len(result.failed)}명: {sorted(result.failed)}")
+        logger.info(f"메일 전송 완료: {len(result.sent)}명, 배치 {result.batches}개")
+        return result
+
+    async def close(self) -> None:
+        """연결 종료"""
+        def _close() -> None:
+            with self._lock:
+                self._drop()
+
+        await asyncio.to_thread(_close)
+
+    async def __aenter__(self) -> "AsyncMailSender":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+MACHO-GPT v3.4-mini 브라우저 리소스 차단 정책
+-------------------------------------------
+Samsung C&T Logistics · HVDC Project
+
+스크래핑 모드별로 불필요한 요청(아바타·스티커·미디어 썸네일·폰트·이모지
+스프라이트)을 차단하여 탭당 메모리/대역폭을 줄이고 메시지 패널 렌더링을
+앞당깁니다.
+
+모드:
+    text  - 텍스트 전용: image/media/font 및 미디어·아바타 호스트 차단
+    media - 미디어/OCR: 폰트·아바타만 차단 (채팅 미디어는 허용)
+    full  - 차단 없음
+
+전략:
+    route - context.route 기반 (resource_type 판별, 모든 브라우저).
+            Playwright는 라우팅 활성화 시 HTTP 캐시를 끄므로 새 컨텍스트용.
+    cdp   - Chromium Network.setBlockedURLs 기반 (URL 패턴 판별).
+            HTTP 캐시가 유지되므로 영구 프로필(웜 스타트)용.
+
+사용법:
+    policy = ResourcePolicy("text")
+    await policy.apply(context)          # route 전략
+    await policy.apply_to_page(page)     # cdp 전략
+    print(policy.report())
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import weakref
+from collections import Counter
+from typing import Any, Dict, FrozenSet, Tuple
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+RESOURCE_MODES = ("text", "media", "full")
+RESOURCE_STRATEGIES = ("route", "cdp")
+
+# 모드별 차단 resource_type / 호스트
+_BLOCKED_TYPES: Dict[str, FrozenSet[str]] = {
+    "text": frozenset({"image", "media", "font"}),
+    "media": frozenset({"font"}),
+    "full": frozenset(),
+}
+_AVATAR_HOSTS = ("pps.whatsapp.net",)
+_MEDIA_HOSTS = ("mmg.whatsapp.net", "media.whatsapp.net")
+_BLOCKED_HOSTS: Dict[str, Tuple[str, ...]] = {
+    "text": _AVATAR_HOSTS + _MEDIA_HOSTS,
+    "media": _AVATAR_HOSTS,
+    "full": (),
+}
+
+# cdp 전략용 URL 패턴 (resource_type을 알 수 없으므로 확장자/호스트로 판별)
+_IMAGE_PATTERNS = ("*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.svg*")
+_MEDIA_PATTERNS = ("*.mp4*", "*.webm*", "*.ogg*", "*.mp3*")
+_FONT_PATTERNS = ("*.woff2*", "*.woff*", "*.ttf*", "*.otf*")
+_BLOCKED_PATTERNS: Dict[str, Tuple[str, ...]] = {
+    "text": tuple(f"*{host}*" for host in _BLOCKED_HOSTS["text"])
+    + _IMAGE_PATTERNS
+    + _MEDIA_PATTERNS
+    + _FONT_PATTERNS,
+    "media": tuple(f"*{host}*" for host in _BLOCKED_HOSTS["media"]) + _FONT_PATTERNS,
+    "full": (),
+}
+
+# 차단 요청 1건당 평균 크기 추정치 (bytes) - 실제 전송이 없으므로 추정
+ESTIMATED_BYTES = {"image": 25_000, "media": 250_000, "font": 60_000, "other": 10_000}
+
+
+class ResourcePolicy:
+    """모드별 요청 차단 정책 + 절감량 집계/Per-mode request blocking with savings report."""
+
+    def __init__(self, mode: str = "text", strategy: str = "route") -> None:
+        if mode not in RESOURCE_MODES:
+            raise ValueError(f"mode must be one of {RESOURCE_MODES}: {mode}")
+        if strategy not in RESOURCE_STRATEGIES:
+            raise ValueError(f"strategy must be one of {RESOURCE_STRATEGIES}: {strategy}")
+        self.mode = mode
+        self.strategy = strategy
+        self.blocked_types = _BLOCKED_TYPES[mode]
+        self.blocked_hosts = _BLOCKED_HOSTS[mode]
+        self.blocked = Counter()
+        self.allowed = 0
+        self._pages: "weakref.WeakSet[Any]" = weakref.WeakSet()
+        self._tasks: set = set()
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "full"
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        """차단 여부 판단/Decide whether a request is blocked."""
+        if resource_type in self.blocked_types:
+            return True
+        return urlsplit(url).hostname in self.blocked_hosts
+
+    def _record_blocked(self, resource_type: str) -> None:
+        kind = resource_type if resource_type in ESTIMATED_BYTES else "other"
+        self.blocked[kind] += 1
+
+    async def _handle_route(self, route: Any) -> None:
+        """route 핸들러/Abort or continue a routed request."""
+        request = route.request
+        if self.should_block(request.resource_type, request.url):
+            self._record_blocked(request.resource_type)
+            await route.abort("blockedbyclient")
+        else:
+            self.allowed += 1
+            await route.continue_()
+
+    async def apply(self, context: Any) -> None:
+        """컨텍스트 전체에 적용/Apply to a browser context (route strategy)."""
+        if not self.enabled:
+            return
+        if self.strategy == "cdp":
+            for page in context.pages:
+                await self.apply_to_page(page)
+            context.on("page", self._schedule_page)
+            return
+        await context.route("**/*", self._handle_route)
+        logger.info("Resource policy '%s' applied via context.route", self.mode)
+
+    def _schedule_page(self, page: Any) -> None:
+        """새 페이지에도 cdp 차단 적용/Apply CDP blocking to pages opened later."""
+        task = asyncio.ensure_future(self.apply_to_page(page))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def apply_to_page(self, page: Any) -> None:
+        """
+        페이지 단위 적용/Apply to a single page.
+
+        cdp 전략은 HTTP 캐시를 유지하므로 영구 프로필에서 사용합니다. CDP를
+        지원하지 않는 브라우저면 route 전략으로 대체합니다.
+        """
+        if not self.enabled or page in self._pages:
+            return
+        self._pages.add(page)
+
+        if self.strategy == "route":
+            await page.route("**/*", self._handle_route)
+            return
+
+        try:
+            session = await page.context.new_cdp_session(page)
+        except Exception as exc:
+            logger.warning("CDP unavailable (%s); falling back to page.route", exc)
+            await page.route("**/*", self._handle_route)
+            return
+
+        def _on_failed(event: Dict[str, Any]) -> None:
+            if event.get("blockedReason") == "inspector":
+                self._record_blocked(event.get("type", "other").lower())
+
+        def _on_finished(event: Dict[str, Any]) -> None:
+            self.allowed += 1
+
+        session.on("Network.loadingFailed", _on_failed)
+        session.on("Network.loadingFinished", _on_finished)
+        await session.send("Network.enable")
+        await session.send(
+            "Network.setBlockedURLs", {"urls": list(_BLOCKED_PATTERNS[self.mode])}
+        )
+        logger.info("Resource policy '%s' applied via CDP", self.mode)
+
+    def estimated_bytes_saved(self) -> int:
+        """차단 요청 기준 절감 바이트 추정/Estimated bytes not downloaded."""
+        return sum(ESTIMATED_BYTES[kind] * count for kind, count in self.blocked.items())
+
+    def report(self) -> Dict[str, Any]:
+        """절감 리포트/Savings report."""
+        return {
+            "mode": self.mode,
+            "strategy": self.strategy,
+            "blocked_requests": sum(self.blocked.values()),
+            "blocked_by_type": dict(self.blocked),
+            "allowed_requests": self.allowed,
+            "estimated_bytes_saved": self.estimated_bytes_saved(),
+        }
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""MACHO-GPT v3.4-mini Baileys Event Consumer CLI
+Baileys NDJSON 이벤트 수집 실행 스크립트/Browserless WhatsApp ingestion runner."""
+
+import argparse
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가/Add project root to import path.
+sys.path.insert(0, str(Path(__file__).parent))
+
+from macho_gpt.async_scraper.baileys_consumer import (
+    BaileysEventConsumer,
+    BaileysEventReplayer,
+)
+from macho_gpt.async_scraper.group_config import MultiGroupConfig
+
+logger = logging.getLogger(__name__)
+
+
+async def main() -> int:
+    """메인 실행 함수/Run CLI entrypoint."""
+    parser = argparse.ArgumentParser(description="MACHO-GPT Baileys Event Consumer")
+    parser.add_argument(
+        "--config",
+        "-c",
+        default="configs/multi_group_config.yaml",
+        help="YAML 설정 파일 경로 (group_jid 매핑 포함)",
+    )
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--socket", help="유닉스 소켓 경로 (Node NDJSON_SOCKET과 동일)")
+    source.add_argument("--port", type=int, help="로컬 TCP 포트 (127.0.0.1)")
+    source.add_argument("--replay", help="녹화된 NDJSON 이벤트 파일 재생")
+    parser.add_argument(
+        "--speed", type=float, default=0.0, help="재생 속도 배율 (0: 지연 없음)"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+
+    config = MultiGroupConfig.load_from_yaml(args.config)
+    consumer = BaileysEventConsumer(
+        config.whatsapp_groups, ai_integration=config.ai_integration.dict()
+    )
+    if not consumer.sinks:
+        print("[FAILED] group_jid가 설정된 그룹이 없습니다")
+        return 1
+
+    if args.replay:
+        stats = await BaileysEventReplayer(args.replay, speed=args.speed).replay(consumer)
+        print(f"[SUCCESS] Replay completed: {stats}")
+        return 0
+
+    if args.port:
+        server = await consumer.serve_tcp(port=args.port)
+    else:
+        server = await consumer.serve_unix(args.socket or "/tmp/wa_events.sock")
+
+    print(f"[START] Listening for Baileys events ({len(consumer.sinks)} groups)")
+    try:
+        async with server:
+            await server.serve_forever()
+    except asyncio.CancelledError:
+        pass
+    finally:
+        await consumer.flush()
+        print(f"[INFO] Stats: {consumer.stats}")
+    return 0
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(asyncio.run(main()))
+    except KeyboardInterrupt:
+        sys.exit(0)
@@ -123,6 +123,11 @@ def print_results(results: list) -> None:
                 f"      · Actor: {apify_run.get('actor_id', 'N/A')} / Run: {apify_run.get('run_id', 'N/A')}"
             )
             print(f"      · Remote items: {apify_run.get('dataset_items', 0)}")
+            if result.get("messages_file"):
+                print(
+                    f"      · Merged into: {result['messages_file']} "
+                    f"({result.get('duplicates_skipped', 0)} duplicates skipped)"
+                )
 
         if result.get("ai_summary"):
             print(f"   [AI] AI 요약 생성 완료")
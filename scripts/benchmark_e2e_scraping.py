@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+MACHO-GPT v3.4-mini 오프라인 E2E 스크래핑 벤치마크
+------------------------------------------------
+Samsung C&T Logistics · HVDC Project
+
+whatsapp_web_fixture의 로컬 정적 페이지(N개 그룹 × M개 메시지)를 대상으로
+AsyncGroupScraper, MultiGroupManager, RPA 추출기(WhatsAppRPAExtractor,
+HVDCWhatsAppExtractor)를 실제 Chromium으로 구동하고 그룹별 사이클 지연,
+messages/sec, 브라우저 RSS를 보고합니다. 네트워크·로그인이 필요 없습니다.
+
+RPA 추출기는 고정 대기(wait_for_timeout)가 대부분이므로 기본적으로 대기를
+건너뛰고 DOM 작업 시간만 측정합니다 (--with-waits로 실제 대기 포함).
+
+사용법:
+$ python -m playwright install chromium   # 최초 1회
+$ python scripts/benchmark_e2e_scraping.py --groups 5 --messages 200 --cycles 3
+$ python scripts/benchmark_e2e_scraping.py --output reports/e2e_benchmark.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# 프로젝트 루트 경로 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+from macho_gpt.async_scraper.async_scraper import AsyncGroupScraper
+from macho_gpt.async_scraper.group_config import GroupConfig, ScraperSettings
+from macho_gpt.async_scraper.metrics import ScraperMetrics
+from macho_gpt.async_scraper.multi_group_manager import MultiGroupManager
+from whatsapp_web_fixture import WhatsAppFixtureServer, generate_groups
+
+
+def chromium_available() -> bool:
+    """Playwright Chromium 설치 여부 (미설치 시 벤치마크/테스트 생략)"""
+    try:
+        from playwright.sync_api import sync_playwright
+
+        with sync_playwright() as p:
+            return Path(p.chromium.executable_path).exists()
+    except Exception:
+        return False
+
+
+def browser_rss_mb() -> Optional[float]:
+    """현재 프로세스의 하위 프로세스(브라우저) RSS 합계 (MB)"""
+    if not PSUTIL_AVAILABLE:
+        return None
+    total = 0
+    for child in psutil.Process().children(recursive=True):
+        try:
+            total += child.memory_info().rss
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    return round(total / (1024 * 1024), 1)
+
+
+def _latency_summary(samples: List[float]) -> Dict[str, float]:
+    """지연 시간 요약 (ms)"""
+    if not samples:
+        return {"mean_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+    return {
+        "mean_ms": round(statistics.mean(samples) * 1000, 2),
+        "p95_ms": round(p95 * 1000, 2),
+        "max_ms": round(ordered[-1] * 1000, 2),
+    }
+
+
+class _NoWaitPage:
+    """고정 대기를 건너뛰는 페이지 프록시 (RPA 추출기의 DOM 작업 시간만 측정)"""
+
+    def __init__(self, page: Any):
+        self._page = page
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._page, name)
+
+    async def wait_for_timeout(self, timeout: float) -> None:
+        await asyncio.sleep(0)
+
+
+async def bench_async_scraper(
+    url: str, group_names: List[str], cycles: int, new_per_cycle: int,
+    workdir: Path, headless: bool = True,
+) -> List[Dict[str, Any]]:
+    """
+    AsyncGroupScraper 그룹별 측정 (그룹마다 브라우저 1개, 순차 실행)
+
+    첫 사이클은 기존 메시지 전체, 이후 사이클은 __benchAppend로 추가된
+    new_per_cycle개를 수집합니다.
+    """
+    rows = []
+    for name in group_names:
+        metrics = ScraperMetrics()
+        config = GroupConfig(name=name, save_file=str(workdir / f"{name}.json"))
+        scraper = AsyncGroupScraper(
+            config, headless=headless, storage_state_path=None,
+            whatsapp_url=url, metrics=metrics,
+        )
+        rss_before = browser_rss_mb()
+        latencies: List[float] = []
+        messages = 0
+        try:
+            await scraper.initialize()
+            if not await scraper.wait_for_whatsapp_login(timeout=30):
+                raise RuntimeError("fixture chat list not ready")
+            if not await scraper.find_and_click_group():
+                raise RuntimeError(f"group not found in fixture: {name}")
+            for cycle in range(cycles):
+                if cycle:
+                    await scraper.page.evaluate("n => window.__benchAppend(n)", new_per_cycle)
+                started = time.perf_counter()
+                result = await scraper.run_scraping_cycle()
+                latencies.append(time.perf_counter() - started)
+                messages += result["messages_scraped"]
+            rss_after = browser_rss_mb()
+        finally:
+            await scraper.close()
+
+        stages = scraper.get_stats()["stages"]
+        busy = sum(latencies)
+        rows.append({
+            "group": name,
+            "init_s": stages.get("init", {}).get("sum"),
+            "login_s": stages.get("login", {}).get("sum"),
+            "find_group_s": stages.get("find_group", {}).get("sum"),
+            "cycle_latency": _latency_summary(latencies),
+            "messages": messages,
+            "messages_per_sec": round(messages / busy, 1) if busy else 0.0,
+            "rss_mb": (
+                round(rss_after - rss_before, 1)
+                if rss_before is not None and rss_after is not None else None
+            ),
+        })
+    return rows
+
+
+class _FixtureManager(MultiGroupManager):
+    """fixture URL로 접속하는 매니저 (인증 파일 미사용)"""
+
+    def __init__(self, *args: Any, fixture_url: str, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.fixture_url = fixture_url
+        self.peak_rss_mb: Optional[float] = None
+
+    def _create_scraper(self, group_config: GroupConfig) -> AsyncGroupScraper:
+        scraper = super()._create_scraper(group_config)
+        scraper.whatsapp_url = self.fixture_url
+        scraper.storage_state_path = None
+        return scraper
+
+
+async def bench_manager(
+    url: str, group_names: List[str], cycles: int, workdir: Path,
+    headless: bool = True, timeout: float = 120.0,
+) -> Dict[str, Any]:
+    """
+    MultiGroupManager 병렬 실행 측정
+
+    사이클 간 대기(scrape_interval)는 처리량 측정을 위해 0으로 두고, 모든
+    그룹이 cycles회 사이클을 마치면 중지합니다.
+    """
+    configs = [GroupConfig(name=name, save_file=str(workdir / f"mgr_{name}.json")) for name in group_names]
+    for config in configs:
+        config.scrape_interval = 0  # 검증(최소 10초) 이후 벤치마크 전용으로 해제
+    manager = _FixtureManager(
+        configs,
+        scraper_settings=ScraperSettings(
+            headless=headless, max_parallel_groups=min(10, len(configs)), auth_state_path=None,
+        ),
+        fixture_url=url,
+    )
+
+    started = time.perf_counter()
+    run_task = asyncio.create_task(manager.run_all_groups())
+    first_scrape: Dict[str, float] = {}
+    deadline = started + timeout
+    while time.perf_counter() < deadline and not run_task.done():
+        done = 0
+        for name in group_names:
+            histogram = manager.metrics.messages_per_cycle.get(name)
+            if histogram is not None:
+                first_scrape.setdefault(name, time.perf_counter() - started)
+                done += histogram.count >= cycles
+        rss = browser_rss_mb()
+        if rss is not None:
+            manager.peak_rss_mb = max(manager.peak_rss_mb or 0.0, rss)
+        if done == len(group_names):
+            break
+        await asyncio.sleep(0.05)
+    wall = time.perf_counter() - started
+    await manager.stop_all()
+    await asyncio.gather(run_task, return_exceptions=True)
+
+    stats = manager.get_stats()
+    messages = sum(
+        h.sum for name, h in manager.metrics.messages_per_cycle.items() if name in group_names
+    )
+    return {
+        "groups": len(group_names),
+        "wall_s": round(wall, 3),
+        "all_groups_first_scrape_s": round(max(first_scrape.values()), 3) if first_scrape else None,
+        "messages": int(messages),
+        "messages_per_sec": round(messages / wall, 1) if wall else 0.0,
+        "peak_rss_mb": manager.peak_rss_mb,
+        "rss_per_group_mb": (
+            round(manager.peak_rss_mb / len(group_names), 1) if manager.peak_rss_mb else None
+        ),
+        "extract_latency": {
+            name: group["stages"].get("extract", {}) for name, group in stats["groups"].items()
+        },
+        "slowest_stages": stats["slowest_stages"],
+    }
+
+
+async def bench_rpa_extractors(
+    url: str, group_names: List[str], headless: bool = True, with_waits: bool = False,
+) -> List[Dict[str, Any]]:
+    """WhatsAppRPAExtractor / HVDCWhatsAppExtractor 채팅방 추출 측정"""
+    from playwright.async_api import async_playwright
+
+    extractors = {}
+    try:
+        from macho_gpt.rpa.logi_rpa_whatsapp_241219 import WhatsAppRPAExtractor
+        extractors["WhatsAppRPAExtractor"] = (
+            WhatsAppRPAExtractor(), lambda ext, page, name: ext._extract_messages_from_chat(page, name)
+        )
+    except Exception as exc:  # 선택 의존성(AI 요약기 등) 부재 시 생략
+        print(f"⚠️ WhatsAppRPAExtractor 생략: {exc}")
+    try:
+        from whatsapp_rpa_hvdc_extract import HVDCWhatsAppExtractor
+        extractors["HVDCWhatsAppExtractor"] = (
+            HVDCWhatsAppExtractor(), lambda ext, page, name: ext.extract_single_chat(page, name)
+        )
+    except Exception as exc:
+        print(f"⚠️ HVDCWhatsAppExtractor 생략: {exc}")
+
+    rows = []
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=headless)
+        page = await browser.new_page()
+        target = page if with_waits else _NoWaitPage(page)
+        try:
+            for extractor_name, (extractor, run) in extractors.items():
+                for name in group_names:
+                    await page.goto(url, wait_until="domcontentloaded")
+                    started = time.perf_counter()
+                    result = await run(extractor, target, name)
+                    elapsed = time.perf_counter() - started
+                    count = len(result) if isinstance(result, list) else result.get("message_count", 0)
+                    rows.append({
+                        "extractor": extractor_name,
+                        "group": name,
+                        "latency_ms": round(elapsed * 1000, 2),
+                        "messages": count,
+                        "messages_per_sec": round(count / elapsed, 1) if elapsed else 0.0,
+                    })
+        finally:
+            await browser.close()
+    return rows
+
+
+async def run_benchmark(
+    groups: int = 3, messages: int = 200, cycles: int = 3, new_per_cycle: int = 20,
+    headless: bool = True, with_waits: bool = False,
+    skip_manager: bool = False, skip_rpa: bool = False,
+) -> Dict[str, Any]:
+    """fixture 서버 기동 후 전체 벤치마크 실행"""
+    fixture = generate_groups(groups, messages)
+    names = list(fixture)
+    report: Dict[str, Any] = {
+        "config": {
+            "groups": groups, "messages": messages, "cycles": cycles,
+            "new_per_cycle": new_per_cycle, "with_waits": with_waits,
+        },
+    }
+    with WhatsAppFixtureServer(fixture) as server, tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        report["async_scraper"] = await bench_async_scraper(
+            server.url, names, cycles, new_per_cycle, workdir, headless
+        )
+        if not skip_manager:
+            report["manager"] = await bench_manager(server.url, names, cycles, workdir, headless)
+        if not skip_rpa:
+            report["rpa"] = await bench_rpa_extractors(server.url, names, headless, with_waits)
+    return report
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    """표 형식 출력"""
+    print("=== AsyncGroupScraper (per group) ===")
+    for row in report["async_scraper"]:
+        latency = row["cycle_latency"]
+        print(
+            f"{row['group']:16s} init {row['init_s'] or 0:6.2f}s | cycle mean {latency['mean_ms']:8.1f}ms "
+            f"p95 {latency['p95_ms']:8.1f}ms | {row['messages_per_sec']:9.1f} msg/s | RSS {row['rss_mb']} MB"
+        )
+    if "manager" in report:
+        manager = report["manager"]
+        print("=== MultiGroupManager ===")
+        print(
+            f"{manager['groups']} groups | all first scrape {manager['all_groups_first_scrape_s']}s | "
+            f"{manager['messages_per_sec']} msg/s | RSS/group {manager['rss_per_group_mb']} MB"
+        )
+    if report.get("rpa"):
+        print("=== RPA extractors ===")
+        for row in report["rpa"]:
+            print(
+                f"{row['extractor']:22s} {row['group']:16s} {row['latency_ms']:9.1f}ms | "
+                f"{row['messages']:5d} msgs | {row['messages_per_sec']:9.1f} msg/s"
+            )
+
+
+def main() -> int:
+    """CLI 진입점"""
+    parser = argparse.ArgumentParser(description="Offline end-to-end scraping benchmark")
+    parser.add_argument("--groups", type=int, default=3, help="Synthetic groups (N)")
+    parser.add_argument("--messages", type=int, default=200, help="Messages per group (M)")
+    parser.add_argument("--cycles", type=int, default=3, help="Scraping cycles per group")
+    parser.add_argument("--new-per-cycle", type=int, default=20, help="Messages appended between cycles")
+    parser.add_argument("--headed", action="store_true", help="Show the browser")
+    parser.add_argument("--with-waits", action="store_true", help="Keep RPA fixed waits")
+    parser.add_argument("--skip-manager", action="store_true", help="Skip MultiGroupManager run")
+    parser.add_argument("--skip-rpa", action="store_true", help="Skip RPA extractors")
+    parser.add_argument("--output", help="Write JSON report to this path")
+    args = parser.parse_args()
+
+    if not chromium_available():
+        print("❌ Chromium not installed: python -m playwright install chromium")
+        return 1
+
+    report = asyncio.run(run_benchmark(
+        groups=args.groups, messages=args.messages, cycles=args.cycles,
+        new_per_cycle=args.new_per_cycle, headless=not args.headed,
+        with_waits=args.with_waits, skip_manager=args.skip_manager, skip_rpa=args.skip_rpa,
+    ))
+    print_report(report)
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"📊 Report saved: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
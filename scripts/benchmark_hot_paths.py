@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+"""
+MACHO-GPT v3.4-mini 핫패스 마이크로 벤치마크
+--------------------------------------------
+Samsung C&T Logistics · HVDC Project
+
+메시지 파싱·분류·요약 경로를 합성 코퍼스(1k/100k/1M 메시지)로 측정하고,
+저장된 기준값(baseline)과 비교하여 성능 회귀를 표시합니다.
+
+측정 대상:
+    parse_whatsapp_text, extract_summary_data, generate_kpi_summary
+    sanitize_ocr_text, sanitize_text + generate_search_tokens
+    mock_llm_summarise, CLI.simple_summary
+    WorkflowManager 일괄 생성(batch)·상태 갱신·요약/트리거
+
+기준값은 머신마다 다르므로 저장소에 커밋하지 않고 로컬에 보관합니다
+(기본: reports/benchmarks/hot_paths_baseline.json).
+
+사용법:
+$ python scripts/benchmark_hot_paths.py --sizes 1k,100k --save-baseline
+$ python scripts/benchmark_hot_paths.py --sizes 1k,100k --threshold 0.2   # 회귀 시 exit 1
+$ python scripts/benchmark_hot_paths.py --sizes 1M --cases parse_whatsapp_text --repeat 1
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import platform
+import random
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+# 프로젝트 루트 경로 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
+import text_sanitizer
+from atomic_io import atomic_write_json
+from macho_gpt.core.logi_whatsapp_241219 import WhatsAppProcessor
+
+DEFAULT_BASELINE = Path("reports/benchmarks/hot_paths_baseline.json")
+BASELINE_VERSION = 1
+SIZE_ALIASES = {"1k": 1_000, "10k": 10_000, "100k": 100_000, "1M": 1_000_000}
+
+SENDERS = ["김민수", "이영희", "Ahmed", "Rahul", "DSV Ops", "MOSB Gate", "박철수", "Site HSE"]
+_FRAGMENTS = [
+    "컨테이너 ABCU{n:07d} MOSB 도착",
+    "Gate pass for trailer {n} ready",
+    "vessel ETA {h:02d}:00 확인 부탁드립니다",
+    "긴급 crane booking {n} 변경",
+    "urgent: DSV delivery note {n} missing",
+    "AGI wall panel 승인 완료 #{n}",
+    "important - storage inspection {n} tomorrow",
+    "연락처 010-1234-{n4:04d} / ops{n}@samsungct.ae",
+    "🚢 HVDC shipment {n} 검토 중",
+    "ASAP decision needed for berth {n}",
+]
+_TITLES = ["[HVDC] 물류팀 🚢", "Abu Dhabi Logistics", "MOSB Gate · Yard", "AGI / DAS 현장", "DSV Delivery"]
+
+
+def parse_size(value: str) -> int:
+    """'1k'/'100k'/'1M' 또는 정수 문자열을 메시지 수로 변환"""
+    if value in SIZE_ALIASES:
+        return SIZE_ALIASES[value]
+    try:
+        return int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid corpus size: {value}") from None
+
+
+def size_label(size: int) -> str:
+    """메시지 수 → 기준값 키에 쓰는 라벨 (1000 → '1k')"""
+    for label, value in SIZE_ALIASES.items():
+        if value == size:
+            return label
+    return str(size)
+
+
+def build_corpus(messages: int, seed: int = 42) -> str:
+    """
+    합성 WhatsApp 내보내기 텍스트 생성
+
+    WhatsAppProcessor가 지원하는 세 가지 타임스탬프 형식을 섞고,
+    약 30%는 긴급/중요 키워드를 포함합니다.
+    """
+    rng = random.Random(seed)
+    start = datetime(2025, 7, 1, 6, 0, 0)
+    lines = []
+    for n in range(messages):
+        ts = start + timedelta(seconds=37 * n)
+        content = rng.choice(_FRAGMENTS).format(n=n, h=ts.hour, n4=n % 10000)
+        sender = rng.choice(SENDERS)
+        style = n % 3
+        if style == 0:
+            lines.append(f"[{ts:%Y-%m-%d %H:%M:%S}] {sender}: {content}")
+        elif style == 1:
+            lines.append(f"[{ts:%m/%d/%y, %I:%M:%S %p}] {sender}: {content}")
+        else:
+            lines.append(f"{ts:%m/%d/%y, %I:%M %p} - {sender}: {content}")
+    return "\n".join(lines)
+
+
+@dataclass
+class Corpus:
+    """사이즈별 공유 입력 (파싱 결과는 한 번만 계산)"""
+
+    size: int
+    text: str
+    lines: List[str]
+    _messages: Optional[list] = None
+
+    @property
+    def messages(self) -> list:
+        if self._messages is None:
+            self._messages = WhatsAppProcessor().parse_whatsapp_text(self.text)
+        return self._messages
+
+
+@dataclass
+class BenchCase:
+    """
+    벤치마크 케이스
+
+    setup(corpus)는 측정할 인자 없는 callable을 반환합니다. 반복마다 새 상태가
+    필요한 케이스(WorkflowManager)는 fresh=True로 매 반복 setup을 다시 호출하며,
+    setup 시간은 측정에서 제외됩니다.
+    """
+
+    name: str
+    setup: Callable[[Corpus], Callable[[], Any]]
+    fresh: bool = False
+
+
+def _case_parse(corpus: Corpus) -> Callable[[], Any]:
+    processor = WhatsAppProcessor()
+    return lambda: processor.parse_whatsapp_text(corpus.text)
+
+
+def _case_extract_summary(corpus: Corpus) -> Callable[[], Any]:
+    processor, messages = WhatsAppProcessor(), corpus.messages
+    return lambda: processor.extract_summary_data(messages)
+
+
+def _case_kpi_summary(corpus: Corpus) -> Callable[[], Any]:
+    processor, messages = WhatsAppProcessor(), corpus.messages
+    return lambda: processor.generate_kpi_summary(messages)
+
+
+def _case_sanitize_ocr(corpus: Corpus) -> Callable[[], Any]:
+    lines = corpus.lines
+    return lambda: [text_sanitizer.sanitize_ocr_text(line) for line in lines]
+
+
+def _case_sanitize_tokens(corpus: Corpus) -> Callable[[], Any]:
+    lines = corpus.lines
+
+    def run() -> None:
+        for i, line in enumerate(lines):
+            text_sanitizer.sanitize_text(line)
+            text_sanitizer.generate_search_tokens(_TITLES[i % len(_TITLES)])
+
+    return run
+
+
+def _case_mock_llm(corpus: Corpus) -> Callable[[], Any]:
+    from simplified_whatsapp_app import mock_llm_summarise
+
+    return lambda: mock_llm_summarise(corpus.text)
+
+
+def _case_cli_simple_summary(corpus: Corpus) -> Callable[[], Any]:
+    from scripts.whatsapp_summary_cli import CLI
+
+    cli = CLI(mode="PRIME")
+    return lambda: cli.simple_summary(corpus.text)
+
+
+def _workflow_manager(tmp_root: str):
+    from macho_gpt.core.logi_workflow_241219 import WorkflowManager
+
+    data_file = Path(tempfile.mkdtemp(dir=tmp_root)) / "workflow_data.json"
+    return WorkflowManager(data_file=str(data_file), compact_threshold=10**9)
+
+
+def _case_workflow_bulk(corpus: Corpus, tmp_root: str) -> Callable[[], Any]:
+    from macho_gpt.core.logi_workflow_241219 import TaskPriority, TaskStatus
+
+    manager = _workflow_manager(tmp_root)
+    room_ids = list(manager.chat_rooms)
+    priorities = list(TaskPriority)
+    now = datetime.now()
+
+    def run() -> None:
+        with manager.batch():
+            task_ids = [
+                manager.create_task(
+                    title=f"Task {n}",
+                    description="bench",
+                    chat_room_id=room_ids[n % len(room_ids)],
+                    assignee=SENDERS[n % len(SENDERS)],
+                    priority=priorities[n % len(priorities)],
+                    due_date=(now + timedelta(hours=(n % 96) - 48)).isoformat(),
+                )
+                for n in range(corpus.size)
+            ]
+            for n, task_id in enumerate(task_ids[::2]):
+                manager.update_task_status(task_id, TaskStatus.IN_PROGRESS, progress=float(n % 100))
+        manager.get_workflow_summary()
+        manager.get_team_workload()
+        manager.generate_workflow_triggers()
+
+    return run
+
+
+def build_cases(tmp_root: str) -> List[BenchCase]:
+    """기본 케이스 목록 (이름 순서가 보고서 순서)"""
+    return [
+        BenchCase("parse_whatsapp_text", _case_parse),
+        BenchCase("extract_summary_data", _case_extract_summary),
+        BenchCase("generate_kpi_summary", _case_kpi_summary),
+        BenchCase("sanitize_ocr_text", _case_sanitize_ocr),
+        BenchCase("sanitize_text+search_tokens", _case_sanitize_tokens),
+        BenchCase("mock_llm_summarise", _case_mock_llm),
+        BenchCase("cli_simple_summary", _case_cli_simple_summary),
+        BenchCase("workflow_bulk", lambda corpus: _case_workflow_bulk(corpus, tmp_root), fresh=True),
+    ]
+
+
+def measure(case: BenchCase, corpus: Corpus, repeat: int) -> Dict[str, float]:
+    """최고 실행 시간(best-of-N) 기준 측정 결과"""
+    best = float("inf")
+    func = None if case.fresh else case.setup(corpus)
+    for _ in range(repeat):
+        if case.fresh:
+            func = case.setup(corpus)
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return {
+        "seconds": round(best, 6),
+        "us_per_message": round(best / corpus.size * 1e6, 4) if corpus.size else 0.0,
+        "messages_per_sec": round(corpus.size / best, 1) if best else float("inf"),
+    }
+
+
+def run_benchmark(
+    sizes: Sequence[int],
+    repeat: int = 3,
+    case_names: Optional[Sequence[str]] = None,
+) -> Dict[str, Dict[str, float]]:
+    """
+    케이스 × 코퍼스 크기 측정
+
+    Returns:
+        Dict[str, Dict]: "<case>@<size>" → {seconds, us_per_message, messages_per_sec}
+    """
+    results: Dict[str, Dict[str, float]] = {}
+    # 케이스별 INFO 로그(태스크 생성 등)가 측정값을 왜곡하지 않도록 억제
+    previous_level = logging.root.manager.disable
+    logging.disable(logging.INFO)
+    try:
+        with tempfile.TemporaryDirectory(prefix="bench_hot_paths_") as tmp_root:
+            cases = build_cases(tmp_root)
+            if case_names:
+                unknown = set(case_names) - {case.name for case in cases}
+                if unknown:
+                    raise ValueError(f"unknown benchmark cases: {sorted(unknown)}")
+                cases = [case for case in cases if case.name in case_names]
+            for size in sizes:
+                text = build_corpus(size)
+                corpus = Corpus(size=size, text=text, lines=text.split("\n"))
+                for case in cases:
+                    results[f"{case.name}@{size_label(size)}"] = measure(case, corpus, repeat)
+    finally:
+        logging.disable(previous_level)
+    return results
+
+
+def load_baseline(path: Path) -> Dict[str, Dict[str, float]]:
+    """저장된 기준값 로드 (없거나 버전이 다르면 빈 dict)"""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != BASELINE_VERSION:
+        return {}
+    return data.get("results", {})
+
+
+def save_baseline(path: Path, results: Dict[str, Dict[str, float]]) -> None:
+    """기준값 저장 (기존 항목과 병합, 임시 파일 기록 후 교체)"""
+    merged = load_baseline(path)
+    merged.update(results)
+    payload = {
+        "version": BASELINE_VERSION,
+        "updated": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "machine": f"{platform.system()} {platform.machine()}",
+        "results": dict(sorted(merged.items())),
+    }
+    atomic_write_json(path, payload)
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    threshold: float = 0.2,
+) -> List[Dict[str, Any]]:
+    """
+    기준값 대비 비교
+
+    메시지당 시간이 기준값보다 threshold(비율) 이상 늘어난 항목을 회귀로 표시합니다.
+    기준값이 없는 항목은 status="new"입니다.
+    """
+    rows = []
+    for key, current in results.items():
+        base = baseline.get(key)
+        if not base or not base.get("us_per_message"):
+            rows.append({"case": key, "status": "new", "ratio": None, **current})
+            continue
+        ratio = current["us_per_message"] / base["us_per_message"]
+        if ratio > 1 + threshold:
+            status = "regression"
+        elif ratio < 1 - threshold:
+            status = "improved"
+        else:
+            status = "ok"
+        rows.append({"case": key, "status": status, "ratio": round(ratio, 3), **current})
+    return rows
+
+
+def print_report(rows: List[Dict[str, Any]]) -> None:
+    """결과 표 출력"""
+    print("=== Hot Path Micro-benchmarks ===")
+    for row in rows:
+        ratio = f"x{row['ratio']:.2f}" if row["ratio"] is not None else "  -  "
+        print(
+            f"{row['case']:36s} {row['seconds']:>10.4f}s "
+            f"{row['us_per_message']:>10.3f} us/msg {row['messages_per_sec']:>14,.0f} msg/s "
+            f"{ratio:>7s} {row['status'].upper()}"
+        )
+
+
+def main() -> int:
+    """CLI 진입점"""
+    parser = argparse.ArgumentParser(description="Benchmark parsing/summarisation hot paths")
+    parser.add_argument("--sizes", default="1k,100k", help="Corpus sizes, e.g. 1k,100k,1M")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions (best run is reported)")
+    parser.add_argument("--cases", default="", help="Comma-separated case names (default: all)")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON path")
+    parser.add_argument("--save-baseline", action="store_true", help="Store results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Regression threshold (0.2 = +20%%)")
+    parser.add_argument("--json", type=Path, help="Also write the comparison rows as JSON")
+    args = parser.parse_args()
+
+    sizes = [parse_size(value.strip()) for value in args.sizes.split(",") if value.strip()]
+    case_names = [name.strip() for name in args.cases.split(",") if name.strip()]
+    results = run_benchmark(sizes, repeat=args.repeat, case_names=case_names or None)
+    rows = compare(results, load_baseline(args.baseline), args.threshold)
+    print_report(rows)
+
+    if args.json:
+        args.json.write_text(json.dumps(rows, ensure_ascii=False, indent=2), encoding="utf-8")
+    if args.save_baseline:
+        save_baseline(args.baseline, results)
+        print(f"baseline saved: {args.baseline}")
+        return 0
+
+    regressions = [row["case"] for row in rows if row["status"] == "regression"]
+    if regressions:
+        print(f"❌ {len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
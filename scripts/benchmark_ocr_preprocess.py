@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+MACHO-GPT v3.4-mini OCR 전처리 벤치마크
+---------------------------------------
+Samsung C&T Logistics · HVDC Project
+
+원본(raw) 경로와 전처리(grayscale/trim/downscale) 경로의
+OCR 처리 시간·신뢰도·텍스트 일치율을 샘플 이미지로 비교합니다.
+
+정답 텍스트가 있으면 이미지와 같은 이름의 .txt 파일로 두세요
+(예: data/sample_01.png → data/sample_01.txt).
+
+사용법:
+$ python scripts/benchmark_ocr_preprocess.py --images data --engine easyocr
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import difflib
+import json
+import statistics
+import sys
+import time
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# 프로젝트 루트 경로 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
+from whatsapp_media_ocr_extractor import MediaOCRProcessor, PreprocessConfig
+
+IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg", ".webp", ".bmp"}
+
+
+def _similarity(left: str, right: str) -> float:
+    """공백 정규화 후 문자열 유사도 (0.0~1.0)"""
+    return difflib.SequenceMatcher(None, " ".join(left.split()), " ".join(right.split())).ratio()
+
+
+def _load_ground_truth(image_path: Path) -> Optional[str]:
+    """이미지와 같은 이름의 .txt 정답 파일 로드"""
+    truth_path = image_path.with_suffix(".txt")
+    if truth_path.exists():
+        return truth_path.read_text(encoding="utf-8")
+    return None
+
+
+async def _run_path(processor: MediaOCRProcessor, image_path: Path, engine: str) -> Dict[str, Any]:
+    """단일 경로(raw 또는 전처리) OCR 실행 및 시간 측정"""
+    started = time.perf_counter()
+    result = await processor.process_image(str(image_path), engine)
+    elapsed = time.perf_counter() - started
+    return {
+        "seconds": elapsed,
+        "text": result.get("text", ""),
+        "confidence": float(result.get("confidence", 0.0)),
+        "error": result.get("error"),
+    }
+
+
+async def run_benchmark(images: List[Path], engine: str, config: PreprocessConfig) -> Dict[str, Any]:
+    """raw vs 전처리 비교 벤치마크 실행"""
+    raw_processor = MediaOCRProcessor(preprocess_config=replace(config, enabled=False))
+    pre_processor = MediaOCRProcessor(preprocess_config=config)
+
+    rows: List[Dict[str, Any]] = []
+    for image_path in images:
+        raw = await _run_path(raw_processor, image_path, engine)
+        pre = await _run_path(pre_processor, image_path, engine)
+        truth = _load_ground_truth(image_path)
+
+        row = {
+            "image": str(image_path),
+            "raw_seconds": raw["seconds"],
+            "preprocessed_seconds": pre["seconds"],
+            "raw_confidence": raw["confidence"],
+            "preprocessed_confidence": pre["confidence"],
+            "agreement": _similarity(raw["text"], pre["text"]),
+            "raw_accuracy": _similarity(raw["text"], truth) if truth is not None else None,
+            "preprocessed_accuracy": _similarity(pre["text"], truth) if truth is not None else None,
+            "errors": [e for e in (raw["error"], pre["error"]) if e],
+        }
+        rows.append(row)
+        print(
+            f"🖼️ {image_path.name}: raw {raw['seconds']:.2f}s → pre {pre['seconds']:.2f}s "
+            f"(conf {raw['confidence']:.2f} → {pre['confidence']:.2f}, agreement {row['agreement']:.2f})"
+        )
+
+    def _mean(key: str) -> Optional[float]:
+        values = [r[key] for r in rows if r[key] is not None]
+        return statistics.mean(values) if values else None
+
+    raw_total = sum(r["raw_seconds"] for r in rows)
+    pre_total = sum(r["preprocessed_seconds"] for r in rows)
+    summary = {
+        "engine": engine,
+        "preprocess": config.cache_key(),
+        "images": len(rows),
+        "raw_total_seconds": raw_total,
+        "preprocessed_total_seconds": pre_total,
+        "speedup": (raw_total / pre_total) if pre_total else None,
+        "raw_mean_confidence": _mean("raw_confidence"),
+        "preprocessed_mean_confidence": _mean("preprocessed_confidence"),
+        "mean_agreement": _mean("agreement"),
+        "raw_mean_accuracy": _mean("raw_accuracy"),
+        "preprocessed_mean_accuracy": _mean("preprocessed_accuracy"),
+    }
+    return {"summary": summary, "results": rows}
+
+
+def main() -> int:
+    """CLI 진입점"""
+    parser = argparse.ArgumentParser(description="Benchmark OCR preprocessing against the raw path")
+    parser.add_argument("--images", default="data", help="Directory containing sample images")
+    parser.add_argument("--engine", default="easyocr", choices=["easyocr", "gcv"], help="OCR engine to use")
+    parser.add_argument("--max-side", type=int, default=1600, help="Preprocess target longest side (px)")
+    parser.add_argument("--limit", type=int, default=0, help="Maximum number of images (0 = all)")
+    parser.add_argument("--output", help="Optional JSON report path")
+    args = parser.parse_args()
+
+    image_dir = Path(args.images)
+    images = sorted(p for p in image_dir.rglob("*") if p.suffix.lower() in IMAGE_SUFFIXES)
+    if args.limit:
+        images = images[:args.limit]
+    if not images:
+        print(f"⚠️ 샘플 이미지를 찾을 수 없습니다: {image_dir}")
+        return 1
+
+    config = PreprocessConfig(max_side=args.max_side)
+    report = asyncio.run(run_benchmark(images, args.engine, config))
+
+    print("\n=== OCR Preprocess Benchmark ===")
+    for key, value in report["summary"].items():
+        print(f"{key}: {value:.3f}" if isinstance(value, float) else f"{key}: {value}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"📄 보고서 저장: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,30 +4,34 @@ MACHO-GPT v3.4-mini Morning Report System
 Samsung C&T Logistics · HVDC Project
 
 매일 아침 자동으로 WhatsApp 대화를 스크래핑하고 보고서를 생성하는 시스템
+
+스크래퍼 메시지 저장소(configs/multi_group_config.yaml의 save_file)가 있으면
+지난 보고서 이후의 새 메시지만 채팅방별로 요약하고(morning_report_state),
+저장소가 없을 때만 기존 스크래핑 경로를 사용합니다.
 """
 
 import asyncio
+import copy
 import json
 import logging
-import os
 import schedule
+import tempfile
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Any
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.base import MIMEBase
-from email import encoders
+import html
 
 import sys
 sys.path.append(str(Path(__file__).parent.parent))
 
+from artifact_index import record_artifact
 from logi_base_model import LogiBaseModel
 from macho_gpt.core.logi_whatsapp_241219 import WhatsAppProcessor
 from macho_gpt.core.role_config import get_enhanced_system_prompt, get_role_status
-from scripts.whatsapp_summary_cli import CLI
+from morning_report_state import IncrementalReportBuilder, IncrementalResult, MorningReportState, SummaryCache
+from report_delivery import AsyncMailSender, get_report_renderer
+from scripts.whatsapp_summary_cli import CLI, SummaryResult
 
 
 # Configure logging
@@ -60,70 +64,155 @@ class MorningReportData(LogiBaseModel):
 class MorningReportGenerator:
     """아침 보고서 생성기 / Morning report generator"""
     
-    def __init__(self, mode: str = "PRIME"):
+    def __init__(self, mode: str = "PRIME", reports_dir: str = "reports/morning_reports",
+                 config_path: str = "configs/multi_group_config.yaml",
+                 store_files: Optional[Dict[str, str]] = None,
+                 scrape_budget: float = 300.0):
         self.mode = mode
         self.processor = WhatsAppProcessor(mode=mode)
         self.cli = CLI(mode=mode)
-        self.reports_dir = Path("reports/morning_reports")
+        self.reports_dir = Path(reports_dir)
         self.reports_dir.mkdir(parents=True, exist_ok=True)
+        self.config_path = config_path
+        self.store_files = store_files
+        self.target_chats = ["MR.CHA 전용", "물류팀", "통관팀"]
+        self.scrape_budget = scrape_budget  # 스크래핑 전체 시간 예산(초)
+        self.state = MorningReportState(self.reports_dir / "report_state.json")
+        self.summary_cache = SummaryCache.beside(self.state)
+        self.renderer = get_report_renderer(
+            cache_dir=Path(tempfile.gettempdir()) / "macho_gpt_template_cache"
+        )
+        self.mail_sender: Optional[AsyncMailSender] = None  # 첫 전송 시 환경변수로 생성
+        self._pending_state: Optional[MorningReportState] = None  # save_report 성공 시 확정
+    
+    def _resolve_store_files(self) -> Dict[str, str]:
+        """채팅방 이름 → 메시지 저장소 경로 (존재하는 파일만)"""
+        store_files = self.store_files
+        if store_files is None:
+            try:
+                from macho_gpt.async_scraper.group_config import MultiGroupConfig
+                config = MultiGroupConfig.load_from_yaml(self.config_path)
+                store_files = {group.name: group.save_file for group in config.whatsapp_groups}
+            except Exception as e:
+                logger.warning(f"멀티 그룹 설정을 읽을 수 없습니다: {e}")
+                return {}
+        return {name: path for name, path in store_files.items() if Path(path).exists()}
+    
+    def build_incremental_report(self, now: Optional[datetime] = None) -> Optional[MorningReportData]:
+        """
+        지난 보고서 이후 새 메시지만으로 보고서 생성 / Build report from new stored messages only
+        
+        채팅방별 요약은 메시지 창 단위로 캐시되고 KPI는 누적값을 갱신하므로
+        처리 시간은 하루치 트래픽에 비례합니다. 상태 사본을 갱신하고
+        save_report가 성공했을 때만 self.state로 확정·저장합니다.
+        
+        Returns:
+            MorningReportData 또는 None (메시지 저장소가 없을 때)
+        """
+        store_files = self._resolve_store_files()
+        if not store_files:
+            return None
+        
+        self._pending_state = None
+        try:
+            pending = copy.deepcopy(self.state)
+            builder = IncrementalReportBuilder(
+                pending, self.processor, summarise=self.cli.generate, summaries=self.summary_cache
+            )
+            result = builder.build(store_files, now=now)
+            report = self._compose_incremental_report(result)
+        except Exception as e:
+            logger.error(f"증분 보고서 생성 오류: {e}")
+            return self._create_error_report()
+        self._pending_state = pending
+        return report
+    
+    def _compose_incremental_report(self, result: IncrementalResult) -> MorningReportData:
+        """채팅방별 요약·누적 KPI → 보고서 / Merge per-chat summaries into one report"""
+        key_points: List[str] = []
+        urgent_items: List[str] = []
+        weighted_confidence = 0.0
+        for chat in result.active_chats:
+            key_points.extend(f"[{chat.name}] {point}" for point in chat.summary.get("key_points", [])[:3])
+            urgent_items.extend(f"[{chat.name}] {item}" for item in chat.summary.get("urgent_items", [])[:3])
+            weighted_confidence += chat.summary.get("confidence_score", 0.0) * chat.new_messages
+        
+        total = result.total_messages
+        summary = SummaryResult(
+            key_points=key_points or ["지난 보고서 이후 새 메시지가 없습니다."],
+            urgent_items=urgent_items or ["긴급 처리 사항이 없습니다."],
+            total_messages=total,
+            summary_date=result.until.isoformat(),
+            confidence_score=round(weighted_confidence / total, 2) if total else 0.0,
+            processing_mode=self.mode
+        )
+        
+        recent = [chat.kpi_7d for chat in result.chats]
+        messages_7d = sum(item.get("messages", 0) for item in recent)
+        urgent_7d = sum(item.get("urgent", 0) for item in recent)
+        team_status = {
+            "active_teams": [chat.name for chat in result.active_chats],
+            "idle_chats": result.idle_chats,
+            "total_messages": total,
+            "window": {"since": result.since.isoformat(), "until": result.until.isoformat()},
+            "totals_7d": {"messages": messages_7d, "urgent": urgent_7d},
+            "workload_distribution": {
+                chat.name: round(chat.new_messages / total, 2) for chat in result.active_chats
+            } if total else {},
+            "chats": {
+                chat.name: {
+                    "new_messages": chat.new_messages,
+                    "summary_cached": chat.cached,
+                    "kpi_7d": chat.kpi_7d,
+                }
+                for chat in result.chats
+            },
+        }
+        
+        # kpi_metrics는 0–1 비율만 (템플릿이 백분율 막대로 표시), 건수는 team_status에
+        kpi_metrics = self._calculate_kpi_metrics(summary, team_status)
+        kpi_metrics["urgent_ratio_7d"] = round(urgent_7d / messages_7d, 4) if messages_7d else 0.0
+        recommendations = self._generate_recommendations(summary, kpi_metrics)
+        
+        return MorningReportData(
+            report_date=result.until.strftime("%Y-%m-%d"),
+            total_messages=total,
+            urgent_items=summary.urgent_items,
+            key_points=summary.key_points,
+            team_status=team_status,
+            kpi_metrics=kpi_metrics,
+            recommendations=recommendations,
+            next_actions=self._generate_next_actions(summary, recommendations),
+            confidence_score=summary.confidence_score,
+            processing_mode=self.mode
+        )
         
     async def scrape_whatsapp_conversations(self) -> List[str]:
         """WhatsApp 대화 스크래핑 / Scrape WhatsApp conversations"""
         try:
             logger.info("WhatsApp 대화 스크래핑 시작...")
             
-                        # 개선된 WhatsApp 스크래퍼 사용 (로딩 상태 개선 버전)
-            try:
-                from extract_whatsapp_loadfix import WhatsAppLoadFixScraper
-                from auth_setup import WhatsAppAuthSetup
-
-                # 인증 상태 확인
-                auth_setup = WhatsAppAuthSetup()
-                auth_valid = await auth_setup.verify_authentication()
-
-                if not auth_valid:
-                    logger.warning("WhatsApp 인증이 만료되었습니다. auth_setup.py --setup을 실행하세요.")
-                    # 샘플 데이터 사용
-                    sample_file = "test_whatsapp_sample.txt"
-                    if Path(sample_file).exists():
-                        with open(sample_file, 'r', encoding='utf-8') as f:
-                            conversations.append(f.read())
-                    return conversations
-
-                # 개선된 스크래퍼 사용
-                scraper = WhatsAppLoadFixScraper(chat_title=chat_title)
-                result = await scraper.run_with_fallback()
-                if result:
-                    conversations.append(result)
-                    logger.info(f"✅ 채팅방 '{chat_title}' 스크래핑 성공")
-                else:
-                    logger.warning(f"⚠️ 채팅방 '{chat_title}' 스크래핑 실패")
-                    
-            except ImportError:
-                logger.warning("개선된 스크래퍼를 찾을 수 없습니다. 기본 스크래퍼 사용")
-                from scripts.whatsapp_scraper import WhatsAppScraperManager
-                manager = WhatsAppScraperManager()
-            
-            # 주요 채팅방들 스크래핑
-            target_chats = ["MR.CHA 전용", "물류팀", "통관팀"]
-            conversations = []
+            # 브라우저 1개·로그인 1회로 대상 채팅방을 순환 수집 (시간 예산 내 부분 결과 허용)
+            from scripts.whatsapp_scraper import WhatsAppScraperManager
+            manager = WhatsAppScraperManager()
+            batch = await manager.scrape_conversations(
+                self.target_chats, hours_back=24, time_budget=self.scrape_budget
+            )
             
-            for chat_room in target_chats:
-                try:
-                    logger.info(f"채팅방 스크래핑: {chat_room}")
-                    messages = await manager.scrape_single_conversation(chat_room, hours_back=24)
-                    
-                    if messages:
-                        # 메시지를 텍스트로 변환
-                        chat_text = "\n".join([msg.content for msg in messages])
-                        conversations.append(chat_text)
-                        logger.info(f"채팅방 '{chat_room}'에서 {len(messages)}개 메시지 스크래핑")
-                    else:
-                        logger.warning(f"채팅방 '{chat_room}'에서 메시지를 찾을 수 없음")
-                        
-                except Exception as e:
-                    logger.error(f"채팅방 '{chat_room}' 스크래핑 오류: {e}")
-                    continue
+            conversations = []
+            for chat_room in self.target_chats:
+                messages = batch.conversations.get(chat_room)
+                if messages:
+                    # 메시지를 텍스트로 변환
+                    conversations.append("\n".join([msg.content for msg in messages]))
+                    logger.info(f"채팅방 '{chat_room}'에서 {len(messages)}개 메시지 스크래핑")
+                else:
+                    logger.warning(f"채팅방 '{chat_room}'에서 메시지를 찾을 수 없음")
+            if not batch.complete:
+                logger.warning(
+                    f"부분 스크래핑 결과 사용 (시간 초과: {batch.timed_out}, "
+                    f"건너뜀: {batch.skipped}, 실패: {batch.failed})"
+                )
             
             # 스크래핑 실패 시 수동 입력 데이터 또는 샘플 데이터 사용
             if not conversations:
@@ -330,165 +419,52 @@ class MorningReportGenerator:
             with open(filepath, 'w', encoding='utf-8') as f:
                 json.dump(report.model_dump(), f, ensure_ascii=False, indent=2)
             
+            record_artifact("morning_report", filepath, report_date=report.report_date)
+            
+            # 보고서가 저장된 경우에만 증분 상태 확정 (실패 시 같은 창 재처리)
+            if self._pending_state is not None:
+                self._pending_state.save()
+                self.state = self._pending_state
             logger.info(f"아침 보고서 저장 완료: {filepath}")
             return filepath
             
         except Exception as e:
             logger.error(f"보고서 저장 오류: {e}")
             return Path()
+        finally:
+            self._pending_state = None
     
     def generate_html_report(self, report: MorningReportData) -> str:
-        """HTML 보고서 생성 / Generate HTML report"""
+        """HTML 보고서 생성 (컴파일된 템플릿) / Render HTML report from the precompiled template"""
         try:
-            html_template = f"""
-<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>MACHO-GPT v3.4-mini 아침 보고서 - {report.report_date}</title>
-    <style>
-        body {{ font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; margin: 0; padding: 20px; background-color: #f5f5f5; }}
-        .container {{ max-width: 1200px; margin: 0 auto; background: white; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); overflow: hidden; }}
-        .header {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 30px; text-align: center; }}
-        .header h1 {{ margin: 0; font-size: 2.5em; }}
-        .header p {{ margin: 10px 0 0 0; opacity: 0.9; }}
-        .content {{ padding: 30px; }}
-        .section {{ margin-bottom: 30px; }}
-        .section h2 {{ color: #333; border-bottom: 2px solid #667eea; padding-bottom: 10px; }}
-        .metric-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 20px; margin: 20px 0; }}
-        .metric-card {{ background: #f8f9fa; padding: 20px; border-radius: 8px; text-align: center; border-left: 4px solid #667eea; }}
-        .metric-value {{ font-size: 2em; font-weight: bold; color: #667eea; }}
-        .metric-label {{ color: #666; margin-top: 5px; }}
-        .list-item {{ background: #f8f9fa; padding: 15px; margin: 10px 0; border-radius: 5px; border-left: 4px solid #28a745; }}
-        .urgent {{ border-left-color: #dc3545; }}
-        .recommendation {{ border-left-color: #ffc107; }}
-        .action {{ border-left-color: #17a2b8; }}
-        .footer {{ background: #333; color: white; padding: 20px; text-align: center; }}
-        .kpi-chart {{ background: #f8f9fa; padding: 20px; border-radius: 8px; margin: 20px 0; }}
-        .progress-bar {{ background: #e9ecef; height: 20px; border-radius: 10px; overflow: hidden; margin: 10px 0; }}
-        .progress-fill {{ height: 100%; background: linear-gradient(90deg, #667eea, #764ba2); transition: width 0.3s ease; }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🤖 MACHO-GPT v3.4-mini</h1>
-            <p>아침 보고서 - {report.report_date}</p>
-            <p>Samsung C&T Logistics · HVDC Project</p>
-        </div>
-        
-        <div class="content">
-            <div class="section">
-                <h2>📊 일일 개요</h2>
-                <div class="metric-grid">
-                    <div class="metric-card">
-                        <div class="metric-value">{report.total_messages}</div>
-                        <div class="metric-label">총 메시지</div>
-                    </div>
-                    <div class="metric-card">
-                        <div class="metric-value">{len(report.urgent_items)}</div>
-                        <div class="metric-label">긴급 사항</div>
-                    </div>
-                    <div class="metric-card">
-                        <div class="metric-value">{report.confidence_score:.1%}</div>
-                        <div class="metric-label">신뢰도</div>
-                    </div>
-                    <div class="metric-card">
-                        <div class="metric-value">{report.processing_mode}</div>
-                        <div class="metric-label">처리 모드</div>
-                    </div>
-                </div>
-            </div>
-            
-            <div class="section">
-                <h2>🚨 긴급 사항</h2>
-                {''.join([f'<div class="list-item urgent">🚨 {item}</div>' for item in report.urgent_items])}
-            </div>
-            
-            <div class="section">
-                <h2>🔑 주요 내용</h2>
-                {''.join([f'<div class="list-item">📋 {item}</div>' for item in report.key_points])}
-            </div>
-            
-            <div class="section">
-                <h2>📈 KPI 메트릭</h2>
-                <div class="kpi-chart">
-                    {''.join([f'''
-                    <div style="margin: 15px 0;">
-                        <div style="display: flex; justify-content: space-between; margin-bottom: 5px;">
-                            <span>{key.replace('_', ' ').title()}</span>
-                            <span>{value:.1%}</span>
-                        </div>
-                        <div class="progress-bar">
-                            <div class="progress-fill" style="width: {value*100}%"></div>
-                        </div>
-                    </div>
-                    ''' for key, value in report.kpi_metrics.items() if isinstance(value, float)])}
-                </div>
-            </div>
-            
-            <div class="section">
-                <h2>💡 추천사항</h2>
-                {''.join([f'<div class="list-item recommendation">💡 {item}</div>' for item in report.recommendations])}
-            </div>
-            
-            <div class="section">
-                <h2>✅ 다음 액션</h2>
-                {''.join([f'<div class="list-item action">✅ {item}</div>' for item in report.next_actions])}
-            </div>
-        </div>
-        
-        <div class="footer">
-            <p>생성일시: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</p>
-            <p>MACHO-GPT v3.4-mini · Samsung C&T Logistics</p>
-        </div>
-    </div>
-</body>
-</html>
-            """
-            
-            return html_template
+            return self.renderer.render(report)
             
         except Exception as e:
             logger.error(f"HTML 보고서 생성 오류: {e}")
-            return f"<html><body><h1>보고서 생성 오류</h1><p>{e}</p></body></html>"
+            return f"<html><body><h1>보고서 생성 오류</h1><p>{html.escape(str(e))}</p></body></html>"
     
-    def send_email_report(self, report: MorningReportData, html_content: str, recipients: List[str]) -> bool:
-        """이메일로 보고서 전송 / Send report via email"""
+    async def send_email_report_async(self, report: MorningReportData, html_content: str,
+                                      recipients: List[str]) -> bool:
+        """이메일로 보고서 전송 (이벤트 루프 비차단) / Send report via email without blocking the loop"""
         try:
-            # 이메일 설정 (실제 환경에서는 환경변수 사용)
-            smtp_server = os.getenv("SMTP_SERVER", "smtp.gmail.com")
-            smtp_port = int(os.getenv("SMTP_PORT", "587"))
-            sender_email = os.getenv("SENDER_EMAIL", "")
-            sender_password = os.getenv("SENDER_PASSWORD", "")
-            
-            if not all([sender_email, sender_password]):
+            if self.mail_sender is None:
+                self.mail_sender = AsyncMailSender.from_env()
+            if self.mail_sender is None:
                 logger.warning("이메일 설정이 완료되지 않았습니다. 보고서 전송을 건너뜁니다.")
                 return False
             
-            # 이메일 메시지 생성
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = f"MACHO-GPT v3.4-mini 아침 보고서 - {report.report_date}"
-            msg['From'] = sender_email
-            msg['To'] = ", ".join(recipients)
-            
-            # HTML 내용 추가
-            html_part = MIMEText(html_content, 'html', 'utf-8')
-            msg.attach(html_part)
-            
-            # SMTP 서버 연결 및 전송
-            with smtplib.SMTP(smtp_server, smtp_port) as server:
-                server.starttls()
-                server.login(sender_email, sender_password)
-                server.send_message(msg)
-            
-            logger.info(f"아침 보고서 이메일 전송 완료: {len(recipients)}명")
-            return True
+            subject = f"MACHO-GPT v3.4-mini 아침 보고서 - {report.report_date}"
+            result = await self.mail_sender.send(subject, html_content, recipients)
+            logger.info(f"아침 보고서 이메일 전송 완료: {len(result.sent)}명")
+            return result.ok
             
         except Exception as e:
             logger.error(f"이메일 전송 오류: {e}")
             return False
+    
+    def send_email_report(self, report: MorningReportData, html_content: str, recipients: List[str]) -> bool:
+        """이메일로 보고서 전송 (동기 호출용) / Send report via email from synchronous code"""
+        return asyncio.run(self.send_email_report_async(report, html_content, recipients))
 
 
 class MorningReportScheduler:
@@ -507,11 +483,13 @@ class MorningReportScheduler:
         try:
             logger.info("=== 아침 보고서 생성 시작 ===")
             
-            # 1. WhatsApp 대화 스크래핑
-            conversations = await self.generator.scrape_whatsapp_conversations()
+            # 1. 메시지 저장소 기반 증분 보고서 (지난 보고서 이후 메시지만)
+            report = self.generator.build_incremental_report()
             
-            # 2. 대화 분석 및 보고서 생성
-            report = self.generator.analyze_conversations(conversations)
+            # 2. 저장소가 없으면 WhatsApp 대화 스크래핑 후 전체 분석
+            if report is None:
+                conversations = await self.generator.scrape_whatsapp_conversations()
+                report = self.generator.analyze_conversations(conversations)
             
             # 3. 보고서 저장
             report_file = self.generator.save_report(report)
@@ -519,8 +497,10 @@ class MorningReportScheduler:
             # 4. HTML 보고서 생성
             html_content = self.generator.generate_html_report(report)
             
-            # 5. 이메일 전송
-            email_sent = self.generator.send_email_report(report, html_content, self.recipients)
+            # 5. 이메일 전송 (작업 스레드에서 SMTP 처리, 연결 재사용·배치 전송)
+            email_sent = await self.generator.send_email_report_async(report, html_content, self.recipients)
+            if self.generator.mail_sender is not None:
+                await self.generator.mail_sender.close()  # 다음 보고서까지 유휴 연결을 두지 않음
             
             # 6. HTML 파일 저장
             if report_file:
@@ -11,10 +11,15 @@ Samsung C&T Logistics · HVDC Project
 - MACHO-GPT 모듈 성능 측정
 - KPI 임계값 알림
 - JSON 형식 성능 보고서 생성
+
+모니터링 루프는 asyncio 기반으로, 서비스 포트를 공유 HTTP 커넥션 풀로 동시에
+확인하고 CPU 사용률은 틱 사이 델타(psutil.cpu_percent(interval=None))로
+측정하여 서비스 수와 무관하게 일정한 주기를 유지합니다.
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import time
 import psutil
@@ -22,7 +27,7 @@ import requests
 import os
 from datetime import datetime
 from typing import Any, Dict, List, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 import subprocess
 import threading
 import signal
@@ -32,6 +37,18 @@ from pathlib import Path
 # 프로젝트 루트 경로 추가
 sys.path.append(str(Path(__file__).parent.parent))
 
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+from artifact_index import record_artifact
+from metrics_timeseries import MetricsTimeSeries
+
+# 시계열 저장소 열 (SystemMetrics 수치 필드)
+METRIC_COLUMNS = ("cpu_percent", "memory_percent", "disk_percent", "network_sent", "network_recv")
+
 
 @dataclass
 class SystemMetrics:
@@ -61,6 +78,7 @@ class PerformanceReport:
     service_status: List[ServiceStatus]
     alerts: List[str]
     summary: Dict[str, Any]
+    rollups: Dict[str, List[Dict[str, float]]] = field(default_factory=dict)
 
 
 class PerformanceMonitor:
@@ -71,11 +89,21 @@ class PerformanceMonitor:
     Confidence: ≥0.95 필요
     """
     
-    def __init__(self, mode: str = "PRIME"):
+    def __init__(
+        self,
+        mode: str = "PRIME",
+        history_file: Optional[str] = None,
+        raw_capacity: int = 8_640,
+        persist_every: int = 30,
+    ):
         self.mode = mode
         self.confidence_threshold = 0.95
         self.is_running = False
-        self.metrics_history: List[SystemMetrics] = []
+        # 고정 메모리 시계열 (raw/1m/1h) - history_file 지정 시 재시작 후에도 유지
+        self.timeseries = MetricsTimeSeries(
+            METRIC_COLUMNS, raw_capacity=raw_capacity, path=history_file
+        )
+        self.persist_every = persist_every
         self.service_ports = [8505, 8508, 8509, 8510]
         self.kpi_thresholds = {
             'cpu_percent': 80.0,
@@ -85,12 +113,50 @@ class PerformanceMonitor:
         }
         self.alerts: List[str] = []
         self.start_time = None
-        
-    def collect_system_metrics(self) -> SystemMetrics:
-        """시스템 리소스 지표 수집"""
+        self.probe_timeout = 5.0
+        self.last_service_status: List[ServiceStatus] = []
+        self.tick_stats = {"ticks": 0, "overruns": 0, "last_tick_seconds": 0.0}
+    
+    @property
+    def metrics_history(self) -> List[SystemMetrics]:
+        """raw 링 버퍼의 지표 목록 (최근 raw_capacity개)"""
+        return [
+            SystemMetrics(
+                timestamp=datetime.fromtimestamp(row["timestamp"]).isoformat(),
+                cpu_percent=row["cpu_percent"],
+                memory_percent=row["memory_percent"],
+                disk_percent=row["disk_percent"],
+                network_sent=int(row["network_sent"]),
+                network_recv=int(row["network_recv"]),
+            )
+            for row in self.timeseries.series("raw")
+        ]
+    
+    def record_metrics(self, metrics: SystemMetrics) -> None:
+        """지표를 시계열 저장소에 기록 (persist_every회마다 디스크 저장)"""
+        try:
+            timestamp = datetime.fromisoformat(metrics.timestamp).timestamp()
+        except ValueError:
+            timestamp = time.time()
+        self.timeseries.append(timestamp, asdict(metrics))
+        if self.persist_every and self.timeseries.totals.count % self.persist_every == 0:
+            self.timeseries.save()
+    
+    def _average_metrics(self) -> Dict[str, float]:
+        """누적 평균 (O(1))"""
+        return self.timeseries.summary()["average"]
+        
+    def collect_system_metrics(self, cpu_interval: Optional[float] = 1) -> SystemMetrics:
+        """
+        시스템 리소스 지표 수집
+        
+        Args:
+            cpu_interval: CPU 측정 대기 시간(초). None이면 대기 없이 직전
+                호출 이후의 델타로 계산 (비동기 루프용)
+        """
         try:
             # CPU 사용률
-            cpu_percent = psutil.cpu_percent(interval=1)
+            cpu_percent = psutil.cpu_percent(interval=cpu_interval)
             
             # 메모리 사용률
             memory = psutil.virtual_memory()
@@ -174,6 +240,51 @@ class PerformanceMonitor:
                 error_message=str(e)
             )
     
+    async def check_service_status_async(self, client: Any, port: int) -> ServiceStatus:
+        """개별 서비스 상태 확인 (비동기, 공유 커넥션 풀)"""
+        if client is None:
+            # httpx 미설치 시 스레드에서 동기 확인
+            return await asyncio.to_thread(self.check_service_status, port)
+        
+        start_time = time.perf_counter()
+        try:
+            response = await client.get(f"http://localhost:{port}")
+        except httpx.ConnectError:
+            return ServiceStatus(port=port, status="stopped", response_time=None,
+                                 error_message="Connection refused")
+        except httpx.TimeoutException:
+            return ServiceStatus(port=port, status="timeout", response_time=None,
+                                 error_message="Request timeout")
+        except Exception as e:
+            return ServiceStatus(port=port, status="error", response_time=None,
+                                 error_message=str(e))
+        
+        response_time = time.perf_counter() - start_time
+        if response.status_code == 200:
+            return ServiceStatus(port=port, status="running", response_time=response_time,
+                                 error_message=None)
+        return ServiceStatus(port=port, status="error", response_time=response_time,
+                             error_message=f"HTTP {response.status_code}")
+    
+    async def check_all_services_async(self, client: Any) -> List[ServiceStatus]:
+        """모든 서비스 동시 확인 (틱 소요 시간 ≈ 가장 느린 서비스 1개)"""
+        return list(await asyncio.gather(
+            *(self.check_service_status_async(client, port) for port in self.service_ports)
+        ))
+    
+    def _create_http_client(self) -> Any:
+        """서비스 확인용 공유 HTTP 클라이언트 (keep-alive 커넥션 풀)"""
+        if not HTTPX_AVAILABLE:
+            return None
+        return httpx.AsyncClient(
+            timeout=self.probe_timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=len(self.service_ports),
+                max_keepalive_connections=len(self.service_ports),
+            ),
+        )
+    
     def check_all_services(self) -> List[ServiceStatus]:
         """모든 서비스 상태 일괄 확인"""
         service_statuses = []
@@ -252,22 +363,20 @@ class PerformanceMonitor:
     
     def generate_summary_report(self) -> Dict[str, Any]:
         """요약 보고서 생성"""
-        if not self.metrics_history:
+        if not self.timeseries.totals.count:
             return {}
         
-        # 평균 시스템 지표 계산
-        total_metrics = len(self.metrics_history)
-        avg_cpu = sum(m.cpu_percent for m in self.metrics_history) / total_metrics
-        avg_memory = sum(m.memory_percent for m in self.metrics_history) / total_metrics
-        avg_disk = sum(m.disk_percent for m in self.metrics_history) / total_metrics
-        
-        # 최대 사용률
-        max_cpu = max(m.cpu_percent for m in self.metrics_history)
-        max_memory = max(m.memory_percent for m in self.metrics_history)
-        max_disk = max(m.disk_percent for m in self.metrics_history)
+        # 누적 집계 기반 평균/최대 (이력 전체 재계산 없음)
+        stats = self.timeseries.summary()
+        avg_cpu = stats["average"]["cpu_percent"]
+        avg_memory = stats["average"]["memory_percent"]
+        avg_disk = stats["average"]["disk_percent"]
+        max_cpu = stats["max"]["cpu_percent"]
+        max_memory = stats["max"]["memory_percent"]
+        max_disk = stats["max"]["disk_percent"]
         
         return {
-            "monitoring_duration": len(self.metrics_history),
+            "monitoring_duration": stats["count"],
             "average_metrics": {
                 "cpu_percent": round(avg_cpu, 2),
                 "memory_percent": round(avg_memory, 2),
@@ -285,13 +394,14 @@ class PerformanceMonitor:
     
     def calculate_health_score(self) -> float:
         """시스템 건강 점수 계산 (0-100)"""
-        if not self.metrics_history:
+        if not self.timeseries.totals.count:
             return 0.0
         
         # 평균 시스템 사용률 기반 점수 계산
-        avg_cpu = sum(m.cpu_percent for m in self.metrics_history) / len(self.metrics_history)
-        avg_memory = sum(m.memory_percent for m in self.metrics_history) / len(self.metrics_history)
-        avg_disk = sum(m.disk_percent for m in self.metrics_history) / len(self.metrics_history)
+        averages = self._average_metrics()
+        avg_cpu = averages["cpu_percent"]
+        avg_memory = averages["memory_percent"]
+        avg_disk = averages["disk_percent"]
         
         # 점수 계산 (낮은 사용률일수록 높은 점수)
         cpu_score = max(0, 100 - avg_cpu)
@@ -306,12 +416,13 @@ class PerformanceMonitor:
         """성능 개선 권장사항 생성"""
         recommendations = []
         
-        if not self.metrics_history:
+        if not self.timeseries.totals.count:
             return ["모니터링 데이터 부족"]
         
-        avg_cpu = sum(m.cpu_percent for m in self.metrics_history) / len(self.metrics_history)
-        avg_memory = sum(m.memory_percent for m in self.metrics_history) / len(self.metrics_history)
-        avg_disk = sum(m.disk_percent for m in self.metrics_history) / len(self.metrics_history)
+        averages = self._average_metrics()
+        avg_cpu = averages["cpu_percent"]
+        avg_memory = averages["memory_percent"]
+        avg_disk = averages["disk_percent"]
         
         if avg_cpu > 70:
             recommendations.append("CPU 사용률 최적화: 백그라운드 프로세스 확인 필요")
@@ -339,14 +450,20 @@ class PerformanceMonitor:
         report = PerformanceReport(
             monitoring_start=self.start_time or "Unknown",
             system_metrics=self.metrics_history,
-            service_status=self.check_all_services(),
+            service_status=self.last_service_status or self.check_all_services(),
             alerts=self.alerts,
-            summary=self.generate_summary_report()
+            summary=self.generate_summary_report(),
+            rollups={
+                "1m": self.timeseries.series("1m"),
+                "1h": self.timeseries.series("1h"),
+            },
         )
         
         with open(filename, 'w', encoding='utf-8') as f:
             json.dump(asdict(report), f, ensure_ascii=False, indent=2)
         
+        record_artifact("performance_report", filename, alerts=len(self.alerts))
+        self.timeseries.save()
         return filename
     
     def signal_handler(self, signum, frame):
@@ -367,7 +484,57 @@ class PerformanceMonitor:
         
         sys.exit(0)
     
-    def start_monitoring(self, interval: int = 10):
+    async def monitor_loop(self, interval: float = 10, max_ticks: Optional[int] = None):
+        """
+        비동기 모니터링 루프 (고정 주기)
+        
+        다음 틱 시각을 시작 시각 + n * interval로 고정하므로 측정 소요 시간이
+        주기에 누적되지 않습니다. 한 틱이 주기를 넘기면 밀린 틱은 건너뜁니다.
+        
+        Args:
+            interval: 모니터링 간격 (초)
+            max_ticks: 지정 시 해당 횟수 후 종료 (테스트/일회성 실행용)
+        """
+        loop = asyncio.get_running_loop()
+        self.is_running = True
+        self.start_time = self.start_time or datetime.now().isoformat()
+        
+        # 첫 델타 측정 기준점 설정 (interval=None 첫 호출은 0.0 반환)
+        psutil.cpu_percent(interval=None)
+        
+        client = self._create_http_client()
+        next_tick = loop.time()
+        try:
+            while self.is_running:
+                tick_start = loop.time()
+                
+                # 서비스 확인은 동시에, 시스템 지표는 대기 없이 수집
+                probes = asyncio.ensure_future(self.check_all_services_async(client))
+                metrics = self.collect_system_metrics(cpu_interval=None)
+                services = await probes
+                
+                self.record_metrics(metrics)
+                self.last_service_status = services
+                self.alerts.extend(self.check_kpi_thresholds(metrics, services))
+                self.print_real_time_status(metrics, services)
+                
+                self.tick_stats["ticks"] += 1
+                self.tick_stats["last_tick_seconds"] = round(loop.time() - tick_start, 3)
+                if max_ticks is not None and self.tick_stats["ticks"] >= max_ticks:
+                    break
+                
+                next_tick += interval
+                now = loop.time()
+                if now > next_tick:
+                    self.tick_stats["overruns"] += 1
+                    next_tick += ((now - next_tick) // interval + 1) * interval
+                await asyncio.sleep(next_tick - now)
+        finally:
+            self.is_running = False
+            if client is not None:
+                await client.aclose()
+    
+    def start_monitoring(self, interval: float = 10):
         """실시간 모니터링 시작"""
         print("🚀 MACHO-GPT v3.4-mini 성능 모니터링 시작")
         print(f"📊 모니터링 간격: {interval}초")
@@ -376,28 +543,10 @@ class PerformanceMonitor:
         # 신호 핸들러 등록
         signal.signal(signal.SIGINT, self.signal_handler)
         
-        self.is_running = True
         self.start_time = datetime.now().isoformat()
         
         try:
-            while self.is_running:
-                # 시스템 지표 수집
-                metrics = self.collect_system_metrics()
-                self.metrics_history.append(metrics)
-                
-                # 서비스 상태 확인
-                services = self.check_all_services()
-                
-                # KPI 임계값 확인
-                new_alerts = self.check_kpi_thresholds(metrics, services)
-                self.alerts.extend(new_alerts)
-                
-                # 실시간 상태 출력
-                self.print_real_time_status(metrics, services)
-                
-                # 대기
-                time.sleep(interval)
-                
+            asyncio.run(self.monitor_loop(interval))
         except KeyboardInterrupt:
             self.signal_handler(signal.SIGINT, None)
 
@@ -407,11 +556,15 @@ def main():
     import argparse
     
     parser = argparse.ArgumentParser(description="MACHO-GPT v3.4-mini 성능 모니터링")
-    parser.add_argument("--interval", type=int, default=10, help="모니터링 간격 (초)")
+    parser.add_argument("--interval", type=float, default=10, help="모니터링 간격 (초)")
     parser.add_argument("--mode", default="PRIME", help="모니터링 모드")
+    parser.add_argument("--history-file", default=None, help="시계열 스냅샷 파일 (재시작 후 이력 유지)")
+    parser.add_argument("--raw-capacity", type=int, default=8640, help="raw 해상도 보관 개수")
     args = parser.parse_args()
     
-    monitor = PerformanceMonitor(mode=args.mode)
+    monitor = PerformanceMonitor(
+        mode=args.mode, history_file=args.history_file, raw_capacity=args.raw_capacity
+    )
     monitor.start_monitoring(interval=args.interval)
 
 
@@ -4,6 +4,11 @@ MACHO-GPT v3.4-mini WhatsApp Scraper
 Samsung C&T Logistics · HVDC Project
 
 WhatsApp Web에서 대화를 자동으로 스크래핑하는 모듈
+
+여러 채팅방은 WhatsAppSession 하나(브라우저 1회 기동 + 로그인 1회)에서
+채팅방을 차례로 전환하며 수집합니다. WhatsApp Web은 같은 계정의 탭을 여러 개
+열면 다른 탭을 비활성화하므로 탭 병렬 대신 단일 페이지 순환을 사용하며,
+전체 시간 예산(time_budget)을 넘기면 그때까지의 결과를 반환합니다.
 """
 
 import asyncio
@@ -40,71 +45,139 @@ class WhatsAppMessage(LogiBaseModel):
     is_urgent: bool = False
 
 
+UA_LIST = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 " +
+    "(KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 " +
+    "(KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 " +
+    "(KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36"
+]
+WHATSAPP_URL = "https://web.whatsapp.com/"
+CHAT_LIST_SELECTOR = '[data-testid="chat-list"]'
+SEARCH_BOX_SELECTOR = '[data-testid="chat-list-search"]'
+
+
+class WhatsAppSession:
+    """
+    로그인된 WhatsApp Web 페이지 1개 / One logged-in WhatsApp Web page.
+    
+    여러 채팅방 스크래핑이 브라우저 기동·로그인을 공유하도록 async with로
+    사용합니다. 채팅방 전환은 같은 페이지에서 일어나므로 lock으로 직렬화합니다.
+    """
+    
+    def __init__(self, auth_file: Path = Path("auth.json"), headless: bool = True,
+                 whatsapp_url: str = WHATSAPP_URL, login_timeout: float = 60.0):
+        self.auth_file = Path(auth_file)
+        self.headless = headless
+        self.whatsapp_url = whatsapp_url
+        self.login_timeout = login_timeout
+        self.lock = asyncio.Lock()
+        self.page = None
+        self._playwright = None
+        self._browser = None
+    
+    async def __aenter__(self) -> "WhatsAppSession":
+        self._playwright = await async_playwright().start()
+        try:
+            self._browser = await self._playwright.chromium.launch(
+                headless=self.headless,
+                args=["--disable-blink-features=AutomationControlled"]
+            )
+            context = await self._browser.new_context(
+                storage_state=self.auth_file if self.auth_file.exists() else None,
+                user_agent=random.choice(UA_LIST),
+                viewport={"width": 1280, "height": 720},
+                locale="en-US"
+            )
+            self.page = await context.new_page()
+            await self.page.goto(self.whatsapp_url)
+            await self.page.wait_for_selector(CHAT_LIST_SELECTOR, timeout=self.login_timeout * 1000)
+            logger.info("WhatsApp Web 접속 완료 (세션 공유)")
+        except BaseException:
+            await self.__aexit__(None, None, None)
+            raise
+        return self
+    
+    async def __aexit__(self, *exc) -> None:
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+        self.page = None
+
+
+class ScrapeBatchResult(LogiBaseModel):
+    """여러 채팅방 스크래핑 결과 / Multi-chat scrape result (may be partial)"""
+    
+    conversations: Dict[str, List[WhatsAppMessage]] = {}
+    timed_out: List[str] = []
+    skipped: List[str] = []
+    failed: List[str] = []
+    elapsed_seconds: float = 0.0
+    
+    @property
+    def complete(self) -> bool:
+        return not (self.timed_out or self.skipped or self.failed)
+
+
 class WhatsAppScraper:
     """WhatsApp 스크래퍼 / WhatsApp scraper"""
     
     def __init__(self, chat_title: str = "MR.CHA 전용"):
         self.chat_title = chat_title
         self.auth_file = Path("auth.json")
-        self.ua_list = [
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 " +
-            "(KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 " +
-            "(KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 " +
-            "(KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36"
-        ]
+        self.ua_list = UA_LIST
         
     async def scrape_conversation(self, hours_back: int = 24) -> List[WhatsAppMessage]:
-        """대화 스크래핑 / Scrape conversation"""
+        """대화 스크래핑 (브라우저 단독 기동) / Scrape one conversation in its own browser"""
         try:
             logger.info(f"WhatsApp 대화 스크래핑 시작: {self.chat_title}")
             
-            async with async_playwright() as p:
-                # 브라우저 설정
-                browser = await p.chromium.launch(
-                    headless=True,
-                    args=["--disable-blink-features=AutomationControlled"]
-                )
-                
-                # 컨텍스트 설정
-                context = await browser.new_context(
-                    storage_state=self.auth_file if self.auth_file.exists() else None,
-                    user_agent=random.choice(self.ua_list),
-                    viewport={"width": 1280, "height": 720},
-                    locale="en-US"
-                )
-                
-                page = await context.new_page()
-                # 기본 Playwright 사용 (stealth_async 제거)
-                
-                # WhatsApp Web 접속
-                await page.goto("https://web.whatsapp.com/")
-                logger.info("WhatsApp Web 접속 완료")
+            async with WhatsAppSession(self.auth_file) as session:
+                messages: List[WhatsAppMessage] = []
+                await self.scrape_in_page(session.page, hours_back, messages)
                 
-                # 채팅방 대기 및 선택
-                await page.wait_for_selector(f'[title="{self.chat_title}"]', timeout=60000)
-                logger.info(f"채팅방 발견: {self.chat_title}")
-                
-                # 사람처럼 클릭 + 랜덤 지연
-                await page.get_by_title(self.chat_title).click()
-                await page.wait_for_timeout(random.randint(2000, 5000))
-                
-                # 스크롤하여 과거 메시지 로드
-                await self._scroll_for_messages(page, hours_back)
-                
-                # 메시지 추출
-                messages = await self._extract_messages(page)
-                
-                await browser.close()
-                
-                logger.info(f"스크래핑 완료: {len(messages)}개 메시지")
-                return messages
+            logger.info(f"스크래핑 완료: {len(messages)}개 메시지")
+            return messages
                 
         except Exception as e:
             logger.error(f"WhatsApp 스크래핑 오류: {e}")
             return []
     
+    async def open_chat(self, page) -> None:
+        """채팅방 열기 (목록에 없으면 검색) / Open the chat, searching if not listed"""
+        title = page.locator(f'[title="{self.chat_title}"]')
+        if await title.count() == 0:
+            search = page.locator(SEARCH_BOX_SELECTOR)
+            await search.click()
+            await page.keyboard.press("Control+A")
+            await page.keyboard.type(self.chat_title)
+        await page.wait_for_selector(f'[title="{self.chat_title}"]', timeout=60000)
+        logger.info(f"채팅방 발견: {self.chat_title}")
+        
+        # 사람처럼 클릭 + 랜덤 지연
+        await title.first.click()
+        await page.wait_for_timeout(random.randint(2000, 5000))
+    
+    async def scrape_in_page(self, page, hours_back: int, sink: List[WhatsAppMessage]) -> List[WhatsAppMessage]:
+        """
+        로그인된 페이지에서 채팅방 수집 / Scrape this chat on an already logged-in page
+        
+        추출한 메시지는 sink에 바로 추가되므로 시간 초과로 취소되어도
+        그때까지의 결과가 남습니다.
+        """
+        await self.open_chat(page)
+        
+        # 스크롤하여 과거 메시지 로드
+        await self._scroll_for_messages(page, hours_back)
+        
+        # 메시지 추출
+        await self._extract_messages(page, sink)
+        return sink
+    
     async def _scroll_for_messages(self, page, hours_back: int):
         """메시지 로드를 위한 스크롤 / Scroll to load messages"""
         try:
@@ -126,13 +199,13 @@ class WhatsAppScraper:
         except Exception as e:
             logger.warning(f"스크롤 중 오류: {e}")
     
-    async def _extract_messages(self, page) -> List[WhatsAppMessage]:
+    async def _extract_messages(self, page, sink: Optional[List[WhatsAppMessage]] = None) -> List[WhatsAppMessage]:
         """메시지 추출 / Extract messages"""
         try:
             # 메시지 요소들 찾기
             message_elements = await page.locator(".message-in, .message-out").all()
             
-            messages = []
+            messages = sink if sink is not None else []
             for element in message_elements:
                 try:
                     # 메시지 내용 추출
@@ -177,7 +250,7 @@ class WhatsAppScraper:
             
         except Exception as e:
             logger.error(f"메시지 추출 오류: {e}")
-            return []
+            return sink if sink is not None else []
     
     def _check_urgency(self, content: str) -> bool:
         """긴급성 확인 / Check urgency"""
@@ -248,8 +321,9 @@ class WhatsAppScraper:
 class WhatsAppScraperManager:
     """WhatsApp 스크래퍼 관리자 / WhatsApp scraper manager"""
     
-    def __init__(self):
+    def __init__(self, session_factory=WhatsAppSession):
         self.scrapers = {}
+        self.session_factory = session_factory
         self.chat_rooms = [
             "MR.CHA 전용",
             "물류팀",
@@ -258,32 +332,85 @@ class WhatsAppScraperManager:
             "프로젝트팀"
         ]
     
-    async def scrape_all_conversations(self, hours_back: int = 24) -> Dict[str, List[WhatsAppMessage]]:
-        """모든 채팅방 스크래핑 / Scrape all conversations"""
-        results = {}
+    async def scrape_all_conversations(self, hours_back: int = 24,
+                                       time_budget: Optional[float] = None) -> Dict[str, List[WhatsAppMessage]]:
+        """모든 채팅방 스크래핑 (브라우저 1개 공유) / Scrape all conversations in one session"""
+        result = await self.scrape_conversations(self.chat_rooms, hours_back, time_budget)
+        return result.conversations
+    
+    async def scrape_conversations(self, chat_rooms: List[str], hours_back: int = 24,
+                                   time_budget: Optional[float] = None,
+                                   save: bool = True) -> ScrapeBatchResult:
+        """
+        여러 채팅방 순환 스크래핑 / Rotate through chats in one logged-in session
         
-        for chat_room in self.chat_rooms:
-            try:
-                logger.info(f"채팅방 스크래핑 시작: {chat_room}")
+        Args:
+            chat_rooms: 채팅방 이름 목록 (우선순위 순)
+            hours_back: 채팅방별 스크롤 범위 (시간)
+            time_budget: 로그인 포함 전체 시간 예산(초). 초과 시 진행 중인
+                채팅방은 그때까지 추출한 메시지만, 남은 채팅방은 skipped로 반환
+            save: 채팅방별 JSON/텍스트 자동 저장 여부
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        deadline = started + time_budget if time_budget else None
+        result = ScrapeBatchResult()
+        
+        def remaining() -> Optional[float]:
+            return None if deadline is None else deadline - loop.time()
+        
+        try:
+            session = self.session_factory()
+            await asyncio.wait_for(session.__aenter__(), remaining())
+        except asyncio.TimeoutError:
+            logger.error("시간 예산 내에 WhatsApp Web 로그인이 완료되지 않았습니다")
+            result.skipped = list(chat_rooms)
+            result.elapsed_seconds = round(loop.time() - started, 3)
+            return result
+        except Exception as e:
+            logger.error(f"WhatsApp 세션 시작 오류: {e}")
+            result.failed = list(chat_rooms)
+            result.elapsed_seconds = round(loop.time() - started, 3)
+            return result
+        
+        try:
+            for index, chat_room in enumerate(chat_rooms):
+                budget = remaining()
+                if budget is not None and budget <= 0:
+                    result.skipped.extend(chat_rooms[index:])
+                    logger.warning(f"시간 예산 소진, 건너뜀: {', '.join(chat_rooms[index:])}")
+                    break
+                
                 scraper = WhatsAppScraper(chat_room)
-                messages = await scraper.scrape_conversation(hours_back)
+                self.scrapers[chat_room] = scraper
+                messages: List[WhatsAppMessage] = []
+                logger.info(f"채팅방 스크래핑 시작: {chat_room}")
+                try:
+                    async with session.lock:
+                        await asyncio.wait_for(scraper.scrape_in_page(session.page, hours_back, messages), budget)
+                except asyncio.TimeoutError:
+                    result.timed_out.append(chat_room)
+                    logger.warning(f"시간 예산 초과: {chat_room} (부분 결과 {len(messages)}개)")
+                except Exception as e:
+                    result.failed.append(chat_room)
+                    logger.error(f"채팅방 스크래핑 오류 ({chat_room}): {e}")
                 
                 if messages:
-                    results[chat_room] = messages
-                    
-                    # 자동 저장
-                    scraper.save_conversation(messages)
-                    scraper.export_as_text(messages)
-                    
-                else:
+                    result.conversations[chat_room] = messages
+                    if save:
+                        scraper.save_conversation(messages)
+                        scraper.export_as_text(messages)
+                elif chat_room not in result.failed:
                     logger.warning(f"채팅방에서 메시지를 찾을 수 없음: {chat_room}")
-                    
-            except Exception as e:
-                logger.error(f"채팅방 스크래핑 오류 ({chat_room}): {e}")
-                continue
+        finally:
+            await session.__aexit__(None, None, None)
         
-        logger.info(f"전체 스크래핑 완료: {len(results)}개 채팅방")
-        return results
+        result.elapsed_seconds = round(loop.time() - started, 3)
+        logger.info(
+            f"전체 스크래핑 완료: {len(result.conversations)}/{len(chat_rooms)}개 채팅방, "
+            f"{result.elapsed_seconds:.1f}초"
+        )
+        return result
     
     async def scrape_single_conversation(self, chat_room: str, hours_back: int = 24) -> List[WhatsAppMessage]:
         """단일 채팅방 스크래핑 / Scrape single conversation"""
@@ -311,6 +438,7 @@ async def main():
     parser.add_argument("--chat", type=str, help="스크래핑할 채팅방 이름")
     parser.add_argument("--hours", type=int, default=24, help="몇 시간 전까지 스크래핑할지")
     parser.add_argument("--all", action="store_true", help="모든 채팅방 스크래핑")
+    parser.add_argument("--budget", type=float, help="전체 시간 예산(초), 초과 시 부분 결과")
     
     args = parser.parse_args()
     
@@ -318,7 +446,7 @@ async def main():
     
     if args.all:
         # 모든 채팅방 스크래핑
-        results = await manager.scrape_all_conversations(args.hours)
+        results = await manager.scrape_all_conversations(args.hours, time_budget=args.budget)
         print(f"총 {len(results)}개 채팅방에서 {sum(len(msgs) for msgs in results.values())}개 메시지 스크래핑 완료")
         
     elif args.chat:
@@ -1,25 +1,74 @@
 # session_manager.py
 import asyncio
+import time
 from pathlib import Path
-from playwright.async_api import async_playwright, BrowserContext
+from typing import Dict, Optional
+
+from playwright.async_api import async_playwright, BrowserContext, Page
+
+from resource_policy import ResourcePolicy
+
+WHATSAPP_URL = "https://web.whatsapp.com/"
+# networkidle 대신 "채팅 목록 준비" 신호로 로딩 완료 판단
+CHAT_LIST_READY_SELECTOR = '#side, #pane-side, [data-testid="chat-list"]'
+
+
+class WarmStartMetrics:
+    """웜 스타트 단계별 경과 시간 (세션 시작 기준, 초)"""
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.marks: Dict[str, float] = {}
+
+    def mark(self, name: str) -> float:
+        """단계 기록 (최초 1회만)"""
+        if name not in self.marks:
+            self.marks[name] = time.perf_counter() - self.started_at
+        return self.marks[name]
+
+    @property
+    def time_to_first_scrape(self) -> Optional[float]:
+        return self.marks.get("first_scrape")
+
+    def as_dict(self) -> Dict[str, float]:
+        return {name: round(value, 3) for name, value in self.marks.items()}
+
+
+async def wait_for_chat_list_ready(page: Page, timeout: int = 60_000) -> bool:
+    """채팅 목록이 보일 때까지 대기 (로그인 필요 시 False)"""
+    try:
+        await page.wait_for_selector(CHAT_LIST_READY_SELECTOR, timeout=timeout)
+        return True
+    except Exception:
+        return False
+
 
 class _GlobalSession:
-    """Playwright PersistentContext 싱글턴"""
+    """Playwright PersistentContext 싱글턴
+
+    프로필 디렉토리(HTTP 캐시·IndexedDB 포함)를 재사용하므로 두 번째 실행부터는
+    WhatsApp Web 앱 번들을 다시 내려받지 않고 채팅 목록까지 빠르게 도달합니다.
+    """
     _instance: BrowserContext | None = None
     _playwright = None
+    _standby: Optional[asyncio.Task] = None
+    metrics: Optional[WarmStartMetrics] = None
+    resource_policy: Optional[ResourcePolicy] = None
 
     @classmethod
     async def get(cls) -> BrowserContext:
         if cls._instance and not cls._instance.is_closed():
             return cls._instance      # 이미 열려있으면 재사용
 
+        cls.metrics = WarmStartMetrics()
+
         # Playwright 인스턴스 시작
         cls._playwright = await async_playwright().start()
-        
+
         # 공유 세션 디렉토리 생성
         shared_dir = Path("browser_data/shared_session")
         shared_dir.mkdir(parents=True, exist_ok=True)
-        
+
         cls._instance = await cls._playwright.chromium.launch_persistent_context(
             user_data_dir=str(shared_dir),
             headless=False,
@@ -29,18 +78,70 @@ class _GlobalSession:
         )
         # 기본 타임아웃
         cls._instance.set_default_timeout(60_000)
-        
+        cls.metrics.mark("context_ready")
+
         print(f"✅ 공유 세션 생성 완료: {shared_dir}")
         return cls._instance
 
+    @classmethod
+    async def _load_whatsapp(cls, page: Page, timeout: int) -> Page:
+        """WhatsApp Web 이동 후 채팅 목록 준비 대기"""
+        if cls.resource_policy:
+            await cls.resource_policy.apply_to_page(page)
+        if not page.url.startswith(WHATSAPP_URL):
+            await page.goto(WHATSAPP_URL, wait_until="domcontentloaded", timeout=300_000)
+        if await wait_for_chat_list_ready(page, timeout=timeout) and cls.metrics:
+            cls.metrics.mark("chat_list_ready")
+        return page
+
+    @classmethod
+    async def open_whatsapp(cls, timeout: int = 15_000) -> Page:
+        """준비된 WhatsApp 페이지 반환 (기존 탭 재사용)"""
+        context = await cls.get()
+        page = next((p for p in context.pages if not p.is_closed()), None)
+        if page is None:
+            page = await context.new_page()
+        return await cls._load_whatsapp(page, timeout)
+
+    @classmethod
+    def prewarm_standby(cls) -> None:
+        """교체용 대기 페이지를 백그라운드에서 미리 생성
+
+        같은 프로필에서 WhatsApp 탭이 두 개 로딩되면 나중 탭이 세션을 가져가므로
+        대기 페이지는 빈 페이지(렌더러)로만 유지하고 교체 시점에 이동합니다.
+        프로필의 HTTP 캐시·IndexedDB 덕분에 이동은 콜드 로드보다 빠릅니다.
+        """
+        if cls._standby is None or cls._standby.done():
+            cls._standby = asyncio.create_task(cls._new_standby())
+
+    @classmethod
+    async def _new_standby(cls) -> Page:
+        context = await cls.get()
+        return await context.new_page()
+
+    @classmethod
+    async def take_standby(cls, timeout: int = 60_000) -> Page:
+        """활성 페이지가 죽었을 때 대기 페이지로 교체 (다음 대기 페이지 재예약)"""
+        cls.prewarm_standby()
+        task, cls._standby = cls._standby, None
+        page = await task
+        if page.is_closed():
+            page = await cls._new_standby()
+        cls.prewarm_standby()
+        return await cls._load_whatsapp(page, timeout)
+
     @classmethod
     async def close(cls):
         """세션 종료"""
+        if cls._standby:
+            cls._standby.cancel()
+            cls._standby = None
+
         if cls._instance and not cls._instance.is_closed():
             await cls._instance.close()
             cls._instance = None
             print("✅ 공유 세션 종료 완료")
-        
+
         if cls._playwright:
             await cls._playwright.stop()
             cls._playwright = None
@@ -51,6 +152,33 @@ async def get_shared_session() -> BrowserContext:
     """공유 세션 가져오기"""
     return await _GlobalSession.get()
 
+async def open_whatsapp_page(timeout: int = 15_000) -> Page:
+    """채팅 목록까지 준비된 WhatsApp 페이지 가져오기"""
+    return await _GlobalSession.open_whatsapp(timeout)
+
+def prewarm_standby_page() -> None:
+    """교체용 대기 페이지 미리 로딩"""
+    _GlobalSession.prewarm_standby()
+
+async def take_standby_page() -> Page:
+    """대기 페이지로 교체"""
+    return await _GlobalSession.take_standby()
+
+def set_resource_policy(mode: str) -> ResourcePolicy:
+    """공유 세션 페이지에 리소스 차단 정책 지정 (영구 프로필 → CDP 전략)"""
+    _GlobalSession.resource_policy = ResourcePolicy(mode, strategy="cdp")
+    return _GlobalSession.resource_policy
+
+def mark_first_scrape() -> Optional[float]:
+    """첫 스크래핑 완료 시점 기록 (time-to-first-scrape, 초)"""
+    if _GlobalSession.metrics is None:
+        return None
+    return _GlobalSession.metrics.mark("first_scrape")
+
+def get_warm_start_report() -> Dict[str, float]:
+    """웜 스타트 단계별 경과 시간"""
+    return _GlobalSession.metrics.as_dict() if _GlobalSession.metrics else {}
+
 async def close_shared_session():
     """공유 세션 종료"""
-    await _GlobalSession.close() 
\ No newline at end of file
+    await _GlobalSession.close()
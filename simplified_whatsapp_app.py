@@ -11,6 +11,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
+from dashboard_data import get_dashboard_service
+
 # Streamlit 안전한 import
 try:
     import streamlit as st
@@ -70,21 +72,19 @@ DB_FILE = Path("summaries.json")
 
 
 def load_db() -> Dict[str, Dict]:
-    """데이터베이스 로딩"""
+    """데이터베이스 로딩 (파일 변경 시에만 재파싱)"""
     try:
-        if DB_FILE.exists():
-            with open(DB_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
+        # 호출부가 항목을 추가/삭제하므로 캐시 객체 대신 얕은 복사본 반환
+        return dict(get_dashboard_service().load(DB_FILE, kind="summaries", default={}))
     except Exception as e:
         print(f"DB 로딩 오류: {e}")
     return {}
 
 
 def save_db(db: Dict[str, Dict]):
-    """데이터베이스 저장"""
+    """데이터베이스 저장 (캐시·집계 즉시 갱신)"""
     try:
-        with open(DB_FILE, "w", encoding="utf-8") as f:
-            json.dump(db, f, ensure_ascii=False, indent=2)
+        get_dashboard_service().commit(DB_FILE, db, kind="summaries")
     except Exception as e:
         print(f"DB 저장 오류: {e}")
 
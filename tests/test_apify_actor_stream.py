@@ -0,0 +1,77 @@
+"""Apify 액터 결과 스트리밍 테스트/ActorItemStream tests with a fake async client."""
+
+import pytest
+
+from integrations.apify_client import ActorItemStream
+
+
+class _FakeApify:
+    """ApifyClientAsync 대역/Run finishes after a few polls while items accumulate."""
+
+    def __init__(self, batches, polls_until_done=2):
+        self.batches = list(batches)
+        self.dataset_items = []
+        self.polls_until_done = polls_until_done
+        self.list_calls = []
+
+    def actor(self, actor_id):
+        class _Actor:
+            async def start(self, run_input, **kwargs):
+                return {"id": "run1", "status": "RUNNING", "defaultDatasetId": "ds1"}
+
+        return _Actor()
+
+    def run(self, run_id):
+        fake = self
+
+        class _Run:
+            async def get(self):
+                fake.polls_until_done -= 1
+                if fake.batches:
+                    fake.dataset_items.extend(fake.batches.pop(0))
+                status = "SUCCEEDED" if fake.polls_until_done <= 0 else "RUNNING"
+                return {"id": run_id, "status": status}
+
+        return _Run()
+
+    def dataset(self, dataset_id):
+        fake = self
+
+        class _Dataset:
+            async def list_items(self, offset, limit):
+                fake.list_calls.append((offset, limit))
+                return {"items": fake.dataset_items[offset : offset + limit]}
+
+        return _Dataset()
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_pages_before_run_finishes():
+    """실행 중에도 페이지 단위로 반환/Pages arrive while the run is still going."""
+    client = _FakeApify(batches=[[{"n": 1}, {"n": 2}, {"n": 3}], [{"n": 4}]])
+    stream = ActorItemStream("user/actor", {}, page_size=2, poll_interval=0, client=client)
+
+    seen = []
+    statuses = []
+    async for page in stream.pages():
+        seen.append([item["n"] for item in page])
+        statuses.append(stream.run["status"])
+
+    assert seen == [[1, 2], [3], [4]]
+    assert statuses[0] == "RUNNING"
+    assert stream.run["status"] == "SUCCEEDED"
+    assert stream.items_read == 4
+    assert all(limit == 2 for _, limit in client.list_calls)
+
+
+@pytest.mark.asyncio
+async def test_stream_times_out_when_run_never_finishes():
+    """제한 시간 초과 시 TimeoutError/Raise when the run outlives timeout_seconds."""
+    client = _FakeApify(batches=[], polls_until_done=10**6)
+    stream = ActorItemStream(
+        "user/actor", {}, timeout_seconds=0.01, poll_interval=0.005, client=client
+    )
+
+    with pytest.raises(TimeoutError):
+        async for _ in stream.pages():
+            pass
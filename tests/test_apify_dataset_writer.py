@@ -0,0 +1,132 @@
+"""ApifyDatasetWriter 로컬 HTTP 테스트/ApifyDatasetWriter tests against a local HTTP stand-in."""
+
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock
+
+import pytest
+
+from macho_gpt.async_scraper.async_scraper import AsyncGroupScraper
+from macho_gpt.async_scraper.group_config import GroupConfig
+from macho_gpt.integrations.apify_client import ApifyDatasetWriter
+
+
+class _DatasetStandIn(BaseHTTPRequestHandler):
+    """Apify Dataset API 대역/Minimal Apify dataset API stand-in."""
+
+    protocol_version = "HTTP/1.1"
+    received = []
+    fail_next = 0
+    lock = threading.Lock()
+
+    def do_POST(self):  # noqa: N802 - http.server naming
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        if self.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        with self.lock:
+            if _DatasetStandIn.fail_next:
+                _DatasetStandIn.fail_next -= 1
+                status = 503
+            else:
+                status = 201
+                _DatasetStandIn.received.append(
+                    {
+                        "path": self.path,
+                        "items": json.loads(body),
+                        "port": self.client_address[1],
+                    }
+                )
+        self.send_response(status)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):
+        return
+
+
+@pytest.fixture
+def stand_in():
+    """로컬 HTTP 대역 서버 실행/Run the local HTTP stand-in."""
+    _DatasetStandIn.received = []
+    _DatasetStandIn.fail_next = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _DatasetStandIn)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/v2"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.asyncio
+async def test_writer_coalesces_groups_and_reuses_connection(stand_in):
+    """그룹별 아이템 배치 + keep-alive 재사용 확인/Coalesce items and reuse connection."""
+    writer = ApifyDatasetWriter(token="t0k", base_url=stand_in, flush_interval=60)
+    await writer.start()
+
+    writer.enqueue("groupA", [{"id": 1}, {"id": 2}])
+    writer.enqueue("groupA", [{"id": 3}])
+    writer.enqueue("groupB", [{"id": 4}])
+    await writer.flush()
+    writer.enqueue("groupA", [{"id": 5}])
+    await writer.close()
+
+    by_dataset = {}
+    for request in _DatasetStandIn.received:
+        dataset = request["path"].split("/")[3]
+        by_dataset.setdefault(dataset, []).extend(item["id"] for item in request["items"])
+
+    assert by_dataset == {"groupA": [1, 2, 3, 5], "groupB": [4]}
+    assert "token=t0k" in _DatasetStandIn.received[0]["path"]
+    assert writer.stats["pushed_items"] == 5
+    assert writer._pool.created < len(_DatasetStandIn.received)
+
+
+@pytest.mark.asyncio
+async def test_writer_chunks_under_request_limit(stand_in):
+    """요청 한도 이하 청크 분할 확인/Split payloads under the request size limit."""
+    writer = ApifyDatasetWriter(
+        token="t0k", base_url=stand_in, max_request_bytes=200, compress=False
+    )
+    items = [{"id": i, "text": "x" * 40} for i in range(10)]
+
+    assert await writer.push("groupA", items) is True
+    await writer.close()
+
+    assert len(_DatasetStandIn.received) > 1
+    assert [item["id"] for r in _DatasetStandIn.received for item in r["items"]] == list(
+        range(10)
+    )
+
+
+@pytest.mark.asyncio
+async def test_writer_retries_transient_errors(stand_in):
+    """일시 오류 재시도 확인/Retry transient server errors."""
+    _DatasetStandIn.fail_next = 2
+    writer = ApifyDatasetWriter(token="t0k", base_url=stand_in, retry_delay=0)
+
+    assert await writer.push("groupA", [{"id": 1}]) is True
+    await writer.close()
+
+    assert writer.stats["retries"] == 2
+    assert writer.stats["failed_items"] == 0
+    assert len(_DatasetStandIn.received) == 1
+
+
+@pytest.mark.asyncio
+async def test_scraper_enqueues_into_shared_writer(tmp_path):
+    """공유 writer 사용 시 즉시 버퍼링 확인/Scraper buffers into the shared writer."""
+    config = GroupConfig(
+        name="Logistics Room",
+        save_file=str(tmp_path / "messages.json"),
+        apify_dataset_id="datasetXYZ",
+    )
+    writer = MagicMock()
+    scraper = AsyncGroupScraper(config, dataset_writer=writer)
+    messages = [{"id": "1", "text": "hello"}]
+
+    await scraper.save_messages(messages)
+
+    writer.enqueue.assert_called_once_with("datasetXYZ", messages)
@@ -0,0 +1,87 @@
+"""결과물 인덱스 테스트/Artifact manifest index tests."""
+
+import json
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+from artifact_index import ArtifactIndex
+
+
+def _artifact(tmp_path, name, mtime=None):
+    path = tmp_path / name
+    path.write_text("{}", encoding="utf-8")
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+    return path
+
+
+def test_latest_is_recorded_without_globbing(tmp_path):
+    """writer 기록 후 최신 조회는 glob 없음/Latest lookups never scan the directory."""
+    index = ArtifactIndex(tmp_path / "artifact_index.json")
+    base = datetime(2025, 7, 24, 21, 0)
+    for offset in (0, 2, 1):
+        path = _artifact(tmp_path, f"ai_analysis_{offset}.json")
+        index.record("ai_analysis", path, created_at=base + timedelta(hours=offset))
+
+    with patch("pathlib.Path.glob", side_effect=AssertionError("globbed")):
+        assert index.latest("ai_analysis").name == "ai_analysis_2.json"
+
+    manifest = json.loads((tmp_path / "artifact_index.json").read_text(encoding="utf-8"))
+    assert [Path(e["path"]).name for e in manifest["kinds"]["ai_analysis"]] == [
+        "ai_analysis_0.json", "ai_analysis_1.json", "ai_analysis_2.json",
+    ]
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_history_by_time_range_and_missing_files(tmp_path):
+    """기간 조회 및 삭제된 최신 파일 건너뛰기/Range queries and deleted artifacts."""
+    index = ArtifactIndex(tmp_path / "artifact_index.json")
+    base = datetime(2025, 7, 24)
+    paths = []
+    for day in range(5):
+        paths.append(_artifact(tmp_path, f"ocr_{day}.json"))
+        index.record("media_ocr", paths[-1], created_at=base + timedelta(days=day))
+
+    window = index.history("media_ocr", since=base + timedelta(days=1), until=base + timedelta(days=3))
+    assert [Path(e["path"]).name for e in window] == ["ocr_1.json", "ocr_2.json", "ocr_3.json"]
+
+    paths[-1].unlink()
+    assert index.latest("media_ocr").name == "ocr_3.json"
+
+
+def test_compact_applies_retention(tmp_path):
+    """보존 정책: 최근 N개 유지 + 파일 삭제/Retention keeps the newest N entries."""
+    index = ArtifactIndex(tmp_path / "artifact_index.json")
+    base = datetime.now() - timedelta(days=10)
+    paths = []
+    for day in range(6):
+        paths.append(_artifact(tmp_path, f"report_{day}.json"))
+        index.record("morning_report", paths[-1], created_at=base + timedelta(days=day))
+
+    removed = index.compact("morning_report", keep_last=2, delete_files=True)
+
+    assert len(removed) == 4
+    assert [p.exists() for p in paths] == [False] * 4 + [True] * 2
+    assert len(index.history("morning_report")) == 2
+
+    assert index.compact(max_age_days=5.5) == [paths[4].as_posix()]
+    assert index.latest("morning_report").name == "report_5.json"
+
+
+def test_bootstrap_seeds_from_existing_files(tmp_path):
+    """인덱스 없는 종류는 1회 스캔/Unknown kinds are seeded once from disk."""
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    _artifact(data_dir, "hvdc_whatsapp_extraction_1.json", mtime=1_000_000)
+    _artifact(data_dir, "hvdc_whatsapp_extraction_2.json", mtime=2_000_000)
+    index = ArtifactIndex(tmp_path / "artifact_index.json")
+
+    with patch.dict(
+        "artifact_index.ARTIFACT_PATTERNS",
+        {"hvdc_extraction": (str(data_dir), "hvdc_whatsapp_extraction_*.json")},
+    ):
+        assert index.latest("hvdc_extraction").name == "hvdc_whatsapp_extraction_2.json"
+        with patch("pathlib.Path.glob", side_effect=AssertionError("globbed")):
+            assert index.latest("hvdc_extraction").name == "hvdc_whatsapp_extraction_2.json"
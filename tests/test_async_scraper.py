@@ -1,9 +1,11 @@
 """AsyncGroupScraper 저장 로직 테스트/AsyncGroupScraper save logic tests."""
 
+import asyncio
 import json
+import time
 from pathlib import Path
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -140,3 +142,180 @@ async def test_initialize_normalizes_legacy_cookie_format(tmp_path):
     assert isinstance(normalized, dict)
     assert normalized["origins"] == []
     assert normalized["cookies"][0]["name"] == "wa_ul"
+
+
+@pytest.mark.asyncio
+async def test_warm_start_reuses_persistent_profile(tmp_path):
+    """웜 스타트 시 그룹별 영구 프로필 재사용 확인/Warm start launches a persistent profile."""
+
+    state_path = tmp_path / "auth.json"
+    state_path.write_text(
+        json.dumps({"cookies": [{"name": "wa_ul", "value": "token"}], "origins": []}),
+        encoding="utf-8",
+    )
+    config = GroupConfig(name="HVDC / Yard", save_file=str(tmp_path / "messages.json"))
+    scraper = AsyncGroupScraper(
+        config,
+        chrome_data_dir=str(tmp_path / "profiles"),
+        storage_state_path=str(state_path),
+        warm_start=True,
+        resource_mode="full",
+    )
+
+    page = Mock()
+    page.is_closed = Mock(return_value=False)
+    page.goto = AsyncMock()
+    context = AsyncMock()
+    context.pages = [page]
+    chromium = SimpleNamespace(
+        launch=AsyncMock(),
+        launch_persistent_context=AsyncMock(return_value=context),
+    )
+    playwright = SimpleNamespace(chromium=chromium, stop=AsyncMock())
+    manager = SimpleNamespace(start=AsyncMock(return_value=playwright))
+
+    with patch(
+        "macho_gpt.async_scraper.async_scraper.async_playwright", return_value=manager
+    ):
+        await scraper.initialize()
+
+    chromium.launch.assert_not_called()
+    kwargs = chromium.launch_persistent_context.await_args.kwargs
+    assert kwargs["user_data_dir"] == str(tmp_path / "profiles" / "HVDC_Yard")
+    context.add_cookies.assert_awaited_once_with([{"name": "wa_ul", "value": "token"}])
+    context.new_page.assert_not_called()
+    assert page.goto.await_args.kwargs["wait_until"] == "domcontentloaded"
+    assert set(scraper.timings) == {"context_ready", "page_loaded"}
+
+
+@pytest.mark.asyncio
+async def test_swap_to_standby_page_when_active_dies(tmp_path):
+    """활성 페이지 종료 시 대기 페이지로 교체/Swap to standby when the page dies."""
+
+    config = GroupConfig(name="Yard", save_file=str(tmp_path / "messages.json"))
+    scraper = AsyncGroupScraper(config, warm_start=True)
+    standby = AsyncMock()
+    next_standby = AsyncMock()
+    scraper.context = AsyncMock()
+    scraper.context.new_page = AsyncMock(return_value=next_standby)
+    scraper.find_and_click_group = AsyncMock(return_value=True)
+
+    async def ready():
+        return standby
+
+    scraper._standby_task = asyncio.create_task(ready())
+
+    assert await scraper._swap_to_standby() is True
+    assert scraper.page is standby
+    standby.goto.assert_awaited_once()
+    standby.wait_for_selector.assert_awaited_once()
+    assert await scraper._standby_task is next_standby
+
+
+def _push_scraper(tmp_path):
+    config = GroupConfig(name="Yard", save_file=str(tmp_path / "messages.json"))
+    scraper = AsyncGroupScraper(config, capture_mode="push", push_health_interval=0.01)
+    scraper.ai_integration = {}
+    scraper.context = AsyncMock()
+    scraper.page = Mock()
+    scraper.page.is_closed = Mock(return_value=False)
+    scraper.page.evaluate = AsyncMock(return_value=True)
+    scraper.save_messages = AsyncMock()
+    return scraper
+
+
+@pytest.mark.asyncio
+async def test_push_mode_feeds_observer_batches_to_save(tmp_path):
+    """observer 배치를 저장 파이프라인으로 전달/Pushed batches reach save_messages."""
+
+    scraper = _push_scraper(tmp_path)
+    scraper.scrape_messages = AsyncMock(return_value=[])
+    scraper.is_running = True
+
+    loop_task = asyncio.create_task(scraper.run_push_loop())
+    await asyncio.sleep(0)
+
+    binding = scraper.context.expose_binding.await_args.args[1]
+    observed_at = int(time.time() * 1000)
+    message = {"text": "Gate pass ready", "sender": "Kim", "timestamp": "10:01"}
+    binding(None, {"observed_at": observed_at, "messages": [message]})
+    binding(None, {"observed_at": observed_at, "messages": [message, {"text": ""}]})
+
+    for _ in range(50):
+        if scraper.save_messages.await_count:
+            break
+        await asyncio.sleep(0.005)
+    scraper.is_running = False
+    await asyncio.wait_for(loop_task, timeout=1)
+
+    scraper.context.expose_binding.assert_awaited_once()
+    saved = scraper.save_messages.await_args.args[0]
+    assert [m["text"] for m in saved] == ["Gate pass ready"]
+    assert saved[0]["group_name"] == "Yard"
+    assert scraper.push_stats["batches"] == 2
+    assert scraper.push_stats["messages"] == 1
+
+
+@pytest.mark.asyncio
+async def test_push_mode_reinstalls_detached_observer(tmp_path):
+    """유휴 점검 시 분리된 observer 재설치/Idle health check reinstalls the observer."""
+
+    scraper = _push_scraper(tmp_path)
+    scraper._binding_exposed = True
+    scraper.page.evaluate = AsyncMock(side_effect=[False, True])
+
+    await scraper._ensure_observer()
+
+    assert scraper.push_stats["reinstalls"] == 1
+    assert scraper.page.evaluate.await_count == 2
+    scraper.context.expose_binding.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_push_loop_survives_failed_observer_check(tmp_path, caplog):
+    """observer 점검 실패 시 대기 후 계속/Health-check errors back off instead of ending the loop."""
+
+    scraper = _push_scraper(tmp_path)
+    scraper.push_health_interval = 0.05
+    scraper.scrape_messages = AsyncMock(return_value=[])
+    scraper.is_running = True
+    checks = []
+
+    async def ensure_observer():
+        checks.append(len(checks) + 1)
+        if len(checks) <= 2:
+            raise RuntimeError("Active page closed and no standby available")
+        scraper.is_running = False
+
+    scraper._ensure_observer = ensure_observer
+
+    with caplog.at_level("ERROR"):
+        await asyncio.wait_for(scraper.run_push_loop(), timeout=2)
+
+    assert checks == [1, 2, 3]
+    messages = [r.getMessage() for r in caplog.records]
+    assert "attempt 1, retry in 0.1s" in messages[0]
+    assert "attempt 2, retry in 0.2s" in messages[1]  # 연속 실패 시 대기 증가
+
+
+def test_poll_and_push_paths_share_dedup_key(tmp_path):
+    """공백 차이와 무관한 중복 키/Both capture paths dedupe on stripped values."""
+
+    scraper = _push_scraper(tmp_path)
+    polled = scraper._message_key(" Kim\n", " Gate pass ready \n", "10:01 ")
+    assert polled == scraper._message_key("Kim", "Gate pass ready", "10:01")
+    assert scraper._is_new_message(polled)
+
+    pushed = scraper._collect_pushed(
+        {"observed_at": 0, "messages": [{"text": "Gate pass ready", "sender": "Kim", "timestamp": "10:01"}]}
+    )
+    assert pushed == []
+    assert scraper._message_key(None, "hi", None) == scraper._message_key("  ", "hi", " ")
+
+
+def test_capture_mode_is_validated(tmp_path):
+    """잘못된 capture_mode 거부/Unknown capture modes are rejected."""
+
+    config = GroupConfig(name="Yard", save_file=str(tmp_path / "messages.json"))
+    with pytest.raises(ValueError):
+        AsyncGroupScraper(config, capture_mode="stream")
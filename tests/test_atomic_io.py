@@ -0,0 +1,69 @@
+"""원자적 파일 기록 도우미 테스트/Tests for the shared atomic write helpers."""
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from atomic_io import atomic_path, atomic_write_json, file_key
+
+
+def test_file_key_tracks_content_changes(tmp_path):
+    path = tmp_path / "state.json"
+    assert file_key(path) is None
+
+    atomic_write_json(path, {"a": 1})
+    first = file_key(path)
+    atomic_write_json(path, {"a": 1, "b": "긴급"})
+
+    assert first is not None and file_key(path) != first
+    assert json.loads(path.read_text(encoding="utf-8")) == {"a": 1, "b": "긴급"}
+
+
+def test_concurrent_writers_in_one_process_never_expose_partial_files(tmp_path):
+    path = tmp_path / "summaries.json"
+    payloads = [{"writer": i, "body": "x" * 50_000} for i in range(16)]
+    stop = threading.Event()
+    seen = []
+
+    def reader():
+        while not stop.is_set():
+            if path.exists():
+                seen.append(json.loads(path.read_text(encoding="utf-8"))["writer"])
+
+    watcher = threading.Thread(target=reader)
+    watcher.start()
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda data: atomic_write_json(path, data), payloads))
+    finally:
+        stop.set()
+        watcher.join()
+
+    assert json.loads(path.read_text(encoding="utf-8")) in payloads
+    assert all(0 <= writer < 16 for writer in seen)
+    assert [p.name for p in tmp_path.iterdir()] == ["summaries.json"]
+
+
+def test_failed_write_keeps_original_and_removes_temp_file(tmp_path):
+    path = tmp_path / "report_state.json"
+    atomic_write_json(path, {"ok": True})
+
+    with pytest.raises(RuntimeError):
+        with atomic_path(path) as tmp_path_:
+            tmp_path_.write_text("{partial", encoding="utf-8")
+            raise RuntimeError("disk full")
+
+    assert json.loads(path.read_text(encoding="utf-8")) == {"ok": True}
+    assert [p.name for p in tmp_path.iterdir()] == ["report_state.json"]
+
+
+def test_replacement_keeps_existing_permissions(tmp_path):
+    path = tmp_path / "auth.json"
+    atomic_write_json(path, {})
+    assert path.stat().st_mode & 0o777 == 0o644
+
+    path.chmod(0o600)
+    atomic_write_json(path, {"cookies": []})
+    assert path.stat().st_mode & 0o777 == 0o600
@@ -0,0 +1,148 @@
+"""인증 상태 공유 서비스 테스트/Shared auth state service tests."""
+
+import json
+import os
+import threading
+import time
+
+from auth_state import AuthStateStore, get_auth_store
+from macho_gpt.async_scraper.async_scraper import AsyncGroupScraper
+from macho_gpt.async_scraper.group_config import GroupConfig
+
+
+def _write_state(path, payload, mtime=None):
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+
+def test_many_scrapers_parse_auth_once(tmp_path):
+    """N개 그룹 시작 시 1회만 파싱/Startup of N groups parses auth once."""
+    state_path = tmp_path / "auth.json"
+    _write_state(state_path, {"cookies": [{"name": "wa_ul", "value": "v"}], "origins": []})
+
+    states = []
+    for index in range(5):
+        config = GroupConfig(name=f"Group {index}", save_file=str(tmp_path / f"{index}.json"))
+        scraper = AsyncGroupScraper(config, storage_state_path=str(state_path))
+        states.append(scraper._load_storage_state())
+
+    store = get_auth_store(state_path)
+    assert store.stats["parses"] == 1
+    assert store.stats["cache_hits"] == 4
+    assert all(state["cookies"][0]["name"] == "wa_ul" for state in states)
+
+
+def test_reloads_when_file_changes(tmp_path):
+    """mtime 변경 시 재파싱/File changes invalidate the cache."""
+    state_path = tmp_path / "auth.json"
+    _write_state(state_path, {"cookies": [], "origins": []}, mtime=1_000_000)
+    store = AuthStateStore(state_path)
+    assert store.load()["cookies"] == []
+
+    _write_state(state_path, {"cookies": [{"name": "new"}], "origins": []}, mtime=2_000_000)
+
+    assert store.load()["cookies"] == [{"name": "new"}]
+    assert store.stats["parses"] == 2
+
+
+def test_legacy_format_is_rewritten_once(tmp_path):
+    """레거시 쿠키 목록을 정규화하여 1회 기록/Legacy list is normalized and persisted."""
+    state_path = tmp_path / "auth.json"
+    _write_state(state_path, [{"name": "wa_ul", "value": "v"}])
+    store = AuthStateStore(state_path)
+
+    assert store.load() == {"cookies": [{"name": "wa_ul", "value": "v"}], "origins": []}
+    assert store.load() is store.load()
+
+    on_disk = json.loads(state_path.read_text(encoding="utf-8"))
+    assert on_disk["origins"] == []
+    assert store.stats == {"parses": 1, "cache_hits": 2, "writes": 1}
+
+
+def test_concurrent_saves_leave_valid_json(tmp_path):
+    """동시 저장 시에도 파일 손상 없음/Locked atomic writes never interleave."""
+    state_path = tmp_path / "auth.json"
+    store = AuthStateStore(state_path)
+
+    def writer(index):
+        for _ in range(20):
+            store.save({"cookies": [{"name": f"c{index}", "value": "x" * 500}], "origins": []})
+
+    threads = [threading.Thread(target=writer, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    state = json.loads(state_path.read_text(encoding="utf-8"))
+    assert state["cookies"][0]["name"] in {"c0", "c1", "c2", "c3"}
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+class TestInspect:
+    """브라우저 없는 유효성 점검 테스트"""
+
+    def test_missing_file(self, tmp_path):
+        status = AuthStateStore(tmp_path / "auth.json").inspect()
+
+        assert status.exists is False
+        assert status.valid is False
+        assert status.reason == "missing"
+
+    def test_whatsapp_local_storage_is_valid(self, tmp_path):
+        state_path = tmp_path / "auth.json"
+        future = time.time() + 86400
+        _write_state(
+            state_path,
+            {
+                "cookies": [{"name": "wa_ul", "domain": ".web.whatsapp.com", "expires": future}],
+                "origins": [
+                    {
+                        "origin": "https://web.whatsapp.com",
+                        "localStorage": [{"name": "last-wid-md", "value": "x"}],
+                    }
+                ],
+            },
+        )
+
+        status = AuthStateStore(state_path).inspect()
+
+        assert status.valid is True
+        assert status.has_whatsapp_storage is True
+        assert 0 < status.expires_in_seconds <= 86400
+
+    def test_expired_cookies_without_storage(self, tmp_path):
+        state_path = tmp_path / "auth.json"
+        _write_state(
+            state_path,
+            {
+                "cookies": [{"name": "wa_ul", "domain": ".web.whatsapp.com", "expires": 1000}],
+                "origins": [],
+            },
+        )
+
+        status = AuthStateStore(state_path).inspect()
+
+        assert status.valid is False
+        assert status.reason == "expired"
+        assert status.expired_cookies == 1
+
+    def test_stale_file(self, tmp_path):
+        state_path = tmp_path / "auth.json"
+        old = time.time() - 10 * 86400
+        _write_state(
+            state_path,
+            {
+                "cookies": [],
+                "origins": [
+                    {"origin": "https://web.whatsapp.com", "localStorage": [{"name": "k"}]}
+                ],
+            },
+            mtime=old,
+        )
+
+        status = AuthStateStore(state_path).inspect(max_age_days=7)
+
+        assert status.valid is False
+        assert status.reason == "stale"
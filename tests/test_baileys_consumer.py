@@ -0,0 +1,93 @@
+"""Baileys 이벤트 소비자 테스트/Baileys NDJSON consumer tests with a recorded replay."""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from macho_gpt.async_scraper.baileys_consumer import (
+    BaileysEventConsumer,
+    BaileysEventReplayer,
+    map_baileys_message,
+)
+from macho_gpt.async_scraper.group_config import GroupConfig
+
+FIXTURE = Path(__file__).parent / "fixtures" / "baileys_events.ndjson"
+
+
+def _groups(tmp_path):
+    return [
+        GroupConfig(
+            name="HVDC Yard",
+            save_file=str(tmp_path / "yard.json"),
+            group_jid="120363000001@g.us",
+        ),
+        GroupConfig(
+            name="ADNOC Berth",
+            save_file=str(tmp_path / "berth.json"),
+            group_jid="120363000002@g.us",
+        ),
+        GroupConfig(name="Browser Only", save_file=str(tmp_path / "browser.json")),
+    ]
+
+
+def test_map_baileys_message_matches_scraper_schema():
+    """스크래퍼와 동일한 필드 구성/Mapped messages share the scraper schema."""
+    message = map_baileys_message(
+        {"messageId": "X1", "from": "9715@s.whatsapp.net", "ts": 1760631670, "text": " hi "},
+        "HVDC Yard",
+    )
+
+    assert {"text", "sender", "timestamp", "scraped_at", "group_name"} <= set(message)
+    assert message["text"] == "hi"
+    assert message["group_name"] == "HVDC Yard"
+    assert message["message_id"] == "X1"
+    assert map_baileys_message({"text": ""}, "HVDC Yard") is None
+
+
+@pytest.mark.asyncio
+async def test_replay_stores_messages_per_group(tmp_path):
+    """녹화 이벤트 재생 → 그룹별 저장/Replay routes events into each group's store."""
+    consumer = BaileysEventConsumer(_groups(tmp_path))
+
+    stats = await BaileysEventReplayer(str(FIXTURE)).replay(consumer)
+
+    yard = json.loads((tmp_path / "yard.json").read_text(encoding="utf-8"))
+    berth = json.loads((tmp_path / "berth.json").read_text(encoding="utf-8"))
+    assert [m["text"] for m in yard] == [
+        "ETA for vessel ABC123 is 14:30",
+        "Invoice INV-77 attached",
+    ]
+    assert [m["text"] for m in berth] == ["Berth 4 gate pass approved"]
+    assert not (tmp_path / "browser.json").exists()
+    assert stats["lines"] == 8
+    assert stats["saved"] == 3
+    assert stats["duplicates"] == 1
+    assert stats["unknown_group"] == 1
+    assert stats["invalid"] == 1
+    assert stats["ignored_events"] == 1
+
+
+@pytest.mark.skipif(not hasattr(asyncio, "start_unix_server"), reason="unix sockets only")
+@pytest.mark.asyncio
+async def test_consumer_serves_unix_socket(tmp_path):
+    """유닉스 소켓 NDJSON 수신/Events written to the socket are stored."""
+    consumer = BaileysEventConsumer(_groups(tmp_path), flush_interval=0.05)
+    socket_path = str(tmp_path / "events.sock")
+    server = await consumer.serve_unix(socket_path)
+
+    _, writer = await asyncio.open_unix_connection(socket_path)
+    writer.write(FIXTURE.read_bytes())
+    await writer.drain()
+    writer.close()
+
+    for _ in range(100):
+        if consumer.stats["saved"] == 3:
+            break
+        await asyncio.sleep(0.01)
+    server.close()
+    await server.wait_closed()
+
+    assert consumer.stats["saved"] == 3
+    assert (tmp_path / "berth.json").exists()
@@ -0,0 +1,58 @@
+"""핫패스 마이크로 벤치마크 러너 테스트."""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPT_PATH = Path(__file__).resolve().parent.parent / "scripts" / "benchmark_hot_paths.py"
+
+
+@pytest.fixture
+def bench(monkeypatch):
+    spec = importlib.util.spec_from_file_location("benchmark_hot_paths", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, "benchmark_hot_paths", module)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_corpus_parses_completely(bench):
+    from macho_gpt.core.logi_whatsapp_241219 import WhatsAppProcessor
+
+    text = bench.build_corpus(300)
+    messages = WhatsAppProcessor().parse_whatsapp_text(text)
+
+    assert len(messages) == 300
+    assert 0 < sum(m.is_urgent for m in messages) < 300
+    assert bench.parse_size("100k") == 100_000 and bench.size_label(1_000_000) == "1M"
+
+
+def test_all_cases_run_on_small_corpus(bench):
+    results = bench.run_benchmark([50], repeat=1)
+
+    assert set(results) == {f"{case}@50" for case in (
+        "parse_whatsapp_text", "extract_summary_data", "generate_kpi_summary",
+        "sanitize_ocr_text", "sanitize_text+search_tokens", "mock_llm_summarise",
+        "cli_simple_summary", "workflow_bulk",
+    )}
+    assert all(row["seconds"] > 0 for row in results.values())
+
+
+def test_baseline_roundtrip_flags_regressions(bench, tmp_path):
+    baseline_path = tmp_path / "baseline.json"
+    bench.save_baseline(baseline_path, {"a@1k": {"us_per_message": 10.0}, "b@1k": {"us_per_message": 10.0}})
+    baseline = bench.load_baseline(baseline_path)
+
+    current = {
+        "a@1k": {"seconds": 0.013, "us_per_message": 13.0, "messages_per_sec": 1.0},
+        "b@1k": {"seconds": 0.011, "us_per_message": 11.0, "messages_per_sec": 1.0},
+        "c@1k": {"seconds": 0.001, "us_per_message": 1.0, "messages_per_sec": 1.0},
+    }
+    rows = {row["case"]: row for row in bench.compare(current, baseline, threshold=0.2)}
+
+    assert rows["a@1k"]["status"] == "regression"
+    assert rows["b@1k"]["status"] == "ok"
+    assert rows["c@1k"]["status"] == "new"
+    assert not list(tmp_path.glob("*.tmp"))
@@ -0,0 +1,111 @@
+"""대시보드 데이터 서비스 테스트/Dashboard data service tests."""
+
+import json
+import os
+from unittest.mock import patch
+
+from dashboard_data import DashboardDataService, histogram
+
+
+def _write(path, payload, mtime=None):
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+
+def test_rerun_uses_cache_until_file_changes(tmp_path):
+    """변경 전에는 재파싱 없음/Reruns hit the cache until the file changes."""
+    path = tmp_path / "ai_analysis_1.json"
+    _write(
+        path,
+        {
+            "total_messages": 3,
+            "chat_analyses": [
+                {"chat_title": "Yard", "message_count": 3, "analysis": {"sentiment": "긍정"}}
+            ],
+            "overall_summary": {"common_keywords": ["ETA", "ETA", "gate"]},
+        },
+        mtime=1_000_000,
+    )
+    service = DashboardDataService()
+
+    first = service.get(path, kind="ai_analysis")
+    with patch("dashboard_data._load_json", side_effect=AssertionError("reparsed")):
+        for _ in range(5):
+            assert service.get(path, kind="ai_analysis") is first
+
+    assert first.aggregates["keyword_counts"] == {"ETA": 2, "gate": 1}
+    assert first.aggregates["sentiment_counts"] == {"긍정": 1}
+    assert service.stats == {"hits": 5, "loads": 1, "commits": 0}
+
+    _write(path, {"total_messages": 9, "chat_analyses": []}, mtime=2_000_000)
+    assert service.aggregates(path, kind="ai_analysis")["total_messages"] == 9
+
+
+def test_commit_refreshes_cache_without_reading(tmp_path):
+    """writer commit 시 캐시·집계 즉시 갱신/Commits update cache and aggregates."""
+    path = tmp_path / "summaries.json"
+    service = DashboardDataService()
+    assert service.load(path, kind="summaries", default={}) == {}
+
+    db = {"k1": {"summary": "s", "tasks": ["a", "b"], "confidence": 0.8}}
+    service.commit(path, db, kind="summaries")
+
+    with patch("dashboard_data._load_json", side_effect=AssertionError("reparsed")):
+        stats = service.aggregates(path, kind="summaries")
+    assert stats["count"] == 1
+    assert stats["task_count"] == 2
+    assert stats["confidence_histogram"]["0.8-0.9"] == 1
+    assert json.loads(path.read_text(encoding="utf-8")) == db
+
+
+def test_concurrent_commits_leave_consistent_file_and_cache(tmp_path):
+    """세션 스레드 동시 저장/Concurrent session commits never corrupt the store."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    path = tmp_path / "summaries.json"
+    service = DashboardDataService()
+    payloads = [{f"k{i}": {"summary": "s" * 2000, "tasks": [str(i)] * 50}} for i in range(16)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda db: service.commit(path, db, kind="summaries"), payloads))
+
+    on_disk = json.loads(path.read_text(encoding="utf-8"))
+    assert on_disk in payloads
+    assert service.load(path, kind="summaries") == on_disk
+    assert service.stats["commits"] == 16
+    assert [p.name for p in tmp_path.iterdir()] == ["summaries.json"]
+
+
+def test_workflow_view_includes_change_log(tmp_path):
+    """워크플로우 스냅샷 + 변경 로그 병합/Workflow view replays the change log."""
+    path = tmp_path / "workflow_data.json"
+    _write(
+        path,
+        {
+            "chat_rooms": [{"id": "r1", "type": "team"}],
+            "tasks": [{"id": "t1", "status": "pending", "priority": "high"}],
+        },
+    )
+    (tmp_path / "workflow_data.changes.jsonl").write_text(
+        json.dumps({"op": "task", "task": {"id": "t1", "status": "completed", "priority": "high"}})
+        + "\n"
+        + json.dumps({"op": "task", "task": {"id": "t2", "status": "pending", "priority": "low"}})
+        + "\n",
+        encoding="utf-8",
+    )
+
+    stats = DashboardDataService().aggregates(path, kind="workflow")
+
+    assert stats["total_tasks"] == 2
+    assert stats["tasks_by_status"] == {"completed": 1, "pending": 1}
+    assert stats["completion_rate"] == 0.5
+
+
+def test_histogram_scales_to_percent_values():
+    """0~100 신뢰도 자동 판별/Percent confidences use a 0-100 range."""
+    assert histogram([95, 40, 0], bins=10) == {
+        **{f"{i * 10:g}-{(i + 1) * 10:g}": 0 for i in range(10)},
+        "40-50": 1,
+        "90-100": 1,
+    }
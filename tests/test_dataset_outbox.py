@@ -0,0 +1,119 @@
+"""디스크 기반 Dataset outbox 테스트/Durable dataset outbox tests."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from macho_gpt.async_scraper.async_scraper import AsyncGroupScraper
+from macho_gpt.async_scraper.group_config import GroupConfig
+from macho_gpt.integrations.dataset_outbox import (
+    DatasetOutbox,
+    OutboxDrainer,
+    make_dedup_id,
+)
+
+
+class _FakePusher:
+    """Dataset 전송 대역/Records pushes and fails on demand."""
+
+    def __init__(self, fail_times: int = 0):
+        self.fail_times = fail_times
+        self.pushed = []
+
+    async def push(self, dataset_id, items):
+        if self.fail_times:
+            self.fail_times -= 1
+            return False
+        self.pushed.append((dataset_id, list(items)))
+        return True
+
+
+def test_outbox_resumes_from_acked_offset(tmp_path):
+    """재시작 후 미확인 레코드만 다시 읽기/Reopen resumes after the acked offset."""
+    outbox = DatasetOutbox(tmp_path)
+    outbox.append("groupA", [{"id": 1}, {"id": 2}])
+    records, offset = outbox.read_pending()
+    outbox.ack(offset)
+    outbox.append("groupA", [{"id": 3}])
+    outbox.close()
+
+    reopened = DatasetOutbox(tmp_path)
+    records, _ = reopened.read_pending()
+    reopened.close()
+
+    assert [r["item"]["id"] for r in records] == [3]
+    assert records[0]["item"]["dedup_id"] == make_dedup_id("groupA", {"id": 3})
+
+
+def test_outbox_ignores_partial_trailing_line(tmp_path):
+    """기록 중인 마지막 줄 무시/Incomplete trailing line is left for later."""
+    outbox = DatasetOutbox(tmp_path)
+    outbox.append("groupA", [{"id": 1}])
+    with open(outbox.log_path, "ab") as handle:
+        handle.write(b'{"dataset_id": "groupA", "it')
+
+    records, offset = outbox.read_pending()
+    outbox.close()
+
+    assert [r["item"]["id"] for r in records] == [1]
+    assert offset < outbox.log_path.stat().st_size
+
+
+def test_outbox_compacts_acked_prefix(tmp_path):
+    """확인된 앞부분 압축/Compaction drops the acknowledged prefix."""
+    outbox = DatasetOutbox(tmp_path, compact_threshold_bytes=1)
+    outbox.append("groupA", [{"id": 1}])
+    _, offset = outbox.read_pending(max_items=1)
+    outbox.append("groupA", [{"id": 2}])
+    outbox.ack(offset)
+
+    records, _ = outbox.read_pending()
+    outbox.close()
+
+    assert outbox.stats["compactions"] == 1
+    assert outbox.acked_offset == 0
+    assert [r["item"]["id"] for r in records] == [2]
+
+
+@pytest.mark.asyncio
+async def test_drainer_acks_only_after_successful_push(tmp_path):
+    """전송 실패 시 미확인 유지 후 재전송/Failed batches stay pending and are retried."""
+    outbox = DatasetOutbox(tmp_path)
+    outbox.append("groupA", [{"id": 1}])
+    outbox.append("groupB", [{"id": 2}])
+    pusher = _FakePusher(fail_times=1)
+    drainer = OutboxDrainer(outbox, pusher)
+
+    assert await drainer.drain_once() is False
+    assert outbox.pending_bytes > 0
+
+    assert await drainer.drain_once() is True
+    outbox.close()
+
+    assert outbox.pending_bytes == 0
+    assert sorted((d, [i["id"] for i in items]) for d, items in pusher.pushed) == [
+        ("groupA", [1]),
+        ("groupB", [2]),
+    ]
+    assert drainer.stats == {"shipped_items": 2, "failed_batches": 1}
+
+
+@pytest.mark.asyncio
+async def test_scraper_appends_to_outbox(tmp_path):
+    """outbox 지정 시 writer 대신 디스크 기록/Scraper records into the outbox."""
+    config = GroupConfig(
+        name="Logistics Room",
+        save_file=str(tmp_path / "messages.json"),
+        apify_dataset_id="datasetXYZ",
+    )
+    writer = MagicMock()
+    outbox = DatasetOutbox(tmp_path / "outbox")
+    scraper = AsyncGroupScraper(config, dataset_writer=writer, dataset_outbox=outbox)
+
+    await scraper.save_messages([{"id": "1", "text": "hello"}])
+    records, _ = outbox.read_pending()
+    outbox.close()
+
+    writer.enqueue.assert_not_called()
+    assert records[0]["dataset_id"] == "datasetXYZ"
+    assert records[0]["item"]["text"] == "hello"
@@ -0,0 +1,70 @@
+"""오프라인 WhatsApp Web fixture 및 E2E 벤치마크 테스트."""
+
+import importlib.util
+import sys
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+from macho_gpt.async_scraper.async_scraper import CHAT_LIST_SELECTOR, MESSAGE_PANEL_SELECTOR
+from whatsapp_web_fixture import WhatsAppFixtureServer, generate_groups, render_fixture_html
+
+SCRIPT_PATH = Path(__file__).resolve().parent.parent / "scripts" / "benchmark_e2e_scraping.py"
+
+
+def _load_benchmark():
+    spec = importlib.util.spec_from_file_location("benchmark_e2e_scraping", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules.setdefault("benchmark_e2e_scraping", module)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_generated_groups_are_deterministic():
+    groups = generate_groups(n_groups=3, n_messages=50)
+
+    assert list(groups) == ["Bench Group 00", "Bench Group 01", "Bench Group 02"]
+    assert all(len(messages) == 50 for messages in groups.values())
+    assert groups == generate_groups(n_groups=3, n_messages=50)
+    texts = [m["text"] for messages in groups.values() for m in messages]
+    assert not any("Bench" in text for text in texts)  # 검색 토큰과 겹치지 않음
+
+
+def test_fixture_reproduces_scraper_selectors():
+    html = render_fixture_html(generate_groups(1, 1))
+
+    for testid in ("chats-list", "chat-list", "chat-list-search", "msg-container",
+                   "msg-text", "msg-meta", "msg-sender", "conversation-panel-messages"):
+        assert testid in html
+    assert CHAT_LIST_SELECTOR.split('"')[1] in html
+    assert MESSAGE_PANEL_SELECTOR.split('"')[1] in html
+    assert 'aria-label="Search or start new chat"' in html
+    assert "window.__benchAppend" in html
+
+
+def test_fixture_server_serves_page_offline():
+    groups = generate_groups(2, 5)
+    with WhatsAppFixtureServer(groups) as server:
+        with urllib.request.urlopen(server.url + "any/path?x=1", timeout=5) as response:
+            body = response.read().decode("utf-8")
+            content_type = response.headers["Content-Type"]
+
+    assert "text/html" in content_type
+    assert "Bench Group 01" in body
+    assert server.requests == 1
+
+
+@pytest.mark.skipif(not _load_benchmark().chromium_available(), reason="Chromium not installed")
+@pytest.mark.asyncio
+async def test_e2e_benchmark_smoke():
+    benchmark = _load_benchmark()
+
+    report = await benchmark.run_benchmark(
+        groups=2, messages=30, cycles=2, new_per_cycle=5, skip_rpa=True
+    )
+
+    rows = report["async_scraper"]
+    assert [row["messages"] for row in rows] == [35, 35]
+    assert all(row["cycle_latency"]["mean_ms"] > 0 for row in rows)
+    assert report["manager"]["messages"] == 60
@@ -12,7 +12,85 @@ from unittest.mock import patch, MagicMock, AsyncMock
 from pathlib import Path
 
 # Import the classes to test
-from whatsapp_media_ocr_extractor import MediaOCRProcessor, WhatsAppMediaOCRExtractor
+from whatsapp_media_ocr_extractor import (
+    BanWatcher,
+    ImagePreprocessor,
+    MediaOCRProcessor,
+    OCRRouter,
+    PreprocessConfig,
+    WhatsAppMediaOCRExtractor,
+)
+
+class TestImagePreprocessor:
+    """ImagePreprocessor 테스트 클래스"""
+
+    @pytest.fixture
+    def bubble_image(self, tmp_path):
+        """흰 여백 안에 텍스트 영역이 있는 큰 이미지 생성"""
+        from PIL import Image, ImageDraw
+
+        image = Image.new("RGB", (4000, 3000), (255, 255, 255))
+        draw = ImageDraw.Draw(image)
+        draw.rectangle((1000, 1000, 2999, 1999), fill=(20, 20, 20))
+        path = tmp_path / "bubble.png"
+        image.save(path)
+        return path
+
+    def test_transform_trims_and_downscales(self, bubble_image, tmp_path):
+        """여백 크롭 + 다운스케일 + 그레이스케일 테스트"""
+        from PIL import Image
+
+        preprocessor = ImagePreprocessor(
+            PreprocessConfig(max_side=500, trim_padding=0),
+            cache_dir=str(tmp_path / "pre"),
+        )
+        output_path = preprocessor.prepare(str(bubble_image))
+
+        assert output_path != str(bubble_image)
+        with Image.open(output_path) as result:
+            assert result.mode == "L"
+            assert result.size == (500, 250)
+
+    def test_prepare_reuses_cached_output(self, bubble_image, tmp_path):
+        """동일 파라미터 결과 재사용 테스트"""
+        preprocessor = ImagePreprocessor(cache_dir=str(tmp_path / "pre"))
+
+        first = preprocessor.prepare(str(bubble_image))
+        with patch.object(preprocessor, "transform") as mock_transform:
+            second = preprocessor.prepare(str(bubble_image))
+
+        assert first == second
+        mock_transform.assert_not_called()
+
+    def test_prepare_uses_given_hash_and_replaces_atomically(self, bubble_image, tmp_path):
+        """전달된 해시 재사용 + 동시 전처리 시 완성된 PNG만 노출 테스트"""
+        from concurrent.futures import ThreadPoolExecutor
+        from PIL import Image
+
+        preprocessor = ImagePreprocessor(cache_dir=str(tmp_path / "pre"))
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            outputs = list(pool.map(lambda _: preprocessor.prepare(str(bubble_image), "precomputed"), range(4)))
+
+        assert len(set(outputs)) == 1
+        assert os.path.basename(outputs[0]).startswith("precomputed_")
+        with Image.open(outputs[0]) as result:
+            result.load()
+        assert [p.name for p in (tmp_path / "pre").iterdir()] == [os.path.basename(outputs[0])]
+
+    def test_disabled_or_unreadable_returns_original(self, tmp_path):
+        """비활성화·손상 파일은 원본 경로 반환 테스트"""
+        broken = tmp_path / "broken.jpg"
+        broken.write_bytes(b"not an image")
+
+        assert ImagePreprocessor(PreprocessConfig(enabled=False)).prepare(str(broken)) == str(broken)
+        assert ImagePreprocessor(cache_dir=str(tmp_path / "pre")).prepare(str(broken)) == str(broken)
+
+    def test_cache_key_includes_preprocess_params(self, bubble_image):
+        """전처리 파라미터가 캐시 키에 포함되는지 테스트"""
+        small = MediaOCRProcessor(preprocess_config=PreprocessConfig(max_side=800))
+        large = MediaOCRProcessor(preprocess_config=PreprocessConfig(max_side=1600))
+
+        assert small.get_cache_key(str(bubble_image)) != large.get_cache_key(str(bubble_image))
 
 class TestMediaOCRProcessor:
     """MediaOCRProcessor 테스트 클래스"""
@@ -190,7 +268,58 @@ class TestWhatsAppMediaOCRExtractor:
         finally:
             import shutil
             shutil.rmtree(download_dir)
-    
+
+    @pytest.mark.asyncio
+    async def test_download_media_fetches_source_bytes(self, tmp_path):
+        """원본 바이트 추출 + 콘텐츠 해시 파일명 테스트"""
+        import base64
+
+        content = b"\xff\xd8\xff original image bytes"
+        mock_element = AsyncMock()
+        mock_element.evaluate.return_value = {
+            'data': base64.b64encode(content).decode('ascii'),
+            'mime': 'image/jpeg',
+        }
+
+        first = await self.extractor.download_media(mock_element, str(tmp_path))
+        second = await self.extractor.download_media(mock_element, str(tmp_path))
+
+        mock_element.screenshot.assert_not_called()
+        assert first == second
+        assert first.endswith('.jpg')
+        assert Path(first).read_bytes() == content
+
+    @pytest.mark.asyncio
+    async def test_download_media_falls_back_to_screenshot(self, tmp_path):
+        """원본 추출 실패 시 스크린샷 폴백 테스트"""
+        mock_element = AsyncMock()
+        mock_element.evaluate.return_value = None
+        mock_element.screenshot.return_value = b"screenshot bytes"
+
+        result = await self.extractor.download_media(mock_element, str(tmp_path))
+
+        mock_element.screenshot.assert_awaited_once_with(type="jpeg")
+        assert Path(result).read_bytes() == b"screenshot bytes"
+
+    @pytest.mark.asyncio
+    async def test_download_media_screenshots_video_elements(self, tmp_path):
+        """동영상 원본은 저장하지 않고 스크린샷 사용 테스트"""
+        import base64
+
+        mock_element = AsyncMock()
+        mock_element.evaluate.return_value = {
+            'data': base64.b64encode(b"\x00\x00\x00\x18ftypmp42").decode('ascii'),
+            'mime': 'video/mp4',
+        }
+        mock_element.screenshot.return_value = b"video frame"
+
+        result = await self.extractor.download_media(mock_element, str(tmp_path))
+
+        mock_element.screenshot.assert_awaited_once_with(type="jpeg")
+        assert result.endswith('.jpg')
+        assert Path(result).read_bytes() == b"video frame"
+        assert not list(tmp_path.glob("*.mp4"))
+
     @pytest.mark.asyncio
     async def test_process_media_file_mock(self):
         """미디어 파일 처리 모의 테스트"""
@@ -226,10 +355,12 @@ class TestWhatsAppMediaOCRExtractor:
             output_file = f.name
         
         try:
-            await self.extractor.save_results(test_results, output_file)
+            with patch('whatsapp_media_ocr_extractor.record_artifact') as mock_record:
+                await self.extractor.save_results(test_results, output_file)
             
             # 파일이 생성되었는지 확인
             assert os.path.exists(output_file)
+            mock_record.assert_called_once_with('media_ocr', output_file, total_processed=2)
             
             # JSON 내용 확인
             import json
@@ -280,6 +411,151 @@ class TestIntegration:
                         mock_process.assert_called()
                         mock_save.assert_called()
 
+class TestOCRRouter:
+    """OCRRouter 테스트 클래스"""
+
+    @staticmethod
+    def _make_router(results, mode="escalate", threshold=0.6, head_start=2.0, delays=None):
+        import time
+
+        def recognize(path, engine, file_hash=None):
+            time.sleep((delays or {}).get(engine, 0))
+            return dict(results[engine])
+
+        processor = MagicMock()
+        processor.recognize.side_effect = recognize
+        router = OCRRouter(processor, threshold=threshold, mode=mode, race_head_start=head_start)
+        router.fallback_available = True
+        return router, processor
+
+    @pytest.mark.asyncio
+    async def test_confident_primary_skips_gcv(self):
+        """EasyOCR 신뢰도 충분 시 GCV 미호출 테스트"""
+        router, processor = self._make_router({
+            'easyocr': {'text': '화물 도착', 'confidence': 0.9, 'engine': 'easyocr'},
+            'gcv': {'text': '화물 도착', 'confidence': 0.95, 'engine': 'gcv'},
+        })
+
+        result = await router.process("image.png")
+
+        assert result['engine'] == 'easyocr'
+        assert result['router']['escalated'] is False
+        processor.recognize.assert_called_once_with("image.png", "easyocr", None)
+
+    @pytest.mark.asyncio
+    async def test_low_confidence_escalates_to_gcv(self):
+        """신뢰도 미달·빈 텍스트 시 GCV 에스컬레이션 테스트"""
+        router, _ = self._make_router({
+            'easyocr': {'text': '', 'confidence': 0.0, 'engine': 'easyocr'},
+            'gcv': {'text': 'Container ABCU1234567', 'confidence': 0.95, 'engine': 'gcv'},
+        })
+
+        result = await router.process("image.png")
+        stats = router.get_stats()
+
+        assert result['engine'] == 'gcv'
+        assert stats['escalations'] == 1
+        assert stats['escalation_rate'] == 1.0
+        assert stats['engines']['easyocr']['calls'] == 1
+        assert stats['engines']['gcv']['calls'] == 1
+
+    @pytest.mark.asyncio
+    async def test_escalation_keeps_better_primary_result(self):
+        """GCV도 미달이면 더 나은 결과 유지 테스트"""
+        router, _ = self._make_router({
+            'easyocr': {'text': 'partial', 'confidence': 0.5, 'engine': 'easyocr'},
+            'gcv': {'error': 'quota exceeded', 'text': '', 'confidence': 0.0, 'engine': 'gcv'},
+        })
+
+        result = await router.process("image.png")
+
+        assert result['engine'] == 'easyocr'
+        assert result['router']['escalated'] is False
+
+    @pytest.mark.asyncio
+    async def test_race_returns_first_confident_result(self):
+        """race 모드에서 임계값 이상 결과 채택 테스트"""
+        router, processor = self._make_router({
+            'easyocr': {'text': 'low', 'confidence': 0.2, 'engine': 'easyocr'},
+            'gcv': {'text': 'high', 'confidence': 0.95, 'engine': 'gcv'},
+        }, mode="race")
+
+        result = await router.process("image.png")
+
+        assert result['text'] == 'high'
+        assert processor.recognize.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_race_skips_gcv_when_primary_wins_head_start(self):
+        """선행 시간 안에 충분한 로컬 결과가 나오면 GCV 미호출 테스트"""
+        router, processor = self._make_router({
+            'easyocr': {'text': 'Gate pass', 'confidence': 0.8, 'engine': 'easyocr'},
+            'gcv': {'text': 'Gate pass', 'confidence': 0.95, 'engine': 'gcv'},
+        }, mode="race")
+
+        result = await router.process("image.png")
+
+        assert result['engine'] == 'easyocr'
+        processor.recognize.assert_called_once_with("image.png", "easyocr", None)
+
+    @pytest.mark.asyncio
+    async def test_race_starts_gcv_after_head_start(self):
+        """선행 시간 초과 시 GCV 병행 실행 테스트"""
+        router, processor = self._make_router({
+            'easyocr': {'text': 'slow', 'confidence': 0.9, 'engine': 'easyocr'},
+            'gcv': {'text': 'fast', 'confidence': 0.95, 'engine': 'gcv'},
+        }, mode="race", head_start=0.01, delays={'easyocr': 0.3})
+
+        result = await router.process("image.png")
+
+        assert result['engine'] == 'gcv'
+        assert processor.recognize.call_count == 2
+
+class TestBanWatcher:
+    """Ban 배너 감시 테스트 클래스"""
+
+    @staticmethod
+    def _make_page(banner_counts):
+        page = MagicMock()
+        page.is_closed.return_value = False
+        page.locator.return_value.count = AsyncMock(side_effect=banner_counts)
+        return page
+
+    @pytest.mark.asyncio
+    async def test_detect_ban_does_not_wait(self):
+        """배너 부재 시 대기 없이 즉시 반환 테스트"""
+        from whatsapp_media_ocr_extractor import detect_ban
+
+        page = self._make_page([0])
+
+        assert await detect_ban(page) is False
+        page.wait_for_selector.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_watcher_sets_banned_event(self):
+        """배너 등장 시 banned 이벤트 설정 테스트"""
+        page = self._make_page([0, 0, 1])
+        watcher = BanWatcher(page, interval=0)
+
+        watcher.start()
+        await asyncio.wait_for(watcher.banned.wait(), timeout=1)
+        await watcher.stop()
+
+        assert not watcher.healthy
+
+    @pytest.mark.asyncio
+    async def test_watcher_flags_closed_page(self):
+        """페이지 종료 시 page_closed 이벤트 설정 테스트"""
+        page = self._make_page([0])
+        page.is_closed.return_value = True
+        watcher = BanWatcher(page, interval=0)
+
+        watcher.start()
+        await asyncio.wait_for(watcher.page_closed.wait(), timeout=1)
+
+        assert not watcher.banned.is_set()
+        assert not watcher.healthy
+
 def test_config_validation():
     """설정 검증 테스트"""
     processor = MediaOCRProcessor(max_file_size_mb=5)
@@ -0,0 +1,94 @@
+"""Tests for the fixed-memory metrics time series store."""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+from metrics_timeseries import MetricsTimeSeries, RingSeries, memory_footprint
+
+COLUMNS = ("cpu_percent", "memory_percent")
+
+
+def _load_performance_monitor(monkeypatch):
+    path = Path(__file__).resolve().parent.parent / "scripts" / "performance_monitor.py"
+    spec = importlib.util.spec_from_file_location("performance_monitor", path)
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, "performance_monitor", module)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_ring_series_keeps_fixed_capacity_in_order():
+    ring = RingSeries(COLUMNS, capacity=3)
+    for i in range(5):
+        ring.append(float(i), {"cpu_percent": i * 10, "memory_percent": i})
+
+    rows = ring.rows()
+    assert len(ring) == 3
+    assert [row["timestamp"] for row in rows] == [2.0, 3.0, 4.0]
+    assert ring.latest()["cpu_percent"] == 40.0
+    assert [row["timestamp"] for row in ring.rows(since=3.0)] == [3.0, 4.0]
+
+
+def test_running_summary_and_rollups_cover_evicted_samples():
+    store = MetricsTimeSeries(COLUMNS, raw_capacity=10, minute_capacity=5, hour_capacity=2)
+    footprint = memory_footprint(store)
+    for second in range(0, 180, 10):  # 18 samples over 3 minutes
+        store.append(float(second), {"cpu_percent": second, "memory_percent": 50})
+
+    assert memory_footprint(store) == footprint
+    assert len(store) == 10
+    summary = store.summary()
+    assert summary["count"] == 18
+    assert summary["average"]["cpu_percent"] == sum(range(0, 180, 10)) / 18
+    assert summary["min"]["cpu_percent"] == 0
+    assert summary["max"]["cpu_percent"] == 170
+
+    minutes = store.series("1m")
+    assert [row["timestamp"] for row in minutes] == [0.0, 60.0, 120.0]
+    assert minutes[0]["cpu_percent_avg"] == 25.0
+    assert minutes[0]["cpu_percent_min"] == 0
+    assert minutes[0]["cpu_percent_max"] == 50
+    assert store.series("1h")[0]["memory_percent_avg"] == 50
+
+
+def test_snapshot_round_trip(tmp_path):
+    path = tmp_path / "perf_history.json"
+    store = MetricsTimeSeries(COLUMNS, raw_capacity=4, path=path)
+    for second in range(0, 120, 20):
+        store.append(float(second), {"cpu_percent": second, "memory_percent": 1})
+    store.save()
+
+    restored = MetricsTimeSeries(COLUMNS, raw_capacity=4, path=path)
+    assert restored.summary() == store.summary()
+    assert restored.series("raw") == store.series("raw")
+    assert restored.series("1m") == store.series("1m")
+
+    restored.append(120.0, {"cpu_percent": 120, "memory_percent": 1})
+    assert restored.series("1m")[-1]["timestamp"] == 120.0
+    assert restored.summary()["count"] == 7
+
+
+def test_performance_monitor_summary_uses_store(tmp_path, monkeypatch):
+    module = _load_performance_monitor(monkeypatch)
+    monitor = module.PerformanceMonitor(
+        history_file=str(tmp_path / "history.json"), raw_capacity=2, persist_every=0
+    )
+    for cpu in (10.0, 20.0, 60.0):
+        monitor.record_metrics(
+            module.SystemMetrics(
+                timestamp="2025-07-24T09:00:00",
+                cpu_percent=cpu,
+                memory_percent=40.0,
+                disk_percent=50.0,
+                network_sent=1,
+                network_recv=2,
+            )
+        )
+
+    summary = monitor.generate_summary_report()
+    assert summary["monitoring_duration"] == 3
+    assert summary["average_metrics"]["cpu_percent"] == 30.0
+    assert summary["peak_metrics"]["cpu_percent"] == 60.0
+    assert len(monitor.metrics_history) == 2
+    assert monitor.metrics_history[-1].cpu_percent == 60.0
@@ -0,0 +1,172 @@
+"""증분 아침 보고서 상태 테스트."""
+
+import importlib.util
+import json
+import sys
+import types
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from macho_gpt.core.logi_whatsapp_241219 import WhatsAppProcessor
+from morning_report_state import IncrementalReportBuilder, MorningReportState, format_messages
+
+NOW = datetime(2025, 7, 25, 7, 0, 0)
+
+
+class _Summariser:
+    def __init__(self):
+        self.texts = []
+
+    def __call__(self, text):
+        self.texts.append(text)
+        return {
+            "key_points": [line.split(": ", 1)[1] for line in text.splitlines()][:3],
+            "urgent_items": [],
+            "total_messages": len(text.splitlines()),
+            "confidence_score": 0.7,
+            "processing_mode": "BASIC",
+        }
+
+
+def _message(text, scraped_at, sender="Kim"):
+    return {"text": text, "sender": sender, "timestamp": "10:00", "scraped_at": scraped_at.isoformat()}
+
+
+def _write(path, messages):
+    path.write_text(json.dumps(messages, ensure_ascii=False), encoding="utf-8")
+
+
+def _builder(state_path, summarise):
+    return IncrementalReportBuilder(MorningReportState(state_path), WhatsAppProcessor(), summarise)
+
+
+def test_only_messages_newer_than_last_report_are_summarised(tmp_path):
+    store = tmp_path / "logistics.json"
+    _write(store, [
+        _message("old history", NOW - timedelta(days=3)),
+        _message("긴급 crane booking moved", NOW - timedelta(hours=5)),
+        _message("Gate pass ready", NOW - timedelta(hours=1)),
+    ])
+    summarise = _Summariser()
+    state_path = tmp_path / "state.json"
+
+    builder = _builder(state_path, summarise)
+    first = builder.build({"물류팀": store}, now=NOW)
+    builder.state.save()
+
+    assert first.total_messages == 2
+    assert "old history" not in summarise.texts[0]
+    assert builder.state.chats["물류팀"].kpi.urgent_count == 1
+
+    # 다음 날: 저장소가 그대로면 파일을 읽거나 요약하지 않음
+    builder = _builder(state_path, summarise)
+    idle = builder.build({"물류팀": store}, now=NOW + timedelta(days=1))
+    builder.state.save()
+    assert idle.total_messages == 0 and idle.idle_chats == ["물류팀"]
+    assert len(summarise.texts) == 1
+
+    # 새 메시지 추가 → 새 항목만 요약, KPI는 누적
+    messages = json.loads(store.read_text(encoding="utf-8"))
+    messages.append(_message("ETA 14:00 confirmed", NOW + timedelta(days=1, hours=2)))
+    _write(store, messages)
+    builder = _builder(state_path, summarise)
+    third = builder.build({"물류팀": store}, now=NOW + timedelta(days=2))
+
+    assert third.total_messages == 1
+    assert summarise.texts[-1].count("\n") == 0 and "ETA 14:00" in summarise.texts[-1]
+    assert builder.state.chats["물류팀"].kpi.total_messages == 3
+    assert third.chats[0].kpi_7d["messages"] == 3
+
+
+def test_rerun_of_unsaved_window_reuses_cached_summary(tmp_path):
+    store = tmp_path / "yard.json"
+    _write(store, [_message("Trailer 7 arrived", NOW - timedelta(hours=2))])
+    summarise = _Summariser()
+    state_path = tmp_path / "state.json"
+
+    first = _builder(state_path, summarise).build({"Yard": store}, now=NOW)
+    # 보고서 저장 실패 → 상태 파일 미저장, 다음 실행은 디스크 상태에서 같은 창을 다시 처리
+    assert not state_path.exists()
+    rerun = _builder(state_path, summarise).build({"Yard": store}, now=NOW)
+
+    assert len(summarise.texts) == 1
+    assert first.chats[0].cached is False and rerun.chats[0].cached is True
+    assert rerun.chats[0].summary["key_points"] == ["Trailer 7 arrived"]
+    assert (tmp_path / "state.summaries.json").exists()
+
+
+def test_rewritten_store_resets_offset_and_window_end_is_respected(tmp_path):
+    store = tmp_path / "port.json"
+    _write(store, [_message(f"msg {i}", NOW - timedelta(hours=3)) for i in range(4)])
+    state_path = tmp_path / "state.json"
+    builder = _builder(state_path, _Summariser())
+    builder.build({"Port": store}, now=NOW)
+    assert builder.state.chats["Port"].offset == 4
+
+    _write(store, [
+        _message("after rotate", NOW + timedelta(hours=1)),
+        _message("too new", NOW + timedelta(hours=30)),
+    ])
+    result = builder.build({"Port": store}, now=NOW + timedelta(hours=2))
+
+    assert result.total_messages == 1
+    assert builder.state.chats["Port"].offset == 1  # 창 이후 항목은 다음 보고서에서
+    assert builder.state.chats["Port"].file_key is None
+
+
+def test_format_messages_produces_parseable_lines():
+    text = format_messages([_message("Check: DSV note", NOW, sender="Ops: Abu Dhabi")])
+    parsed = WhatsAppProcessor().parse_whatsapp_text(text)
+
+    assert len(parsed) == 1
+    assert parsed[0].sender == "Ops Abu Dhabi"
+    assert parsed[0].content == "Check: DSV note"
+
+
+def _load_report_system(monkeypatch, tmp_path):
+    # schedule는 스케줄러 실행에만 필요하고, 로그 파일은 작업 디렉터리의 logs/에 생성됨
+    monkeypatch.setitem(sys.modules, "schedule", types.ModuleType("schedule"))
+    (tmp_path / "logs").mkdir()
+    monkeypatch.chdir(tmp_path)
+    path = Path(__file__).resolve().parent.parent / "scripts" / "morning_report_system.py"
+    spec = importlib.util.spec_from_file_location("morning_report_system", path)
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, "morning_report_system", module)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_failed_save_keeps_state_and_same_generator_rerun_reprocesses_window(monkeypatch, tmp_path):
+    module = _load_report_system(monkeypatch, tmp_path)
+    artifacts = []
+
+    def record_artifact(kind, path, **meta):
+        if not artifacts:
+            artifacts.append(None)
+            raise OSError("index locked")
+        artifacts.append(path)
+
+    monkeypatch.setattr(module, "record_artifact", record_artifact)
+    store = tmp_path / "logistics.json"
+    _write(store, [_message("긴급 crane booking moved", NOW - timedelta(hours=1))])
+    generator = module.MorningReportGenerator(
+        reports_dir=str(tmp_path / "reports"), store_files={"물류팀": str(store)}
+    )
+    summarise = _Summariser()
+    generator.cli.generate = summarise
+
+    report = generator.build_incremental_report(now=NOW)
+    assert generator.save_report(report) == Path()
+    assert generator.state.last_report_at is None
+    assert generator.state.chats == {}
+    assert not generator.state.path.exists()
+
+    rerun = generator.build_incremental_report(now=NOW)
+    assert rerun.total_messages == 1
+    assert rerun.team_status["totals_7d"] == {"messages": 1, "urgent": 1}
+    assert all(0.0 <= value <= 1.0 for key, value in rerun.kpi_metrics.items() if key != "average_response_time")
+    assert len(summarise.texts) == 1  # 같은 창의 요약은 캐시에서
+    assert generator.save_report(rerun) == artifacts[-1]
+    assert generator.state.last_report_at == NOW
+    assert generator.state.chats["물류팀"].kpi.total_messages == 1
+    assert MorningReportState(generator.state.path).chats["물류팀"].offset == 1
@@ -4,6 +4,7 @@ Kent Beck TDD 원칙 준수: Red → Green → Refactor
 """
 
 import asyncio
+import json
 import tempfile
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock, patch
@@ -548,13 +549,12 @@ class TestMultiGroupManager:
         for scraper in mock_scrapers:
             scraper.close.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_should_use_apify_fallback_on_failure(self, mock_group_configs):
-        """Apify 폴백 실행 테스트"""
-
+    @staticmethod
+    def _fallback_manager(tmp_path, pages):
         fallback = ApifyFallbackSettings(enabled=True, actor_id="user/actor")
+        group_config = GroupConfig(name="Group 1", save_file=str(tmp_path / "g1.json"))
         manager = MultiGroupManager(
-            group_configs=[mock_group_configs[0]],
+            group_configs=[group_config],
             max_parallel_groups=1,
             apify_fallback=fallback,
         )
@@ -562,28 +562,80 @@ class TestMultiGroupManager:
         fake_scraper = AsyncMock()
         fake_scraper.run = AsyncMock(side_effect=Exception("Local failure"))
         fake_scraper.close = AsyncMock()
-
         manager._create_scraper = Mock(return_value=fake_scraper)
 
-        fallback_response = {
-            "run": {"id": "abc123", "status": "SUCCEEDED"},
-            "items": [{"messages": [{"text": "Remote message"}]}],
-        }
+        class FakeStream:
+            def __init__(self, actor_id, payload, **kwargs):
+                self.run = {"id": "abc123", "status": "SUCCEEDED"}
+                self.items_read = 2
+
+            async def pages(self):
+                for page in pages:
+                    if isinstance(page, Exception):
+                        raise page
+                    yield page
+
+        return manager, fake_scraper, FakeStream
+
+    @pytest.mark.asyncio
+    async def test_should_use_apify_fallback_on_failure(self, tmp_path):
+        """Apify 폴백 메시지가 저장소에 중복 없이 병합되는지 테스트"""
+
+        store = tmp_path / "g1.json"
+        store.write_text(
+            json.dumps([{"text": "Remote message", "sender": "Kim", "timestamp": "10:00"}]),
+            encoding="utf-8",
+        )
+        manager, fake_scraper, FakeStream = self._fallback_manager(tmp_path, [
+            [{"messages": [{"text": " Remote message ", "sender": "Kim", "timestamp": "10:00"}]}],
+            [{"text": "Second page", "sender": "Lee"}],
+        ])
 
         with patch(
-            "macho_gpt.async_scraper.multi_group_manager.asyncio.to_thread",
-            new=AsyncMock(return_value=fallback_response),
+            "macho_gpt.async_scraper.multi_group_manager.ActorItemStream", FakeStream
         ):
             result = await manager._scrape_group(manager.group_configs[0])
+            rerun = await manager._scrape_group(manager.group_configs[0])
 
         assert result["success"] is True
         assert result["fallback_used"] == "apify"
         assert result["messages_scraped"] == 1
-        assert result["remote_messages"][0]["text"] == "Remote message"
+        assert result["duplicates_skipped"] == 1
+        assert result["apify_run"]["run_id"] == "abc123"
+        assert result["messages_file"] == str(store)
+        assert rerun["messages_scraped"] == 0 and rerun["duplicates_skipped"] == 2
+
+        stored = json.loads(store.read_text(encoding="utf-8"))
+        assert [m["text"] for m in stored] == ["Remote message", "Second page"]
+        assert stored[1]["group_name"] == "Group 1" and stored[1]["source"] == "apify"
+        assert stored[1]["scraped_at"]
+        assert [p.name for p in tmp_path.iterdir()] == ["g1.json"]
         fake_scraper.close.assert_awaited()
 
         assert len(manager.scrapers) == 0
 
+    @pytest.mark.asyncio
+    async def test_failed_apify_stream_keeps_message_store(self, tmp_path):
+        """스트림 중간 실패 시 저장소 유지 테스트"""
+
+        store = tmp_path / "g1.json"
+        store.write_text(json.dumps([{"text": "kept", "sender": "Kim"}]), encoding="utf-8")
+        original = store.read_text(encoding="utf-8")
+        manager, _, FakeStream = self._fallback_manager(tmp_path, [
+            [{"text": "partial", "sender": "Lee"}],
+            RuntimeError("dataset page failed"),
+        ])
+
+        with patch(
+            "macho_gpt.async_scraper.multi_group_manager.ActorItemStream", FakeStream
+        ):
+            result = await manager._scrape_group(manager.group_configs[0])
+
+        assert result["success"] is False
+        assert "fallback_used" not in result
+        assert store.read_text(encoding="utf-8") == original
+        assert [p.name for p in tmp_path.iterdir()] == ["g1.json"]
+
     def test_should_pass_scraper_settings_to_async_scraper(self, mock_group_configs):
         """스크래퍼 설정이 AsyncGroupScraper에 전파되는지 테스트"""
         scraper_settings = ScraperSettings(
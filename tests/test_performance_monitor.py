@@ -0,0 +1,91 @@
+"""Tests for the async PerformanceMonitor loop."""
+
+import asyncio
+import importlib.util
+import socket
+import sys
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def monitor_module(monkeypatch):
+    path = Path(__file__).resolve().parent.parent / "scripts" / "performance_monitor.py"
+    spec = importlib.util.spec_from_file_location("performance_monitor", path)
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, "performance_monitor", module)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.mark.asyncio
+async def test_probes_run_concurrently_on_fixed_cadence(monitor_module, monkeypatch):
+    monitor = monitor_module.PerformanceMonitor(persist_every=0)
+    monitor.service_ports = [9001, 9002, 9003, 9004, 9005]
+    monkeypatch.setattr(monitor, "print_real_time_status", lambda *args: None)
+
+    async def slow_probe(client, port):
+        await asyncio.sleep(0.1)
+        return monitor_module.ServiceStatus(port, "running", 0.1, None)
+
+    monkeypatch.setattr(monitor, "check_service_status_async", slow_probe)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    await monitor.monitor_loop(interval=0.2, max_ticks=3)
+    elapsed = loop.time() - started
+
+    # 순차 확인이면 틱당 0.5초 - 동시 확인이므로 틱당 ~0.1초, 주기 0.2초 유지
+    assert monitor.tick_stats["ticks"] == 3
+    assert monitor.tick_stats["last_tick_seconds"] < 0.3
+    assert monitor.tick_stats["overruns"] == 0
+    assert 0.35 <= elapsed < 0.7
+    assert len(monitor.last_service_status) == 5
+    assert monitor.generate_summary_report()["monitoring_duration"] == 3
+
+
+@pytest.mark.skipif(not importlib.util.find_spec("httpx"), reason="httpx not installed")
+@pytest.mark.asyncio
+async def test_async_probe_statuses_with_pooled_client(monitor_module):
+    async def handle(reader, writer):
+        await reader.readuntil(b"\r\n\r\n")
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+        await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    running_port = server.sockets[0].getsockname()[1]
+    stopped_port = _free_port()
+
+    monitor = monitor_module.PerformanceMonitor(persist_every=0)
+    monitor.service_ports = [running_port, stopped_port]
+    client = monitor._create_http_client()
+    try:
+        statuses = await monitor.check_all_services_async(client)
+    finally:
+        await client.aclose()
+        server.close()
+        await server.wait_closed()
+
+    assert [s.status for s in statuses] == ["running", "stopped"]
+    assert statuses[0].response_time is not None
+
+
+def test_cpu_sampling_is_non_blocking(monitor_module, monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        monitor_module.psutil, "cpu_percent", lambda interval=None: calls.append(interval) or 12.5
+    )
+    monitor = monitor_module.PerformanceMonitor(persist_every=0)
+
+    metrics = monitor.collect_system_metrics(cpu_interval=None)
+
+    assert calls == [None]
+    assert metrics.cpu_percent == 12.5
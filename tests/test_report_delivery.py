@@ -0,0 +1,141 @@
+"""보고서 템플릿 렌더링 및 비동기 메일 전송 테스트."""
+
+import asyncio
+
+import pytest
+
+from report_delivery import JINJA2_AVAILABLE, AsyncMailSender, ReportRenderer
+
+REPORT = {
+    "report_date": "2025-07-25",
+    "total_messages": 42,
+    "urgent_items": ["[물류팀] <script>alert(1)</script> crane 변경"],
+    "key_points": ["Gate pass ready"],
+    "team_status": {},
+    "kpi_metrics": {"urgent_response_rate": 0.92, "urgent_ratio_7d": 0.05, "error": "n/a"},
+    "recommendations": ["에스컬레이션 점검"],
+    "next_actions": ["오전 9시 팀 미팅 진행"],
+    "confidence_score": 0.7,
+    "processing_mode": "PRIME",
+}
+
+
+class SMTPStub:
+    """로컬 SMTP 스텁 (EHLO/MAIL/RCPT/DATA/RSET/QUIT, AUTH·TLS 없음)"""
+
+    def __init__(self, reject=()):
+        self.reject = set(reject)
+        self.connections = 0
+        self.envelopes = []
+        self._server = None
+        self.port = None
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        rcpts, mail_from = [], None
+
+        async def reply(line):
+            writer.write((line + "\r\n").encode())
+            await writer.drain()
+
+        await reply("220 stub ESMTP")
+        while True:
+            line = (await reader.readline()).decode().rstrip("\r\n")
+            if not line:
+                break
+            verb = line.split(" ", 1)[0].upper()
+            if verb in ("EHLO", "HELO"):
+                await reply("250 stub")
+            elif verb == "MAIL":
+                mail_from, rcpts = line[10:].strip("<>").split(">")[0], []
+                await reply("250 OK")
+            elif verb == "RCPT":
+                rcpt = line.split(":", 1)[1].strip().strip("<>")
+                if rcpt in self.reject:
+                    await reply("550 mailbox unavailable")
+                else:
+                    rcpts.append(rcpt)
+                    await reply("250 OK")
+            elif verb == "DATA":
+                await reply("354 go ahead")
+                body = []
+                while (data := await reader.readline()) != b".\r\n":
+                    body.append(data)
+                self.envelopes.append({"from": mail_from, "to": rcpts, "data": b"".join(body)})
+                await reply("250 queued")
+            elif verb == "RSET":
+                rcpts = []
+                await reply("250 OK")
+            elif verb == "QUIT":
+                await reply("221 bye")
+                break
+            else:
+                await reply("502 not implemented")
+        writer.close()
+
+
+@pytest.mark.skipif(not JINJA2_AVAILABLE, reason="Jinja2 not installed")
+def test_renderer_escapes_values_and_writes_bytecode_cache(tmp_path):
+    renderer = ReportRenderer(cache_dir=tmp_path / "cache")
+    html = renderer.render(REPORT)
+
+    assert "&lt;script&gt;alert(1)&lt;/script&gt;" in html
+    assert "<script>alert" not in html
+    assert "92.0%" in html and "70.0%" in html and "5.0%" in html
+    assert "Urgent Response Rate" in html and "Error" not in html
+    assert list((tmp_path / "cache").iterdir())
+
+    # 새 인스턴스는 바이트코드 캐시에서 로드해도 같은 결과
+    assert ReportRenderer(cache_dir=tmp_path / "cache").render(REPORT).count('class="list-item') == 4
+
+
+@pytest.mark.asyncio
+async def test_sender_batches_recipients_over_one_connection():
+    stub = SMTPStub()
+    await stub.start()
+    try:
+        sender = AsyncMailSender("127.0.0.1", stub.port, sender="report@samsung-ct.com",
+                                 use_starttls=False, batch_size=2, timeout=5)
+        recipients = [f"user{i}@samsung-ct.com" for i in range(5)]
+        async with sender:
+            result = await sender.send("아침 보고서", "<p>hi</p>", recipients + recipients[:1])
+            # 같은 연결로 두 번째 전송
+            again = await sender.send("아침 보고서", "<p>hi</p>", recipients[:1])
+    finally:
+        await stub.stop()
+
+    assert result.sent == recipients
+    assert result.batches == 3 and result.connections == 1
+    assert again.connections == 0
+    assert stub.connections == 1
+    assert [envelope["to"] for envelope in stub.envelopes[:3]] == [recipients[0:2], recipients[2:4], recipients[4:]]
+    assert b"Content-Type: text/html" in stub.envelopes[0]["data"]
+
+
+@pytest.mark.asyncio
+async def test_refused_recipients_are_reported_per_batch():
+    # 스텁이 같은 이벤트 루프에서 응답하므로, 전송이 루프를 막으면 이 테스트는 멈춥니다
+    stub = SMTPStub(reject={"bad@samsung-ct.com"})
+    await stub.start()
+    try:
+        sender = AsyncMailSender("127.0.0.1", stub.port, sender="report@samsung-ct.com",
+                                 use_starttls=False, batch_size=1, timeout=5)
+        async with sender:
+            result = await sender.send(
+                "아침 보고서", "<p>hi</p>", ["ok@samsung-ct.com", "bad@samsung-ct.com", "ok2@samsung-ct.com"]
+            )
+    finally:
+        await stub.stop()
+
+    assert result.sent == ["ok@samsung-ct.com", "ok2@samsung-ct.com"]
+    assert list(result.failed) == ["bad@samsung-ct.com"]
+    assert result.failed["bad@samsung-ct.com"].startswith("550")
+    assert not result.ok
@@ -0,0 +1,98 @@
+"""리소스 차단 정책 테스트/Resource blocking policy tests."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from resource_policy import ESTIMATED_BYTES, ResourcePolicy
+
+
+def _route(resource_type, url):
+    route = SimpleNamespace(
+        request=SimpleNamespace(resource_type=resource_type, url=url),
+        abort=AsyncMock(),
+        continue_=AsyncMock(),
+    )
+    return route
+
+
+class TestShouldBlock:
+    """모드별 차단 판단 테스트"""
+
+    def test_text_mode_blocks_heavy_resources(self):
+        policy = ResourcePolicy("text")
+
+        assert policy.should_block("image", "https://static.whatsapp.net/emoji.png")
+        assert policy.should_block("font", "https://web.whatsapp.com/font.woff2")
+        assert policy.should_block("fetch", "https://mmg.whatsapp.net/v/t62/sticker")
+        assert not policy.should_block("script", "https://web.whatsapp.com/app.js")
+        assert not policy.should_block("websocket", "wss://web.whatsapp.com/ws/chat")
+
+    def test_media_mode_keeps_chat_media(self):
+        policy = ResourcePolicy("media")
+
+        assert policy.should_block("font", "https://web.whatsapp.com/font.woff2")
+        assert policy.should_block("image", "https://pps.whatsapp.net/v/t61/avatar.jpg")
+        assert not policy.should_block("fetch", "https://mmg.whatsapp.net/v/t62/photo")
+        assert not policy.should_block("image", "https://web.whatsapp.com/img/photo.jpg")
+
+    def test_invalid_mode(self):
+        with pytest.raises(ValueError):
+            ResourcePolicy("images-only")
+
+
+@pytest.mark.asyncio
+async def test_route_strategy_aborts_and_reports_savings():
+    """route 전략 차단 및 절감 리포트/Route handler aborts and tallies savings."""
+    policy = ResourcePolicy("text")
+    context = AsyncMock()
+    await policy.apply(context)
+    handler = context.route.await_args.args[1]
+
+    blocked = _route("image", "https://pps.whatsapp.net/avatar.jpg")
+    allowed = _route("script", "https://web.whatsapp.com/app.js")
+    await handler(blocked)
+    await handler(allowed)
+    await handler(_route("font", "https://web.whatsapp.com/f.woff2"))
+
+    blocked.abort.assert_awaited_once()
+    allowed.continue_.assert_awaited_once()
+    report = policy.report()
+    assert report["blocked_by_type"] == {"image": 1, "font": 1}
+    assert report["allowed_requests"] == 1
+    assert report["estimated_bytes_saved"] == ESTIMATED_BYTES["image"] + ESTIMATED_BYTES["font"]
+
+
+@pytest.mark.asyncio
+async def test_full_mode_installs_nothing():
+    """full 모드는 라우팅 없음 (HTTP 캐시 유지)/Full mode leaves routing off."""
+    context = AsyncMock()
+
+    await ResourcePolicy("full").apply(context)
+
+    context.route.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_cdp_strategy_blocks_urls_once_per_page():
+    """cdp 전략: 페이지당 1회 setBlockedURLs 적용/CDP blocking applied once per page."""
+    session = SimpleNamespace(on=Mock(), send=AsyncMock())
+    page = Mock()
+    page.context.new_cdp_session = AsyncMock(return_value=session)
+    policy = ResourcePolicy("text", strategy="cdp")
+
+    await policy.apply_to_page(page)
+    await policy.apply_to_page(page)
+
+    methods = [call.args[0] for call in session.send.await_args_list]
+    assert methods == ["Network.enable", "Network.setBlockedURLs"]
+    patterns = session.send.await_args_list[1].args[1]["urls"]
+    assert "*mmg.whatsapp.net*" in patterns and "*.woff2*" in patterns
+
+    on_failed = dict((c.args[0], c.args[1]) for c in session.on.call_args_list)[
+        "Network.loadingFailed"
+    ]
+    on_failed({"blockedReason": "inspector", "type": "Image"})
+    on_failed({"errorText": "net::ERR_FAILED", "type": "Script"})
+    assert policy.report()["blocked_by_type"] == {"image": 1}
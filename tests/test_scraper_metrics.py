@@ -0,0 +1,108 @@
+"""스크래퍼 계측 테스트/Scraper instrumentation tests."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from macho_gpt.async_scraper.async_scraper import AsyncGroupScraper
+from macho_gpt.async_scraper.group_config import GroupConfig, ScraperSettings
+from macho_gpt.async_scraper.metrics import Histogram, MetricsServer, ScraperMetrics
+from macho_gpt.async_scraper.multi_group_manager import MultiGroupManager
+
+
+def _element(text, sender="Kim", meta="10:01"):
+    children = {
+        '[data-testid="msg-text"]': Mock(text_content=AsyncMock(return_value=text)),
+        '[data-testid="msg-meta"]': Mock(text_content=AsyncMock(return_value=meta)),
+        '[data-testid="msg-sender"]': Mock(text_content=AsyncMock(return_value=sender)),
+    }
+    element = Mock()
+    element.query_selector = AsyncMock(side_effect=lambda selector: children[selector])
+    return element
+
+
+def test_histogram_buckets_and_openmetrics_rendering():
+    histogram = Histogram((0.1, 1.0))
+    for value in (0.05, 0.5, 2.0):
+        histogram.observe(value)
+    assert histogram.cumulative()[-1][1] == 3
+    assert histogram.quantile(0.5) == 1.0  # 버킷 상한
+    assert histogram.quantile(1.0) == 2.0  # +Inf 버킷은 관측 최대값
+
+    metrics = ScraperMetrics()
+    metrics.observe_stage('Yard "A"', "extract", 0.2)
+    metrics.observe_messages('Yard "A"', 3)
+    metrics.inc('Yard "A"', "dedup_hits")
+    text = metrics.render_openmetrics()
+
+    assert "# TYPE macho_scraper_stage_duration_seconds histogram" in text
+    assert 'macho_scraper_stage_duration_seconds_bucket{group="Yard \\"A\\"",stage="extract",le="0.25"} 1' in text
+    assert 'macho_scraper_stage_duration_seconds_count{group="Yard \\"A\\"",stage="extract"} 1' in text
+    assert 'macho_scraper_messages_per_cycle_bucket{group="Yard \\"A\\"",le="5.0"} 1' in text
+    assert 'macho_scraper_dedup_hits_total{group="Yard \\"A\\""} 1' in text
+    assert text.endswith("# EOF\n")
+
+
+@pytest.mark.asyncio
+async def test_scraper_records_stage_timings_and_dedup(tmp_path):
+    config = GroupConfig(name="Yard", save_file=str(tmp_path / "messages.json"))
+    scraper = AsyncGroupScraper(config)
+    scraper.page = Mock()
+    scraper.page.wait_for_selector = AsyncMock()
+    scraper.page.query_selector_all = AsyncMock(
+        return_value=[_element("Gate pass ready"), _element("Gate pass ready"), _element("ETA 14:00")]
+    )
+
+    first = await scraper.run_scraping_cycle()
+    second = await scraper.run_scraping_cycle()
+
+    assert first["messages_scraped"] == 2
+    assert second["messages_scraped"] == 0
+    stats = scraper.get_stats()
+    assert stats["stages"]["extract"]["count"] == 2
+    assert stats["stages"]["save"]["count"] == 1
+    assert stats["stages"]["push"]["count"] == 1
+    assert stats["messages_per_cycle"]["count"] == 2
+    assert stats["counters"]["dedup_checks"] == 6
+    assert stats["counters"]["dedup_hits"] == 4
+    assert stats["dedup_hit_rate"] == round(4 / 6, 4)
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_serves_openmetrics():
+    metrics = ScraperMetrics()
+    metrics.observe_stage("Yard", "login", 1.5)
+    server = MetricsServer(metrics, port=0)
+    port = await server.start()
+    try:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"GET /metrics HTTP/1.1\r\nHost: localhost\r\n\r\n")
+        await writer.drain()
+        response = (await reader.read()).decode("utf-8")
+        writer.close()
+    finally:
+        await server.stop()
+
+    assert response.startswith("HTTP/1.1 200 OK")
+    assert "application/openmetrics-text" in response
+    assert 'stage="login"' in response
+
+
+def test_manager_shares_metrics_and_reports_per_group(tmp_path):
+    groups = [
+        GroupConfig(name="Yard", save_file=str(tmp_path / "yard.json")),
+        GroupConfig(name="Port", save_file=str(tmp_path / "port.json")),
+    ]
+    manager = MultiGroupManager(groups, scraper_settings=ScraperSettings(metrics_port=0))
+    yard = manager._create_scraper(groups[0])
+    port = manager._create_scraper(groups[1])
+    assert yard.metrics is port.metrics is manager.metrics
+
+    yard.metrics.observe_stage("Yard", "find_group", 4.0)
+    port.metrics.observe_stage("Port", "find_group", 0.5)
+
+    stats = manager.get_stats()
+    assert set(stats["groups"]) == {"Yard", "Port"}
+    assert stats["slowest_stages"][0]["group"] == "Yard"
+    assert stats["groups"]["Port"]["stages"]["find_group"]["count"] == 1
@@ -0,0 +1,66 @@
+"""공유 텍스트 정제 모듈 테스트/Shared text sanitizer tests."""
+
+import text_sanitizer
+
+
+class TestMaskPII:
+    """PII 마스킹 테스트"""
+
+    def test_masks_all_pii_kinds_in_one_pass(self):
+        """전화·이메일·주민번호·카드번호 마스킹 확인"""
+        text = (
+            "연락처: 010-1234-5678 이메일: test@example.com "
+            "주민번호: 123456-1234567 카드: 1234-5678-9012-3456 일반 텍스트"
+        )
+
+        result = text_sanitizer.mask_pii(text)
+
+        assert result == (
+            "연락처: [PHONE] 이메일: [EMAIL] "
+            "주민번호: [ID_NUMBER] 카드: [CARD_NUMBER] 일반 텍스트"
+        )
+
+    def test_sanitize_ocr_text_strips_and_handles_empty(self):
+        """빈 입력 처리 및 양끝 공백 제거 확인"""
+        assert text_sanitizer.sanitize_ocr_text("") == ""
+        assert text_sanitizer.sanitize_ocr_text(None) == ""
+        assert text_sanitizer.sanitize_ocr_text("  call 010-1111-2222  ") == "call [PHONE]"
+
+    def test_iter_masked_messages_does_not_mutate_input(self):
+        """메시지 스트림 마스킹 시 원본 보존 확인"""
+        messages = [{"text": "mail me: a.b@corp.ae", "sender": "Kim"}, {"sender": "Lee"}]
+
+        masked = list(text_sanitizer.iter_masked_messages(messages))
+
+        assert masked[0] == {"text": "mail me: [EMAIL]", "sender": "Kim"}
+        assert masked[1] == {"sender": "Lee"}
+        assert messages[0]["text"] == "mail me: a.b@corp.ae"
+
+
+class TestSanitizeText:
+    """이모지·제어문자 제거 테스트"""
+
+    def test_removes_emoji_controls_and_brackets(self):
+        """이모지·ZWSP·대괄호 제거 및 공백 정규화 확인"""
+        title = "[HVDC] ⚡ Project​ lightning ⚡ 😀🚢\t물류팀"
+
+        assert text_sanitizer.sanitize_text(title) == "HVDC Project lightning 물류팀"
+
+    def test_keeps_regular_text(self):
+        """일반 텍스트 보존 확인"""
+        assert text_sanitizer.sanitize_text("Abu Dhabi  Logistics") == "Abu Dhabi Logistics"
+
+
+class TestGenerateSearchTokens:
+    """검색 토큰 생성 테스트"""
+
+    def test_tokens_sorted_by_length(self):
+        """특수문자 제거 후 길이순 토큰 확인"""
+        tokens = text_sanitizer.generate_search_tokens("[HVDC] ⚡ Project lightning ⚡")
+
+        assert tokens == ["lightning", "Project", "HVDC"]
+
+    def test_falls_back_to_normalized_title(self):
+        """짧은 토큰만 있으면 정규화된 제목 반환 확인"""
+        assert text_sanitizer.generate_search_tokens("⚡ AB ⚡") == ["AB"]
+        assert text_sanitizer.generate_search_tokens("⚡") == ["⚡"]
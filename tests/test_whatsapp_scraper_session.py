@@ -0,0 +1,74 @@
+"""단일 세션 다중 채팅방 스크래핑 테스트."""
+
+import asyncio
+
+import pytest
+
+from scripts.whatsapp_scraper import WhatsAppMessage, WhatsAppScraper, WhatsAppScraperManager
+
+
+class _FakeSession:
+    entered = 0
+
+    def __init__(self):
+        self.page = object()
+        self.lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        type(self).entered += 1
+        return self
+
+    async def __aexit__(self, *exc):
+        self.page = None
+
+
+def _fake_scrape(delays):
+    async def scrape_in_page(self, page, hours_back, sink):
+        assert page is not None
+        sink.append(WhatsAppMessage(content=f"{self.chat_title} first", timestamp="t", sender="Kim"))
+        await asyncio.sleep(delays.get(self.chat_title, 0))
+        sink.append(WhatsAppMessage(content=f"{self.chat_title} second", timestamp="t", sender="Kim"))
+        return sink
+
+    return scrape_in_page
+
+
+@pytest.mark.asyncio
+async def test_chats_share_one_session(monkeypatch):
+    _FakeSession.entered = 0
+    monkeypatch.setattr(WhatsAppScraper, "scrape_in_page", _fake_scrape({}))
+    manager = WhatsAppScraperManager(session_factory=_FakeSession)
+
+    result = await manager.scrape_conversations(["A", "B", "C"], save=False)
+
+    assert _FakeSession.entered == 1
+    assert list(result.conversations) == ["A", "B", "C"]
+    assert all(len(messages) == 2 for messages in result.conversations.values())
+    assert result.complete
+
+
+@pytest.mark.asyncio
+async def test_time_budget_returns_partial_results(monkeypatch):
+    monkeypatch.setattr(WhatsAppScraper, "scrape_in_page", _fake_scrape({"B": 5.0}))
+    manager = WhatsAppScraperManager(session_factory=_FakeSession)
+
+    result = await manager.scrape_conversations(["A", "B", "C"], time_budget=0.3, save=False)
+
+    assert [m.content for m in result.conversations["A"]] == ["A first", "A second"]
+    assert [m.content for m in result.conversations["B"]] == ["B first"]
+    assert result.timed_out == ["B"]
+    assert result.skipped == ["C"]
+    assert result.elapsed_seconds < 2.0
+
+
+@pytest.mark.asyncio
+async def test_session_start_failure_marks_all_chats_failed():
+    class _Broken(_FakeSession):
+        async def __aenter__(self):
+            raise RuntimeError("login required")
+
+    manager = WhatsAppScraperManager(session_factory=_Broken)
+    result = await manager.scrape_conversations(["A", "B"], save=False)
+
+    assert result.failed == ["A", "B"]
+    assert not result.conversations
@@ -0,0 +1,188 @@
+"""WorkflowManager 증분 저장 테스트/WorkflowManager incremental persistence tests."""
+
+import json
+import time
+from datetime import datetime, timedelta
+
+from macho_gpt.core.logi_workflow_241219 import (
+    ChatRoomType,
+    TaskPriority,
+    TaskStatus,
+    WorkflowManager,
+)
+
+
+def _manager(tmp_path, **kwargs):
+    return WorkflowManager(data_file=str(tmp_path / "workflow.json"), **kwargs)
+
+
+def _log_lines(manager):
+    with open(manager.change_log_file, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def test_default_data_is_written_as_snapshot(tmp_path):
+    """기본 데이터는 스냅샷으로만 기록/Defaults go to the snapshot, not the log."""
+    manager = _manager(tmp_path)
+
+    snapshot = json.loads((tmp_path / "workflow.json").read_text(encoding="utf-8"))
+    assert len(snapshot["chat_rooms"]) == len(manager.chat_rooms) == 6
+    assert len(snapshot["tasks"]) == 2
+    assert not (tmp_path / "workflow.changes.jsonl").exists()
+
+
+def test_mutations_append_to_change_log_and_replay(tmp_path):
+    """변경은 로그에 추가되고 재로드 시 재적용/Changes append and replay on load."""
+    manager = _manager(tmp_path)
+    room_id = manager.create_chat_room("Yard", ChatRoomType.PROJECT, ["Kim"])
+    child_id = manager.create_chat_room("Gate", ChatRoomType.TASK, ["Lee"])
+    task_id = manager.create_task("Gate pass", "DSV gate pass", room_id, "Kim")
+    manager.update_task_status(task_id, TaskStatus.COMPLETED)
+    manager.connect_rooms(room_id, child_id)
+
+    assert [record["op"] for record in _log_lines(manager)] == [
+        "room", "room", "task", "task", "link",
+    ]
+
+    reloaded = _manager(tmp_path)
+    assert reloaded.tasks[task_id].status == TaskStatus.COMPLETED
+    assert reloaded.tasks[task_id].progress == 100.0
+    assert reloaded.chat_rooms[room_id].connected_tasks == [task_id]
+    assert reloaded.chat_rooms[room_id].child_room_ids == [child_id]
+    assert reloaded.chat_rooms[child_id].parent_room_id == room_id
+
+
+def test_batch_coalesces_changes(tmp_path):
+    """batch 내 변경은 객체별로 병합/Batch writes one record per object."""
+    manager = _manager(tmp_path)
+
+    with manager.batch():
+        room_id = manager.create_chat_room("Yard", ChatRoomType.PROJECT, ["Kim"])
+        task_id = manager.create_task("ETA", "Vessel ETA", room_id, "Kim")
+        manager.update_task_status(task_id, TaskStatus.IN_PROGRESS, progress=40)
+        manager.update_task_status(task_id, TaskStatus.BLOCKED)
+        assert not (tmp_path / "workflow.changes.jsonl").exists()
+
+    records = _log_lines(manager)
+    assert [record["op"] for record in records] == ["room", "task"]
+    assert records[1]["task"]["status"] == "blocked"
+
+    reloaded = _manager(tmp_path)
+    assert reloaded.chat_rooms[room_id].connected_tasks == [task_id]
+    assert reloaded.tasks[task_id].progress == 40
+
+
+def test_change_log_is_compacted(tmp_path):
+    """임계치 도달 시 스냅샷으로 압축/Log compacts into the snapshot."""
+    manager = _manager(tmp_path, compact_threshold=5)
+    room_id = next(iter(manager.chat_rooms))
+
+    for index in range(6):
+        manager.create_task(f"Task {index}", "", room_id, "Kim")
+
+    assert len(_log_lines(manager)) == 1
+    snapshot = json.loads((tmp_path / "workflow.json").read_text(encoding="utf-8"))
+    assert snapshot["metadata"]["total_tasks"] == 7
+    assert len(_manager(tmp_path).tasks) == 8
+
+
+def test_bulk_import_is_fast(tmp_path):
+    """1만 건 일괄 생성이 수 초 내 완료/10k task import finishes in seconds."""
+    manager = _manager(tmp_path)
+    room_id = next(iter(manager.chat_rooms))
+
+    started = time.perf_counter()
+    with manager.batch():
+        for index in range(10_000):
+            manager.create_task(
+                f"Task {index}", "AI extracted", room_id, "Kim", priority=TaskPriority.HIGH
+            )
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 10
+    reloaded = _manager(tmp_path)
+    assert len(reloaded.tasks) == 10_002
+    assert len(reloaded.chat_rooms[room_id].connected_tasks) == len(
+        set(reloaded.chat_rooms[room_id].connected_tasks)
+    )
+
+
+def _seed(manager, room_id, count=40):
+    now = datetime.now()
+    task_ids = []
+    with manager.batch():
+        for index in range(count):
+            task_ids.append(
+                manager.create_task(
+                    f"Task {index}",
+                    "",
+                    room_id,
+                    ["김민수", "이영희", "박철수"][index % 3],
+                    priority=list(TaskPriority)[index % 5],
+                    due_date=(now + timedelta(days=index - 20)).isoformat(),
+                )
+            )
+    return task_ids
+
+
+def test_indexes_follow_status_updates(tmp_path):
+    """상태 변경 시 인덱스 갱신/Indexes stay in sync with status changes."""
+    manager = _manager(tmp_path)
+    room_id = next(r.id for r in manager.chat_rooms.values() if r.name == "마케팅팀")
+    task_ids = _seed(manager, room_id)
+
+    manager.update_task_status(task_ids[0], TaskStatus.BLOCKED)
+
+    assert {t.id for t in manager.get_tasks_by_status(TaskStatus.BLOCKED)} == {task_ids[0]}
+    assert task_ids[0] not in {t.id for t in manager.get_tasks_by_status(TaskStatus.PENDING)}
+    assert len(manager.get_tasks_by_room(room_id)) == 41
+    assert all(t.assignee == "이영희" for t in manager.get_tasks_by_assignee("이영희"))
+    assert len(manager.get_tasks_by_priority(TaskPriority.CRITICAL)) == 8
+
+
+def test_overdue_heap_matches_linear_scan(tmp_path):
+    """마감일 힙 결과가 전체 스캔과 동일/Heap query equals a brute-force scan."""
+    manager = _manager(tmp_path)
+    room_id = next(iter(manager.chat_rooms))
+    task_ids = _seed(manager, room_id)
+    manager.update_task_status(task_ids[0], TaskStatus.COMPLETED)
+    manager.update_task_status(task_ids[1], TaskStatus.COMPLETED)
+    manager.update_task_status(task_ids[1], TaskStatus.IN_PROGRESS)
+
+    now = datetime.now()
+    expected = {
+        t.id
+        for t in manager.tasks.values()
+        if t.due_date
+        and t.status != TaskStatus.COMPLETED
+        and datetime.fromisoformat(t.due_date) < now
+    }
+    overdue = manager.get_overdue_tasks(now)
+
+    assert {t.id for t in overdue} == expected
+    assert len(overdue) == 20  # index 1..20 (index 20 due at seeding time)
+    assert [t.due_date for t in overdue] == sorted(t.due_date for t in overdue)
+    assert "/alert_system overdue_tasks" in manager.generate_workflow_triggers()
+
+
+def test_dashboard_aggregates_survive_reload(tmp_path):
+    """재로드 후 집계 동일/Aggregates match after rebuilding indexes on load."""
+    manager = _manager(tmp_path)
+    room_id = next(r.id for r in manager.chat_rooms.values() if r.name == "마케팅팀")
+    task_ids = _seed(manager, room_id)
+    manager.update_task_status(task_ids[3], TaskStatus.COMPLETED)
+
+    reloaded = _manager(tmp_path)
+
+    for current in (manager, reloaded):
+        summary = current.get_workflow_summary()
+        assert summary["completed_tasks"] == 1
+        assert summary["urgent_tasks"] == 16
+        workload = current.get_team_workload()["마케팅팀"]
+        assert workload["total_tasks"] == 41
+        assert sum(workload["member_tasks"].values()) == 41
+        assert sum(workload["priority_distribution"].values()) == 41
+    assert abs(
+        manager._calculate_workflow_confidence() - reloaded._calculate_workflow_confidence()
+    ) < 1e-9
+    assert reloaded._calculate_room_health(room_id)["overdue_tasks"] == 20
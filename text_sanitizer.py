@@ -0,0 +1,115 @@
+# text_sanitizer.py
+"""
+공유 텍스트 정제 모듈
+MACHO-GPT v3.4-mini for HVDC Project
+
+- PII 마스킹: 단일 결합 정규식으로 1-pass 치환
+- 이모지·제어문자 제거: str.translate 변환 테이블 (코드포인트별 판정 캐시)
+- 채팅방 제목 검색 토큰 생성
+
+OCR 대량 배치와 스크래핑 메시지 스트림 양쪽에서 사용합니다.
+"""
+
+import re
+import unicodedata
+from typing import Any, Dict, Iterable, Iterator, List
+
+# 개인정보 패턴 (긴 패턴 우선: 카드번호 → 전화번호)
+_PII_PATTERN = re.compile(
+    r'(?P<CARD_NUMBER>\b\d{4}-\d{4}-\d{4}-\d{4}\b)'
+    r'|(?P<PHONE>\b\d{3}-\d{4}-\d{4}\b)'
+    r'|(?P<ID_NUMBER>\b\d{6}-\d{7}\b)'
+    r'|(?P<EMAIL>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b)'
+)
+
+# 제거 대상 이모지 범위
+_EMOJI_RANGES = (
+    (0x1F600, 0x1F64F),  # 감정 이모지
+    (0x1F300, 0x1F5FF),  # 기호 및 픽토그램
+    (0x1F680, 0x1F6FF),  # 교통 및 지도
+    (0x1F1E0, 0x1F1FF),  # 국기
+    (0x02600, 0x027BF),  # 기타 기호
+    (0x1F900, 0x1F9FF),  # 보충 기호 및 픽토그램
+    (0x1F018, 0x1F270),  # 기타 기호
+    (0x1F004, 0x1F004),  # 마작패
+    (0x1F0CF, 0x1F0CF),  # 플레잉 카드 블랙 조커
+    (0x1F170, 0x1F251),  # 기타 기호
+)
+
+# 검색 토큰에 허용되는 문자 외 제거
+_TOKEN_STRIP = re.compile(r'[^0-9A-Za-z가-힣 ]+')
+
+
+class _StripTable(dict):
+    """
+    str.translate 변환 테이블
+
+    이모지·대괄호는 미리 등록하고, 그 외 코드포인트는 처음 조회될 때
+    유니코드 범주(C*: 제어·서식·미할당)를 판정해 결과를 캐시합니다.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        for start, end in _EMOJI_RANGES:
+            self.update(dict.fromkeys(range(start, end + 1)))
+        self.update(dict.fromkeys(map(ord, '[]')))
+
+    def __missing__(self, codepoint: int):
+        value = None if unicodedata.category(chr(codepoint))[0] == 'C' else codepoint
+        self[codepoint] = value
+        return value
+
+
+_STRIP_TABLE = _StripTable()
+
+
+def mask_pii(text: str) -> str:
+    """전화번호·이메일·주민번호·카드번호 마스킹 (1-pass)"""
+    return _PII_PATTERN.sub(lambda m: f"[{m.lastgroup}]", text)
+
+
+def sanitize_ocr_text(text: str) -> str:
+    """OCR 텍스트 정제"""
+    if not text:
+        return ""
+    return mask_pii(text).strip()
+
+
+def strip_emoji_and_controls(text: str) -> str:
+    """이모지·제로폭 공백·제어문자·대괄호 제거"""
+    return text.translate(_STRIP_TABLE)
+
+
+def sanitize_text(text: str) -> str:
+    """텍스트 정규화 (이모지 제거, ZWSP 제거, 공백 정규화)"""
+    return ' '.join(strip_emoji_and_controls(text).split())
+
+
+def generate_search_tokens(title: str) -> List[str]:
+    """채팅방 제목에서 검색용 키워드 토큰 생성"""
+    cleaned = _TOKEN_STRIP.sub('', title)
+
+    # 길이 기준 내림차순 정렬 (가장 구체적인 토큰 우선)
+    tokens = sorted((t for t in cleaned.split() if len(t) >= 3), key=len, reverse=True)
+
+    # 토큰이 없으면 정규화된 전체 텍스트 반환
+    if not tokens:
+        normalized = sanitize_text(title)
+        return [normalized] if normalized else [title]
+
+    return tokens
+
+
+def iter_sanitized_ocr(texts: Iterable[str]) -> Iterator[str]:
+    """OCR 텍스트 배치를 지연 정제"""
+    for text in texts:
+        yield sanitize_ocr_text(text)
+
+
+def iter_masked_messages(messages: Iterable[Dict[str, Any]], field: str = "text") -> Iterator[Dict[str, Any]]:
+    """스크래핑 메시지 스트림의 텍스트 필드 PII 마스킹 (원본 dict는 변경하지 않음)"""
+    for message in messages:
+        text = message.get(field)
+        if isinstance(text, str) and text:
+            message = {**message, field: mask_pii(text)}
+        yield message
@@ -3,7 +3,6 @@ MACHO-GPT v3.4-mini WhatsApp AI Dashboard
 HVDC Project - Samsung C&T Logistics
 """
 
-import json
 import streamlit as st
 import pandas as pd
 from datetime import datetime
@@ -12,22 +11,24 @@ import plotly.graph_objects as go
 from pathlib import Path
 from collections import Counter
 
+from artifact_index import get_artifact_index
+from dashboard_data import get_dashboard_service
+
 def load_ai_analysis(file_path: str):
-    """Load AI analysis results"""
+    """Load AI analysis results (cached per file version)"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return get_dashboard_service().load(file_path, kind="ai_analysis")
     except Exception as e:
         st.error(f"Failed to load analysis: {e}")
         return None
 
-def create_keyword_chart(keywords: list):
+def create_keyword_chart(keywords: list, keyword_counts: dict = None):
     """Create keyword frequency chart"""
-    if not keywords:
+    if not keywords and not keyword_counts:
         return None
     
-    # Count keyword frequency
-    keyword_counts = Counter(keywords)
+    # Count keyword frequency (precomputed when available)
+    keyword_counts = keyword_counts or Counter(keywords)
     
     # Create DataFrame
     df = pd.DataFrame(list(keyword_counts.items()), columns=['Keyword', 'Frequency'])
@@ -198,19 +199,20 @@ def main():
         st.error("📁 reports 폴더를 찾을 수 없습니다.")
         return
     
-    # Find latest analysis file
-    analysis_files = list(reports_dir.glob("ai_analysis_*.json"))
-    if not analysis_files:
+    # Find latest analysis file (artifact index lookup)
+    service = get_dashboard_service()
+    latest_file = get_artifact_index().latest("ai_analysis")
+    if latest_file is None:
         st.error("📊 AI 분석 파일을 찾을 수 없습니다.")
         return
     
-    latest_file = max(analysis_files, key=lambda x: x.stat().st_mtime)
     st.info(f"📄 분석 파일: {latest_file.name}")
     
     # Load analysis
     analysis = load_ai_analysis(latest_file)
     if not analysis:
         return
+    stats = service.aggregates(latest_file, kind="ai_analysis")
     
     # Display summary metrics
     col1, col2, col3, col4 = st.columns(4)
@@ -249,7 +251,7 @@ def main():
     with col2:
         # Keyword chart
         keywords = analysis.get('overall_summary', {}).get('common_keywords', [])
-        keyword_fig = create_keyword_chart(keywords)
+        keyword_fig = create_keyword_chart(keywords, stats.get('keyword_counts'))
         if keyword_fig:
             st.plotly_chart(keyword_fig, use_container_width=True)
     
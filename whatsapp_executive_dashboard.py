@@ -5,12 +5,11 @@ Samsung C&T Logistics · HVDC Project Executive Summary
 """
 
 import streamlit as st
-import json
-import os
 from datetime import datetime
-from pathlib import Path
 from typing import Dict, List, Any
 
+from dashboard_data import get_dashboard_service
+
 # 페이지 설정
 st.set_page_config(
     page_title="WhatsApp 업무 요약 대시보드",
@@ -82,21 +81,18 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 def load_system_data():
-    """시스템 데이터 로딩"""
+    """시스템 데이터 로딩 (파일 버전 기준 캐시, 변경 시에만 재파싱)"""
     try:
-        # 워크플로우 데이터 로딩
-        if Path("data/workflow_data.json").exists():
-            with open("data/workflow_data.json", 'r', encoding='utf-8') as f:
-                workflow_data = json.load(f)
-        else:
-            workflow_data = {"chat_rooms": [], "tasks": [], "metadata": {}}
+        service = get_dashboard_service()
+        
+        # 워크플로우 데이터 로딩 (스냅샷 + 변경 로그)
+        workflow_data = service.load(
+            "data/workflow_data.json", kind="workflow",
+            default={"chat_rooms": [], "tasks": [], "metadata": {}}
+        )
         
         # 요약 데이터 로딩
-        if Path("summaries.json").exists():
-            with open("summaries.json", 'r', encoding='utf-8') as f:
-                summaries = json.load(f)
-        else:
-            summaries = {}
+        summaries = service.load("summaries.json", kind="summaries", default={})
         
         return workflow_data, summaries
     except Exception as e:
@@ -106,9 +102,10 @@ def load_system_data():
 def create_executive_summary(workflow_data: Dict, summaries: Dict) -> str:
     """Executive Summary 생성"""
     
-    # 기본 통계
-    total_rooms = len(workflow_data.get("chat_rooms", []))
-    total_tasks = len(workflow_data.get("tasks", []))
+    # 기본 통계 (사전 집계)
+    stats = get_dashboard_service().aggregates("data/workflow_data.json", kind="workflow")
+    total_rooms = stats.get("total_rooms", len(workflow_data.get("chat_rooms", [])))
+    total_tasks = stats.get("total_tasks", len(workflow_data.get("tasks", [])))
     
     # DSV 팀 관련 정보 (HVDC 프로젝트 맥락)
     summary_text = f"""
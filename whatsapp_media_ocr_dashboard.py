@@ -22,6 +22,8 @@ from datetime import datetime
 from collections import Counter
 import re
 
+from artifact_index import get_artifact_index
+
 # 페이지 설정
 st.set_page_config(
     page_title="WhatsApp 미디어 OCR 분석 대시보드",
@@ -36,14 +38,11 @@ def load_latest_media_ocr_result():
     if not data_dir.exists():
         return None
     
-    # 미디어 OCR 결과 파일 찾기
-    media_files = list(data_dir.glob('whatsapp_media_ocr_*.json'))
-    if not media_files:
+    # 최신 파일 선택 (artifact 인덱스 조회)
+    latest_file = get_artifact_index().latest('media_ocr')
+    if latest_file is None:
         return None
     
-    # 최신 파일 선택
-    latest_file = max(media_files, key=lambda x: x.stat().st_mtime)
-    
     try:
         with open(latest_file, 'r', encoding='utf-8') as f:
             return json.load(f)
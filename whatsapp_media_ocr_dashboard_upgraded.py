@@ -11,7 +11,6 @@ Streamlit 기반 미디어 OCR 결과 시각화
 """
 
 import streamlit as st
-import json
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
@@ -21,6 +20,9 @@ from collections import Counter
 import re
 import numpy as np
 
+from artifact_index import get_artifact_index
+from dashboard_data import get_dashboard_service
+
 # 페이지 설정
 st.set_page_config(
     page_title="WhatsApp 미디어 OCR 분석 대시보드",
@@ -30,23 +32,20 @@ st.set_page_config(
 )
 
 def load_latest_results():
-    """최신 OCR 결과 파일 로드"""
+    """최신 OCR 결과 파일 로드 → (데이터, 파일 경로), 파일 변경 시에만 재파싱"""
     data_dir = Path("data")
     if not data_dir.exists():
-        return None
-        
-    # JSON 파일 찾기
-    json_files = list(data_dir.glob("whatsapp_media_ocr_*.json"))
-    if not json_files:
-        return None
+        return None, None
         
-    # 최신 파일 선택
-    latest_file = max(json_files, key=lambda x: x.stat().st_mtime)
+    # 최신 파일 선택 (artifact 인덱스 조회)
+    service = get_dashboard_service()
+    latest_file = get_artifact_index().latest("media_ocr")
+    if latest_file is None:
+        return None, None
     
     try:
-        with open(latest_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return data, latest_file.name
+        data = service.load(latest_file, kind="ocr")
+        return data, latest_file
     except Exception as e:
         st.error(f"파일 로드 오류: {e}")
         return None, None
@@ -268,10 +267,13 @@ def analyze_sensitive_info(data):
     
     return sensitive_counts, total_texts
 
-def create_performance_metrics(data):
+def create_performance_metrics(data, aggregates=None):
     """성능 지표 카드"""
     if not data:
         return None
+    if aggregates:
+        # 파일 버전당 1회 계산된 사전 집계 사용
+        return aggregates
         
     metrics = {}
     
@@ -299,17 +301,17 @@ def main():
     st.markdown("---")
     
     # 데이터 로드
-    data, filename = load_latest_results()
+    data, latest_file = load_latest_results()
     
     if not data:
         st.warning("📁 OCR 결과 파일을 찾을 수 없습니다.")
         st.info("먼저 WhatsApp 미디어 OCR 추출기를 실행해주세요.")
         return
     
-    st.success(f"✅ 데이터 로드 완료: {filename}")
+    st.success(f"✅ 데이터 로드 완료: {latest_file.name}")
     
     # 성능 지표
-    metrics = create_performance_metrics(data)
+    metrics = create_performance_metrics(data, get_dashboard_service().aggregates(latest_file, kind="ocr"))
     if metrics:
         col1, col2, col3, col4 = st.columns(4)
         
@@ -417,7 +419,7 @@ def main():
     
     # 사이드바 정보
     st.sidebar.title("📊 대시보드 정보")
-    st.sidebar.info(f"**데이터 파일:** {filename}")
+    st.sidebar.info(f"**데이터 파일:** {latest_file.name}")
     st.sidebar.info(f"**채팅방:** {data.get('chat_title', 'N/A')}")
     st.sidebar.info(f"**처리 상태:** {data.get('status', 'N/A')}")
     st.sidebar.info(f"**추출 시간:** {data.get('extraction_time', 'N/A')}")
@@ -6,13 +6,14 @@ MACHO-GPT v3.4-mini for HVDC Project
 """
 
 import asyncio
+import base64
 import inspect
 import json
 import os
 import re
 import hashlib
-import unicodedata
 import warnings
+from dataclasses import dataclass
 from datetime import datetime, timezone          # S‑06
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Awaitable
@@ -61,7 +62,16 @@ warnings.filterwarnings(
 
 # Playwright imports
 from playwright.async_api import Page, Error
-from session_manager import get_shared_session, close_shared_session
+from session_manager import (
+    close_shared_session,
+    get_warm_start_report,
+    mark_first_scrape,
+    open_whatsapp_page,
+    set_resource_policy,
+)
+import text_sanitizer
+from artifact_index import record_artifact
+from atomic_io import atomic_path
 
 # OCR imports
 try:
@@ -70,6 +80,13 @@ try:
 except ImportError:
     EASYOCR_AVAILABLE = False
 
+# Image preprocessing imports
+try:
+    from PIL import Image, ImageChops, ImageOps
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -93,13 +110,127 @@ def get_unique_user_data_dir(chat_name: str) -> str:
     
     return user_data_dir
 
+@dataclass(frozen=True)
+class PreprocessConfig:
+    """
+    OCR 전처리 설정
+
+    - grayscale    : 그레이스케일 변환
+    - trim_borders : 말풍선 테두리·빈 여백 크롭 (배경색 기준)
+    - max_side     : 긴 변 최대 픽셀 (목표 해상도, 초과 시 다운스케일)
+    """
+    enabled: bool = True
+    grayscale: bool = True
+    trim_borders: bool = True
+    trim_threshold: int = 24
+    trim_padding: int = 8
+    max_side: int = 1600
+
+    def cache_key(self) -> str:
+        """캐시 키에 포함될 전처리 파라미터 문자열"""
+        if not self.enabled:
+            return "raw"
+        return (
+            f"g{int(self.grayscale)}"
+            f"-t{int(self.trim_borders)}.{self.trim_threshold}.{self.trim_padding}"
+            f"-m{self.max_side}"
+        )
+
+class ImagePreprocessor:
+    """OCR 전 이미지 전처리 (그레이스케일 → 여백 크롭 → 다운스케일)"""
+
+    def __init__(self, config: Optional[PreprocessConfig] = None,
+                 cache_dir: str = "downloads/preprocessed"):
+        self.config = config or PreprocessConfig()
+        self.cache_dir = cache_dir
+
+    def prepare(self, file_path: str, file_hash: Optional[str] = None) -> str:
+        """
+        전처리된 이미지 경로 반환
+
+        동일 원본·동일 파라미터 결과는 cache_dir에 재사용되며,
+        전처리가 불가능하면 원본 경로를 그대로 반환합니다. 결과는 고유 임시
+        파일에 쓴 뒤 교체하므로, 같은 파일을 동시에 처리하는 스레드(race 모드)가
+        기록 중인 PNG를 읽지 않습니다.
+
+        Args:
+            file_path: 원본 이미지 경로
+            file_hash: 이미 계산한 원본 MD5 (없으면 파일을 읽어 계산)
+        """
+        if not self.config.enabled or not PIL_AVAILABLE:
+            return file_path
+
+        try:
+            if file_hash is None:
+                with open(file_path, 'rb') as f:
+                    file_hash = hashlib.md5(f.read()).hexdigest()
+            key_digest = hashlib.md5(self.config.cache_key().encode('utf-8')).hexdigest()[:8]
+            output_path = os.path.join(self.cache_dir, f"{file_hash}_{key_digest}.png")
+            if os.path.exists(output_path):
+                return output_path
+
+            with Image.open(file_path) as image:
+                processed = self.transform(image)
+
+            with atomic_path(output_path, suffix=".png.tmp") as tmp_path:
+                processed.save(tmp_path, format="PNG")
+            return output_path
+        except Exception as e:
+            logger.warning(f"Image preprocessing skipped for {file_path}: {e}")
+            return file_path
+
+    def transform(self, image: "Image.Image") -> "Image.Image":
+        """PIL 이미지에 전처리 단계 적용"""
+        processed = ImageOps.exif_transpose(image)
+        processed = processed.convert("L" if self.config.grayscale else "RGB")
+
+        if self.config.trim_borders:
+            processed = self._trim_borders(processed)
+
+        max_side = self.config.max_side
+        if max_side and max(processed.size) > max_side:
+            processed = processed.copy()
+            processed.thumbnail((max_side, max_side), Image.LANCZOS)
+
+        return processed
+
+    def _trim_borders(self, image: "Image.Image") -> "Image.Image":
+        """모서리 배경색과 다른 영역(텍스트·콘텐츠)만 남기도록 크롭"""
+        gray = image if image.mode == "L" else image.convert("L")
+        width, height = gray.size
+        corners = [
+            gray.getpixel((0, 0)),
+            gray.getpixel((width - 1, 0)),
+            gray.getpixel((0, height - 1)),
+            gray.getpixel((width - 1, height - 1)),
+        ]
+        background = max(set(corners), key=corners.count)
+
+        diff = ImageChops.difference(gray, Image.new("L", gray.size, background))
+        threshold = self.config.trim_threshold
+        mask = diff.point(lambda p: 255 if p > threshold else 0)
+        bbox = mask.getbbox()
+        if not bbox:
+            return image
+
+        pad = self.config.trim_padding
+        left, top, right, bottom = bbox
+        return image.crop((
+            max(left - pad, 0),
+            max(top - pad, 0),
+            min(right + pad, width),
+            min(bottom + pad, height),
+        ))
+
 class MediaOCRProcessor:
     """미디어 파일 OCR 처리 클래스"""
-    
-    def __init__(self, max_file_size_mb: int = 5):
+
+    def __init__(self, max_file_size_mb: int = 5,
+                 preprocess_config: Optional[PreprocessConfig] = None):
         self.max_file_size_mb = max_file_size_mb
         self.processed_files = set()
-        
+        self.preprocessor = ImagePreprocessor(preprocess_config)
+
         # EasyOCR 초기화 (CPU 최적화)
         if EASYOCR_AVAILABLE:
             # CPU 전용 설정으로 UserWarning 방지
@@ -116,35 +247,35 @@ class MediaOCRProcessor:
         """파일 해시 생성"""
         with open(file_path, 'rb') as f:
             return hashlib.md5(f.read()).hexdigest()
+
+    def get_cache_key(self, file_path: str, file_hash: Optional[str] = None) -> str:
+        """처리 캐시 키 (파일 해시 + 전처리 파라미터)"""
+        file_hash = file_hash or self.get_file_hash(file_path)
+        return f"{file_hash}:{self.preprocessor.config.cache_key()}"
     
     def sanitize_ocr_text(self, text: str) -> str:
-        """OCR 텍스트 정제"""
-        if not text:
-            return ""
-        
-        # 개인정보 마스킹
-        patterns = {
-            r'\b\d{3}-\d{4}-\d{4}\b': '[PHONE]',
-            r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b': '[EMAIL]',
-            r'\b\d{6}-\d{7}\b': '[ID_NUMBER]',
-            r'\b\d{4}-\d{4}-\d{4}-\d{4}\b': '[CARD_NUMBER]'
-        }
-        
-        for pattern, replacement in patterns.items():
-            text = re.sub(pattern, replacement, text)
-        
-        return text.strip()
+        """OCR 텍스트 정제 (개인정보 1-pass 마스킹)"""
+        return text_sanitizer.sanitize_ocr_text(text)
     
-    async def process_image(self, file_path: str, engine: str = "easyocr") -> Dict[str, Any]:
+    async def process_image(self, file_path: str, engine: str = "easyocr",
+                            file_hash: Optional[str] = None) -> Dict[str, Any]:
         """이미지 OCR 처리"""
+        return self.recognize(file_path, engine, file_hash)
+
+    def recognize(self, file_path: str, engine: str = "easyocr",
+                  file_hash: Optional[str] = None) -> Dict[str, Any]:
+        """이미지 OCR 처리 (동기 버전, 스레드 실행용)"""
         try:
+            # OCR 입력 전처리 (실패 시 원본 사용)
+            ocr_path = self.preprocessor.prepare(file_path, file_hash)
+
             if engine == "gcv":
                 # Google Cloud Vision API 사용
                 try:
                     from google_vision_ocr_patch import create_gcv_client
                     client = create_gcv_client()
                     
-                    with open(file_path, 'rb') as image_file:
+                    with open(ocr_path, 'rb') as image_file:
                         content = image_file.read()
                     
                     image = vision.Image(content=content)
@@ -192,7 +323,7 @@ class MediaOCRProcessor:
                         'engine': 'easyocr'
                     }
                 
-                result = self.easyocr_reader.readtext(file_path)
+                result = self.easyocr_reader.readtext(ocr_path)
                 if result:
                     text = ' '.join([item[1] for item in result])
                     confidence = sum([item[2] for item in result]) / len(result)
@@ -220,7 +351,7 @@ class MediaOCRProcessor:
     async def _process_with_easyocr(self, image_path: str) -> Dict[str, Any]:
         """EasyOCR로 이미지 처리"""
         try:
-            results = self.easyocr_reader.readtext(image_path)
+            results = self.easyocr_reader.readtext(self.preprocessor.prepare(image_path))
             text_parts = []
             total_confidence = 0.0
             
@@ -255,7 +386,7 @@ class MediaOCRProcessor:
             client = vision.ImageAnnotatorClient()
             
             # 이미지 읽기
-            with open(image_path, 'rb') as image_file:
+            with open(self.preprocessor.prepare(image_path), 'rb') as image_file:
                 content = image_file.read()
             
             image = vision.Image(content=content)
@@ -297,11 +428,179 @@ class MediaOCRProcessor:
                 'engine': 'gcv'
             }
 
+class OCRRouter:
+    """
+    OCR 엔진 라우터
+
+    - escalate : 저비용 로컬 엔진(EasyOCR) 우선, 신뢰도 미달·빈 텍스트일 때만 GCV 호출
+    - race     : 로컬 엔진에 race_head_start초 선행 시간을 준 뒤에도 결과가
+                 없거나 미달이면 GCV를 함께 실행, 임계값 이상인 첫 결과 채택
+    엔진별 지연시간과 에스컬레이션 비율을 기록합니다.
+
+    엔진은 작업 스레드에서 실행되므로 이미 시작된 호출은 취소할 수 없습니다.
+    race에서 진 GCV 요청도 끝까지 실행·과금되므로, 선행 시간으로 빠른 이미지의
+    GCV 호출 자체를 피합니다.
+    """
+
+    MODES = ("escalate", "race")
+
+    def __init__(self, processor: MediaOCRProcessor, threshold: float = 0.6,
+                 mode: str = "escalate", primary: str = "easyocr", fallback: str = "gcv",
+                 race_head_start: float = 2.0):
+        if mode not in self.MODES:
+            raise ValueError(f"Unsupported OCR router mode: {mode}")
+        self.processor = processor
+        self.threshold = threshold
+        self.mode = mode
+        self.race_head_start = race_head_start
+        self.primary = primary
+        self.fallback = fallback
+        self.fallback_available = GCV_AVAILABLE if fallback == "gcv" else True
+        self.stats = {
+            'requests': 0,
+            'escalations': 0,
+            'engines': {
+                name: {'calls': 0, 'total_seconds': 0.0, 'accepted': 0}
+                for name in (primary, fallback)
+            },
+        }
+
+    def is_acceptable(self, result: Dict[str, Any]) -> bool:
+        """오류 없음 + 텍스트 존재 + 신뢰도 임계값 이상"""
+        return (
+            'error' not in result
+            and bool(result.get('text', '').strip())
+            and result.get('confidence', 0.0) >= self.threshold
+        )
+
+    async def _run_engine(self, file_path: str, engine: str,
+                          file_hash: Optional[str] = None) -> Dict[str, Any]:
+        """엔진 실행 (스레드) 및 지연시간 기록"""
+        started = time.perf_counter()
+        result = await asyncio.to_thread(self.processor.recognize, file_path, engine, file_hash)
+        elapsed = time.perf_counter() - started
+
+        engine_stats = self.stats['engines'][engine]
+        engine_stats['calls'] += 1
+        engine_stats['total_seconds'] += elapsed
+        if self.is_acceptable(result):
+            engine_stats['accepted'] += 1
+        result['latency_seconds'] = elapsed
+        return result
+
+    @staticmethod
+    def _best(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """텍스트가 있는 결과 중 신뢰도 최고 결과 선택"""
+        with_text = [r for r in results if r.get('text', '').strip()] or results
+        return max(with_text, key=lambda r: r.get('confidence', 0.0))
+
+    async def process(self, file_path: str, file_hash: Optional[str] = None) -> Dict[str, Any]:
+        """라우팅된 OCR 처리 (file_hash: 이미 계산한 원본 해시, 전처리 캐시 조회용)"""
+        self.stats['requests'] += 1
+        if self.mode == "race" and self.fallback_available:
+            result = await self._race(file_path, file_hash)
+        else:
+            result = await self._escalate(file_path, file_hash)
+
+        escalated = result.get('engine') == self.fallback
+        if escalated:
+            self.stats['escalations'] += 1
+        result['router'] = {'mode': self.mode, 'escalated': escalated}
+        return result
+
+    async def _escalate(self, file_path: str, file_hash: Optional[str] = None) -> Dict[str, Any]:
+        primary_result = await self._run_engine(file_path, self.primary, file_hash)
+        if self.is_acceptable(primary_result) or not self.fallback_available:
+            return primary_result
+
+        fallback_result = await self._run_engine(file_path, self.fallback, file_hash)
+        if self.is_acceptable(fallback_result):
+            return fallback_result
+        return self._best([primary_result, fallback_result])
+
+    async def _race(self, file_path: str, file_hash: Optional[str] = None) -> Dict[str, Any]:
+        primary = asyncio.create_task(self._run_engine(file_path, self.primary, file_hash))
+        finished: List[Dict[str, Any]] = []
+        done, _ = await asyncio.wait({primary}, timeout=self.race_head_start)
+        if done:
+            result = primary.result()
+            if self.is_acceptable(result):
+                return result
+            finished.append(result)
+
+        tasks = [asyncio.create_task(self._run_engine(file_path, self.fallback, file_hash))]
+        if not done:
+            tasks.insert(0, primary)
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                result = await next_done
+                if self.is_acceptable(result):
+                    return result
+                finished.append(result)
+        finally:
+            # 래퍼만 취소됨 (스레드의 엔진 호출은 끝까지 실행)
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+        return self._best(finished)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """엔진별 평균 지연시간·에스컬레이션 비율"""
+        requests = self.stats['requests']
+        engines = {}
+        for name, engine_stats in self.stats['engines'].items():
+            calls = engine_stats['calls']
+            engines[name] = {
+                **engine_stats,
+                'avg_seconds': engine_stats['total_seconds'] / calls if calls else 0.0,
+            }
+        return {
+            'mode': self.mode,
+            'threshold': self.threshold,
+            'requests': requests,
+            'escalations': self.stats['escalations'],
+            'escalation_rate': self.stats['escalations'] / requests if requests else 0.0,
+            'engines': engines,
+        }
+
 class WhatsAppMediaOCRExtractor:
     """WhatsApp 미디어 OCR 추출기 (성공적인 접근법 적용)"""
     
-    def __init__(self, chat_name: str = "HVDC 물류팀"):
+    # 이미지 원본 바이트 추출 스크립트 (blob:/img src → base64, 동영상·음성은 가져오지 않음)
+    FETCH_MEDIA_JS = """
+        async (el) => {
+            const target = el.matches('img,video,audio') ? el : el.querySelector('img,video,audio');
+            if (!target || target.tagName !== 'IMG') return null;
+            const src = target.currentSrc || target.src;
+            if (!src) return null;
+            const blob = await (await fetch(src)).blob();
+            const bytes = new Uint8Array(await blob.arrayBuffer());
+            let binary = '';
+            for (let i = 0; i < bytes.length; i += 0x8000) {
+                binary += String.fromCharCode.apply(null, bytes.subarray(i, i + 0x8000));
+            }
+            return { data: btoa(binary), mime: blob.type };
+        }
+    """
+
+    MIME_EXTENSIONS = {
+        'image/jpeg': '.jpg',
+        'image/png': '.png',
+        'image/webp': '.webp',
+        'image/gif': '.gif',
+        'video/mp4': '.mp4',
+        'audio/ogg': '.ogg',
+        'audio/mpeg': '.mp3',
+    }
+
+    def __init__(self, chat_name: str = "HVDC 물류팀",
+                 preprocess_config: Optional[PreprocessConfig] = None,
+                 capture_mode: str = "source",
+                 ocr_threshold: float = 0.6):
+        if capture_mode not in ("source", "screenshot"):
+            raise ValueError(f"Unsupported capture_mode: {capture_mode}")
         self.chat_name = chat_name
+        self.capture_mode = capture_mode
         # === S‑04 Secrets Vault ENV 스위치 =============
         self.auth_file = os.environ.get(
             "WAPP_AUTH_FILE",
@@ -312,7 +611,13 @@ class WhatsAppMediaOCRExtractor:
             os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = gcv_key_file
         # ===============================================
 
-        self.ocr_processor = MediaOCRProcessor()
+        self.ocr_processor = MediaOCRProcessor(preprocess_config=preprocess_config)
+        self.ocr_routers = {
+            mode: OCRRouter(self.ocr_processor, threshold=ocr_threshold, mode=mode)
+            for mode in OCRRouter.MODES
+        }
+        # 리소스 차단 정책 (main에서 session_manager.set_resource_policy로 지정)
+        self.resource_policy = None
 
         # === S‑02 RateLimiter 인스턴스 ==================
         self.rate_limiter = RateLimiter(rate=20, per=60)   # 20 요청/min
@@ -543,49 +848,11 @@ class WhatsAppMediaOCRExtractor:
     
     def sanitize_text(self, text: str) -> str:
         """텍스트 정규화 (이모지 제거, ZWSP 제거, 공백 정규화)"""
-        # 이모지 제거 (유니코드 이모지 범위)
-        text = re.sub(r'[\U0001F600-\U0001F64F]', '', text)  # 감정 이모지
-        text = re.sub(r'[\U0001F300-\U0001F5FF]', '', text)  # 기호 및 픽토그램
-        text = re.sub(r'[\U0001F680-\U0001F6FF]', '', text)  # 교통 및 지도
-        text = re.sub(r'[\U0001F1E0-\U0001F1FF]', '', text)  # 국기
-        text = re.sub(r'[\U00002600-\U000027BF]', '', text)  # 기타 기호
-        text = re.sub(r'[\U0001F900-\U0001F9FF]', '', text)  # 보충 기호 및 픽토그램
-        text = re.sub(r'[\U0001F018-\U0001F270]', '', text)  # 기타 기호
-        text = re.sub(r'[\U0001F004]', '', text)  # 마하종
-        text = re.sub(r'[\U0001F0CF]', '', text)  # 플레잉 카드 블랙 조커
-        text = re.sub(r'[\U0001F170-\U0001F251]', '', text)  # 기타 기호
-        
-        # 제로폭 공백(ZWSP) 및 제어문자 제거
-        text = ''.join(c for c in text if unicodedata.category(c)[0] != 'C')
-        
-        # 대괄호 제거 (채팅방 제목에서 일반적)
-        text = text.replace('[', '').replace(']', '')
-        
-        # 연속 공백을 단일 공백으로 정규화
-        text = ' '.join(text.split())
-        
-        return text.strip()
+        return text_sanitizer.sanitize_text(text)
     
     def generate_search_tokens(self, title: str) -> list:
         """채팅방 제목에서 검색용 키워드 토큰 생성"""
-        # 이모지·제어문자 제거
-        cleaned = ''.join(c for c in title if unicodedata.category(c)[0] != 'C' and c.isprintable())
-        
-        # 대괄호·특수문자 제거 (이모지 포함)
-        cleaned = re.sub(r'[\[\]⚡☆★○●□■▶►▪️•]|[^0-9A-Za-z가-힣 ]', '', cleaned)
-        
-        # 공백 기준 토큰 분리
-        tokens = [t for t in cleaned.split() if len(t) >= 3]
-        
-        # 길이 기준 내림차순 정렬 (가장 구체적인 토큰 우선)
-        tokens = sorted(tokens, key=len, reverse=True)
-        
-        # 토큰이 없으면 정규화된 전체 텍스트 반환
-        if not tokens:
-            normalized = self.sanitize_text(title)
-            return [normalized] if normalized else [title]
-        
-        return tokens
+        return text_sanitizer.generate_search_tokens(title)
     
     def sanitize_filename(self, filename: str) -> str:
         """파일명 정제"""
@@ -821,23 +1088,51 @@ class WhatsAppMediaOCRExtractor:
             logger.error(f"Error finding media messages: {e}")
             return []
     
+    async def fetch_media_source(self, element: Any) -> Optional[tuple]:
+        """이미지 원본 바이트 추출 (blob:/img src) → (bytes, mime), 이미지가 아니면 None"""
+        try:
+            payload = await element.evaluate(self.FETCH_MEDIA_JS)
+            if not isinstance(payload, dict) or not payload.get('data'):
+                return None
+            mime = payload.get('mime') or ''
+            if not mime.lower().startswith('image/'):
+                # OCR 입력은 이미지여야 하므로 동영상·음성 등은 스크린샷으로 대체
+                logger.debug(f"Non-image media source ({mime or 'unknown'}), using screenshot")
+                return None
+            return base64.b64decode(payload['data']), mime
+        except Exception as e:
+            logger.warning(f"Media source fetch failed, falling back to screenshot: {e}")
+            return None
+
+    def write_media_file(self, content: bytes, download_dir: str, mime: str = 'image/jpeg') -> str:
+        """콘텐츠 해시 파일명으로 저장 (동일 콘텐츠는 재사용)"""
+        content_hash = hashlib.sha256(content).hexdigest()[:16]
+        extension = self.MIME_EXTENSIONS.get(mime.split(';')[0].strip().lower(), '.bin')
+        filepath = os.path.join(download_dir, f"whatsapp_media_{content_hash}{extension}")
+        if not os.path.exists(filepath):
+            with atomic_path(filepath) as tmp_path:
+                tmp_path.write_bytes(content)
+        return filepath
+
     async def download_media(self, element: Any, download_dir: str) -> Optional[str]:
-        """미디어 파일 다운로드"""
+        """미디어 파일 다운로드 (이미지 원본 바이트 우선, 그 외·실패 시 스크린샷)"""
         try:
             # 다운로드 디렉토리 생성
             os.makedirs(download_dir, exist_ok=True)
             
-            # 파일명 생성
-            timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")  # S‑06
-            filename = f"whatsapp_media_{timestamp}.jpg"
-            filepath = os.path.join(download_dir, filename)
-            
             # === S‑02 속도제한 =========================
             await self.rate_limiter.acquire()
-            # 파일 다운로드
-            await element.screenshot(path=filepath)
-            
-            return filepath
+
+            # 원본 바이트 추출 (렌더링·재인코딩 없음)
+            if self.capture_mode == "source":
+                source = await self.fetch_media_source(element)
+                if source:
+                    content, mime = source
+                    return self.write_media_file(content, download_dir, mime)
+
+            # 스크린샷 캡처
+            content = await element.screenshot(type="jpeg")
+            return self.write_media_file(content, download_dir, 'image/jpeg')
         except Exception as e:
             logger.error(f"Error downloading media: {e}")
             return None
@@ -845,16 +1140,22 @@ class WhatsAppMediaOCRExtractor:
     async def process_media_file(self, file_path: str, engine: str = "easyocr") -> Dict[str, Any]:
         """미디어 파일 처리"""
         try:
-            # 파일 해시 확인
+            # 캐시 키 확인 (파일 해시 + 전처리 파라미터, 해시는 전처리 캐시에도 재사용)
             file_hash = self.ocr_processor.get_file_hash(file_path)
-            if file_hash in self.ocr_processor.processed_files:
+            cache_key = self.ocr_processor.get_cache_key(file_path, file_hash)
+            if cache_key in self.ocr_processor.processed_files:
                 return {'error': 'File already processed', 'text': '', 'confidence': 0.0}
             
-            # OCR 처리
-            result = await self.ocr_processor.process_image(file_path, engine)
+            # OCR 처리 (auto: 에스컬레이션, race: 경합)
+            if engine == "auto":
+                result = await self.ocr_routers["escalate"].process(file_path, file_hash)
+            elif engine == "race":
+                result = await self.ocr_routers["race"].process(file_path, file_hash)
+            else:
+                result = await self.ocr_processor.process_image(file_path, engine, file_hash)
             
             # 처리된 파일 기록
-            self.ocr_processor.processed_files.add(file_hash)
+            self.ocr_processor.processed_files.add(cache_key)
             
             return result
         except Exception as e:
@@ -870,24 +1171,82 @@ class WhatsAppMediaOCRExtractor:
                 'successful': len([r for r in results if 'error' not in r]),
                 'results': results
             }
+            router_stats = {
+                mode: router.get_stats()
+                for mode, router in self.ocr_routers.items()
+                if router.stats['requests']
+            }
+            if router_stats:
+                output_data['ocr_router'] = router_stats
+            if self.resource_policy is not None:
+                output_data['resource_policy'] = self.resource_policy.report()
             
             with open(output_file, 'w', encoding='utf-8') as f:
                 json.dump(output_data, f, ensure_ascii=False, indent=2)
             
+            record_artifact("media_ocr", output_file,
+                            total_processed=output_data['total_processed'])
             logger.info(f"Results saved to {output_file}")
         except Exception as e:
             logger.error(f"Error saving results: {e}")
 
 # === S‑03 : Ban Banner Watch Helper ===================
+BAN_BANNER_SELECTOR = 'text="Temporarily banned"'
+
 async def detect_ban(page) -> bool:
     """
     Returns True if WhatsApp 'Temporarily banned' banner is present.
+    Non-blocking: counts matching nodes instead of waiting for them.
     """
     try:
-        await page.wait_for_selector('text="Temporarily banned"', timeout=15000)
-        return True
-    except:
+        return await page.locator(BAN_BANNER_SELECTOR).count() > 0
+    except Exception:
         return False
+
+class BanWatcher:
+    """
+    Background ban/health watcher
+    ‑ banned      : set when the ban banner appears
+    ‑ page_closed : set when the page is closed
+    The pipeline checks `healthy` per item at no cost.
+    """
+    def __init__(self, page, interval: float = 5.0):
+        self.page = page
+        self.interval = interval
+        self.banned = asyncio.Event()
+        self.page_closed = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def healthy(self) -> bool:
+        return not (self.banned.is_set() or self.page_closed.is_set())
+
+    def start(self) -> None:
+        """start polling in the background"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._watch())
+
+    async def stop(self) -> None:
+        """cancel the background poller"""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    async def _watch(self) -> None:
+        while self.healthy:
+            if self.page.is_closed():
+                self.page_closed.set()
+                logger.error("🛑 Page closed—health watcher stopped")
+                return
+            if await detect_ban(self.page):
+                self.banned.set()
+                logger.error("🛑 BAN banner detected by watcher")
+                return
+            await asyncio.sleep(self.interval)
 # =====================================================
 
 async def main():
@@ -897,28 +1256,36 @@ async def main():
     parser = argparse.ArgumentParser(description="WhatsApp Media OCR Extractor")
     parser.add_argument("--chat", default="HVDC 물류팀", help="Chat name to extract media from")
     parser.add_argument("--media-only", action="store_true", help="Extract media only")
-    parser.add_argument("--ocr-engine", default="easyocr", choices=["easyocr", "gcv"], help="OCR engine to use")
+    parser.add_argument("--ocr-engine", default="easyocr", choices=["easyocr", "gcv", "auto", "race"], help="OCR engine to use (auto: EasyOCR then GCV on low confidence, race: GCV joins after an EasyOCR head start, first confident result wins)")
+    parser.add_argument("--ocr-threshold", type=float, default=0.6, help="Confidence threshold for auto/race OCR routing")
     parser.add_argument("--max-media", type=int, default=10, help="Maximum number of media files to process")
     parser.add_argument("--output", default="data/whatsapp_media_ocr_results.json", help="Output file path")
+    parser.add_argument("--no-preprocess", action="store_true", help="Disable image preprocessing before OCR")
+    parser.add_argument("--max-side", type=int, default=1600, help="Downscale images so the longest side fits (px)")
+    parser.add_argument("--capture-mode", default="source", choices=["source", "screenshot"], help="Fetch original media bytes or take element screenshots")
     
     args = parser.parse_args()
     
     # 출력 디렉토리 생성
     os.makedirs(os.path.dirname(args.output), exist_ok=True)
     
-    extractor = WhatsAppMediaOCRExtractor(args.chat)
+    preprocess_config = PreprocessConfig(enabled=not args.no_preprocess, max_side=args.max_side)
+    extractor = WhatsAppMediaOCRExtractor(
+        args.chat,
+        preprocess_config=preprocess_config,
+        capture_mode=args.capture_mode,
+        ocr_threshold=args.ocr_threshold,
+    )
     browser = context = page = None          # S‑08
+    ban_watcher = None
     
     try:
         print("🔄 공유 세션 사용 중...")
-        context = await get_shared_session()
-        
-        # launch_persistent_context는 이미 페이지를 포함하므로 새로 생성하지 않음
-        page = context.pages[0] if context.pages else await context.new_page()
-        
-        print("🌐 WhatsApp Web 접속 중...")
-        # WhatsApp Web 접속
-        await page.goto("https://web.whatsapp.com/", wait_until="domcontentloaded", timeout=300000)
+        # 미디어/OCR 모드: 폰트·아바타만 차단 (채팅 미디어는 허용)
+        extractor.resource_policy = set_resource_policy("media")
+        # 웜 스타트: 영구 프로필의 기존 탭 재사용 + 채팅 목록 준비 신호까지 대기
+        page = await open_whatsapp_page(timeout=15000)
+        context = page.context
         print("✅ WhatsApp Web 접속 완료")
         
         # 로그인 상태 확인 (완전히 새로운 방식)
@@ -930,8 +1297,8 @@ async def main():
             if page.is_closed():
                 raise RuntimeError("브라우저가 닫혔습니다.")
             
-            # 먼저 짧은 시간으로 확인
-            await page.wait_for_selector("#side", timeout=15000)
+            # open_whatsapp_page에서 이미 대기했으므로 짧게 확인
+            await page.wait_for_selector("#side", timeout=1000)
             print("✅ 이미 로그인된 상태")
             login_success = True
         except Exception as initial_check_error:
@@ -951,14 +1318,15 @@ async def main():
         if not login_success:
             raise RuntimeError("로그인 상태를 확인할 수 없습니다.")
         
-        # 페이지가 완전히 로드될 때까지 대기
-        await page.wait_for_timeout(3000)  # 3초 대기
-        
         # Ban Banner 사전 감지
         if await detect_ban(page):
             logger.error("🛑 BAN banner detected—exiting (ZERO mode)")
             return
 
+        # Ban/Health 백그라운드 감시 시작
+        ban_watcher = BanWatcher(page)
+        ban_watcher.start()
+
         # 미디어 메시지 찾기
         print(f"🔍 채팅방 '{args.chat}'에서 미디어 검색 중...")
         media_elements = await extractor.find_media_messages(page, args.chat)
@@ -977,9 +1345,9 @@ async def main():
             print(f"📱 미디어 처리 중... ({i+1}/{min(len(media_elements), args.max_media)})")
             
             try:
-                # Ban banner 실시간 감지 (loop 중)
-                if await detect_ban(page):
-                    logger.error("🛑 BAN banner detected—stopping process")
+                # Ban banner 실시간 감지 (백그라운드 감시 결과 확인)
+                if not ban_watcher.healthy:
+                    logger.error("🛑 BAN banner or closed page detected—stopping process")
                     break
 
                 # 미디어 다운로드
@@ -991,6 +1359,7 @@ async def main():
                 result = await extractor.process_media_file(file_path, args.ocr_engine)
                 result['file_path'] = file_path
                 results.append(result)
+                mark_first_scrape()
                 
                 print(f"✅ 미디어 {i+1} 처리 완료")
                 
@@ -1003,6 +1372,9 @@ async def main():
                 })
         
         # 결과 저장
+        warm_start = get_warm_start_report()
+        if warm_start:
+            print(f"⏱️ 웜 스타트 경과 시간(초): {warm_start}")
         await extractor.save_results(results, args.output)
         
         print(f"✅ 미디어 OCR 처리 완료! 결과 저장: {args.output}")
@@ -1028,6 +1400,10 @@ async def main():
             print(f"⚠️ 오류 정보 저장: {args.output}")
         except:
             pass
+
+    finally:
+        if ban_watcher:
+            await ban_watcher.stop()
     
     # 세션 유지 - 종료 호출 제거
 
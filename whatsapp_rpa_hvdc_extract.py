@@ -18,8 +18,6 @@ import asyncio
 import logging
 import sys
 import json
-import re
-import unicodedata
 from pathlib import Path
 from datetime import datetime
 
@@ -32,7 +30,18 @@ except ImportError as e:
     sys.exit(1)
 
 # 세션 매니저 import
-from session_manager import get_shared_session, close_shared_session
+from session_manager import (
+    get_shared_session,
+    close_shared_session,
+    get_warm_start_report,
+    mark_first_scrape,
+    open_whatsapp_page,
+    prewarm_standby_page,
+    set_resource_policy,
+    take_standby_page,
+)
+import text_sanitizer
+from artifact_index import record_artifact
 
 # 로깅 설정
 logging.basicConfig(
@@ -77,49 +86,11 @@ class HVDCWhatsAppExtractor:
     
     def sanitize_text(self, text: str) -> str:
         """텍스트 정규화 (이모지 제거, ZWSP 제거, 공백 정규화)"""
-        # 이모지 제거 (유니코드 이모지 범위)
-        text = re.sub(r'[\U0001F600-\U0001F64F]', '', text)  # 감정 이모지
-        text = re.sub(r'[\U0001F300-\U0001F5FF]', '', text)  # 기호 및 픽토그램
-        text = re.sub(r'[\U0001F680-\U0001F6FF]', '', text)  # 교통 및 지도
-        text = re.sub(r'[\U0001F1E0-\U0001F1FF]', '', text)  # 국기
-        text = re.sub(r'[\U00002600-\U000027BF]', '', text)  # 기타 기호
-        text = re.sub(r'[\U0001F900-\U0001F9FF]', '', text)  # 보충 기호 및 픽토그램
-        text = re.sub(r'[\U0001F018-\U0001F270]', '', text)  # 기타 기호
-        text = re.sub(r'[\U0001F004]', '', text)  # 마하종
-        text = re.sub(r'[\U0001F0CF]', '', text)  # 플레잉 카드 블랙 조커
-        text = re.sub(r'[\U0001F170-\U0001F251]', '', text)  # 기타 기호
-        
-        # 제로폭 공백(ZWSP) 및 제어문자 제거
-        text = ''.join(c for c in text if unicodedata.category(c)[0] != 'C')
-        
-        # 대괄호 제거 (채팅방 제목에서 일반적)
-        text = text.replace('[', '').replace(']', '')
-        
-        # 연속 공백을 단일 공백으로 정규화
-        text = ' '.join(text.split())
-        
-        return text.strip()
+        return text_sanitizer.sanitize_text(text)
     
     def generate_search_tokens(self, title: str) -> list:
         """채팅방 제목에서 검색용 키워드 토큰 생성"""
-        # 이모지·제어문자 제거
-        cleaned = ''.join(c for c in title if unicodedata.category(c)[0] != 'C' and c.isprintable())
-        
-        # 대괄호·특수문자 제거 (이모지 포함)
-        cleaned = re.sub(r'[\[\]⚡☆★○●□■▶►▪️•]|[^0-9A-Za-z가-힣 ]', '', cleaned)
-        
-        # 공백 기준 토큰 분리
-        tokens = [t for t in cleaned.split() if len(t) >= 3]
-        
-        # 길이 기준 내림차순 정렬 (가장 구체적인 토큰 우선)
-        tokens = sorted(tokens, key=len, reverse=True)
-        
-        # 토큰이 없으면 정규화된 전체 텍스트 반환
-        if not tokens:
-            normalized = self.sanitize_text(title)
-            return [normalized] if normalized else [title]
-        
-        return tokens
+        return text_sanitizer.generate_search_tokens(title)
     
     async def setup_browser_context(self, playwright):
         """브라우저 컨텍스트 설정 (공유 세션 사용)"""
@@ -289,30 +260,39 @@ class HVDCWhatsAppExtractor:
         results = []
         from playwright.async_api import TimeoutError, Error   # S‑08
 
-        # 공유 세션 사용
-        context = await get_shared_session()
-        page = await context.new_page()
-        
+        # 텍스트 추출 전용: 이미지·미디어·폰트 요청 차단
+        resource_policy = set_resource_policy("text")
+
         try:
-            # WhatsApp Web 접속 및 로그인
-            await page.goto("https://web.whatsapp.com/", wait_until="domcontentloaded")
-            
+            # 공유 세션 웜 스타트: 기존 탭 재사용 + 채팅 목록 준비 신호로 로딩 판단
+            page = await open_whatsapp_page(timeout=10000)
+
             # 로그인 상태 확인
             try:
-                await page.wait_for_selector("#side", timeout=10000)
+                await page.wait_for_selector("#side", timeout=1000)
                 print("✅ 이미 로그인된 상태")
             except:
                 print("⚠️ WhatsApp 웹에 접속합니다. QR 코드를 스캔하여 로그인해주세요 (2분 제한).")
                 await page.wait_for_selector("#side", timeout=120000)
                 print("✅ 로그인 성공!")
 
+            # 활성 페이지가 죽으면 즉시 교체할 대기 페이지 미리 로딩
+            prewarm_standby_page()
+
             for chat_title in self.hvdc_chats:
                 print(f"\n📱 채팅방 처리 중: {chat_title}")
                 try:
+                    if page.is_closed():
+                        print("♻️ 활성 페이지 종료 감지 - 대기 페이지로 교체")
+                        page = await take_standby_page()
+
                     result = await self.extract_single_chat(page, chat_title)
                     results.append(result)
                     
                     if result['status'] == 'SUCCESS':
+                        ttfs = mark_first_scrape()
+                        if ttfs is not None:
+                            logger.info(f"time-to-first-scrape: {ttfs:.2f}s")
                         print(f"✅ 추출 성공: {result['message_count']}개 메시지")
                     else:
                         print(f"❌ 추출 실패: {result.get('error', 'Unknown error')}")
@@ -334,6 +314,9 @@ class HVDCWhatsAppExtractor:
             print(f"❌ 오류 발생: {str(e)}")
             logger.error(f"Browser automation error: {str(e)}")
         # 세션 유지 - 종료 호출 제거
+
+        logger.info(f"Warm start timings: {get_warm_start_report()}")
+        logger.info(f"Resource policy: {resource_policy.report()}")
         
         return results
     
@@ -437,6 +420,7 @@ class HVDCWhatsAppExtractor:
         with open(output_file, 'w', encoding='utf-8') as f:
             json.dump(results, f, ensure_ascii=False, indent=2)
         
+        record_artifact("hvdc_extraction", output_file, chats=len(results))
         print(f"\n💾 결과 저장: {output_file}")
         return output_file
 
@@ -13,6 +13,7 @@ import asyncio
 import random
 import json
 import logging
+import time
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Optional, Any
@@ -20,6 +21,8 @@ from typing import List, Dict, Optional, Any
 # Playwright imports
 from playwright.async_api import async_playwright, Page, Browser, BrowserContext
 
+from resource_policy import ResourcePolicy
+
 # MACHO-GPT system imports (with fallback)
 try:
     from simplified_whatsapp_app import llm_summarise, load_db, save_db
@@ -106,17 +109,6 @@ class WhatsAppScraper:
             except Exception as e:
                 logger.warning(f"DOM load timeout: {e}")
             
-            # Wait for network idle
-            try:
-                await page.wait_for_load_state('networkidle', timeout=self.network_idle_timeout)
-                logger.info("Network idle")
-            except Exception as e:
-                logger.warning(f"Network idle timeout: {e}")
-            
-            # Additional stabilization wait
-            await page.wait_for_timeout(15000)  # 15 seconds
-            logger.info("Additional stabilization wait completed")
-            
             # Check for chat list elements
             chat_selectors = [
                 '[data-testid="chat-list"]',
@@ -130,19 +122,12 @@ class WhatsAppScraper:
                 'div[data-testid="cell-frame"]'
             ]
             
-            chat_list_found = False
-            for selector in chat_selectors:
-                try:
-                    await page.wait_for_selector(selector, timeout=10000)
-                    logger.info(f"Chat list found: {selector}")
-                    chat_list_found = True
-                    break
-                except Exception as e:
-                    logger.debug(f"Selector {selector} failed: {e}")
-                    continue
-            
-            if not chat_list_found:
-                logger.warning("Chat list not found")
+            # networkidle/고정 대기 대신 "채팅 목록 준비" 신호 하나로 판단
+            try:
+                await page.wait_for_selector(", ".join(chat_selectors), timeout=self.load_timeout)
+                logger.info("Chat list ready")
+            except Exception as e:
+                logger.warning(f"Chat list not found: {e}")
                 return False
             
             return True
@@ -216,6 +201,7 @@ class WhatsAppScraper:
         """Main conversation scraping method with comprehensive error handling"""
         for attempt in range(self.max_retries):
             logger.info(f"Scraping attempt {attempt + 1}/{self.max_retries}")
+            started_at = time.perf_counter()
             
             try:
                 async with async_playwright() as pw:
@@ -241,14 +227,15 @@ class WhatsAppScraper:
                         },
                         locale="en-US"
                     )
+                    # 텍스트 전용: 이미지·미디어·폰트 요청 차단
+                    resource_policy = ResourcePolicy("text")
+                    await resource_policy.apply(context)
                     
                     page = await context.new_page()
                     
                     # Navigate to WhatsApp Web
                     logger.info("Navigating to WhatsApp Web...")
-                    await page.goto("https://web.whatsapp.com/", wait_until="networkidle", timeout=self.load_timeout)
-                    await page.wait_for_load_state("load", timeout=60000)
-                    await page.wait_for_timeout(10000)  # Additional stabilization
+                    await page.goto("https://web.whatsapp.com/", wait_until="domcontentloaded", timeout=self.load_timeout)
                     
                     # Check for CAPTCHA
                     await self.solve_captcha(page)
@@ -288,6 +275,8 @@ class WhatsAppScraper:
                     
                     if messages:
                         logger.info(f"{len(messages)} messages extracted successfully")
+                        logger.info(f"Time to first scrape: {time.perf_counter() - started_at:.1f}s")
+                        logger.info(f"Resource policy: {resource_policy.report()}")
                         return "\n".join(messages)
                     else:
                         logger.warning("No messages found")
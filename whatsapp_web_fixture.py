@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+MACHO-GPT v3.4-mini 오프라인 WhatsApp Web fixture
+-------------------------------------------------
+Samsung C&T Logistics · HVDC Project
+
+실제 WhatsApp Web 없이 스크래퍼 성능을 측정할 수 있도록, 스크래퍼·RPA
+추출기가 사용하는 셀렉터를 재현한 정적 HTML 한 장을 생성하고 로컬 HTTP
+서버로 제공합니다. 네트워크·로그인이 필요 없으므로 CI에서도 동작합니다.
+
+재현 셀렉터:
+    [data-testid="chats-list"] > [data-testid="chat-list"]  채팅 목록 (로그인 완료 신호)
+    [data-testid="chat-list-search"]                       검색창 (role=searchbox, contenteditable)
+    button[aria-label="Search or start new chat"]          돋보기 버튼 (HVDC 추출기)
+    [title="<그룹명>"]                                     채팅방 항목
+    [data-testid="conversation-panel-messages"]            대화 패널
+    .message-in/.message-out > [data-testid="msg-container"]
+        [data-testid="msg-sender"|"msg-text"|"msg-meta"]
+
+페이지 함수:
+    window.__benchAppend(n)  열려 있는 채팅에 새 메시지 n개 추가 (폴링/push 측정용)
+
+사용법:
+    groups = generate_groups(n_groups=5, n_messages=200)
+    with WhatsAppFixtureServer(groups) as server:
+        scraper = AsyncGroupScraper(config, whatsapp_url=server.url, storage_state_path=None)
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+SENDERS = ["Kim", "Lee", "Park", "Ahmed", "Rahul", "DSV Ops", "MOSB Gate"]
+_FRAGMENTS = [
+    "HVDC container ABCU{n:07d} arrived at MOSB",
+    "Gate pass for trailer {n} ready",
+    "Abu Dhabi logistics update: vessel ETA {n:02d}:00",
+    "AGI wall panel delivery #{n} confirmed",
+    "storage inspection {n} scheduled tomorrow",
+    "Please check DSV delivery note {n}",
+    "Crane booking {n} moved to afternoon",
+]
+
+
+def group_name(index: int) -> str:
+    """fixture 그룹명 (검색 토큰이 다른 텍스트와 겹치지 않도록 고정 접두어)"""
+    return f"Bench Group {index:02d}"
+
+
+def generate_groups(n_groups: int, n_messages: int, seed: int = 42) -> Dict[str, List[Dict[str, str]]]:
+    """
+    합성 그룹/메시지 생성
+
+    Returns:
+        Dict[str, List[Dict]]: 그룹명 → [{sender, text, meta}] (오래된 순)
+    """
+    rng = random.Random(seed)
+    groups: Dict[str, List[Dict[str, str]]] = {}
+    for index in range(n_groups):
+        messages = []
+        for number in range(n_messages):
+            minutes = number % (24 * 60)
+            messages.append(
+                {
+                    "sender": rng.choice(SENDERS),
+                    "text": rng.choice(_FRAGMENTS).format(n=index * n_messages + number),
+                    "meta": f"{minutes // 60:02d}:{minutes % 60:02d}",
+                }
+            )
+        groups[group_name(index)] = messages
+    return groups
+
+
+_PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>Offline fixture</title>
+<style>
+  body { margin: 0; display: flex; font-family: sans-serif; }
+  #side { width: 30%; } #main { flex: 1; }
+  [role="listitem"] { padding: 4px; cursor: pointer; }
+  [data-testid="conversation-panel-messages"] { height: 90vh; overflow-y: auto; }
+</style>
+</head>
+<body>
+<div id="side" data-testid="chats-list">
+  <button aria-label="Search or start new chat" title="Search or start new chat">&#128269;</button>
+  <div data-testid="chat-list-search" role="searchbox" contenteditable="true"></div>
+  <div id="pane-side" data-testid="chat-list" role="list"></div>
+</div>
+<div id="main"></div>
+<script>
+const DATA = __DATA__;
+let current = null;
+let appended = 0;
+const list = document.getElementById('pane-side');
+const search = document.querySelector('[data-testid="chat-list-search"]');
+
+function renderList(filter) {
+  const needle = (filter || '').trim().toLowerCase();
+  list.replaceChildren();
+  for (const name of Object.keys(DATA)) {
+    if (needle && !name.toLowerCase().includes(needle)) continue;
+    const item = document.createElement('div');
+    item.setAttribute('role', 'listitem');
+    const span = document.createElement('span');
+    span.title = name;
+    span.textContent = name;
+    item.appendChild(span);
+    item.addEventListener('click', () => openChat(name));
+    list.appendChild(item);
+  }
+}
+
+function messageNode(msg, index) {
+  const row = document.createElement('div');
+  row.setAttribute('role', 'row');
+  row.className = index % 2 ? 'message-out' : 'message-in';
+  const box = document.createElement('div');
+  box.setAttribute('data-testid', 'msg-container');
+  for (const [testid, value] of [['msg-sender', msg.sender], ['msg-text', msg.text], ['msg-meta', msg.meta]]) {
+    const el = document.createElement('span');
+    el.setAttribute('data-testid', testid);
+    el.textContent = value;
+    box.appendChild(el);
+  }
+  row.appendChild(box);
+  return row;
+}
+
+function openChat(name) {
+  current = name;
+  const panel = document.createElement('div');
+  panel.setAttribute('data-testid', 'conversation-panel-messages');
+  DATA[name].forEach((msg, i) => panel.appendChild(messageNode(msg, i)));
+  document.getElementById('main').replaceChildren(panel);
+  panel.scrollTop = panel.scrollHeight;
+}
+
+window.__benchAppend = (count) => {
+  const panel = document.querySelector('[data-testid="conversation-panel-messages"]');
+  if (!current || !panel) return 0;
+  for (let i = 0; i < count; i++) {
+    appended += 1;
+    const msg = {sender: 'Live Feed', text: 'HVDC live update ' + appended, meta: 'now-' + appended};
+    DATA[current].push(msg);
+    panel.appendChild(messageNode(msg, DATA[current].length - 1));
+  }
+  return count;
+};
+
+search.addEventListener('input', () => renderList(search.textContent));
+document.querySelector('button[aria-label="Search or start new chat"]')
+  .addEventListener('click', () => search.focus());
+renderList('');
+</script>
+</body>
+</html>
+"""
+
+
+def render_fixture_html(groups: Dict[str, List[Dict[str, str]]]) -> str:
+    """fixture HTML 생성 (데이터는 인라인 JSON)"""
+    data = json.dumps(groups, ensure_ascii=False).replace("</", "<\\/")
+    return _PAGE_TEMPLATE.replace("__DATA__", data)
+
+
+class WhatsAppFixtureServer:
+    """
+    fixture 정적 서버/Serve the fixture page on 127.0.0.1 from a background thread.
+
+    모든 GET 경로에 같은 페이지를 반환하므로 스크래퍼가 붙이는 경로·쿼리와
+    무관하게 동작합니다 (favicon 제외).
+    """
+
+    def __init__(self, groups: Dict[str, List[Dict[str, str]]], host: str = "127.0.0.1", port: int = 0):
+        self.groups = groups
+        self.host = host
+        self.port = port
+        self.requests = 0
+        self._body = render_fixture_html(groups).encode("utf-8")
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/"
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802 - http.server API
+                server.requests += 1
+                if self.path.startswith("/favicon"):
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(server._body)))
+                self.end_headers()
+                self.wfile.write(server._body)
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+        return Handler
+
+    def start(self) -> str:
+        """서버 시작 후 URL 반환"""
+        self._httpd = ThreadingHTTPServer((self.host, self.port), self._handler())
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self.url
+
+    def stop(self) -> None:
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self) -> "WhatsAppFixtureServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()